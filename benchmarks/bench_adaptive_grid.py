@@ -0,0 +1,65 @@
+"""Timing of the image placement of AdaptiveGrid with its pre-computed index maps
+against the placement of the sub-pixel positions one by one.
+
+Usage::
+
+    python benchmarks/bench_adaptive_grid.py
+"""
+
+import timeit
+
+import numpy as np
+
+from lenstronomy.ImSim.Numerics.grid import AdaptiveGrid
+from lenstronomy.Util import util
+
+
+def main(nx=100, ny=100, supersampling_factor=5):
+    supersampling_indexes = np.zeros((nx, ny), dtype=bool)
+    for x, y in [(30, 30), (30, 70), (70, 30), (70, 70)]:
+        supersampling_indexes[x - 6 : x + 7, y - 6 : y + 7] = True
+    adaptive_grid = AdaptiveGrid(
+        nx,
+        ny,
+        np.eye(2) * 0.05,
+        -2.5,
+        -2.5,
+        supersampling_indexes,
+        supersampling_factor,
+    )
+    num_sub = supersampling_factor**2
+    high_res_values = np.random.random(np.sum(supersampling_indexes) * num_sub)
+    supersampling_indexes1d = util.image2array(supersampling_indexes)
+
+    def _high_res_image_loop():
+        high_res = np.zeros((nx * supersampling_factor, ny * supersampling_factor))
+        count = 0
+        for i in range(supersampling_factor):
+            for j in range(supersampling_factor):
+                grid1d = np.zeros(nx * ny)
+                grid1d[supersampling_indexes1d] = high_res_values[count::num_sub]
+                high_res[i::supersampling_factor, j::supersampling_factor] = (
+                    util.array2image(grid1d, nx, ny)
+                )
+                count += 1
+        return high_res
+
+    max_diff = np.max(
+        np.abs(adaptive_grid._high_res_image(high_res_values) - _high_res_image_loop())
+    )
+    time_index_maps = min(
+        timeit.repeat(
+            lambda: adaptive_grid._high_res_image(high_res_values),
+            number=20,
+            repeat=5,
+        )
+    )
+    time_loop = min(timeit.repeat(_high_res_image_loop, number=20, repeat=5))
+    print(
+        "supersampled image placement: index maps %.0f us, loop %.0f us, max diff %s"
+        % (time_index_maps / 20 * 1e6, time_loop / 20 * 1e6, max_diff)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Timing and accuracy of the single precision mode (kwargs_numerics 'dtype':
+'float32') of the linear inversion against the default double precision.
+
+Usage::
+
+    python benchmarks/bench_float32.py
+"""
+
+import timeit
+
+import numpy as np
+
+from lenstronomy.Data.imaging_data import ImageData
+from lenstronomy.Data.psf import PSF
+from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LightModel.light_model import LightModel
+import lenstronomy.Util.simulation_util as sim_util
+
+
+def image_models(num_pix=200, supersampling_factor=3, kernel_size=31):
+    """
+
+    :param num_pix: number of pixels per axis
+    :param supersampling_factor: supersampling factor of the surface brightness
+    :param kernel_size: number of pixels per axis of the PSF kernel
+    :return: double and single precision ImageLinearFit instances, keyword arguments
+    """
+    delta_pix = 0.05
+    kwargs_data = sim_util.data_configure_simple(
+        num_pix, delta_pix, exposure_time=100, background_rms=0.05
+    )
+    x, y = np.meshgrid(np.arange(kernel_size), np.arange(kernel_size))
+    r2 = (x - kernel_size // 2) ** 2 + (y - kernel_size // 2) ** 2
+    psf = PSF(psf_type="PIXEL", kernel_point_source=np.exp(-r2 / 2.0 / 3**2))
+    lens_model = LensModel(["SIE", "SHEAR"])
+    source_model = LightModel(["SERSIC_ELLIPSE", "SHAPELETS"])
+    kwargs_lens = [
+        {"theta_E": 1.2, "e1": 0.1, "e2": -0.05, "center_x": 0, "center_y": 0},
+        {"gamma1": 0.03, "gamma2": 0.01},
+    ]
+    kwargs_source = [
+        {
+            "amp": 10,
+            "R_sersic": 0.3,
+            "n_sersic": 2,
+            "e1": 0.1,
+            "e2": 0,
+            "center_x": 0.05,
+            "center_y": 0,
+        },
+        {"amp": np.ones(45), "n_max": 8, "beta": 0.2, "center_x": 0.05, "center_y": 0},
+    ]
+    data = ImageData(**kwargs_data)
+    image_model = ImageLinearFit(
+        data,
+        psf,
+        lens_model,
+        source_model,
+        kwargs_numerics={"supersampling_factor": supersampling_factor},
+    )
+    image = image_model.image(kwargs_lens, kwargs_source)
+    np.random.seed(42)
+    data.update_data(image + np.random.normal(0, 0.05, image.shape))
+    models = [
+        ImageLinearFit(
+            data,
+            psf,
+            lens_model,
+            source_model,
+            kwargs_numerics={
+                "supersampling_factor": supersampling_factor,
+                "dtype": dtype,
+            },
+        )
+        for dtype in ["float64", "float32"]
+    ]
+    return models, kwargs_lens, kwargs_source
+
+
+def main():
+    (image_model, image_model_32), kwargs_lens, kwargs_source = image_models()
+    result = {}
+    for name, model in [("float64", image_model), ("float32", image_model_32)]:
+        logL, _ = model.likelihood_data_given_model(kwargs_lens, kwargs_source)
+        time = min(
+            timeit.repeat(
+                lambda: model.likelihood_data_given_model(kwargs_lens, kwargs_source),
+                number=3,
+                repeat=3,
+            )
+        )
+        result[name] = logL
+        print("%s: %.3f s per likelihood call, logL = %.6f" % (name, time / 3, logL))
+    print("|delta logL| = %.2e" % abs(result["float32"] - result["float64"]))
+
+
+if __name__ == "__main__":
+    main()
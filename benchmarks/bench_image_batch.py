@@ -0,0 +1,111 @@
+"""Timing of ImageModel.image_batch() for N realisations of the model parameters,
+compared with one ImageModel.image() call per realisation.
+
+Usage::
+
+    python benchmarks/bench_image_batch.py
+"""
+
+import timeit
+
+import numpy as np
+
+import lenstronomy.Util.simulation_util as sim_util
+from lenstronomy.Data.imaging_data import ImageData
+from lenstronomy.Data.psf import PSF
+from lenstronomy.ImSim.image_model import ImageModel
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LightModel.light_model import LightModel
+
+
+def image_model(num_pix=100, lens_model_list=None):
+    """
+
+    :param num_pix: number of pixels per axis
+    :param lens_model_list: list of lens models
+    :return: ImageModel instance
+    """
+    kwargs_data = sim_util.data_configure_simple(num_pix, 0.05, 100, 0.05)
+    kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.1, "pixel_size": 0.05}
+    return ImageModel(
+        ImageData(**kwargs_data),
+        PSF(**kwargs_psf),
+        lens_model_class=LensModel(lens_model_list),
+        source_model_class=LightModel(["SERSIC_ELLIPSE"]),
+        lens_light_model_class=LightModel(["SERSIC_ELLIPSE"]),
+    )
+
+
+def realisations(num, lens_model_list):
+    """
+
+    :param num: number of realisations
+    :param lens_model_list: list of lens models (the first one with an Einstein radius)
+    :return: lists of num kwargs_lens, kwargs_source and kwargs_lens_light
+    """
+    np.random.seed(42)
+    kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list = [], [], []
+    for i in range(num):
+        e1, e2 = np.random.uniform(-0.2, 0.2, 2)
+        kwargs_main = {"theta_E": np.random.uniform(0.9, 1.1), "e1": e1, "e2": e2}
+        if lens_model_list[0] == "EPL":
+            kwargs_main["gamma"] = 2.0
+        kwargs_lens_list.append(
+            [kwargs_main, {"gamma1": 0.02, "gamma2": np.random.uniform(-0.05, 0.05)}]
+        )
+        kwargs_sersic = {
+            "amp": 10,
+            "R_sersic": np.random.uniform(0.1, 0.3),
+            "n_sersic": np.random.uniform(1, 4),
+            "e1": e1,
+            "e2": e2,
+            "center_x": 0.05,
+            "center_y": 0,
+        }
+        kwargs_source_list.append([kwargs_sersic])
+        kwargs_lens_light_list.append([dict(kwargs_sersic, R_sersic=0.8)])
+    return kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list
+
+
+def main(num=100):
+    for num_pix, lens_model_list in [
+        (40, ["SIE", "SHEAR"]),
+        (40, ["EPL", "SHEAR"]),
+        (100, ["SIE", "SHEAR"]),
+    ]:
+        model = image_model(num_pix, lens_model_list)
+        kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list = realisations(
+            num, lens_model_list
+        )
+
+        def image_loop():
+            return [
+                model.image(kwargs_lens, kwargs_source, kwargs_lens_light)
+                for kwargs_lens, kwargs_source, kwargs_lens_light in zip(
+                    kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list
+                )
+            ]
+
+        def image_batch():
+            return model.image_batch(
+                kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list
+            )
+
+        time_loop = min(timeit.repeat(image_loop, number=1, repeat=5))
+        time_batch = min(timeit.repeat(image_batch, number=1, repeat=5))
+        print(
+            "%s, %d realisations of %dx%d pixels: image() loop %.3f s, image_batch() %.3f s, speed-up %.1f"
+            % (
+                " + ".join(lens_model_list),
+                num,
+                num_pix,
+                num_pix,
+                time_loop,
+                time_batch,
+                time_loop / time_batch,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Timing of the construction of LensModel instances with the registry-based lens model
+dispatch, compared with the construction of a single astropy cosmology.
+
+Usage::
+
+    python benchmarks/bench_lens_model_construction.py
+"""
+
+import timeit
+
+from astropy.cosmology import FlatLambdaCDM
+
+from lenstronomy.LensModel.lens_model import LensModel
+
+
+def main():
+    kwargs = {"z_source": 2, "lens_redshift_list": [0.5] * 10}
+    lens_model_list_analytic = [
+        "SIS",
+        "SIE",
+        "EPL",
+        "NFW",
+        "TNFW",
+        "NIE",
+        "SHEAR",
+        "CONVERGENCE",
+        "POINT_MASS",
+        "HERNQUIST",
+        "GAUSSIAN",
+        "MULTIPOLE",
+        "NFW_ELLIPSE_CSE",
+    ]
+    for name, lens_model_list, kwargs_model in [
+        ("10 x NFW_MC", ["NFW_MC"] * 10, kwargs),
+        ("13 analytic profiles", lens_model_list_analytic, {}),
+    ]:
+        # the first construction imports the profile modules
+        LensModel(lens_model_list, **kwargs_model)
+        time = min(
+            timeit.repeat(
+                lambda: LensModel(lens_model_list, **kwargs_model), number=10, repeat=3
+            )
+        )
+        print("%s: %.1f us per LensModel" % (name, time / 10 * 1e6))
+    time_cosmo = min(
+        timeit.repeat(
+            lambda: FlatLambdaCDM(H0=70, Om0=0.3, Ob0=0.05), number=10, repeat=3
+        )
+    )
+    print("FlatLambdaCDM: %.1f us" % (time_cosmo / 10 * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Timing of the numba variants of the lens profiles (SIE/NIE, SHEAR, MULTIPOLE and
+the CSE-based NFW/Hernquist profiles) against their numpy reference implementations.
+
+Usage::
+
+    python benchmarks/bench_numba_profiles.py
+"""
+
+import timeit
+
+import numpy as np
+
+from lenstronomy.LensModel.Profiles.hernquist_ellipse_cse import HernquistEllipseCSE
+from lenstronomy.LensModel.Profiles.hernquist_ellipse_cse_numba import (
+    HernquistEllipseCSE_numba,
+)
+from lenstronomy.LensModel.Profiles.multipole import Multipole
+from lenstronomy.LensModel.Profiles.multipole_numba import Multipole_numba
+from lenstronomy.LensModel.Profiles.nfw_ellipse_cse import NFW_ELLIPSE_CSE
+from lenstronomy.LensModel.Profiles.nfw_ellipse_cse_numba import (
+    NFW_ELLIPSE_CSE_numba,
+)
+from lenstronomy.LensModel.Profiles.nie import NIE
+from lenstronomy.LensModel.Profiles.nie_numba import NIE_numba
+from lenstronomy.LensModel.Profiles.shear import Shear
+from lenstronomy.LensModel.Profiles.shear_numba import Shear_numba
+
+
+def profiles():
+    """
+
+    :return: list of (name, numpy profile, numba profile, keyword arguments)
+    """
+    kwargs_ellipse = {"e1": 0.1, "e2": -0.2, "center_x": 0.1, "center_y": -0.05}
+    return [
+        ("NIE", NIE(), NIE_numba(), dict(kwargs_ellipse, theta_E=1.2, s_scale=0.05)),
+        ("SHEAR", Shear(), Shear_numba(), {"gamma1": 0.03, "gamma2": -0.02}),
+        (
+            "MULTIPOLE",
+            Multipole(),
+            Multipole_numba(),
+            {"m": 4, "a_m": 0.05, "phi_m": 0.3, "center_x": 0.1, "center_y": -0.2},
+        ),
+        (
+            "NFW_ELLIPSE_CSE",
+            NFW_ELLIPSE_CSE(),
+            NFW_ELLIPSE_CSE_numba(),
+            dict(kwargs_ellipse, Rs=1.5, alpha_Rs=0.5),
+        ),
+        (
+            "HERNQUIST_ELLIPSE_CSE",
+            HernquistEllipseCSE(),
+            HernquistEllipseCSE_numba(),
+            dict(kwargs_ellipse, sigma0=1.5, Rs=0.8),
+        ),
+    ]
+
+
+def main(num_points=100000):
+    np.random.seed(42)
+    x, y = np.random.normal(0, 2, (2, num_points))
+    for name, profile, profile_numba, kwargs in profiles():
+        for function in ["derivatives", "hessian"]:
+            # first call compiles the numba kernels
+            getattr(profile_numba, function)(x, y, **kwargs)
+            times = []
+            for model in [profile, profile_numba]:
+                times.append(
+                    min(
+                        timeit.repeat(
+                            lambda: getattr(model, function)(x, y, **kwargs),
+                            number=3,
+                            repeat=3,
+                        )
+                    )
+                    / 3
+                )
+            print(
+                "%s %s: numpy %.2f ms, numba %.2f ms, speed-up %.1f"
+                % (
+                    name,
+                    function,
+                    times[0] * 1e3,
+                    times[1] * 1e3,
+                    times[0] / times[1],
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -43,12 +43,10 @@ def light2mass_interpol(
 
     # compute lensing quantities with subgrid
     convergence_sub = util.array2image(flux)
-    f_x_sub, f_y_sub = integral.deflection_from_kappa_grid(
-        convergence_sub, grid_spacing=deltaPix / float(subgrid_res)
-    )
-    f_sub = integral.potential_from_kappa_grid(
-        convergence_sub, grid_spacing=deltaPix / float(subgrid_res)
+    solver = integral.KappaGridSolver(
+        len(convergence_sub), grid_spacing=deltaPix / float(subgrid_res)
     )
+    f_sub, f_x_sub, f_y_sub = solver.solve(convergence_sub)
     # interpolation function on lensing quantities
     x_axes_sub, y_axes_sub = util.get_axes(x_grid_sub, y_grid_sub)
     from lenstronomy.LensModel.Profiles.interpol import Interpol
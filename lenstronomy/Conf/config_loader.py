@@ -2,7 +2,6 @@ import yaml
 import os
 import lenstronomy
 
-
 # in case the xdg library is installed, the import statement with pyxdg can raise an error
 # to avoid it, we draw back to the ~/.config directory in case this import fails.
 # TODO come up with more permanent solution of path to configuration directory
@@ -12,6 +11,10 @@ except ImportError:
     xdg_config_home = "~/.config"
 
 user_config_file = os.path.join(xdg_config_home, "lenstronomy", "config.yaml")
+# directory to store pre-computed lookup tables (see lenstronomy.Util.tabulation_util)
+user_table_directory = os.path.join(
+    os.path.expanduser(xdg_config_home), "lenstronomy", "tables"
+)
 
 module_path = os.path.dirname(lenstronomy.__file__)
 default_config_file = os.path.join(module_path, "Conf", "conf_default.yaml")
@@ -58,3 +61,17 @@ def conventions_conf():
         conf = yaml.safe_load(file)
         conventions_conf = conf["conventions"]
     return conventions_conf
+
+
+def tabulation_conf():
+    """
+
+    :return: keyword arguments of the tabulation of numerical integrals
+    """
+    with open(default_config_file) as file:
+        tabulation_conf = yaml.safe_load(file)["tabulation"]
+    with open(conf_file) as file:
+        conf = yaml.safe_load(file)
+        # user configuration files from previous versions may not include this section
+        tabulation_conf.update(conf.get("tabulation", {}))
+    return tabulation_conf
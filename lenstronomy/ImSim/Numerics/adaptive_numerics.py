@@ -5,8 +5,13 @@ from lenstronomy.ImSim.Numerics.numba_convolution import (
 from lenstronomy.ImSim.Numerics.convolution import PixelKernelConvolution
 from lenstronomy.Util import kernel_util
 from lenstronomy.Util import image_util
+import numpy as np
 
-__all__ = ["AdaptiveConvolution"]
+__all__ = [
+    "AdaptiveConvolution",
+    "adaptive_supersampled_indexes",
+    "adaptive_supersampling_kernel_size",
+]
 
 
 class AdaptiveConvolution(object):
@@ -91,11 +96,27 @@ class AdaptiveConvolution(object):
         image_low_res_conv = self._low_res_conv.convolution2d(image_low_res)
         image_low_res_partial_conv = self._low_res_partial.convolve2d(image_low_res)
         image_high_res_partial_conv = self._hig_res_partial.convolve2d(image_high_res)
-        return (
+        image_conv = (
             image_low_res_conv
             + image_high_res_partial_conv
             - image_low_res_partial_conv
         )
+        # the partial numba convolutions are computed in double precision
+        return image_conv.astype(image_low_res.dtype, copy=False)
+
+    def re_size_convolve_stack(self, image_low_res, image_high_res):
+        """
+
+        :param image_low_res: 3d array (n_images, nx, ny), stack of regular sampled images/models
+        :param image_high_res: stack of supersampled images/models to be convolved on a regular pixel grid
+        :return: 3d array of convolved and re-sized images
+        """
+        image_conv = self._low_res_conv.convolution2d_stack(image_low_res)
+        for i in range(len(image_conv)):
+            image_conv[i] += self._hig_res_partial.convolve2d(
+                image_high_res[i]
+            ) - self._low_res_partial.convolve2d(image_low_res[i])
+        return image_conv
 
     def convolve2d(self, image_high_res):
         """
@@ -107,3 +128,75 @@ class AdaptiveConvolution(object):
             image_high_res, factor=self._supersampling_factor
         )
         return self.re_size_convolve(image_low_res, image_high_res)
+
+
+def adaptive_supersampled_indexes(image_low_res, image_high_res, tolerance):
+    """Selects the pixels whose flux, evaluated at the pixel center, deviates by more
+    than the tolerance from the flux averaged over the supersampled sub-pixels.
+
+    :param image_low_res: 2d array, (unconvolved) image evaluated at the pixel centers
+    :param image_high_res: 2d array, (unconvolved) supersampled image, with the size of
+        image_low_res times the supersampling factor per axis
+    :param tolerance: float, maximum tolerated flux difference per pixel (in the units
+        of the images)
+    :return: 2d boolean array of the size of image_low_res, pixels to be supersampled
+    """
+    supersampling_factor = int(len(image_high_res) / len(image_low_res))
+    image_average = image_util.re_size(image_high_res, factor=supersampling_factor)
+    return np.abs(image_average - image_low_res) > tolerance
+
+
+def adaptive_supersampling_kernel_size(
+    kernel_super,
+    supersampling_factor,
+    image_high_res,
+    supersampled_indexes,
+    tolerance,
+    compute_indexes=None,
+):
+    """Smallest supersampling_kernel_size of the AdaptiveConvolution for which the
+    convolved image deviates by less than the tolerance from the one computed with the
+    full supersampled kernel.
+
+    :param kernel_super: convolution kernel in units of super sampled pixels, odd length
+        per axis
+    :param supersampling_factor: factor of supersampling relative to pixel grid
+    :param image_high_res: 2d array, (unconvolved) supersampled image
+    :param supersampled_indexes: 2d boolean array of the size of the image, pixels being
+        supersampled
+    :param tolerance: float, maximum tolerated difference per pixel (in the units of the
+        images)
+    :param compute_indexes: 2d boolean array of the size of the image, pixels for which
+        the convolution is computed (default all)
+    :return: int, odd number of pixels (in units of the image pixels)
+    """
+    # largest odd kernel size (in units of image pixels) covered by kernel_super
+    kernel_size_max = len(kernel_super) // supersampling_factor
+    if kernel_size_max % 2 == 0:
+        kernel_size_max -= 1
+    if not np.any(supersampled_indexes):
+        return 1
+    # the supersampled image is only passed on in the supersampled pixels
+    high_res_indexes = np.repeat(
+        np.repeat(supersampled_indexes, supersampling_factor, axis=0),
+        supersampling_factor,
+        axis=1,
+    )
+    image_high_res_partial = np.where(high_res_indexes, image_high_res, 0)
+    image_low_res = image_util.re_size(image_high_res, factor=supersampling_factor)
+
+    def _convolve(kernel_size):
+        adaptive_conv = AdaptiveConvolution(
+            kernel_super,
+            supersampling_factor,
+            conv_supersample_pixels=supersampled_indexes,
+            supersampling_kernel_size=kernel_size,
+            compute_pixels=compute_indexes,
+        )
+        return adaptive_conv.re_size_convolve(image_low_res, image_high_res_partial)
+
+    image_conv_full = _convolve(kernel_size_max)
+    for kernel_size in range(1, kernel_size_max, 2):
+        if np.max(np.abs(_convolve(kernel_size) - image_conv_full)) < tolerance:
+            return kernel_size
+    return kernel_size_max
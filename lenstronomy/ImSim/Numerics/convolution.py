@@ -1,4 +1,5 @@
 from scipy import fftpack, ndimage, signal
+from scipy import fft as scipy_fft
 import numpy as np
 import threading
 import lenstronomy.Util.kernel_util as kernel_util
@@ -11,16 +12,18 @@ export, __all__ = exporter()
 
 _rfft_mt_safe = True  # (NumpyVersion(np.__version__) >= '1.9.0.dev-e24486e')
 _rfft_lock = threading.Lock()
+# number of images transformed together in a batched FFT of a stack of images (limits the size of the work buffers)
+_stack_chunk_size = 8
 
 
 def _centered(arr, newshape):
-    # Return the center newshape portion of the array.
+    # Return the center newshape portion of the array (along the last len(newshape) axes).
     newshape = np.asarray(newshape)
-    currshape = np.array(arr.shape)
+    currshape = np.array(arr.shape[arr.ndim - len(newshape) :])
     startind = (currshape - newshape) // 2
     endind = startind + newshape
     myslice = [slice(startind[k], endind[k]) for k in range(len(endind))]
-    return arr[tuple(myslice)]
+    return arr[(Ellipsis,) + tuple(myslice)]
 
 
 @export
@@ -73,10 +76,36 @@ class PixelKernelConvolution(object):
             raise ValueError("convolution_type %s not supported!" % self._type)
         return image_conv
 
+    def convolution2d_stack(self, images):
+        """Convolves a stack of images with the same kernel. For the 'fft_static' and
+        'fft' convolution types, the images are transformed in batched FFTs.
+
+        :param images: 3d array (n_images, nx, ny) of images to be convolved
+        :return: 3d array of convolved images
+        """
+        images = np.asarray(images)
+        if self._type == "fft":
+            image_conv = signal.fftconvolve(
+                images, self._kernel[np.newaxis, :, :], mode="same", axes=(-2, -1)
+            )
+        elif self._type == "fft_static":
+            image_conv = self._static_fft_stack(images)
+        elif self._type == "grid":
+            image_conv = np.array(
+                [
+                    signal.convolve2d(image, self._kernel, mode="same")
+                    for image in images
+                ]
+            )
+        else:
+            raise ValueError("convolution_type %s not supported!" % self._type)
+        return image_conv
+
     def _static_fft(self, image, mode="same"):
         """Scipy fft convolution with saved static fft kernel.
 
-        :param image: 2d numpy array to be convolved
+        :param image: 2d numpy array to be convolved, or 3d array (n_images, nx, ny) of
+            images to be convolved in a single batched FFT
         :return:
         """
         in1 = image
@@ -118,8 +147,10 @@ class PixelKernelConvolution(object):
         # sure we only call rfftn/irfftn from one thread at a time.
         if not complex_result and (_rfft_mt_safe or _rfft_lock.acquire(False)):
             try:
-                sp1 = np.fft.rfftn(in1, fshape)
-                ret = np.fft.irfftn(sp1 * sp2, fshape)[fslice].copy()
+                sp1 = np.fft.rfftn(in1, fshape, axes=(-2, -1))
+                ret = np.fft.irfftn(sp1 * sp2, fshape, axes=(-2, -1))[
+                    (Ellipsis,) + fslice
+                ].copy()
             finally:
                 if not _rfft_mt_safe:
                     _rfft_lock.release()
@@ -128,8 +159,8 @@ class PixelKernelConvolution(object):
             # failed to acquire _rfft_lock (meaning rfftn isn't threadsafe and
             # is already in use by another thread).  In either case, use the
             # (threadsafe but slower) SciPy complex-FFT routines instead.
-            sp1 = fftpack.fftn(in1, fshape)
-            ret = fftpack.ifftn(sp1 * sp2)[fslice].copy()
+            sp1 = fftpack.fftn(in1, fshape, axes=(-2, -1))
+            ret = fftpack.ifftn(sp1 * sp2, axes=(-2, -1))[(Ellipsis,) + fslice].copy()
             if not complex_result:
                 ret = ret.real
 
@@ -142,16 +173,50 @@ class PixelKernelConvolution(object):
         else:
             raise ValueError("Acceptable mode flags are 'valid'," " 'same', or 'full'.")
 
+    def _static_fft_stack(self, images):
+        """Batched scipy fft convolution in 'same' mode with saved static fft kernel.
+        The images are transformed in chunks with scipy.fft, which makes use of
+        multiple threads when set with scipy.fft.set_workers().
+
+        :param images: 3d numpy array (n_images, nx, ny) to be convolved
+        :return: 3d numpy array of convolved images
+        """
+        images = np.asarray(images)
+        if self._pre_computed is False:
+            (
+                self._s1,
+                self._s2,
+                self._complex_result,
+                self._shape,
+                self._fshape,
+                self._fslice,
+                self._sp2,
+            ) = self._static_pre_compute(images)
+            self._pre_computed = True
+        if self._complex_result or np.iscomplexobj(images):
+            return self._static_fft(images, mode="same")
+        s1, fshape, fslice, sp2 = self._s1, self._fshape, self._fslice, self._sp2
+        image_conv = np.empty(np.shape(images), dtype=np.result_type(images, sp2.real))
+        for i in range(0, len(images), _stack_chunk_size):
+            sp1 = scipy_fft.rfftn(
+                images[i : i + _stack_chunk_size], fshape, axes=(-2, -1)
+            )
+            ret = scipy_fft.irfftn(sp1 * sp2, fshape, axes=(-2, -1))
+            image_conv[i : i + _stack_chunk_size] = _centered(
+                ret[(Ellipsis,) + fslice], s1
+            )
+        return image_conv
+
     def _static_pre_compute(self, image):
         """Pre-compute Fourier transformed kernel and shape quantities to speed up
         convolution.
 
-        :param image: 2d numpy array
+        :param image: 2d numpy array (or 3d stack of 2d arrays)
         :return:
         """
         in1 = image
         in2 = self._kernel
-        s1 = np.array(in1.shape)
+        s1 = np.array(in1.shape[-2:])
         s2 = np.array(in2.shape)
         complex_result = np.issubdtype(in1.dtype, np.complexfloating) or np.issubdtype(
             in2.dtype, np.complexfloating
@@ -192,6 +257,15 @@ class PixelKernelConvolution(object):
         """
         return self.convolution2d(image_low_res)
 
+    def re_size_convolve_stack(self, image_low_res, image_high_res=None):
+        """
+
+        :param image_low_res: 3d array (n_images, nx, ny), stack of regular sampled images/models
+        :param image_high_res: stack of supersampled images/models to be convolved on a regular pixel grid
+        :return: 3d array of convolved and re-sized images
+        """
+        return self.convolution2d_stack(image_low_res)
+
 
 @export
 class SubgridKernelConvolution(object):
@@ -266,6 +340,36 @@ class SubgridKernelConvolution(object):
             image_resized_conv += self._low_res_conv.convolution2d(image_low_res)
         return image_resized_conv
 
+    def convolution2d_stack(self, images):
+        """
+
+        :param images: 3d array (n_images, nx, ny) of high resolution images to be convolved and re-sized
+        :return: 3d array of convolved images
+        """
+        image_high_res_conv = self._high_res_conv.convolution2d_stack(images)
+        image_resized_conv = image_util.re_size(
+            image_high_res_conv, self._supersampling_factor
+        )
+        if self._low_res_convolution is True:
+            image_resized = image_util.re_size(images, self._supersampling_factor)
+            image_resized_conv += self._low_res_conv.convolution2d_stack(image_resized)
+        return image_resized_conv
+
+    def re_size_convolve_stack(self, image_low_res, image_high_res):
+        """
+
+        :param image_low_res: 3d array (n_images, nx, ny), stack of regular sampled images/models
+        :param image_high_res: stack of supersampled images/models to be convolved on a regular pixel grid
+        :return: 3d array of convolved and re-sized images
+        """
+        image_high_res_conv = self._high_res_conv.convolution2d_stack(image_high_res)
+        image_resized_conv = image_util.re_size(
+            image_high_res_conv, self._supersampling_factor
+        )
+        if self._low_res_convolution is True:
+            image_resized_conv += self._low_res_conv.convolution2d_stack(image_low_res)
+        return image_resized_conv
+
 
 @export
 class MultiGaussianConvolution(object):
@@ -304,30 +408,34 @@ class MultiGaussianConvolution(object):
     def convolution2d(self, image):
         """2d convolution.
 
-        :param image: 2d numpy array, image to be convolved
+        :param image: 2d numpy array, image to be convolved (or 3d stack of images
+            (n_images, nx, ny), each of which is convolved)
         :return: convolved image, 2d numpy array
         """
         image_conv = None
+        # no smoothing along the stacking axis in case of a 3d input
+        sigma_leading = (0,) * (np.ndim(image) - 2)
+        # python float weights keep the floating point precision of the image
         for i in range(self._num_gaussians):
             if image_conv is None:
                 image_conv = (
                     ndimage.gaussian_filter(
                         image,
-                        self._sigmas_scaled[i],
+                        sigma_leading + (self._sigmas_scaled[i],) * 2,
                         mode="nearest",
                         truncate=self._truncation,
                     )
-                    * self._fraction_list[i]
+                    * float(self._fraction_list[i])
                 )
             else:
                 image_conv += (
                     ndimage.gaussian_filter(
                         image,
-                        self._sigmas_scaled[i],
+                        sigma_leading + (self._sigmas_scaled[i],) * 2,
                         mode="nearest",
                         truncate=self._truncation,
                     )
-                    * self._fraction_list[i]
+                    * float(self._fraction_list[i])
                 )
         return image_conv
 
@@ -346,6 +454,15 @@ class MultiGaussianConvolution(object):
             image_resized_conv = self.convolution2d(image_low_res)
         return image_resized_conv
 
+    def re_size_convolve_stack(self, image_low_res, image_high_res):
+        """
+
+        :param image_low_res: 3d array (n_images, nx, ny), stack of regular sampled images/models
+        :param image_high_res: stack of supersampled images/models to be convolved on a regular pixel grid
+        :return: 3d array of convolved and re-sized images
+        """
+        return self.re_size_convolve(image_low_res, image_high_res)
+
     def pixel_kernel(self, num_pix):
         """Computes a pixelized kernel from the MGE parameters.
 
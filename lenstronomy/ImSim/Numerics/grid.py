@@ -22,6 +22,7 @@ class AdaptiveGrid(Coordinates1D):
         supersampling_indexes,
         supersampling_factor,
         flux_evaluate_indexes=None,
+        dtype=np.float64,
     ):
         """
 
@@ -34,8 +35,10 @@ class AdaptiveGrid(Coordinates1D):
         :param supersampling_factor: int, factor (per axis) of super-sampling
         :param flux_evaluate_indexes: bool array of shape nx x ny, corresponding to pixels being evaluated
          (for both low and high res). Default is None, replaced by setting all pixels to being evaluated.
+        :param dtype: floating point type of the coordinates and images
         """
         super(AdaptiveGrid, self).__init__(transform_pix2angle, ra_at_xy_0, dec_at_xy_0)
+        self._dtype = np.dtype(dtype)
         self._nx = nx
         self._ny = ny
         self._x_grid, self._y_grid = self.coordinate_grid(nx, ny)
@@ -48,9 +51,28 @@ class AdaptiveGrid(Coordinates1D):
         )
         self._supersampling_factor = supersampling_factor
         self._num_sub = supersampling_factor * supersampling_factor
-        self._x_low_res = self._x_grid[self._low_res_indexes1d]
-        self._y_low_res = self._y_grid[self._low_res_indexes1d]
+        self._x_low_res = self._x_grid[self._low_res_indexes1d].astype(self._dtype)
+        self._y_low_res = self._y_grid[self._low_res_indexes1d].astype(self._dtype)
         self._num_low_res = len(self._x_low_res)
+        self._init_index_maps()
+
+    def _init_index_maps(self):
+        """Pre-computes the flat indexes of the images at which the evaluated flux
+        values are placed, such that the images are populated with a single
+        assignment each.
+
+        :return: None
+        """
+        self._low_res_index_map = np.where(self._low_res_indexes1d)[0]
+        self._high_res_index_map = np.where(self._high_res_indexes1d)[0]
+        # sub-pixel (i, j) of the flux values in the order of the coordinates_evaluate
+        sub_i, sub_j = np.divmod(np.arange(self._num_sub), self._supersampling_factor)
+        x, y = np.divmod(self._high_res_index_map, self._ny)
+        x_high_res = x[:, np.newaxis] * self._supersampling_factor + sub_i
+        y_high_res = y[:, np.newaxis] * self._supersampling_factor + sub_j
+        self._high_res_image_index_map = (
+            x_high_res * self._ny * self._supersampling_factor + y_high_res
+        ).ravel()
 
     @property
     def coordinates_evaluate(self):
@@ -64,6 +86,13 @@ class AdaptiveGrid(Coordinates1D):
         dec_joint = np.append(dec_low, dec_high)
         return ra_joint, dec_joint
 
+    @property
+    def supersampling_factor(self):
+        """
+        :return: factor (per axis) of super-sampling relative to a pixel
+        """
+        return self._supersampling_factor
+
     def flux_array2image_low_high(self, flux_array, high_res_return=True):
         """
 
@@ -99,11 +128,10 @@ class AdaptiveGrid(Coordinates1D):
         :return: 2d image
         """
 
-        array = np.zeros_like(self._x_grid)
-        array[self._low_res_indexes1d] = low_res_values
-        array_low_res_partial = self._average_subgrid(supersampled_values)
-        array[self._high_res_indexes1d] = array_low_res_partial
-        return util.array2image(array)
+        array = np.zeros(self._nx * self._ny, dtype=self._dtype)
+        array[self._low_res_index_map] = low_res_values
+        array[self._high_res_index_map] = self._average_subgrid(supersampled_values)
+        return util.array2image(array, self._nx, self._ny)
 
     def _high_res_image(self, supersampled_values):
         """
@@ -112,20 +140,15 @@ class AdaptiveGrid(Coordinates1D):
         :return: 2d array of supersampled image (zeros outside supersampled frame)
         """
         high_res = np.zeros(
-            (
-                self._nx * self._supersampling_factor,
-                self._ny * self._supersampling_factor,
-            )
+            self._nx * self._ny * self._num_sub,
+            dtype=self._dtype,
+        )
+        high_res[self._high_res_image_index_map] = supersampled_values
+        return util.array2image(
+            high_res,
+            self._nx * self._supersampling_factor,
+            self._ny * self._supersampling_factor,
         )
-        count = 0
-        for i in range(self._supersampling_factor):
-            for j in range(self._supersampling_factor):
-                selected = supersampled_values[count :: self._num_sub]
-                high_res[
-                    i :: self._supersampling_factor, j :: self._supersampling_factor
-                ] = self._array2image_subset(selected)
-                count += 1
-        return high_res
 
     def _subpixel_coordinates(self):
         """
@@ -158,8 +181,8 @@ class AdaptiveGrid(Coordinates1D):
                     y_grid_select + delta_dec - delta_dec_0
                 )
                 count += 1
-        self._x_high_res = x_sub_grid
-        self._y_high_res = y_sub_grid
+        self._x_high_res = x_sub_grid.astype(self._dtype)
+        self._y_high_res = y_sub_grid.astype(self._dtype)
 
     def _average_subgrid(self, subgrid_values):
         """Averages the values over a pixel.
@@ -170,14 +193,6 @@ class AdaptiveGrid(Coordinates1D):
         values_2d = np.reshape(subgrid_values, (-1, self._num_sub))
         return np.mean(values_2d, axis=1)
 
-    def _array2image_subset(self, array):
-        """Maps a 1d array into a (nx, ny) 2d grid with array populating the idex_mask
-        indices :param array: 1d array :return: 2d array."""
-        grid1d = np.zeros(self._nx * self._ny)
-        grid1d[self._high_res_indexes1d] = array
-        grid2d = util.array2image(grid1d, self._nx, self._ny)
-        return grid2d
-
 
 @export
 class RegularGrid(Coordinates1D):
@@ -192,6 +207,7 @@ class RegularGrid(Coordinates1D):
         dec_at_xy_0,
         supersampling_factor=1,
         flux_evaluate_indexes=None,
+        dtype=np.float64,
     ):
         """
 
@@ -203,8 +219,10 @@ class RegularGrid(Coordinates1D):
         :param supersampling_factor: int, factor (per axis) of super-sampling
         :param flux_evaluate_indexes: bool array of shape nx x ny, corresponding to pixels being evaluated
          (for both low and high res). Default is None, replaced by setting all pixels to being evaluated.
+        :param dtype: floating point type of the coordinates and images
         """
         super(RegularGrid, self).__init__(transform_pix2angle, ra_at_xy_0, dec_at_xy_0)
+        self._dtype = np.dtype(dtype)
         self._supersampling_factor = supersampling_factor
         self._nx = nx
         self._ny = ny
@@ -220,8 +238,8 @@ class RegularGrid(Coordinates1D):
         x_grid_sub, y_grid_sub = util.make_subgrid(
             self._x_grid, self._y_grid, self._supersampling_factor
         )
-        self._ra_subgrid = x_grid_sub[self._compute_indexes]
-        self._dec_subgrid = y_grid_sub[self._compute_indexes]
+        self._ra_subgrid = x_grid_sub[self._compute_indexes].astype(self._dtype)
+        self._dec_subgrid = y_grid_sub[self._compute_indexes].astype(self._dtype)
 
     @property
     def coordinates_evaluate(self):
@@ -300,7 +318,7 @@ class RegularGrid(Coordinates1D):
             self._nx * self._supersampling_factor,
             self._ny * self._supersampling_factor,
         )
-        grid1d = np.zeros((nx * ny))
+        grid1d = np.zeros((nx * ny), dtype=self._dtype)
         grid1d[self._compute_indexes] = array
         grid2d = util.array2image(grid1d, nx, ny)
         return grid2d
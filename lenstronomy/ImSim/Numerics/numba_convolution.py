@@ -3,8 +3,9 @@ import numpy as np
 from lenstronomy.Util import numba_util
 from lenstronomy.ImSim.Numerics.partial_image import PartialImage
 from lenstronomy.Util import image_util
+from lenstronomy.Util import util
 
-__all__ = ["NumbaConvolution"]
+__all__ = ["NumbaConvolution", "SubgridNumbaConvolution"]
 
 
 class NumbaConvolution(object):
@@ -31,13 +32,15 @@ class NumbaConvolution(object):
          pixels
         :param nopython: bool, numba jit setting to use python or compiled.
         :param cache: bool, numba jit setting to use cache
-        :param parallel: bool, numba jit setting to use parallel mode
+        :param parallel: bool, if True, each output pixel is computed independently such that the output pixels can
+         be distributed across threads (numba prange, active when numba is configured with parallel=True)
         :param memory_raise: bool, if True, checks whether memory required to store the convolution kernel is within
          certain bounds
         """
         # numba_util.nopython = nopython
         # numba_util.cache = cache
         # numba_util.parallel = parallel
+        self._parallel = parallel
         self._memory_raise = memory_raise
         self._kernel = kernel
         self._conv_pixels = conv_pixels
@@ -93,6 +96,14 @@ class NumbaConvolution(object):
                     self._image_frame_psfs[image_index, :] = image_frame_psfs
                     self._image_frame_lengths[image_index] = frame_length
                     image_index += 1
+        if self._parallel is True:
+            (
+                self._gather_indptr,
+                self._gather_indexes,
+                self._gather_kernels,
+            ) = _gather_frames(
+                self.frame_triplets(), num_data=self._partialOutput.num_partial
+            )
 
     def convolve2d(self, image):
         """2d convolution.
@@ -101,16 +112,39 @@ class NumbaConvolution(object):
         :return: convolved image, 2d numpy array
         """
         image_array_partial = self._partialInput.partial_array(image)
-        conv_array = self._convolve_jit(
-            image_array_partial,
-            num_data=self._partialOutput.num_partial,
-            image_frame_kernels=self._image_frame_psfs,
-            image_frame_indexes=self._image_frame_indexes,
-            image_frame_lengths=self._image_frame_lengths,
-        )
+        if self._parallel is True:
+            conv_array = _convolve_gather_jit(
+                image_array_partial,
+                self._gather_indptr,
+                self._gather_indexes,
+                self._gather_kernels,
+            )
+        else:
+            conv_array = self._convolve_jit(
+                image_array_partial,
+                num_data=self._partialOutput.num_partial,
+                image_frame_kernels=self._image_frame_psfs,
+                image_frame_indexes=self._image_frame_indexes,
+                image_frame_lengths=self._image_frame_lengths,
+            )
         conv_image = self._partialOutput.image_from_partial(conv_array)
         return conv_image
 
+    def frame_triplets(self):
+        """Pre-computed kernel frames as a list of (input pixel, output pixel, kernel
+        value) contributions, in the order in which the serial convolution adds them.
+
+        :return: 1d int array of input indexes (of the partial input array), 1d int
+            array of output indexes (of the partial output array), 1d array of kernel
+            values
+        """
+        lengths = self._image_frame_lengths
+        valid = np.arange(self.kernel_max_size)[np.newaxis, :] < lengths[:, np.newaxis]
+        input_indexes = np.repeat(np.arange(len(lengths)), lengths)
+        output_indexes = self._image_frame_indexes[valid]
+        kernels = self._image_frame_psfs[valid]
+        return input_indexes, output_indexes, kernels
+
     @staticmethod
     @numba_util.jit()
     def _pre_compute_frame_kernel(image_index, kernel, mask, index_array):
@@ -212,15 +246,21 @@ class SubgridNumbaConvolution(object):
         :param compute_pixels: bool array of size of image, these pixels (if True) will get blurred light from other pixels
         :param nopython: bool, numba jit setting to use python or compiled.
         :param cache: bool, numba jit setting to use cache
-        :param parallel: bool, numba jit setting to use parallel mode
+        :param parallel: bool, if True, the convolutions of all the sub-pixel positions are folded into a single
+         compiled kernel with the output pixels distributed across threads (numba prange, active when numba is
+         configured with parallel=True)
         """
         self._nx, self._ny = conv_pixels.shape
         self._supersampling_factor = supersampling_factor
+        self._parallel = parallel
         # loop through the different supersampling sectors
         self._numba_conv_list = []
         if compute_pixels is None:
             compute_pixels = np.ones_like(conv_pixels)
             compute_pixels = np.array(compute_pixels, dtype=bool)
+        triplets = []
+        # 1d indexes of the convolved pixels in the (flattened) supersampled image
+        x_conv, y_conv = np.where(conv_pixels)
 
         for i in range(supersampling_factor):
             for j in range(supersampling_factor):
@@ -234,9 +274,30 @@ class SubgridNumbaConvolution(object):
                     compute_pixels=compute_pixels,
                     nopython=nopython,
                     cache=cache,
-                    parallel=parallel,
+                    parallel=False,
                 )
-                self._numba_conv_list.append(numba_conv)
+                if parallel is True:
+                    input_indexes, output_indexes, kernels = numba_conv.frame_triplets()
+                    high_res_indexes = (
+                        x_conv * supersampling_factor + i
+                    ) * self._ny * supersampling_factor + (
+                        y_conv * supersampling_factor + j
+                    )
+                    triplets.append(
+                        (high_res_indexes[input_indexes], output_indexes, kernels)
+                    )
+                else:
+                    self._numba_conv_list.append(numba_conv)
+        if parallel is True:
+            self._partialOutput = PartialImage(partial_read_bools=compute_pixels)
+            (
+                self._gather_indptr,
+                self._gather_indexes,
+                self._gather_kernels,
+            ) = _gather_frames(
+                [np.concatenate(arrays) for arrays in zip(*triplets)],
+                num_data=self._partialOutput.num_partial,
+            )
 
     def convolve2d(self, image_high_res):
         """
@@ -244,6 +305,14 @@ class SubgridNumbaConvolution(object):
         :param image_high_res: supersampled image/model to be convolved and re-bined to regular resolution
         :return: convolved and re-bind image
         """
+        if self._parallel is True:
+            conv_array = _convolve_gather_jit(
+                util.image2array(image_high_res),
+                self._gather_indptr,
+                self._gather_indexes,
+                self._gather_kernels,
+            )
+            return self._partialOutput.image_from_partial(conv_array)
         conv_image = np.zeros((self._nx, self._ny))
         count = 0
         for i in range(self._supersampling_factor):
@@ -288,3 +357,50 @@ class SubgridNumbaConvolution(object):
             kernel_super_match, factor=self._supersampling_factor
         )
         return kernel
+
+
+def _gather_frames(triplets, num_data):
+    """Sorts the (input pixel, output pixel, kernel value) contributions of a
+    convolution by output pixel, such that each output pixel can be computed
+    independently.
+
+    :param triplets: 1d int array of input indexes, 1d int array of output indexes, 1d
+        array of kernel values
+    :param num_data: number of output pixels
+    :return: 1d array of pointers (num_data + 1) to the start of the contributions of
+        each output pixel, 1d array of input indexes, 1d array of kernel values
+    """
+    input_indexes, output_indexes, kernels = triplets
+    output_indexes = np.asarray(output_indexes, dtype=int)
+    # stable sort keeps the summation order of the serial convolution
+    order = np.argsort(output_indexes, kind="stable")
+    indptr = np.zeros(num_data + 1, dtype=int)
+    indptr[1:] = np.cumsum(np.bincount(output_indexes, minlength=num_data))
+    return (
+        indptr,
+        np.asarray(input_indexes, dtype=int)[order],
+        np.asarray(kernels, dtype=float)[order],
+    )
+
+
+@numba_util.jit()
+def _convolve_gather_jit(image_array, indptr, input_indexes, kernels):
+    """Convolution of an array as a sum over the contributions to each output pixel.
+    The output pixels are distributed across threads when numba is configured with
+    parallel=True (see the 'parallel' option of the numba config).
+
+    :param image_array: 1d array of the input pixels
+    :param indptr: 1d array of pointers (num_data + 1) to the start of the
+        contributions of each output pixel
+    :param input_indexes: 1d array of input indexes of the contributions
+    :param kernels: 1d array of kernel values of the contributions
+    :return: 1d array of the convolved output pixels
+    """
+    num_data = len(indptr) - 1
+    conv_array = np.zeros(num_data)
+    for data_index in numba_util.prange(num_data):
+        value = 0.0
+        for k in range(indptr[data_index], indptr[data_index + 1]):
+            value += image_array[input_indexes[k]] * kernels[k]
+        conv_array[data_index] = value
+    return conv_array
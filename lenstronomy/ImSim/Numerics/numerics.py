@@ -7,6 +7,8 @@ from lenstronomy.ImSim.Numerics.convolution import (
 from lenstronomy.ImSim.Numerics.point_source_rendering import PointSourceRendering
 from lenstronomy.Util import util
 from lenstronomy.Util import kernel_util
+from lenstronomy.Util import numba_util
+from lenstronomy.Util import timing_util
 import numpy as np
 
 __all__ = ["Numerics"]
@@ -33,6 +35,7 @@ class Numerics(PointSourceRendering):
         convolution_kernel_size=None,
         convolution_type="fft_static",
         truncation=4,
+        dtype="float64",
     ):
         """
 
@@ -57,6 +60,8 @@ class Numerics(PointSourceRendering):
         :param point_source_supersampling_factor: super-sampling resolution of the point source placing
         :param convolution_kernel_size: int, odd number, size of convolution kernel. If None, takes size of point_source_kernel
         :param convolution_type: string, 'fft', 'grid', 'fft_static' mode of 2d convolution
+        :param dtype: floating point type ('float64' or 'float32') of the coordinates, surface brightness evaluations
+         and convolutions. 'float32' trades precision for speed and memory.
         """
         if compute_mode not in ["regular", "adaptive"]:
             raise ValueError(
@@ -71,7 +76,12 @@ class Numerics(PointSourceRendering):
             )
         if supersampling_factor == 1:
             supersampling_convolution = False
-        self._pixel_width = pixel_grid.pixel_width
+        self._pixel_width = float(pixel_grid.pixel_width)
+        self._dtype = np.dtype(dtype)
+        if self._dtype not in [np.float64, np.float32]:
+            raise ValueError(
+                "dtype %s not supported! Chose either float64 or float32." % dtype
+            )
         nx, ny = pixel_grid.num_pixel_axes
         transform_pix2angle = pixel_grid.transform_pix2angle
         ra_at_xy_0, dec_at_xy_0 = pixel_grid.radec_at_xy_0
@@ -89,6 +99,7 @@ class Numerics(PointSourceRendering):
                 supersampled_indexes,
                 supersampling_factor,
                 flux_evaluate_indexes,
+                dtype=self._dtype,
             )
         else:
             self._grid = RegularGrid(
@@ -99,6 +110,7 @@ class Numerics(PointSourceRendering):
                 dec_at_xy_0,
                 supersampling_factor,
                 flux_evaluate_indexes,
+                dtype=self._dtype,
             )
         if self._psf_type == "PIXEL":
             if compute_mode == "adaptive" and supersampling_convolution is True:
@@ -120,7 +132,7 @@ class Numerics(PointSourceRendering):
                     compute_pixels=compute_indexes,
                     nopython=True,
                     cache=True,
-                    parallel=False,
+                    parallel=numba_util.parallel,
                 )
 
             elif compute_mode == "regular" and supersampling_convolution is True:
@@ -135,7 +147,7 @@ class Numerics(PointSourceRendering):
                         kernel_super, convolution_kernel_size, supersampling_factor
                     )
                 self._conv = SubgridKernelConvolution(
-                    kernel_super,
+                    kernel_super.astype(self._dtype),
                     supersampling_factor,
                     supersampling_kernel_size=supersampling_kernel_size,
                     convolution_type=convolution_type,
@@ -146,7 +158,7 @@ class Numerics(PointSourceRendering):
                     kernel, convolution_kernel_size, supersampling_factor=1
                 )
                 self._conv = PixelKernelConvolution(
-                    kernel, convolution_type=convolution_type
+                    kernel.astype(self._dtype), convolution_type=convolution_type
                 )
 
         elif self._psf_type == "GAUSSIAN":
@@ -195,11 +207,53 @@ class Numerics(PointSourceRendering):
             image_conv = image_low_res
         else:
             # convolve low res grid and high res grid
-            image_conv = self._conv.re_size_convolve(
-                image_low_res, image_high_res_partial
+            with timing_util.stage("convolution"):
+                image_conv = self._conv.re_size_convolve(
+                    image_low_res, image_high_res_partial
+                )
+        return image_conv * self._pixel_width**2
+
+    def re_size_convolve_stack(self, flux_arrays, unconvolved=False):
+        """Same as re_size_convolve() for a stack of flux arrays evaluated on the same
+        coordinates. The convolution of all the images is performed in a single batched
+        operation (one FFT for all images for the FFT-based convolution types).
+
+        :param flux_arrays: 2d array (n_arrays, n_coordinates), flux values corresponding
+            to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array (n_arrays, nx, ny)
+        """
+        image_low_res_list, image_high_res_list = [], []
+        for flux_array in flux_arrays:
+            image_low_res, image_high_res_partial = (
+                self._grid.flux_array2image_low_high(
+                    flux_array, high_res_return=self._high_res_return
+                )
             )
+            image_low_res_list.append(image_low_res)
+            image_high_res_list.append(image_high_res_partial)
+        image_low_res = np.array(image_low_res_list)
+        if unconvolved is True or self._psf_type == "NONE":
+            image_conv = image_low_res
+        else:
+            if self._high_res_return is True:
+                image_high_res_partial = np.array(image_high_res_list)
+            else:
+                image_high_res_partial = None
+            with timing_util.stage("convolution"):
+                image_conv = self._conv.re_size_convolve_stack(
+                    image_low_res, image_high_res_partial
+                )
         return image_conv * self._pixel_width**2
 
+    @property
+    def dtype(self):
+        """
+
+        :return: floating point type of the numerical computations
+        """
+        return self._dtype
+
     @property
     def grid_supersampling_factor(self):
         """
@@ -26,6 +26,7 @@ class NumericsSubFrame(PointSourceRendering):
         convolution_kernel_size=None,
         convolution_type="fft_static",
         truncation=4,
+        dtype="float64",
     ):
         """
 
@@ -49,6 +50,8 @@ class NumericsSubFrame(PointSourceRendering):
         :param point_source_supersampling_factor: super-sampling resolution of the point source placing
         :param convolution_kernel_size: int, odd number, size of convolution kernel. If None, takes size of
         point_source_kernel
+        :param dtype: floating point type ('float64' or 'float32') of the coordinates, surface brightness evaluations
+        and convolutions
 
         """
         # if no super sampling, turn the supersampling convolution off
@@ -70,6 +73,7 @@ class NumericsSubFrame(PointSourceRendering):
             convolution_kernel_size=convolution_kernel_size,
             convolution_type=convolution_type,
             truncation=truncation,
+            dtype=dtype,
         )
         super(NumericsSubFrame, self).__init__(
             pixel_grid=pixel_grid,
@@ -89,6 +93,27 @@ class NumericsSubFrame(PointSourceRendering):
         )
         return self._complete_frame(image_sub_frame)
 
+    def re_size_convolve_stack(self, flux_arrays, unconvolved=False):
+        """
+
+        :param flux_arrays: 2d array (n_arrays, n_coordinates), flux values corresponding
+            to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array (n_arrays, nx, ny)
+        """
+        image_sub_frame = self._numerics_subframe.re_size_convolve_stack(
+            flux_arrays, unconvolved=unconvolved
+        )
+        return self._complete_frame(image_sub_frame)
+
+    @property
+    def dtype(self):
+        """
+
+        :return: floating point type of the numerical computations
+        """
+        return self._numerics_subframe.dtype
+
     @property
     def grid_supersampling_factor(self):
         """
@@ -123,12 +148,17 @@ class NumericsSubFrame(PointSourceRendering):
 
     def _complete_frame(self, image_sub_frame):
         """
-        :param image_sub_frame: 2d numpy array of size of the sub-frame
+        :param image_sub_frame: 2d numpy array of size of the sub-frame (or 3d stack
+            thereof)
         :return: 2d numpy array of size of image with added zeros on their edges
         """
         if self._subframe_calc is True:
-            image = np.zeros((self._nx, self._ny))
+            image = np.zeros(
+                np.shape(image_sub_frame)[:-2] + (self._nx, self._ny),
+                dtype=image_sub_frame.dtype,
+            )
             image[
+                ...,
                 self._x_min_sub : self._x_max_sub + 1,
                 self._y_min_sub : self._y_max_sub + 1,
             ] = image_sub_frame
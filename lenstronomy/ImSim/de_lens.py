@@ -2,6 +2,7 @@ __author__ = "sibirrer"
 
 import numpy as np
 import sys
+from scipy import linalg, sparse
 
 from lenstronomy.Util.package_util import exporter
 
@@ -42,6 +43,46 @@ def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     return B, M_inv, image
 
 
+@export
+def get_param_WLS_sparse(A, C_D_inv, d, inv_bool=True, marg_const=False):
+    """Returns the parameter values given a (sparse) response matrix. Same as
+    get_param_WLS() but the normal equations are built from a scipy.sparse response
+    matrix (only the overlapping support of the basis functions is multiplied) and
+    solved with a Cholesky decomposition.
+
+    :param A: response matrix Nd x Ns (Nd = # data points, Ns = # parameters), scipy
+        sparse matrix or 2d numpy array
+    :param C_D_inv: inverse covariance matrix of the data, Nd x Nd, diagonal form
+    :param d: data array, 1-d Nd
+    :param inv_bool: boolean, whether returning also the inverse matrix or just solve
+        the linear system
+    :param marg_const: boolean, if True, additionally returns the marginalisation
+        constant of the inverse matrix (see marginalisation_const()) from the Cholesky
+        decomposition of the solve
+    :return: 1-d array of parameter values, inverse matrix (or None), 1-d model array
+        (and marginalisation constant)
+    """
+    A = sparse.csc_matrix(A)
+    C_D_inv = np.asarray(C_D_inv, dtype=float)
+    M = (A.T @ A.multiply(C_D_inv[:, np.newaxis])).toarray()
+    R = A.T @ np.multiply(C_D_inv, d)
+    c_factor = _cho_factor_stable(M)
+    if c_factor is None:
+        B = np.zeros(A.shape[1])
+        M_inv = np.zeros_like(M) if inv_bool else None
+    else:
+        B = linalg.cho_solve(c_factor, R)
+        if inv_bool:
+            M_inv = linalg.cho_solve(c_factor, np.eye(len(M)))
+        else:
+            M_inv = None
+    image = A @ B
+    if marg_const is True:
+        # log det(M_inv) = - log det(M)
+        return B, M_inv, image, -_log_det_cholesky(c_factor)
+    return B, M_inv, image
+
+
 @export
 def marginalisation_const(M_inv):
     """Get marginalisation constant 1/2 log(M_beta) for flat priors.
@@ -57,14 +98,29 @@ def marginalisation_const(M_inv):
 
 
 @export
-def marginalization_new(M_inv, d_prior=None):
+def marginalisation_const_cholesky(M_inv):
+    """Get marginalisation constant 1/2 log(M_beta) for flat priors from the Cholesky
+    decomposition of the (positive definite) covariance matrix.
+
+    :param M_inv: 2D covariance matrix
+    :return: float
+    """
+    return _log_det_cholesky(_cho_factor_stable(M_inv))
+
+
+@export
+def marginalization_new(M_inv, d_prior=None, cholesky=False):
     """
 
     :param M_inv: 2D covariance matrix
     :param d_prior: maximum prior length of linear parameters
+    :param cholesky: bool, if True, computes the log determinant (without prior
+        length) with a Cholesky decomposition
     :return: log determinant with eigenvalues to be smaller or equal d_prior
     """
     if d_prior is None:
+        if cholesky is True:
+            return marginalisation_const_cholesky(M_inv)
         return marginalisation_const(M_inv)
     v, w = np.linalg.eig(M_inv)
     sign_v = np.sign(v)
@@ -91,6 +147,43 @@ def _stable_inv(m):
     return m_inv
 
 
+def _log_det_cholesky(c_factor):
+    """Half of the log determinant of a matrix from its Cholesky decomposition.
+
+    :param c_factor: Cholesky factor as returned by _cho_factor_stable() or None
+    :return: float, 1/2 log det of the matrix (or -10**15 if c_factor is None)
+    """
+    if c_factor is None:
+        return -(10**15)
+    return np.sum(np.log(np.diag(c_factor[0])))
+
+
+def _cho_factor_stable(m):
+    """Cholesky decomposition of a symmetric positive definite matrix. The matrix is
+    rejected if (max/min)^2 of the diagonal of the Cholesky factor exceeds 5/epsilon.
+    This ratio is a lower bound of the condition number, hence the criterion is less
+    strict than the condition number threshold 5/epsilon of the dense solver
+    get_param_WLS() (which requires a singular value decomposition) and may accept
+    matrices the dense solver rejects.
+
+    :param m: square matrix
+    :return: Cholesky factor as returned by scipy.linalg.cho_factor (or None if the
+        matrix is not positive definite or ill-conditioned)
+    """
+    try:
+        c_factor = linalg.cho_factor(m, lower=True)
+    except (linalg.LinAlgError, ValueError):
+        return None
+    diag = np.abs(np.diag(c_factor[0]))
+    # the squared ratio of the diagonal elements is a lower bound of the condition number
+    if (
+        len(diag) == 0
+        or (np.min(diag) / np.max(diag)) ** 2 < sys.float_info.epsilon / 5
+    ):
+        return None
+    return c_factor
+
+
 def _solve_stable(m, r):
     """
 
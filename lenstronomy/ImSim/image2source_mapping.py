@@ -1,6 +1,11 @@
+import copy
 import numpy as np
 from lenstronomy.Cosmo.background import Background
 from lenstronomy.ImSim.multiplane_organizer import MultiPlaneOrganizer
+from lenstronomy.LensModel.single_plane import SinglePlane
+from lenstronomy.LensModel.fused_single_plane import FusedSinglePlane, alpha_batch
+from lenstronomy.Util import util
+from lenstronomy.Util import timing_util
 
 __all__ = ["Image2SourceMapping"]
 
@@ -22,7 +27,7 @@ class Image2SourceMapping(object):
     the mapping between source to image plane.
     """
 
-    def __init__(self, lens_model, source_model):
+    def __init__(self, lens_model, source_model, ray_shooting_cache=0):
         """
 
         :param lens_model: LensModel() class instance
@@ -31,9 +36,13 @@ class Image2SourceMapping(object):
 
          - source_scale_factor_list: list of floats corresponding to the rescaled deflection angles to the specific source components. None indicates that the list will be set to 1, meaning a single source plane model (in single lens plane mode).
          - source_redshift_list: list of redshifts of the light components (in multi lens plane mode)
+        :param ray_shooting_cache: int, number of ray-shooting results (of different image plane coordinates and lens
+         model keyword arguments) kept in memory and re-used (only for a single source plane). 0 turns the cache off.
         """
 
         self._light_model = source_model
+        self._ray_shooting_cache_size = int(ray_shooting_cache)
+        self._ray_shooting_cache = []
         self._lens_model = lens_model
         light_model_list = source_model.profile_type_list
         self._multi_lens_plane = lens_model.multi_plane
@@ -177,7 +186,7 @@ class Image2SourceMapping(object):
             )
 
         if self._multi_source_plane is False:
-            x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
+            x_source, y_source = self._ray_shooting(x, y, kwargs_lens)
         else:
             if self._multi_lens_plane is False:
                 x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
@@ -207,6 +216,66 @@ class Image2SourceMapping(object):
 
         return x_source, y_source
 
+    def _ray_shooting(self, x, y, kwargs_lens):
+        """Ray-shooting of the image plane coordinates to the (single) source plane. If
+        the ray-shooting cache is turned on, previous results for the same coordinates and
+        lens model keyword arguments are re-used.
+
+        :param x: image plane coordinate (angle)
+        :param y: image plane coordinate (angle)
+        :param kwargs_lens: lens model kwargs list
+        :return: source plane coordinates
+        """
+        with timing_util.stage("ray_shooting"):
+            return self._ray_shooting_cached(x, y, kwargs_lens)
+
+    def _ray_shooting_cached(self, x, y, kwargs_lens):
+        """Ray-shooting with the optional ray-shooting cache, see _ray_shooting().
+
+        :param x: image plane coordinate (angle)
+        :param y: image plane coordinate (angle)
+        :param kwargs_lens: lens model kwargs list
+        :return: source plane coordinates
+        """
+        if self._ray_shooting_cache_size <= 0 or self._distance_ratio_sampling:
+            return self._lens_model.ray_shooting(x, y, kwargs_lens)
+        for i, (x_, y_, kwargs_lens_, beta_x, beta_y) in enumerate(
+            self._ray_shooting_cache
+        ):
+            if (
+                np.array_equal(x, x_)
+                and np.array_equal(y, y_)
+                and util.kwargs_equal(kwargs_lens, kwargs_lens_)
+            ):
+                # move the entry to the end of the list (most recently used)
+                self._ray_shooting_cache.append(self._ray_shooting_cache.pop(i))
+                return beta_x, beta_y
+        beta_x, beta_y = self._lens_model.ray_shooting(x, y, kwargs_lens)
+        self._ray_shooting_cache.append(
+            (np.copy(x), np.copy(y), copy.deepcopy(kwargs_lens), beta_x, beta_y)
+        )
+        if len(self._ray_shooting_cache) > self._ray_shooting_cache_size:
+            self._ray_shooting_cache.pop(0)
+        return beta_x, beta_y
+
+    def reset_ray_shooting_cache(self):
+        """Deletes the cached ray-shooting results.
+
+        :return: None
+        """
+        self._ray_shooting_cache = []
+
+    def set_ray_shooting_cache(self, ray_shooting_cache):
+        """Changes the number of ray-shooting results kept in memory and deletes the
+        cached results.
+
+        :param ray_shooting_cache: int, number of ray-shooting results kept in memory, 0
+            turns the cache off
+        :return: None
+        """
+        self._ray_shooting_cache_size = int(ray_shooting_cache)
+        self.reset_ray_shooting_cache()
+
     def image_flux_joint(
         self, x, y, kwargs_lens, kwargs_source, kwargs_special=None, k=None
     ):
@@ -230,22 +299,26 @@ class Image2SourceMapping(object):
             )
 
         if self._multi_source_plane is False:
-            x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
-            return self._light_model.surface_brightness(
-                x_source, y_source, kwargs_source, k=k
-            )
+            x_source, y_source = self._ray_shooting(x, y, kwargs_lens)
+            x_source, y_source = _match_dtype(x_source, y_source, x, y)
+            with timing_util.stage("source"):
+                return self._light_model.surface_brightness(
+                    x_source, y_source, kwargs_source, k=k
+                )
         else:
             flux = np.zeros_like(x)
             if self._multi_lens_plane is False:
-                x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
+                with timing_util.stage("ray_shooting"):
+                    x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
                 for i in range(len(self._deflection_scaling_list)):
                     scale_factor = self._deflection_scaling_list[i]
                     x_source = x - x_alpha * scale_factor
                     y_source = y - y_alpha * scale_factor
                     if k is None or k == i:
-                        flux += self._light_model.surface_brightness(
-                            x_source, y_source, kwargs_source, k=i
-                        )
+                        with timing_util.stage("source"):
+                            flux += self._light_model.surface_brightness(
+                                x_source, y_source, kwargs_source, k=i
+                            )
             else:
                 alpha_x, alpha_y = x, y
                 x_source, y_source = np.zeros_like(x), np.zeros_like(y)
@@ -256,31 +329,75 @@ class Image2SourceMapping(object):
                         T_ij_start = self._T_ij_start_list[i]
                         T_ij_end = self._T_ij_end_list[i]
 
-                        (
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                        ) = self._lens_model.lens_model.ray_shooting_partial(
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                            z_start,
-                            z_stop,
-                            kwargs_lens,
-                            include_z_start=False,
-                            T_ij_start=T_ij_start,
-                            T_ij_end=T_ij_end,
-                        )
+                        with timing_util.stage("ray_shooting"):
+                            (
+                                x_source,
+                                y_source,
+                                alpha_x,
+                                alpha_y,
+                            ) = self._lens_model.lens_model.ray_shooting_partial(
+                                x_source,
+                                y_source,
+                                alpha_x,
+                                alpha_y,
+                                z_start,
+                                z_stop,
+                                kwargs_lens,
+                                include_z_start=False,
+                                T_ij_start=T_ij_start,
+                                T_ij_end=T_ij_end,
+                            )
 
                     if k is None or k == i:
-                        flux += self._light_model.surface_brightness(
-                            x_source, y_source, kwargs_source, k=index_source
-                        )
+                        with timing_util.stage("source"):
+                            flux += self._light_model.surface_brightness(
+                                x_source, y_source, kwargs_source, k=index_source
+                            )
                     z_start = z_stop
             return flux
 
+    def image_flux_joint_batch(
+        self, x, y, kwargs_lens_batch, kwargs_source_batch, kwargs_special_batch=None
+    ):
+        """Surface brightness of all light components at image positions (x, y) for N
+        realisations of the lens and source model parameters. With a single lens and
+        source plane, the ray-shooting and the source profiles are evaluated vectorized
+        over the realisations (see alpha_batch() and surface_brightness_batch()),
+        otherwise image_flux_joint() is evaluated for each realisation.
+
+        :param x: coordinate in image plane, 1d array
+        :param y: coordinate in image plane, 1d array
+        :param kwargs_lens_batch: list of N lens model kwargs lists
+        :param kwargs_source_batch: list of N source model kwargs lists
+        :param kwargs_special_batch: list of N kwargs_special (or None)
+        :return: surface brightness, 2d array (N, len(x))
+        """
+        if kwargs_special_batch is None:
+            kwargs_special_batch = [None] * len(kwargs_lens_batch)
+        single_plane = getattr(self._lens_model, "lens_model", None)
+        if (
+            self._multi_source_plane is True
+            or self._distance_ratio_sampling is True
+            or type(single_plane) not in (SinglePlane, FusedSinglePlane)
+        ):
+            return np.array(
+                [
+                    self.image_flux_joint(
+                        x, y, kwargs_lens, kwargs_source, kwargs_special=kwargs_special
+                    )
+                    for kwargs_lens, kwargs_source, kwargs_special in zip(
+                        kwargs_lens_batch, kwargs_source_batch, kwargs_special_batch
+                    )
+                ]
+            )
+        with timing_util.stage("ray_shooting"):
+            alpha_x, alpha_y = alpha_batch(single_plane, x, y, kwargs_lens_batch)
+        x_source, y_source = _match_dtype(x - alpha_x, y - alpha_y, x, y)
+        with timing_util.stage("source"):
+            return self._light_model.surface_brightness_batch(
+                x_source, y_source, kwargs_source_batch
+            )
+
     def image_flux_split(self, x, y, kwargs_lens, kwargs_source, kwargs_special=None):
         """Computes the surface brightness of all light components at image position (x,
         y)
@@ -300,20 +417,26 @@ class Image2SourceMapping(object):
                 self, kwargs_special
             )
         if self._multi_source_plane is False:
-            x_source, y_source = self._lens_model.ray_shooting(x, y, kwargs_lens)
-            return self._light_model.functions_split(x_source, y_source, kwargs_source)
+            x_source, y_source = self._ray_shooting(x, y, kwargs_lens)
+            x_source, y_source = _match_dtype(x_source, y_source, x, y)
+            with timing_util.stage("source"):
+                return self._light_model.functions_split(
+                    x_source, y_source, kwargs_source
+                )
         else:
             response = []
             n = 0
             if self._multi_lens_plane is False:
-                x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
+                with timing_util.stage("ray_shooting"):
+                    x_alpha, y_alpha = self._lens_model.alpha(x, y, kwargs_lens)
                 for i in range(len(self._deflection_scaling_list)):
                     scale_factor = self._deflection_scaling_list[i]
                     x_source = x - x_alpha * scale_factor
                     y_source = y - y_alpha * scale_factor
-                    response_i, n_i = self._light_model.functions_split(
-                        x_source, y_source, kwargs_source, k=i
-                    )
+                    with timing_util.stage("source"):
+                        response_i, n_i = self._light_model.functions_split(
+                            x_source, y_source, kwargs_source, k=i
+                        )
                     response += response_i
                     n += n_i
             else:
@@ -327,28 +450,30 @@ class Image2SourceMapping(object):
                         T_ij_start = self._T_ij_start_list[i]
                         T_ij_end = self._T_ij_end_list[i]
 
-                        (
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                        ) = self._lens_model.lens_model.ray_shooting_partial(
-                            x_source,
-                            y_source,
-                            alpha_x,
-                            alpha_y,
-                            z_start,
-                            z_stop,
-                            kwargs_lens,
-                            include_z_start=False,
-                            T_ij_start=T_ij_start,
-                            T_ij_end=T_ij_end,
+                        with timing_util.stage("ray_shooting"):
+                            (
+                                x_source,
+                                y_source,
+                                alpha_x,
+                                alpha_y,
+                            ) = self._lens_model.lens_model.ray_shooting_partial(
+                                x_source,
+                                y_source,
+                                alpha_x,
+                                alpha_y,
+                                z_start,
+                                z_stop,
+                                kwargs_lens,
+                                include_z_start=False,
+                                T_ij_start=T_ij_start,
+                                T_ij_end=T_ij_end,
+                            )
+
+                    with timing_util.stage("source"):
+                        response_i, n_i = self._light_model.functions_split(
+                            x_source, y_source, kwargs_source, k=index_source
                         )
 
-                    response_i, n_i = self._light_model.functions_split(
-                        x_source, y_source, kwargs_source, k=index_source
-                    )
-
                     n_i_list.append(n_i)
                     response += response_i
                     n += n_i
@@ -394,3 +519,19 @@ class Image2SourceMapping(object):
             ]
             n_sum_sorted += n_i
         return reshuffled
+
+
+def _match_dtype(x_source, y_source, x, y):
+    """Casts the source plane coordinates to single precision if the image plane
+    coordinates are in single precision (the ray-shooting itself is performed in double
+    precision).
+
+    :param x_source: source plane coordinate
+    :param y_source: source plane coordinate
+    :param x: image plane coordinate
+    :param y: image plane coordinate
+    :return: x_source, y_source
+    """
+    if np.asarray(x).dtype == np.float32 and np.asarray(y).dtype == np.float32:
+        return x_source.astype(np.float32), y_source.astype(np.float32)
+    return x_source, y_source
@@ -1,11 +1,22 @@
 from lenstronomy.ImSim.image_model import ImageModel
 import lenstronomy.ImSim.de_lens as de_lens
 from lenstronomy.Util import util
+from lenstronomy.Util import timing_util
 from lenstronomy.ImSim.Numerics.convolution import PixelKernelConvolution
 import numpy as np
+from scipy import sparse
+import copy
 
 __all__ = ["ImageLinearFit"]
 
+# keyword arguments of the light and point source models solved for by the linear
+# inversion (not affecting the linear response). They are only stripped from the light
+# and point source keyword arguments, "amp" is a non-linear parameter of some lens models
+_LINEAR_KWARGS = ["amp", "point_amp", "source_amp"]
+
+# number of basis functions convolved together when the sparse response rows are built
+_SPARSE_BLOCK_SIZE = 16
+
 
 class ImageLinearFit(ImageModel):
     """Linear version class, inherits ImageModel.
@@ -60,6 +71,10 @@ class ImageLinearFit(ImageModel):
             kwargs_pixelbased=kwargs_pixelbased,
         )
         self._linear_solver = linear_solver
+        self._response_cache = {}
+        # covariance matrix of the last sparse linear solve and its marginalisation
+        # constant from the Cholesky decomposition of the solve
+        self._marg_const_cholesky = (None, None)
         if psf_error_map_bool_list is None:
             psf_error_map_bool_list = [True] * len(
                 self.PointSource.point_source_type_list
@@ -165,14 +180,28 @@ class ImageLinearFit(ImageModel):
                 kwargs_ps,
                 kwargs_extinction,
                 kwargs_special,
+                sparse_format=self._sparse_linear_solver,
             )
             C_D_response, model_error = self._error_response(
                 kwargs_lens, kwargs_ps, kwargs_special=kwargs_special
             )
             d = self.data_response
-            param, cov_param, wls_model = de_lens.get_param_WLS(
-                A.T, 1 / C_D_response, d, inv_bool=inv_bool
-            )
+            # a single precision response matrix is promoted to float64 in the WLS solve
+            with timing_util.stage("linear_solve"):
+                if self._sparse_linear_solver is True:
+                    (
+                        param,
+                        cov_param,
+                        wls_model,
+                        marg_const,
+                    ) = de_lens.get_param_WLS_sparse(
+                        A.T, 1 / C_D_response, d, inv_bool=inv_bool, marg_const=True
+                    )
+                    self._marg_const_cholesky = (cov_param, marg_const)
+                else:
+                    param, cov_param, wls_model = de_lens.get_param_WLS(
+                        A.T, 1 / C_D_response, d, inv_bool=inv_bool
+                    )
             model = self.array_masked2image(wls_model)
             _, _, _, _ = self._update_linear_kwargs(
                 param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
@@ -430,6 +459,95 @@ class ImageLinearFit(ImageModel):
         )
         return logL, param
 
+    def likelihood_data_given_model_batch(
+        self,
+        kwargs_lens_list=None,
+        kwargs_source_list=None,
+        kwargs_lens_light_list=None,
+        kwargs_ps_list=None,
+        kwargs_extinction_list=None,
+        kwargs_special_list=None,
+        source_marg=False,
+        linear_prior=None,
+        check_positive_flux=False,
+        linear_solver=True,
+    ):
+        """Log likelihoods of the data for N realisations of the model parameters (see
+        likelihood_data_given_model()). Without the linear solver, the model images are
+        computed with image_batch() (vectorized over the realisations). With the linear
+        solver, the linear inversion is performed for each realisation separately.
+
+        :param kwargs_lens_list: list of N kwargs_lens (or None)
+        :param kwargs_source_list: list of N kwargs_source (or None)
+        :param kwargs_lens_light_list: list of N kwargs_lens_light (or None)
+        :param kwargs_ps_list: list of N kwargs_ps (or None)
+        :param kwargs_extinction_list: list of N kwargs_extinction (or None)
+        :param kwargs_special_list: list of N kwargs_special (or None)
+        :param source_marg: bool, performs a marginalization over the linear parameters
+        :param linear_prior: linear prior width in eigenvalues
+        :param check_positive_flux: bool, if True, checks whether the linear inversion
+            resulted in non-negative flux components and applies a punishment in the
+            likelihood if so.
+        :param linear_solver: bool, if True (default) fixes the linear amplitude
+            parameters 'amp' (avoid sampling) such that they get overwritten by the
+            linear solver solution.
+        :return: 1d array of N log likelihoods (natural logarithm)
+        """
+        kwargs_batch = util.batch_kwargs(
+            kwargs_lens_list,
+            kwargs_source_list,
+            kwargs_lens_light_list,
+            kwargs_ps_list,
+            kwargs_extinction_list,
+            kwargs_special_list,
+        )
+        logL_list = np.zeros(len(kwargs_batch))
+        if linear_solver is True or self._pixelbased_bool is True:
+            # the linear inversion is specific to each realisation
+            for i, kwargs in enumerate(kwargs_batch):
+                logL_list[i], _ = self._likelihood_data_given_model(
+                    *kwargs,
+                    source_marg=source_marg,
+                    linear_prior=linear_prior,
+                    check_positive_flux=check_positive_flux,
+                    linear_solver=linear_solver,
+                )
+            return logL_list
+        models = self.image_batch(
+            kwargs_lens_list,
+            kwargs_source_list,
+            kwargs_lens_light_list,
+            kwargs_ps_list,
+            kwargs_extinction_list,
+            kwargs_special_list,
+        )
+        for i, kwargs in enumerate(kwargs_batch):
+            (
+                kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                _,
+                kwargs_special,
+            ) = kwargs
+            model_error = self._error_map_model(
+                kwargs_lens, kwargs_ps=kwargs_ps, kwargs_special=kwargs_special
+            )
+            logL_list[i] = self.likelihood_data_given_model_solution(
+                models[i],
+                model_error,
+                None,
+                None,
+                kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                source_marg=source_marg,
+                linear_prior=linear_prior,
+                check_positive_flux=check_positive_flux,
+            )
+        return logL_list
+
     def likelihood_data_given_model_solution(
         self,
         model,
@@ -464,9 +582,15 @@ class ImageLinearFit(ImageModel):
 
         if self._pixelbased_bool is False:
             if cov_matrix is not None and source_marg:
-                marg_const = de_lens.marginalization_new(
-                    cov_matrix, d_prior=linear_prior
-                )
+                if linear_prior is None and cov_matrix is self._marg_const_cholesky[0]:
+                    # re-use the decomposition of the sparse linear solve
+                    marg_const = self._marg_const_cholesky[1]
+                else:
+                    marg_const = de_lens.marginalization_new(
+                        cov_matrix,
+                        d_prior=linear_prior,
+                        cholesky=self._sparse_linear_solver,
+                    )
                 logL += marg_const
         if check_positive_flux is True:
             _, _, _, _ = self._update_linear_kwargs(
@@ -515,6 +639,7 @@ class ImageLinearFit(ImageModel):
         kwargs_extinction=None,
         kwargs_special=None,
         unconvolved=False,
+        sparse_format=False,
     ):
         """Computes the linear response matrix (m x n), with n being the data size and m
         being the coefficients.
@@ -530,66 +655,241 @@ class ImageLinearFit(ImageModel):
         :param kwargs_lens_light: list of keyword arguments corresponding to different lens light surface brightness profiles
         :param kwargs_ps: keyword arguments corresponding to "other" parameters, such as external shear and point source image positions
         :param unconvolved: bool, if True, computes components without convolution kernel (will not work for point sources)
+        :param sparse_format: bool, if True, returns the response matrix as a scipy.sparse CSR matrix with the rows
+         restricted to the support of each component
         :return: response matrix (m x n)
         """
         x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
+        # response of lensed source profile
+        A_source = self._response_rows(
+            "source",
+            sparse_format,
+            kwargs_source,
+            [kwargs_lens, kwargs_extinction, kwargs_special, unconvolved],
+            self._source_response,
+            x_grid,
+            y_grid,
+            kwargs_lens,
+            kwargs_source,
+            kwargs_extinction,
+            kwargs_special,
+            unconvolved,
+        )
+        # response of deflector light profile (or any other un-lensed extended components)
+        A_lens_light = self._response_rows(
+            "lens_light",
+            sparse_format,
+            kwargs_lens_light,
+            [unconvolved],
+            self._lens_light_response,
+            x_grid,
+            y_grid,
+            kwargs_lens_light,
+            unconvolved,
+        )
+        # response of point sources
+        if self.PointSource.lens_model_dependent is True:
+            kwargs_ps_dependent = [kwargs_lens, kwargs_special]
+        else:
+            # only the astrometric corrections of kwargs_special are applied
+            kwargs_ps_dependent = [
+                _select_kwargs(kwargs_special, ["delta_x_image", "delta_y_image"])
+            ]
+        A_point_source = self._response_rows(
+            "point_source",
+            sparse_format,
+            kwargs_ps,
+            kwargs_ps_dependent,
+            self._point_source_response,
+            kwargs_ps,
+            kwargs_lens,
+            kwargs_special,
+        )
+        if sparse_format is True:
+            A = sparse.vstack([A_source, A_lens_light, A_point_source], format="csr")
+        else:
+            A = np.concatenate([A_source, A_lens_light, A_point_source], axis=0)
+        return A * self._flux_scaling
+
+    def _response_rows(
+        self,
+        component,
+        sparse_format,
+        kwargs_component,
+        kwargs_dependent,
+        response_function,
+        *args
+    ):
+        """Evaluates the rows of the linear response matrix of a model component. If the
+        linear response cache is turned on (kwargs_numerics 'linear_response_cache'), the
+        rows of the previous call are returned when none of the (non-linear) keyword
+        arguments the component depends on have changed.
+
+        :param component: string, name of the model component ('source', 'lens_light',
+            'point_source')
+        :param sparse_format: bool, if True, returns the rows as a scipy.sparse CSR matrix
+        :param kwargs_component: keyword argument list of the light or point source
+            model of the component (its linear amplitudes are ignored)
+        :param kwargs_dependent: list of further keyword arguments (or keyword argument
+            lists) the response of the component depends on, compared in full
+        :param response_function: function computing the response rows with args
+        :param args: arguments of response_function
+        :return: 2d array (num_param, num_data_evaluate) of the response rows
+        """
+        if self._linear_response_cache is False:
+            return response_function(*args, sparse_format=sparse_format)
+        key = [_strip_linear_kwargs(kwargs_component), kwargs_dependent]
+        if component in self._response_cache:
+            key_cached, rows = self._response_cache[component]
+            if util.kwargs_equal(key, key_cached):
+                return _rows_format(rows, sparse_format)
+        rows = response_function(*args, sparse_format=sparse_format)
+        self._response_cache[component] = (copy.deepcopy(key), rows)
+        return rows
+
+    def reset_linear_response_cache(self):
+        """Deletes the cached rows of the linear response matrix.
+
+        :return: None
+        """
+        self._response_cache = {}
+
+    def _source_response(
+        self,
+        x_grid,
+        y_grid,
+        kwargs_lens,
+        kwargs_source,
+        kwargs_extinction,
+        kwargs_special,
+        unconvolved,
+        sparse_format=False,
+    ):
+        """Linear response of the lensed source light components.
 
+        :param x_grid: image plane coordinates being evaluated
+        :param y_grid: image plane coordinates being evaluated
+        :param sparse_format: bool, if True, returns the rows as a scipy.sparse CSR
+            matrix
+        :return: 2d array (n_source, num_data_evaluate)
+        """
         source_light_response, n_source = self.source_mapping.image_flux_split(
             x_grid, y_grid, kwargs_lens, kwargs_source, kwargs_special
         )
+        if n_source == 0:
+            return self._empty_rows(sparse_format)
         extinction = self._extinction.extinction(
             x_grid,
             y_grid,
             kwargs_extinction=kwargs_extinction,
             kwargs_special=kwargs_special,
         )
-        lens_light_response, n_lens_light = self.LensLightModel.functions_split(
-            x_grid, y_grid, kwargs_lens_light
+        return self._extended_response(
+            source_light_response, extinction, unconvolved, sparse_format
         )
 
-        ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(
-            kwargs_ps, kwargs_lens, kwargs_special, with_amp=False
+    def _lens_light_response(
+        self, x_grid, y_grid, kwargs_lens_light, unconvolved, sparse_format=False
+    ):
+        """Linear response of the deflector light (or any other un-lensed extended)
+        components.
+
+        :param x_grid: image plane coordinates being evaluated
+        :param y_grid: image plane coordinates being evaluated
+        :param sparse_format: bool, if True, returns the rows as a scipy.sparse CSR
+            matrix
+        :return: 2d array (n_lens_light, num_data_evaluate)
+        """
+        with timing_util.stage("lens_light"):
+            lens_light_response, n_lens_light = self.LensLightModel.functions_split(
+                x_grid, y_grid, kwargs_lens_light
+            )
+        if n_lens_light == 0:
+            return self._empty_rows(sparse_format)
+        return self._extended_response(
+            lens_light_response, 1, unconvolved, sparse_format
         )
-        num_param = n_points + n_lens_light + n_source
-
-        num_response = self.num_data_evaluate
-        A = np.zeros((num_param, num_response))
-        n = 0
-        # response of lensed source profile
-        for i in range(0, n_source):
-            image = source_light_response[i]
 
+    def _extended_response(self, response, extinction, unconvolved, sparse_format):
+        """Convolved and masked response rows of extended basis functions. In the
+        sparse format, the basis functions are convolved in blocks and only the
+        support of each row is kept, such that the dense response matrix is never
+        built.
+
+        :param response: list of the basis functions evaluated on the (supersampled)
+            coordinates
+        :param extinction: extinction factor on the coordinates
+        :param unconvolved: bool, if True, the basis functions are not convolved
+        :param sparse_format: bool, if True, returns the rows as a scipy.sparse CSR
+            matrix
+        :return: 2d array (n_basis, num_data_evaluate)
+        """
+        block_size = _SPARSE_BLOCK_SIZE if sparse_format is True else len(response)
+        blocks = []
+        for i in range(0, len(response), block_size):
+            images = np.array(
+                response[i : i + block_size], dtype=self.ImageNumerics.dtype
+            )
             # multiply with primary beam before convolution
             if self._pb is not None:
-                image *= self._pb_1d
+                images *= self._pb_1d
+            images *= extinction
+            # all basis functions of a block are convolved in a batched convolution
+            images = self.ImageNumerics.re_size_convolve_stack(
+                images, unconvolved=unconvolved
+            )
+            rows = np.nan_to_num(self._image_stack2array_masked(images), copy=False)
+            if sparse_format is False:
+                return rows
+            blocks.append(_csr_from_rows(rows, self.num_data_evaluate))
+        return sparse.vstack(blocks, format="csr")
+
+    def _point_source_response(
+        self, kwargs_ps, kwargs_lens, kwargs_special, sparse_format=False
+    ):
+        """Linear response of the point sources.
 
-            image *= extinction
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
-        # response of deflector light profile (or any other un-lensed extended components)
-        for i in range(0, n_lens_light):
-            image = lens_light_response[i]
+        :param sparse_format: bool, if True, returns the rows as a scipy.sparse CSR
+            matrix built from the pixels covered by each point source
+        :return: 2d array (n_points, num_data_evaluate)
+        """
+        with timing_util.stage("point_source"):
+            ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(
+                kwargs_ps, kwargs_lens, kwargs_special, with_amp=False
+            )
+            if sparse_format is True:
+                A = []
+            else:
+                A = np.zeros(
+                    (n_points, self.num_data_evaluate), dtype=self.ImageNumerics.dtype
+                )
+            for i in range(0, n_points):
+                # raise warnings when primary beam is attempted to be applied for point sources
+                if self._pb is not None:
+                    raise Warning(
+                        "Antenna primary beam does not apply to point sources!"
+                    )
 
-            # multiply with primary beam before convolution
-            if self._pb is not None:
-                image *= self._pb_1d
+                image = self.ImageNumerics.point_source_rendering(
+                    ra_pos[i], dec_pos[i], amp[i]
+                )
+                row = np.nan_to_num(self.image2array_masked(image), copy=False)
+                if sparse_format is True:
+                    A.append(row.astype(self.ImageNumerics.dtype, copy=False))
+                else:
+                    A[i, :] = row
+        if sparse_format is True:
+            return _csr_from_rows(A, self.num_data_evaluate)
+        return A
 
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
-        # response of point sources
-        for i in range(0, n_points):
-            # raise warnings when primary beam is attempted to be applied for point sources
-            if self._pb is not None:
-                raise Warning("Antenna primary beam does not apply to point sources!")
+    def _empty_rows(self, sparse_format):
+        """
 
-            image = self.ImageNumerics.point_source_rendering(
-                ra_pos[i], dec_pos[i], amp[i]
-            )
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
-        return A * self._flux_scaling
+        :param sparse_format: bool, if True, returns a scipy.sparse CSR matrix
+        :return: response rows without basis functions (0, num_data_evaluate)
+        """
+        rows = np.zeros((0, self.num_data_evaluate), dtype=self.ImageNumerics.dtype)
+        return _rows_format(rows, sparse_format)
 
     def update_linear_kwargs(
         self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
@@ -715,6 +1015,28 @@ class ImageLinearFit(ImageModel):
         """
         self.Data = data_class
         self.ImageNumerics._PixelGrid = data_class
+        self.reset_linear_response_cache()
+        self.reset_ray_shooting_cache()
+
+    def update_psf(self, psf_class):
+        """Update the instance of the class with a new instance of PSF() with a
+        potentially different point spread function.
+
+        :param psf_class:
+        :return: no return. Class is updated.
+        """
+        super(ImageLinearFit, self).update_psf(psf_class)
+        self.reset_linear_response_cache()
+
+    def update_numerics(self, kwargs_numerics):
+        """Updates the numerical settings of the image computation.
+
+        :param kwargs_numerics: keyword arguments of the numerics (see NumericsSubFrame
+            class for options) to be changed, all others are kept
+        :return: no return. Class is updated.
+        """
+        super(ImageLinearFit, self).update_numerics(kwargs_numerics)
+        self.reset_linear_response_cache()
 
     def image2array_masked(self, image):
         """Returns 1d array of values in image that are not masked out for the
@@ -723,6 +1045,14 @@ class ImageLinearFit(ImageModel):
         array = util.image2array(image)
         return array[self._mask1d]
 
+    def _image_stack2array_masked(self, images):
+        """Same as image2array_masked() for a stack of images.
+
+        :param images: 3d numpy array (n_images, nx, ny) of full images
+        :return: 2d array (n_images, n_data_evaluate)
+        """
+        return np.reshape(images, (len(images), -1))[:, self._mask1d]
+
     def array_masked2image(self, array):
         """
 
@@ -745,7 +1075,8 @@ class ImageLinearFit(ImageModel):
         :param kwargs_special: special parameter keyword arguments
         :return: 2d array corresponding to the pixels in terms of variance in noise
         """
-        return self._error_map_psf(kwargs_lens, kwargs_ps, kwargs_special)
+        with timing_util.stage("error_map"):
+            return self._error_map_psf(kwargs_lens, kwargs_ps, kwargs_special)
 
     def _error_map_psf(self, kwargs_lens, kwargs_ps, kwargs_special=None):
         """Map of image with error terms (sigma**2) expected from inaccuracies in the
@@ -989,3 +1320,69 @@ class ImageLinearFit(ImageModel):
         model = [clean_model, dirty_model]
 
         return model, param_amps
+
+
+def _rows_format(rows, sparse_format):
+    """Converts response rows into a scipy.sparse CSR matrix or a dense array.
+
+    :param rows: 2d array or scipy.sparse matrix
+    :param sparse_format: bool, if True, returns a CSR matrix, otherwise a numpy array
+    :return: rows in the requested format
+    """
+    if sparse_format is True:
+        if sparse.issparse(rows) and rows.format == "csr":
+            return rows
+        return sparse.csr_matrix(rows)
+    if sparse.issparse(rows):
+        return rows.toarray()
+    return rows
+
+
+def _csr_from_rows(rows, num_data):
+    """CSR matrix from dense response rows keeping the support (non-zero pixels) of
+    each row only.
+
+    :param rows: 2d array or list of 1d arrays of the rows
+    :param num_data: number of columns
+    :return: scipy.sparse CSR matrix (len(rows), num_data)
+    """
+    indices = [np.flatnonzero(row) for row in rows]
+    data = [row[index] for row, index in zip(rows, indices)]
+    indptr = np.zeros(len(indices) + 1, dtype=int)
+    indptr[1:] = np.cumsum([len(index) for index in indices])
+    if len(indices) == 0:
+        return sparse.csr_matrix((0, num_data))
+    return sparse.csr_matrix(
+        (np.concatenate(data), np.concatenate(indices), indptr),
+        shape=(len(indices), num_data),
+    )
+
+
+def _strip_linear_kwargs(kwargs):
+    """Copy of a (nested) structure of keyword arguments without the linear amplitude
+    parameters.
+
+    :param kwargs: keyword arguments, list of keyword arguments or nested lists thereof
+    :return: same structure without the keys in _LINEAR_KWARGS
+    """
+    if isinstance(kwargs, dict):
+        return {
+            key: _strip_linear_kwargs(value)
+            for key, value in kwargs.items()
+            if key not in _LINEAR_KWARGS
+        }
+    if isinstance(kwargs, (list, tuple)):
+        return [_strip_linear_kwargs(value) for value in kwargs]
+    return kwargs
+
+
+def _select_kwargs(kwargs, keys):
+    """Subset of a keyword argument dictionary.
+
+    :param kwargs: keyword arguments or None
+    :param keys: list of keys to select
+    :return: keyword arguments with only the keys present in kwargs and keys
+    """
+    if kwargs is None:
+        return {}
+    return {key: kwargs[key] for key in keys if key in kwargs}
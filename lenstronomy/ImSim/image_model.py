@@ -1,12 +1,19 @@
 __author__ = "sibirrer"
 
 from lenstronomy.ImSim.Numerics.numerics_subframe import NumericsSubFrame
+from lenstronomy.ImSim.Numerics.numerics import Numerics
+from lenstronomy.ImSim.Numerics.grid import RegularGrid
+from lenstronomy.ImSim.Numerics.adaptive_numerics import (
+    adaptive_supersampled_indexes,
+    adaptive_supersampling_kernel_size,
+)
 from lenstronomy.ImSim.image2source_mapping import Image2SourceMapping
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.PointSource.point_source import PointSource
 from lenstronomy.ImSim.differential_extinction import DifferentialExtinction
 from lenstronomy.Util import util
+from lenstronomy.Util import timing_util
 
 import numpy as np
 
@@ -36,7 +43,15 @@ class ImageModel(object):
         :param source_model_class: instance of LightModel() class describing the source parameters
         :param lens_light_model_class: instance of LightModel() class describing the lens light parameters
         :param point_source_class: instance of PointSource() class describing the point sources
-        :param kwargs_numerics: keyword arguments with various numeric description (see ImageNumerics class for options)
+        :param kwargs_numerics: keyword arguments with various numeric description (see ImageNumerics class for options).
+         In addition, 'linear_response_cache' (bool, default False) re-uses the rows of the linear response matrix of
+         the model components (source, lens light, point sources) whose non-linear keyword arguments did not change
+         since the previous call. 'sparse_linear_solver' (bool, default False) solves the linear inversion with a
+         sparse (CSR) response matrix and a Cholesky decomposition of the normal equations. With 'dtype': 'float32',
+         the surface brightness evaluations, convolutions and the linear response matrix are computed in single
+         precision while the linear inversion and the likelihood are computed in double precision.
+         'ray_shooting_cache' (int, default 0) keeps the ray-shooting results of the last N different lens model
+         keyword arguments in memory (e.g. to speed up the PSF iteration with fixed lens model).
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
          (see SLITronomy documentation)
         """
@@ -52,6 +67,14 @@ class ImageModel(object):
         self.PSF.set_pixel_size(self.Data.pixel_width)
         if kwargs_numerics is None:
             kwargs_numerics = {}
+        kwargs_numerics = kwargs_numerics.copy()
+        # options of the linear solver (ImageLinearFit), not passed to the Numerics class
+        self._linear_response_cache = kwargs_numerics.pop(
+            "linear_response_cache", False
+        )
+        self._sparse_linear_solver = kwargs_numerics.pop("sparse_linear_solver", False)
+        # option of the ray-shooting (Image2SourceMapping)
+        ray_shooting_cache = kwargs_numerics.pop("ray_shooting_cache", 0)
         self.ImageNumerics = NumericsSubFrame(
             pixel_grid=self.Data, psf=self.PSF, **kwargs_numerics
         )
@@ -111,7 +134,9 @@ class ImageModel(object):
             self.source_mapping = None  # handled with pixelated operator
         else:
             self.source_mapping = Image2SourceMapping(
-                lens_model=lens_model_class, source_model=source_model_class
+                lens_model=lens_model_class,
+                source_model=source_model_class,
+                ray_shooting_cache=ray_shooting_cache,
             )
 
         self._pb = data_class.primary_beam
@@ -130,6 +155,14 @@ class ImageModel(object):
         self.PointSource.delete_lens_model_cache()
         self.PointSource.set_save_cache(cache)
 
+    def reset_ray_shooting_cache(self):
+        """Deletes the cached ray-shooting results of the source mapping.
+
+        :return: None
+        """
+        if self.source_mapping is not None:
+            self.source_mapping.reset_ray_shooting_cache()
+
     def update_psf(self, psf_class):
         """Update the instance of the class with a new instance of PSF() with a
         potentially different point spread function.
@@ -143,6 +176,154 @@ class ImageModel(object):
             pixel_grid=self.Data, psf=self.PSF, **self._kwargs_numerics
         )
 
+    def update_numerics(self, kwargs_numerics):
+        """Updates the numerical settings of the image computation.
+
+        :param kwargs_numerics: keyword arguments of the numerics (see NumericsSubFrame
+            class and the options of ImageModel) to be changed, all others are kept
+        :return: no return. Class is updated.
+        """
+        kwargs_numerics = kwargs_numerics.copy()
+        # options of the linear solver and the ray-shooting, as in __init__()
+        if "linear_response_cache" in kwargs_numerics:
+            self._linear_response_cache = kwargs_numerics.pop("linear_response_cache")
+        if "sparse_linear_solver" in kwargs_numerics:
+            self._sparse_linear_solver = kwargs_numerics.pop("sparse_linear_solver")
+        if "ray_shooting_cache" in kwargs_numerics:
+            ray_shooting_cache = kwargs_numerics.pop("ray_shooting_cache")
+            if self.source_mapping is not None:
+                self.source_mapping.set_ray_shooting_cache(ray_shooting_cache)
+        self._kwargs_numerics = dict(self._kwargs_numerics, **kwargs_numerics)
+        self.ImageNumerics = NumericsSubFrame(
+            pixel_grid=self.Data, psf=self.PSF, **self._kwargs_numerics
+        )
+
+    def adaptive_supersampling_numerics(
+        self,
+        tolerance,
+        supersampling_factor=3,
+        kwargs_lens=None,
+        kwargs_source=None,
+        kwargs_lens_light=None,
+        kwargs_extinction=None,
+        kwargs_special=None,
+    ):
+        """Selects the pixels to be supersampled in compute_mode='adaptive' for a trial
+        model. Pixels are supersampled when the flux of the model evaluated at the pixel
+        center deviates by more than the tolerance from the flux averaged over the
+        supersampled sub-pixels. The supersampling_kernel_size is chosen as the smallest
+        size for which the convolved model deviates by less than the tolerance from the
+        one with the full supersampled PSF kernel.
+
+        :param tolerance: float, maximum tolerated flux error per pixel (in units of the
+            image)
+        :param supersampling_factor: int, factor of higher resolution sub-pixel sampling
+        :param kwargs_lens: list of keyword arguments of the lens model
+        :param kwargs_source: list of keyword arguments of the source light model
+        :param kwargs_lens_light: list of keyword arguments of the lens light model
+        :param kwargs_extinction: list of keyword arguments of the extinction model
+        :param kwargs_special: keyword arguments of the special parameters
+        :return: keyword arguments of the numerics to be updated (e.g. with
+            update_numerics())
+        """
+        if self._pixelbased_bool is True:
+            raise ValueError(
+                "adaptive supersampling is not supported for pixel-based light models."
+            )
+        image_low_res, _ = self._surface_brightness_grid(
+            1,
+            kwargs_lens,
+            kwargs_source,
+            kwargs_lens_light,
+            kwargs_extinction,
+            kwargs_special,
+        )
+        _, image_high_res = self._surface_brightness_grid(
+            supersampling_factor,
+            kwargs_lens,
+            kwargs_source,
+            kwargs_lens_light,
+            kwargs_extinction,
+            kwargs_special,
+        )
+        supersampled_indexes = adaptive_supersampled_indexes(
+            image_low_res, image_high_res, tolerance
+        )
+        kwargs_numerics = {
+            "compute_mode": "adaptive",
+            "supersampling_factor": supersampling_factor,
+            "supersampled_indexes": supersampled_indexes,
+            "supersampling_convolution": bool(np.any(supersampled_indexes)),
+        }
+        if self.PSF.psf_type == "PIXEL" and np.any(supersampled_indexes):
+            kernel_super = self.PSF.kernel_point_source_supersampled(
+                supersampling_factor
+            )
+            kernel_super = Numerics._supersampling_cut_kernel(
+                kernel_super,
+                self._kwargs_numerics.get("convolution_kernel_size", None),
+                supersampling_factor,
+            )
+            kwargs_numerics["supersampling_kernel_size"] = (
+                adaptive_supersampling_kernel_size(
+                    kernel_super,
+                    supersampling_factor,
+                    image_high_res,
+                    supersampled_indexes,
+                    tolerance,
+                    compute_indexes=self._kwargs_numerics.get("compute_indexes", None),
+                )
+            )
+        return kwargs_numerics
+
+    def _surface_brightness_grid(
+        self,
+        supersampling_factor,
+        kwargs_lens=None,
+        kwargs_source=None,
+        kwargs_lens_light=None,
+        kwargs_extinction=None,
+        kwargs_special=None,
+    ):
+        """Unconvolved flux of the source and lens light evaluated on a regular
+        (supersampled) grid of the full image.
+
+        :param supersampling_factor: int, factor of higher resolution sub-pixel sampling
+        :return: 2d array of the image, 2d array of the supersampled image (None if
+            supersampling_factor=1)
+        """
+        nx, ny = self.Data.num_pixel_axes
+        ra_at_xy_0, dec_at_xy_0 = self.Data.radec_at_xy_0
+        grid = RegularGrid(
+            nx,
+            ny,
+            self.Data.transform_pix2angle,
+            ra_at_xy_0,
+            dec_at_xy_0,
+            supersampling_factor=supersampling_factor,
+        )
+        ra_grid, dec_grid = grid.coordinates_evaluate
+        flux = np.zeros_like(ra_grid)
+        if len(self.SourceModel.profile_type_list) > 0 and kwargs_source is not None:
+            flux += self.source_mapping.image_flux_joint(
+                ra_grid,
+                dec_grid,
+                kwargs_lens,
+                kwargs_source,
+                kwargs_special=kwargs_special,
+            ) * self._extinction.extinction(
+                ra_grid,
+                dec_grid,
+                kwargs_extinction=kwargs_extinction,
+                kwargs_special=kwargs_special,
+            )
+        if kwargs_lens_light is not None:
+            flux += self.LensLightModel.surface_brightness(
+                ra_grid, dec_grid, kwargs_lens_light
+            )
+        flux *= self.Data.pixel_width**2 * self._flux_scaling
+        return grid.flux_array2image_low_high(flux)
+
     def source_surface_brightness(
         self,
         kwargs_source,
@@ -410,9 +591,10 @@ class ImageModel(object):
         :return: 2d array of surface brightness pixels
         """
         ra_grid, dec_grid = self.ImageNumerics.coordinates_evaluate
-        lens_light = self.LensLightModel.surface_brightness(
-            ra_grid, dec_grid, kwargs_lens_light, k=k
-        )
+        with timing_util.stage("lens_light"):
+            lens_light = self.LensLightModel.surface_brightness(
+                ra_grid, dec_grid, kwargs_lens_light, k=k
+            )
 
         # multiply with primary beam before convolution
         if self._pb is not None:
@@ -484,20 +666,21 @@ class ImageModel(object):
         point_source_image = np.zeros((self.Data.num_pixel_axes))
         if unconvolved or self.PointSource is None:
             return point_source_image
-        ra_pos, dec_pos, amp = self.PointSource.point_source_list(
-            kwargs_ps, kwargs_lens=kwargs_lens, k=k
-        )
-        # raise warnings when primary beam is attempted to be applied to point sources.
-        if len(ra_pos) != 0 and self._pb is not None:
-            raise Warning(
-                "Antenna primary beam does not apply to point sources in ImageModel!"
+        with timing_util.stage("point_source"):
+            ra_pos, dec_pos, amp = self.PointSource.point_source_list(
+                kwargs_ps, kwargs_lens=kwargs_lens, k=k
+            )
+            # raise warnings when primary beam is attempted to be applied to point sources.
+            if len(ra_pos) != 0 and self._pb is not None:
+                raise Warning(
+                    "Antenna primary beam does not apply to point sources in ImageModel!"
+                )
+            ra_pos, dec_pos = self._displace_astrometry(
+                ra_pos, dec_pos, kwargs_special=kwargs_special
+            )
+            point_source_image += self.ImageNumerics.point_source_rendering(
+                ra_pos, dec_pos, amp
             )
-        ra_pos, dec_pos = self._displace_astrometry(
-            ra_pos, dec_pos, kwargs_special=kwargs_special
-        )
-        point_source_image += self.ImageNumerics.point_source_rendering(
-            ra_pos, dec_pos, amp
-        )
         return point_source_image * self._flux_scaling
 
     def image(
@@ -595,6 +778,122 @@ class ImageModel(object):
             )
         return model
 
+    def image_batch(
+        self,
+        kwargs_lens_list=None,
+        kwargs_source_list=None,
+        kwargs_lens_light_list=None,
+        kwargs_ps_list=None,
+        kwargs_extinction_list=None,
+        kwargs_special_list=None,
+        unconvolved=False,
+        source_add=True,
+        lens_light_add=True,
+        point_source_add=True,
+        max_elements=2**14,
+    ):
+        """Images of N realisations of the model parameters with the same model
+        configuration. With a single lens and source plane, the ray-shooting and the
+        surface brightness of the profiles supporting parameter arrays are evaluated
+        vectorized over the realisations on (N, n_coordinates) arrays (see
+        Image2SourceMapping.image_flux_joint_batch() and
+        LightModel.surface_brightness_batch()), all other models are evaluated for each
+        realisation separately. The N flux arrays are convolved in a single batched
+        operation (see re_size_convolve_stack()). The realisations are processed in
+        chunks of at most max_elements pixels, such that the intermediate arrays remain
+        small (larger arrays are slower to allocate and to access than the few per
+        realisation arrays they replace).
+
+        :param kwargs_lens_list: list of N kwargs_lens (or None)
+        :param kwargs_source_list: list of N kwargs_source (or None)
+        :param kwargs_lens_light_list: list of N kwargs_lens_light (or None)
+        :param kwargs_ps_list: list of N kwargs_ps (or None)
+        :param kwargs_extinction_list: list of N kwargs_extinction (or None)
+        :param kwargs_special_list: list of N kwargs_special (or None)
+        :param unconvolved: if True: returns the unconvolved light distribution (prefect
+            seeing)
+        :param source_add: if True, compute source, otherwise without
+        :param lens_light_add: if True, compute lens light, otherwise without
+        :param point_source_add: if True, add point sources, otherwise without
+        :param max_elements: maximum number of pixels (number of realisations x number
+            of evaluated coordinates) computed together
+        :return: 3d array (N, nx, ny) of surface brightness pixels of the simulations
+        """
+        if self._pixelbased_bool is True:
+            raise ValueError(
+                "batched image simulation is not supported for pixel-based light models."
+            )
+        kwargs_batch = util.batch_kwargs(
+            kwargs_lens_list,
+            kwargs_source_list,
+            kwargs_lens_light_list,
+            kwargs_ps_list,
+            kwargs_extinction_list,
+            kwargs_special_list,
+        )
+        source_add = source_add and len(self.SourceModel.profile_type_list) > 0
+        lens_light_add = (
+            lens_light_add and len(self.LensLightModel.profile_type_list) > 0
+        )
+        ra_grid, dec_grid = self.ImageNumerics.coordinates_evaluate
+        chunk_size = max(1, max_elements // len(ra_grid))
+        models = []
+        for n in range(0, len(kwargs_batch), chunk_size):
+            (
+                kwargs_lens_chunk,
+                kwargs_source_chunk,
+                kwargs_lens_light_chunk,
+                _,
+                kwargs_extinction_chunk,
+                kwargs_special_chunk,
+            ) = zip(*kwargs_batch[n : n + chunk_size])
+            flux_arrays = np.zeros(
+                (len(kwargs_lens_chunk), len(ra_grid)), dtype=self.ImageNumerics.dtype
+            )
+            if source_add is True:
+                source_light = self.source_mapping.image_flux_joint_batch(
+                    ra_grid,
+                    dec_grid,
+                    kwargs_lens_chunk,
+                    kwargs_source_chunk,
+                    kwargs_special_batch=kwargs_special_chunk,
+                )
+                for i in range(len(source_light)):
+                    source_light[i] *= self._extinction.extinction(
+                        ra_grid,
+                        dec_grid,
+                        kwargs_extinction=kwargs_extinction_chunk[i],
+                        kwargs_special=kwargs_special_chunk[i],
+                    )
+                flux_arrays += source_light
+            if lens_light_add is True:
+                x = np.broadcast_to(ra_grid, flux_arrays.shape)
+                y = np.broadcast_to(dec_grid, flux_arrays.shape)
+                with timing_util.stage("lens_light"):
+                    flux_arrays += self.LensLightModel.surface_brightness_batch(
+                        x, y, kwargs_lens_light_chunk
+                    )
+            # multiply with primary beam before convolution
+            if self._pb is not None:
+                flux_arrays *= self._pb_1d
+            flux_arrays *= self._flux_scaling
+            models.append(
+                self.ImageNumerics.re_size_convolve_stack(
+                    flux_arrays, unconvolved=unconvolved
+                )
+            )
+        models = np.concatenate(models)
+        if point_source_add is True:
+            for i, kwargs in enumerate(kwargs_batch):
+                kwargs_lens, _, _, kwargs_ps, _, kwargs_special = kwargs
+                models[i] += self._point_source(
+                    kwargs_ps,
+                    kwargs_lens,
+                    kwargs_special=kwargs_special,
+                    unconvolved=unconvolved,
+                )
+        return models
+
     def extinction_map(self, kwargs_extinction=None, kwargs_special=None):
         """Differential extinction per pixel.
 
@@ -84,15 +84,8 @@ class MassSlice(object):
         self._mass_map = mass_map
         self._grid_spacing = grid_spacing
         self._redshift = redshift
-        (
-            self._f_x_mass,
-            self._f_y_mass,
-        ) = convergence_integrals.deflection_from_kappa_grid(
-            self._mass_map, self._grid_spacing
-        )
-        self._f_mass = convergence_integrals.potential_from_kappa_grid(
-            self._mass_map, self._grid_spacing
-        )
+        solver = convergence_integrals.KappaGridSolver(nx, self._grid_spacing)
+        self._f_mass, self._f_x_mass, self._f_y_mass = solver.solve(self._mass_map)
         x_grid, y_grid = util.make_grid(
             numPix=len(self._mass_map), deltapix=self._grid_spacing
         )
@@ -401,8 +401,13 @@ class MultiPlane(object):
         diff=0.00000001,
         check_convention=True,
     ):
-        """Computes the hessian components f_xx, f_yy, f_xy from f_x and f_y with
-        numerical differentiation.
+        """Computes the hessian components f_xx, f_yy, f_xy of the multi-plane lens
+        mapping with numerical differentiation of f_x and f_y. With diff=None, the
+        derivatives of the ray positions are instead propagated together with the rays
+        using the Hessians of the deflectors at each plane (exact up to the accuracy of
+        the profile Hessians). This is faster when the profile Hessians are cheap
+        compared to their deflection angles (e.g. SIS), and slower otherwise (e.g.
+        NFW).
 
         :param theta_x: x-position (preferentially arcsec)
         :type theta_x: numpy array
@@ -410,7 +415,8 @@ class MultiPlane(object):
         :type theta_y: numpy array
         :param kwargs_lens: list of keyword arguments of lens model parameters matching
             the lens model classes
-        :param diff: numerical differential step (float)
+        :param diff: numerical differential step (float), or None for the propagated
+            Jacobian
         :param check_convention: boolean, if True goes through the lens model list and
             checks whether the positional conventions are satisfied.
         :return: f_xx, f_xy, f_yx, f_yy
@@ -418,6 +424,21 @@ class MultiPlane(object):
         self._check_raise(k=k)
         if check_convention and not self.ignore_observed_positions:
             kwargs_lens = self._convention(kwargs_lens)
+        if diff is None:
+            _, _, _, _, jacobian = (
+                self._multi_plane_base.ray_shooting_partial_comoving_jacobian(
+                    np.zeros_like(theta_x, dtype=float),
+                    np.zeros_like(theta_y, dtype=float),
+                    theta_x,
+                    theta_y,
+                    z_start=0,
+                    z_stop=self._z_source,
+                    kwargs_lens=kwargs_lens,
+                    T_ij_start=self._T_ij_start,
+                    T_ij_end=self._T_ij_stop,
+                )
+            )
+            return self._jacobian2hessian(jacobian, self._T_z_source)
 
         alpha_ra, alpha_dec = self.alpha(
             theta_x, theta_y, kwargs_lens, check_convention=False
@@ -451,13 +472,31 @@ class MultiPlane(object):
         :param theta_y: angular position and direction of the ray
         :param kwargs_lens: list of keyword arguments of lens model parameters matching
             the lens model classes
-        :param diff: numerical differential step (float)
+        :param diff: numerical differential step (float), or None for the propagated
+            Jacobian, see hessian()
         :return: f_xx, f_xy, f_yx, f_yy
         """
 
         T_0z1 = self._multi_plane_base._cosmo_bkg.T_xy(0, z1)
         x = theta_x * T_0z1
         y = theta_x * T_0z1
+        if diff is None:
+            if not self.ignore_observed_positions:
+                kwargs_lens = self._convention(kwargs_lens)
+            _, _, _, _, jacobian = (
+                self._multi_plane_base.ray_shooting_partial_comoving_jacobian(
+                    x,
+                    y,
+                    theta_x,
+                    theta_y,
+                    z_start=z1,
+                    z_stop=z2,
+                    kwargs_lens=kwargs_lens,
+                    include_z_start=False,
+                )
+            )
+            T_z1z2 = self._multi_plane_base._cosmo_bkg.T_xy(z1, z2)
+            return self._jacobian2hessian(jacobian, T_z1z2)
         x_s0, y_s0, _, _ = self.ray_shooting_partial_comoving(
             x=x,
             y=y,
@@ -520,6 +559,20 @@ class MultiPlane(object):
         f_yx = dalpha_decra
         return f_xx, f_xy, f_yx, f_yy
 
+    @staticmethod
+    def _jacobian2hessian(jacobian, T_z):
+        """Hessian of the lens mapping from the derivatives of the co-moving position
+        at the end of the ray-tracing with respect to the ray angles.
+
+        :param jacobian: dx/dalpha_x, dx/dalpha_y, dy/dalpha_x, dy/dalpha_y, see
+            MultiPlaneBase.ray_shooting_partial_comoving_jacobian()
+        :param T_z: transverse distance to the end of the ray-tracing (as seen from
+            its start)
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        x_x, x_y, y_x, y_y = jacobian
+        return 1 - x_x / T_z, -x_y / T_z, -y_x / T_z, 1 - y_y / T_z
+
     def co_moving2angle_z1_z2(self, x, y, z1, z2):
         """Computes angle for co-moving distance at z=z2 when seen from z=z1.
 
@@ -546,16 +599,17 @@ class MultiPlane(object):
         theta_y = y / T_z
         return theta_x, theta_y
 
-    def set_static(self, kwargs):
+    def set_static(self, kwargs, cache=None):
         """
 
         :param kwargs: lens model keyword argument list
+        :param cache: None or StaticCache instance, see ProfileListBase.set_static()
         :return: lens model keyword argument list with positional parameters all in flat sky coordinates
         """
 
         kwargs = self.observed2flat_convention(kwargs)
         self.ignore_observed_positions = True
-        return self._multi_plane_base.set_static(kwargs)
+        return self._multi_plane_base.set_static(kwargs, cache=cache)
 
     def set_dynamic(self):
         """
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import numpy as np
 from lenstronomy.Cosmo.background import Background
 from lenstronomy.LensModel.profile_list_base import ProfileListBase
@@ -5,6 +7,10 @@ import lenstronomy.Util.constants as const
 
 __all__ = ["MultiPlaneBase"]
 
+# number of plane schedules (per combination of start and stop redshift) kept per
+# instance
+_PLANE_SCHEDULE_CACHE_SIZE = 32
+
 
 class MultiPlaneBase(ProfileListBase):
     """Multi-plane lensing class.
@@ -96,6 +102,7 @@ class MultiPlaneBase(ProfileListBase):
             self._T_ij_list.append(delta_T)
             self._T_z_list.append(T_z)
             z_before = z_lens
+        self._plane_schedules = OrderedDict()
 
     @property
     def z_source_convention(self):
@@ -119,6 +126,7 @@ class MultiPlaneBase(ProfileListBase):
         """List of transverse angular diameter distances between the observer and the
         lens planes."""
         self._T_z_list = T_z_list
+        self._plane_schedules.clear()
 
     @property
     def T_ij_list(self):
@@ -129,6 +137,7 @@ class MultiPlaneBase(ProfileListBase):
     def T_ij_list(self, T_ij_list):
         """List of transverse angular diameter distances between the lens planes."""
         self._T_ij_list = T_ij_list
+        self._plane_schedules.clear()
 
     def ray_shooting_partial_comoving(
         self,
@@ -173,40 +182,143 @@ class MultiPlaneBase(ProfileListBase):
         alpha_x = np.array(alpha_x)
         alpha_y = np.array(alpha_y)
 
+        planes, T_ij_stop = self._plane_schedule(z_start, z_stop, include_z_start)
+        for n, plane in enumerate(planes):
+            delta_T = plane[0]
+            if n == 0 and T_ij_start is not None:
+                delta_T = T_ij_start
+            x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+            alpha_x, alpha_y = self._add_plane_deflection(
+                x, y, alpha_x, alpha_y, kwargs_lens, plane
+            )
+        if T_ij_end is None:
+            delta_T = T_ij_stop
+        else:
+            delta_T = T_ij_end
+        x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+        return x, y, alpha_x, alpha_y
+
+    def ray_shooting_partial_comoving_jacobian(
+        self,
+        x,
+        y,
+        alpha_x,
+        alpha_y,
+        z_start,
+        z_stop,
+        kwargs_lens,
+        include_z_start=False,
+        T_ij_start=None,
+        T_ij_end=None,
+    ):
+        """Ray-tracing as ray_shooting_partial_comoving() that propagates, along with
+        the rays, the derivatives of the co-moving positions with respect to the ray
+        angles at z_start (the multi-plane magnification recursion, see e.g.
+        https://arxiv.org/abs/1312.1536). The deflectors enter with their Hessians
+        at each plane.
+
+        :param x: co-moving position [Mpc]
+        :param y: co-moving position [Mpc]
+        :param alpha_x: ray angle at z_start [arcsec]
+        :param alpha_y: ray angle at z_start [arcsec]
+        :param z_start: redshift of start of computation
+        :param z_stop: redshift where output is computed
+        :param kwargs_lens: lens model keyword argument list
+        :param include_z_start: bool, see ray_shooting_partial_comoving()
+        :param T_ij_start: see ray_shooting_partial_comoving()
+        :param T_ij_end: see ray_shooting_partial_comoving()
+        :return: co-moving position and angles at redshift z_stop, and the derivatives
+            of the co-moving position at z_stop with respect to the angles at z_start
+            (dx/dalpha_x, dx/dalpha_y, dy/dalpha_x, dy/dalpha_y)
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        alpha_x = np.array(alpha_x, dtype=float)
+        alpha_y = np.array(alpha_y, dtype=float)
+        x, y, alpha_x, alpha_y = np.broadcast_arrays(x, y, alpha_x, alpha_y)
+        x, y, alpha_x, alpha_y = x.copy(), y.copy(), alpha_x.copy(), alpha_y.copy()
+        # derivatives of the positions (x_x = dx/dalpha_x etc.) and of the angles
+        x_x, x_y = np.zeros_like(x), np.zeros_like(x)
+        y_x, y_y = np.zeros_like(x), np.zeros_like(x)
+        a_xx, a_xy = np.ones_like(x), np.zeros_like(x)
+        a_yx, a_yy = np.zeros_like(x), np.ones_like(x)
+
+        planes, T_ij_stop = self._plane_schedule(z_start, z_stop, include_z_start)
+        for n, plane in enumerate(planes):
+            delta_T = plane[0]
+            if n == 0 and T_ij_start is not None:
+                delta_T = T_ij_start
+            x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+            x_x, x_y = self._ray_step_add(x_x, x_y, a_xx, a_xy, delta_T)
+            y_x, y_y = self._ray_step_add(y_x, y_y, a_yx, a_yy, delta_T)
+            f_xx, f_xy, f_yx, f_yy = self._plane_hessian(x, y, kwargs_lens, plane)
+            alpha_x, alpha_y = self._add_plane_deflection(
+                x, y, alpha_x, alpha_y, kwargs_lens, plane
+            )
+            a_xx = a_xx - (f_xx * x_x + f_xy * y_x)
+            a_xy = a_xy - (f_xx * x_y + f_xy * y_y)
+            a_yx = a_yx - (f_yx * x_x + f_yy * y_x)
+            a_yy = a_yy - (f_yx * x_y + f_yy * y_y)
+        if T_ij_end is None:
+            delta_T = T_ij_stop
+        else:
+            delta_T = T_ij_end
+        x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+        x_x, x_y = self._ray_step_add(x_x, x_y, a_xx, a_xy, delta_T)
+        y_x, y_y = self._ray_step_add(y_x, y_y, a_yx, a_yy, delta_T)
+        return x, y, alpha_x, alpha_y, (x_x, x_y, y_x, y_y)
+
+    def _plane_schedule(self, z_start, z_stop, include_z_start=False):
+        """Lens planes traversed by the ray-tracing from z_start to z_stop with the
+        transverse distances between them, kept for the most recent combinations of
+        z_start and z_stop.
+
+        :param z_start: redshift of start of computation
+        :param z_stop: redshift where output is computed
+        :param include_z_start: bool, if True, includes the deflectors at z_start
+        :return: list of planes (transverse distance from the previous plane, transverse
+            distance from the observer, factor from reduced to physical deflection,
+            indices of the lens models) and transverse distance from the last plane to
+            z_stop
+        """
+        key = (z_start, z_stop, include_z_start)
+        schedule = self._plane_schedules.get(key)
+        if schedule is not None:
+            self._plane_schedules.move_to_end(key)
+            return schedule
+        planes = []
         z_lens_last = z_start
-        first_deflector = True
         for i, idex in enumerate(self._sorted_redshift_index):
             z_lens = self._lens_redshift_list[idex]
-
-            if (
+            if not (
                 self._start_condition(include_z_start, z_lens, z_start)
                 and z_lens <= z_stop
             ):
-                if first_deflector is True:
-                    if T_ij_start is None:
-                        if z_start == 0:
-                            delta_T = self._T_ij_list[0]
-                        else:
-                            delta_T = self._cosmo_bkg.T_xy(z_start, z_lens)
-                    else:
-                        delta_T = T_ij_start
-                    first_deflector = False
+                continue
+            if len(planes) > 0 and z_lens == z_lens_last:
+                # same plane as the previous deflector (no propagation in between)
+                planes[-1][3].append(idex)
+                continue
+            if len(planes) == 0:
+                if z_start == 0:
+                    delta_T = self._T_ij_list[0]
                 else:
-                    delta_T = self._T_ij_list[i]
-                x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
-                alpha_x, alpha_y = self._add_deflection(
-                    x, y, alpha_x, alpha_y, kwargs_lens, i
-                )
-                z_lens_last = z_lens
-        if T_ij_end is None:
-            if z_lens_last == z_stop:
-                delta_T = 0
+                    delta_T = self._cosmo_bkg.T_xy(z_start, z_lens)
             else:
-                delta_T = self._cosmo_bkg.T_xy(z_lens_last, z_stop)
+                delta_T = self._T_ij_list[i]
+            planes.append(
+                (delta_T, self._T_z_list[i], self._reduced2physical_factor[i], [idex])
+            )
+            z_lens_last = z_lens
+        if z_lens_last == z_stop:
+            T_ij_stop = 0
         else:
-            delta_T = T_ij_end
-        x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
-        return x, y, alpha_x, alpha_y
+            T_ij_stop = self._cosmo_bkg.T_xy(z_lens_last, z_stop)
+        schedule = (planes, T_ij_stop)
+        self._plane_schedules[key] = schedule
+        if len(self._plane_schedules) > _PLANE_SCHEDULE_CACHE_SIZE:
+            self._plane_schedules.popitem(last=False)
+        return schedule
 
     def ray_shooting_partial(
         self,
@@ -507,6 +619,56 @@ class MultiPlaneBase(ProfileListBase):
         alpha_y_phys = self._reduced2physical_deflection(alpha_y_red, index)
         return alpha_x - alpha_x_phys, alpha_y - alpha_y_phys
 
+    def _add_plane_deflection(self, x, y, alpha_x, alpha_y, kwargs_lens, plane):
+        """Adds the physical deflection angle of all deflectors of a lens plane to the
+        deflection field.
+
+        :param x: co-moving distance at the deflector plane
+        :param y: co-moving distance at the deflector plane
+        :param alpha_x: physical angle (radian) before the deflector plane
+        :param alpha_y: physical angle (radian) before the deflector plane
+        :param kwargs_lens: lens model parameter kwargs
+        :param plane: lens plane, see _plane_schedule()
+        :return: updated physical deflection after deflector plane (in a backwards ray-
+            tracing perspective)
+        """
+        _, T_z, factor, lens_indices = plane
+        theta_x = x / T_z
+        theta_y = y / T_z
+        f_x, f_y = 0, 0
+        for k in lens_indices:
+            f_x_, f_y_ = self.func_list[k].derivatives(
+                theta_x, theta_y, **kwargs_lens[k]
+            )
+            f_x = f_x + f_x_
+            f_y = f_y + f_y_
+        return alpha_x - f_x * factor, alpha_y - f_y * factor
+
+    def _plane_hessian(self, x, y, kwargs_lens, plane):
+        """Derivatives of the physical deflection angle of a lens plane with respect to
+        the co-moving position at the plane.
+
+        :param x: co-moving distance at the deflector plane
+        :param y: co-moving distance at the deflector plane
+        :param kwargs_lens: lens model parameter kwargs
+        :param plane: lens plane, see _plane_schedule()
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        _, T_z, factor, lens_indices = plane
+        theta_x = x / T_z
+        theta_y = y / T_z
+        f_xx, f_xy, f_yx, f_yy = 0, 0, 0, 0
+        for k in lens_indices:
+            f_xx_, f_xy_, f_yx_, f_yy_ = self.func_list[k].hessian(
+                theta_x, theta_y, **kwargs_lens[k]
+            )
+            f_xx = f_xx + f_xx_
+            f_xy = f_xy + f_xy_
+            f_yx = f_yx + f_yx_
+            f_yy = f_yy + f_yy_
+        factor = factor / T_z
+        return f_xx * factor, f_xy * factor, f_yx * factor, f_yy * factor
+
     @staticmethod
     def _start_condition(inclusive, z_lens, z_start):
         """
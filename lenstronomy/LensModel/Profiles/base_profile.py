@@ -1,4 +1,6 @@
-__all__ = ["LensProfileBase"]
+import numpy as np
+
+__all__ = ["LensProfileBase", "finite_difference_jacobian"]
 
 
 class LensProfileBase(object):
@@ -24,8 +26,15 @@ class LensProfileBase(object):
 
     With that, you should be good to go and import and use it for any purpose.
     Further definitions in the class are optional and only used for certain applications (such as kinematics)
+
+    Derivatives of the deflection angles with respect to the parameters of the profile are available with
+    derivatives_jacobian(). By default, they are computed with finite differences. A profile can provide analytic
+    expressions by overwriting _derivatives_jacobian() and exclude discrete parameters in non_differentiable_params.
     """
 
+    # parameters not considered in derivatives_jacobian() (e.g. integer orders)
+    non_differentiable_params = []
+
     def __init__(self, *args, **kwargs):
         self._static = False
 
@@ -60,6 +69,81 @@ class LensProfileBase(object):
             "hessian definition is not defined in the profile you want to execute."
         )
 
+    def derivatives_jacobian(self, x, y, kwargs, param_names=None, step=1e-6):
+        """Derivatives of the deflection angles with respect to the parameters of the
+        profile. Parameters without an analytic expression in the profile are
+        differentiated with central finite differences of derivatives(). The profile
+        must not be static (see set_static()).
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of parameter names to differentiate; if None, all
+            real scalar parameters in kwargs except non_differentiable_params
+        :param step: relative step size of the finite differences (absolute step for
+            parameters with modulus below 1)
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        if param_names is None:
+            param_names = [
+                name
+                for name, value in kwargs.items()
+                if name not in self.non_differentiable_params and _is_real_scalar(value)
+            ]
+        jacobian = self._derivatives_jacobian(x, y, kwargs, param_names)
+        numerical_names = [name for name in param_names if name not in jacobian]
+        if len(numerical_names) > 0:
+            if getattr(self, "_static", False) is True:
+                raise ValueError(
+                    "derivatives with respect to the lens model parameters can not be "
+                    "computed with finite differences for a static profile."
+                )
+            jacobian.update(
+                finite_difference_jacobian(
+                    self.derivatives, x, y, kwargs, numerical_names, step=step
+                )
+            )
+        return jacobian
+
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivatives of the deflection angles with respect to (a subset of)
+        the parameters of the profile. To be overwritten by profiles with analytic
+        expressions, parameters not included in the returned dictionary are evaluated
+        numerically.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        return {}
+
+    def _center_jacobian(
+        self, x, y, kwargs, param_names, center_names=("center_x", "center_y")
+    ):
+        """Derivatives of the deflection angles with respect to the center of the
+        profile, given by the negative Hessian for profiles that only depend on the
+        offset from their center.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :param center_names: names of the x- and y-center parameters
+        :return: dictionary with the requested center parameters
+        """
+        jacobian = {}
+        if center_names[0] in param_names or center_names[1] in param_names:
+            f_xx, f_xy, f_yx, f_yy = self.hessian(x, y, **kwargs)
+            if center_names[0] in param_names:
+                jacobian[center_names[0]] = (-f_xx, -f_yx)
+            if center_names[1] in param_names:
+                jacobian[center_names[1]] = (-f_xy, -f_yy)
+        return jacobian
+
     def density_lens(self, *args, **kwargs):
         """Computes the density at 3d radius r given lens model parameterization. The
         integral in the LOS projection of this quantity results in the convergence
@@ -125,3 +209,45 @@ class LensProfileBase(object):
         :return: no return, deletes pre-computed variables for certain lens models
         """
         pass
+
+
+def finite_difference_jacobian(derivatives, x, y, kwargs, param_names, step=1e-6):
+    """Derivatives of the deflection angles with respect to lens model parameters with
+    central finite differences.
+
+    :param derivatives: function derivatives(x, y, **kwargs) returning the deflection
+        angles
+    :param x: x-coordinate (angle)
+    :param y: y-coordinate (angle)
+    :param kwargs: keyword arguments of the deflection function
+    :param param_names: list of parameter names to differentiate
+    :param step: relative step size (absolute step for parameters with modulus below 1)
+    :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+        alpha_y / d param) as values
+    """
+    jacobian = {}
+    for name in param_names:
+        value = kwargs[name]
+        delta = step * max(1.0, abs(value))
+        kwargs_plus = dict(kwargs)
+        kwargs_minus = dict(kwargs)
+        kwargs_plus[name] = value + delta
+        kwargs_minus[name] = value - delta
+        f_x_plus, f_y_plus = derivatives(x, y, **kwargs_plus)
+        f_x_minus, f_y_minus = derivatives(x, y, **kwargs_minus)
+        jacobian[name] = (
+            (np.asarray(f_x_plus) - f_x_minus) / (2 * delta),
+            (np.asarray(f_y_plus) - f_y_minus) / (2 * delta),
+        )
+    return jacobian
+
+
+def _is_real_scalar(value):
+    """
+
+    :param value: keyword argument value
+    :return: bool, True for (non-boolean) real numbers
+    """
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, (int, float, np.integer, np.floating))
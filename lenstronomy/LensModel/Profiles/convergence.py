@@ -1,5 +1,7 @@
 __author__ = "sibirrer"
 
+import numpy as np
+
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 
@@ -57,3 +59,27 @@ class Convergence(LensProfileBase):
         f_yy = kappa - gamma1
         f_xy = gamma2
         return f_xx, f_xy, f_xy, f_yy
+
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivatives of the deflection angles with respect to all
+        parameters.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        kappa = kwargs["kappa"]
+        x_ = x - kwargs.get("ra_0", 0)
+        y_ = y - kwargs.get("dec_0", 0)
+        zeros = np.zeros_like(x_, dtype=float)
+        jacobian = {}
+        if "kappa" in param_names:
+            jacobian["kappa"] = (x_ + zeros, y_ + zeros)
+        if "ra_0" in param_names:
+            jacobian["ra_0"] = (zeros - kappa, zeros)
+        if "dec_0" in param_names:
+            jacobian["dec_0"] = (zeros, zeros - kappa)
+        return jacobian
@@ -0,0 +1,124 @@
+import numpy as np
+from lenstronomy.Util import numba_util
+
+__all__ = ["cse_set_derivatives", "cse_set_hessian"]
+
+
+@numba_util.jit()
+def cse_set_derivatives(
+    x, y, a_list, s_list, q, cos_phi, sin_phi, center_x, center_y, scale, const
+):
+    """Deflection angles of a set of cored steep ellipsoids (CSE) with a joint center
+    and axis (see CSEMajorAxisSet, Oguri 2021 https://arxiv.org/pdf/2106.11464.pdf).
+    Shift, rotation, the sum over the CSE components and the rotation back are fused in
+    a single loop over the coordinates.
+
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param a_list: 1d array of lensing strengths of the CSE components
+    :param s_list: 1d array of core radii of the CSE components
+    :param q: axis ratio
+    :param cos_phi: cosine of the position angle
+    :param sin_phi: sine of the position angle
+    :param center_x: profile center
+    :param center_y: profile center
+    :param scale: factor applied to the rotated coordinates before the evaluation of
+        the CSE components
+    :param const: normalization of the deflection angles
+    :return: alpha_x, alpha_y
+    """
+    n = len(x)
+    num_cse = len(a_list)
+    f_x = np.empty(n)
+    f_y = np.empty(n)
+    q2 = q**2
+    for i in numba_util.prange(n):
+        dx = x[i] - center_x
+        dy = y[i] - center_y
+        x_ = (dx * cos_phi + dy * sin_phi) * scale
+        y_ = (-dx * sin_phi + dy * cos_phi) * scale
+        x2 = x_**2
+        y2 = y_**2
+        f_x_ = 0.0
+        f_y_ = 0.0
+        for k in range(num_cse):
+            s = s_list[k]
+            psi = np.sqrt(q2 * (s**2 + x2) + y2)
+            Phi = (psi + s) ** 2 + (1 - q2) * x2
+            amp = a_list[k] * q / (s * psi * Phi)
+            f_x_ += amp * x_ * (psi + q2 * s)
+            f_y_ += amp * y_ * (psi + s)
+        f_x[i] = const * (f_x_ * cos_phi - f_y_ * sin_phi)
+        f_y[i] = const * (f_x_ * sin_phi + f_y_ * cos_phi)
+    return f_x, f_y
+
+
+@numba_util.jit()
+def cse_set_hessian(
+    x, y, a_list, s_list, q, cos_phi, sin_phi, center_x, center_y, scale, const
+):
+    """Hessian of a set of cored steep ellipsoids (CSE) with a joint center and axis
+    (equations 21-23 in Oguri 2021), see cse_set_derivatives().
+
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param a_list: 1d array of lensing strengths of the CSE components
+    :param s_list: 1d array of core radii of the CSE components
+    :param q: axis ratio
+    :param cos_phi: cosine of the position angle
+    :param sin_phi: sine of the position angle
+    :param center_x: profile center
+    :param center_y: profile center
+    :param scale: factor applied to the rotated coordinates before the evaluation of
+        the CSE components
+    :param const: normalization of the Hessian
+    :return: f_xx, f_xy, f_yy
+    """
+    n = len(x)
+    num_cse = len(a_list)
+    f_xx = np.empty(n)
+    f_xy = np.empty(n)
+    f_yy = np.empty(n)
+    q2 = q**2
+    cos_2phi = cos_phi**2 - sin_phi**2
+    sin_2phi = 2 * cos_phi * sin_phi
+    for i in numba_util.prange(n):
+        dx = x[i] - center_x
+        dy = y[i] - center_y
+        x_ = (dx * cos_phi + dy * sin_phi) * scale
+        y_ = (-dx * sin_phi + dy * cos_phi) * scale
+        x2 = x_**2
+        y2 = y_**2
+        f__xx = 0.0
+        f__xy = 0.0
+        f__yy = 0.0
+        for k in range(num_cse):
+            s = s_list[k]
+            psi2 = q2 * (s**2 + x2) + y2
+            psi = np.sqrt(psi2)
+            psi3 = psi2 * psi
+            Phi = (psi + s) ** 2 + (1 - q2) * x2
+            amp = a_list[k] * q / (s * Phi)
+            f__xx += amp * (
+                1
+                + q2 * s * (q2 * s**2 + y2) / psi3
+                - 2 * x2 * (psi + q2 * s) ** 2 / (psi2 * Phi)
+            )
+            f__yy += amp * (
+                1 + q2 * s * (s**2 + x2) / psi3 - 2 * y2 * (psi + s) ** 2 / (psi2 * Phi)
+            )
+            f__xy -= (
+                amp
+                * x_
+                * y_
+                * (q2 * s / psi3 + 2 * (psi + q2 * s) * (psi + s) / (psi2 * Phi))
+            )
+        # rotate back
+        kappa = (f__xx + f__yy) / 2.0
+        gamma1_ = (f__xx - f__yy) / 2.0
+        gamma1 = cos_2phi * gamma1_ - sin_2phi * f__xy
+        gamma2 = sin_2phi * gamma1_ + cos_2phi * f__xy
+        f_xx[i] = const * (kappa + gamma1)
+        f_yy[i] = const * (kappa - gamma1)
+        f_xy[i] = const * gamma2
+    return f_xx, f_xy, f_yy
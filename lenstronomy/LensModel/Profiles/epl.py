@@ -63,8 +63,16 @@ class EPL(LensProfileBase):
         "center_y": 100,
     }
 
-    def __init__(self):
-        self.epl_major_axis = EPLMajorAxis()
+    def __init__(self, series_tol=1e-14, max_order=300):
+        """
+
+        :param series_tol: truncation tolerance of the hypergeometric series of the
+            angular dependency of the deflection (see EPLMajorAxis). If None,
+            scipy.special.hyp2f1 is evaluated instead.
+        :param max_order: maximal number of terms of the series, scipy.special.hyp2f1
+            is evaluated for axis ratios requiring more terms
+        """
+        self.epl_major_axis = EPLMajorAxis(series_tol=series_tol, max_order=max_order)
         self.spp = SPP()
         super(EPL, self).__init__()
 
@@ -240,6 +248,25 @@ class EPL(LensProfileBase):
         """
         return self.spp.density_lens(r, theta_E, gamma)
 
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivatives of the deflection angles with respect to theta_E and the
+        center. The slope and the ellipticity are differentiated numerically.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        jacobian = self._center_jacobian(x, y, kwargs, param_names)
+        if "theta_E" in param_names:
+            # the deflection scales as theta_E**(gamma - 1)
+            f_x, f_y = self.derivatives(x, y, **kwargs)
+            fac = (kwargs["gamma"] - 1) / kwargs["theta_E"]
+            jacobian["theta_E"] = (fac * f_x, fac * f_y)
+        return jacobian
+
 
 class EPLMajorAxis(LensProfileBase):
     """This class contains the function and the derivatives of the elliptical power law.
@@ -251,11 +278,29 @@ class EPLMajorAxis(LensProfileBase):
     critical radius b, axis ratio q.
 
     Tessore & Metcalf (2015), https://arxiv.org/abs/1507.01819
+
+    The hypergeometric function of the angular dependency of the deflection (eq. 23)
+    is evaluated as a power series in :math:`-(1-q)/(1+q) e^{2i\\phi}` with a fixed
+    number of terms for all coordinates (Horner's scheme). The coefficients only depend
+    on t and the number of terms is set by the truncation tolerance and q, both are
+    computed once per (t, q).
     """
 
     param_names = ["b", "t", "q", "center_x", "center_y"]
 
-    def __init__(self):
+    def __init__(self, series_tol=1e-14, max_order=300):
+        """
+
+        :param series_tol: upper bound on the truncation error of the hypergeometric
+            series (relative to its leading term). If None, scipy.special.hyp2f1 is
+            evaluated instead.
+        :param max_order: maximal number of terms of the series, scipy.special.hyp2f1
+            is evaluated for axis ratios requiring more terms
+        """
+        self._series_tol = series_tol
+        self._max_order = max_order
+        self._coefficients_key = None
+        self._coefficients = None
         super(EPLMajorAxis, self).__init__()
 
     def function(self, x, y, b, t, q):
@@ -294,7 +339,7 @@ class EPLMajorAxis(LensProfileBase):
         R = np.maximum(R, 0.000000001)
 
         # angular dependency with extra factor of R, eq. (23)
-        R_omega = Z * hyp2f1(1, t / 2, 2 - t / 2, -(1 - q) / (1 + q) * (Z / Z.conj()))
+        R_omega = Z * self._hyp2f1(-(1 - q) / (1 + q) * (Z / Z.conj()), t, q)
 
         # deflection, eq. (22)
         alpha = 2 / (1 + q) * (b / R) ** t * R_omega
@@ -305,6 +350,60 @@ class EPLMajorAxis(LensProfileBase):
 
         return alpha_real, alpha_imag
 
+    def _hyp2f1(self, w, t, q):
+        """Hypergeometric function 2F1(1, t/2; 2 - t/2; w) of eq. (23) with
+        :math:`|w| = (1-q)/(1+q)`.
+
+        :param w: complex numpy array
+        :param t: projected power-law slope
+        :param q: axis ratio
+        :return: complex numpy array
+        """
+        coefficients = self._series_coefficients(t, q)
+        if coefficients is None:
+            return hyp2f1(1, t / 2, 2 - t / 2, w)
+        # Horner's scheme with the same number of terms for all coordinates
+        series = np.full(np.shape(w), coefficients[-1], dtype=complex)
+        for coefficient in coefficients[-2::-1]:
+            series *= w
+            series += coefficient
+        return series
+
+    def _series_coefficients(self, t, q):
+        """Coefficients of the power series of 2F1(1, t/2; 2 - t/2; w), truncated such
+        that the remainder is below the tolerance for :math:`|w| = (1-q)/(1+q)`. The
+        coefficients of the last (t, q) are kept.
+
+        :param t: projected power-law slope
+        :param q: axis ratio
+        :return: 1d array of coefficients or None if the series is not used
+        """
+        if self._series_tol is None:
+            return None
+        key = (t, q)
+        if key == self._coefficients_key:
+            return self._coefficients
+        f = (1 - q) / (1 + q)
+        if f <= 0:
+            num_terms = 0
+        elif f >= 1:
+            num_terms = self._max_order + 1
+        else:
+            # the coefficients are bounded by 1 (for t < 2) such that the remainder is
+            # bounded by f**(N+1) / (1 - f)
+            num_terms = max(
+                int(np.ceil(np.log(self._series_tol * (1 - f)) / np.log(f))), 0
+            )
+        if num_terms > self._max_order or t >= 2:
+            coefficients = None
+        else:
+            n = np.arange(1, num_terms + 1)
+            coefficients = np.ones(num_terms + 1)
+            coefficients[1:] = np.cumprod((2 * n - 2 + t) / (2 * n + 2 - t))
+        self._coefficients_key = key
+        self._coefficients = coefficients
+        return coefficients
+
     def hessian(self, x, y, b, t, q):
         """Hessian matrix of the lensing potential.
 
@@ -4,6 +4,8 @@ import numpy as np
 from scipy.integrate import quad
 from scipy.special import hyp2f1
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.Util import tabulation_util
+from lenstronomy.Conf import config_loader
 
 __all__ = ["GNFW"]
 
@@ -44,17 +46,42 @@ class GNFW(LensProfileBase):
         "center_y": 100,
     }
 
-    def __init__(self, trapezoidal_integration=False, integration_steps=1000):
+    def __init__(
+        self, trapezoidal_integration=False, integration_steps=1000, tabulated=None
+    ):
         """
 
         :param trapezoidal_integrate: bool, if True, the numerical integral is performed
          with the trapezoidal rule, otherwise with ~scipy.integrate.quad
         :param integration_steps: number of steps in the trapezoidal integral
+        :param tabulated: bool, if True (and trapezoidal_integration=False), the numerical
+         integrals are interpolated from lookup tables over (R/Rs, gamma_in), see
+         ~lenstronomy.Util.tabulation_util. If None, the default of the lenstronomy
+         configuration is used.
         """
         super(GNFW, self).__init__()
         self._integration_steps = integration_steps
+        if tabulated is None:
+            tabulated = config_loader.tabulation_conf()["enable"]
         if trapezoidal_integration:
             self._integrate = self._trapezoidal_integrate
+        elif tabulated:
+            self._integrate = self._tabulated_integrate
+            table_kwargs = {
+                "x_range": [self._s, 1e4],
+                "y_range": [0, 3],
+                "num_x": 101,
+                "num_y": 16,
+                "log_f": True,
+            }
+            self._tables = {
+                "_alpha_integrand": tabulation_util.tabulated_function(
+                    "gnfw_alpha", _alpha_integral, **table_kwargs
+                ),
+                "_kappa_integrand": tabulation_util.tabulated_function(
+                    "gnfw_kappa", _kappa_integral, **table_kwargs
+                ),
+            }
         else:
             self._integrate = self._quad_integrate
 
@@ -342,6 +369,20 @@ class GNFW(LensProfileBase):
 
         return integral
 
+    def _tabulated_integrate(self, func, x, gamma_in):
+        """Interpolate the integral of a function from a pre-computed lookup table.
+
+        :param func: function to integrate (either _alpha_integrand or _kappa_integrand)
+        :type func: function
+        :param x: x = R/Rs
+        :type x: float
+        :param gamma_in: inner slope
+        :type gamma_in: float
+        :return: integral
+        :rtype: float
+        """
+        return self._tables[func.__name__](x, gamma_in)
+
     def _alpha_integrand(self, y, x, gamma_in):
         """Integrand of the deflection angel integral.
 
@@ -460,3 +501,59 @@ class GNFW(LensProfileBase):
         :rtype: float
         """
         return kappa_s / Rs
+
+
+def _gauss_legendre_integral(x, power, y_power, num_nodes=128):
+    """Vectorized integral of (y + x)^power * (1 - sqrt(1 - y^2)) * y^y_power over y in
+    [0, 1]. The integral is evaluated with a Gauss-Legendre quadrature in s = log(theta)
+    with y = sin(theta), which removes the singular derivative of the integrand at y=1
+    and resolves its peak at y ~ x for small x. The relative accuracy is ~1e-9 for x in
+    [0.001, 10^4] and gamma_in in [0, 3].
+
+    :param x: 1d array of x = R/Rs
+    :param power: 1d array of the powers of (y + x)
+    :param y_power: power of y
+    :param num_nodes: number of nodes of the quadrature
+    :return: 1d array of the integrals
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(num_nodes)
+    s_min, s_max = -30.0, np.log(np.pi / 2)
+    s = (nodes + 1) / 2 * (s_max - s_min) + s_min
+    weights = weights * (s_max - s_min) / 2
+    theta = np.exp(s)
+    sin_theta = np.sin(theta)
+    # 1 - sqrt(1 - y^2) = 1 - cos(theta), without cancellation at small theta, times
+    # y^y_power and the Jacobian dy = cos(theta) * theta * ds
+    weights = weights * (
+        2 * np.sin(theta / 2) ** 2 * sin_theta**y_power * np.cos(theta) * theta
+    )
+    x = np.asarray(x, dtype=float)
+    power = np.asarray(power, dtype=float)
+    integral = np.zeros(len(x))
+    # chunks limit the memory of the (len(x), num_nodes) arrays
+    chunk = 10000
+    for i in range(0, len(x), chunk):
+        x_ = x[i : i + chunk, np.newaxis]
+        power_ = power[i : i + chunk, np.newaxis]
+        integral[i : i + chunk] = ((sin_theta + x_) ** power_) @ weights
+    return integral
+
+
+def _alpha_integral(x, gamma_in):
+    """Integral of GNFW._alpha_integrand over [0, 1].
+
+    :param x: 1d array of x = R/Rs
+    :param gamma_in: 1d array of inner slopes
+    :return: 1d array of the integrals
+    """
+    return _gauss_legendre_integral(x, np.asarray(gamma_in) - 3, y_power=-1)
+
+
+def _kappa_integral(x, gamma_in):
+    """Integral of GNFW._kappa_integrand over [0, 1].
+
+    :param x: 1d array of x = R/Rs
+    :param gamma_in: 1d array of inner slopes
+    :return: 1d array of the integrals
+    """
+    return _gauss_legendre_integral(x, np.asarray(gamma_in) - 4, y_power=0)
@@ -0,0 +1,84 @@
+import numpy as np
+import lenstronomy.Util.param_util as param_util
+from lenstronomy.LensModel.Profiles.hernquist_ellipse_cse import HernquistEllipseCSE
+from lenstronomy.LensModel.Profiles.cored_steep_ellipsoid_numba import (
+    cse_set_derivatives,
+    cse_set_hessian,
+)
+from lenstronomy.Util import numba_util
+
+__all__ = ["HernquistEllipseCSE_numba"]
+
+
+class HernquistEllipseCSE_numba(HernquistEllipseCSE):
+    """Elliptical Hernquist profile approximated with CSE profiles (see
+    'HERNQUIST_ELLIPSE_CSE') with the deflection angles and the Hessian computed in
+    jitted kernels that fuse the elliptical transform with the sum over the CSE
+    components."""
+
+    def __init__(self):
+        super(HernquistEllipseCSE_numba, self).__init__()
+        self._a_array = np.array(self._a_list, dtype=float)
+        self._s_array = np.array(self._s_list, dtype=float)
+
+    def derivatives(self, x, y, sigma0, Rs, e1, e2, center_x=0, center_y=0):
+        """Returns df/dx and df/dy of the function.
+
+        :param x: x-coordinate in image plane
+        :param y: y-coordinate in image plane
+        :param sigma0: sigma0/sigma_crit
+        :param Rs: scale radius
+        :param e1: eccentricity component
+        :param e2: eccentricity component
+        :param center_x: profile center
+        :param center_y: profile center
+        :return: alpha_x, alpha_y
+        """
+        phi_q, q = param_util.ellipticity2phi_q(e1, e2)
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        f_x, f_y = cse_set_derivatives(
+            x_,
+            y_,
+            self._a_array,
+            self._s_array,
+            q,
+            np.cos(phi_q),
+            np.sin(phi_q),
+            center_x,
+            center_y,
+            1.0 / Rs,
+            self._normalization(sigma0, Rs, q) / Rs,
+        )
+        return numba_util.reshape_output(shape, f_x, f_y)
+
+    def hessian(self, x, y, sigma0, Rs, e1, e2, center_x=0, center_y=0):
+        """Returns Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx,
+        d^f/dy^2.
+
+        :param x: x-coordinate in image plane
+        :param y: y-coordinate in image plane
+        :param sigma0: sigma0/sigma_crit
+        :param Rs: scale radius
+        :param e1: eccentricity component
+        :param e2: eccentricity component
+        :param center_x: profile center
+        :param center_y: profile center
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        phi_q, q = param_util.ellipticity2phi_q(e1, e2)
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        f_xx, f_xy, f_yy = cse_set_hessian(
+            x_,
+            y_,
+            self._a_array,
+            self._s_array,
+            q,
+            np.cos(phi_q),
+            np.sin(phi_q),
+            center_x,
+            center_y,
+            1.0 / Rs,
+            self._normalization(sigma0, Rs, q) / Rs**2,
+        )
+        f_xx, f_xy, f_yy = numba_util.reshape_output(shape, f_xx, f_xy, f_yy)
+        return f_xx, f_xy, f_xy, f_yy
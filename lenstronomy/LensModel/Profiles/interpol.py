@@ -1,12 +1,20 @@
 __author__ = "sibirrer"
 
+import os
+
 import scipy.interpolate
 import numpy as np
 
 import lenstronomy.Util.util as util
+from lenstronomy.Util import numba_util
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 
-__all__ = ["Interpol", "InterpolScaled"]
+__all__ = [
+    "Interpol",
+    "InterpolScaled",
+    "save_interpol_kwargs",
+    "load_interpol_kwargs",
+]
 
 
 class Interpol(LensProfileBase):
@@ -18,6 +26,15 @@ class Interpol(LensProfileBase):
 
     The deflection angle is in the same convention as the one in the LensModel module, meaning that:
     source position = image position - deflection angle
+
+    The maps are interpolated with tensor product B-splines (as
+    scipy.interpolate.RectBivariateSpline) built once with the first evaluation. The
+    evaluation is done in jitted kernels: the knot spans and B-spline basis functions
+    are looked up once per position (or once per axis for grid=True) and shared among
+    all maps evaluated in the same call (e.g. f_x and f_y, or f_xx, f_xy and f_yy).
+    For the default linear interpolation, the maps are used as they are without any
+    copy, such that maps loaded with np.load(..., mmap_mode='r') (see
+    load_interpol_kwargs()) stay on disk and only the pixels needed are read.
     """
 
     param_names = [
@@ -46,6 +63,8 @@ class Interpol(LensProfileBase):
         if kwargs_spline is None:
             kwargs_spline = {"kx": 1, "ky": 1, "s": 0}
         self._kwargs_spline = kwargs_spline
+        # interpolations of the individual maps, built with their first evaluation
+        self._splines = {}
         super(Interpol, self).__init__()
 
     def function(
@@ -75,26 +94,7 @@ class Interpol(LensProfileBase):
         :param f_xy: 2d numpy array of df/dxy, matching the grids in grid_interp_x and grid_interp_y
         :return: potential at interpolated positions (x, y)
         """
-        # self._check_interp(grid_interp_x, grid_interp_y, f_, f_x, f_y, f_xx, f_yy, f_xy)
-        n = len(np.atleast_1d(x))
-        if n <= 1 and np.shape(x) == ():
-            # if type(x) == float or type(x) == int or type(x) == type(np.float64(1)) or len(x) <= 1:
-            f_out = self.f_interp(x, y, grid_interp_x, grid_interp_y, f_)
-            return f_out
-        else:
-            if self._grid and n >= self._min_grid_number:
-                x_axes, y_axes = util.get_axes(x, y)
-                f_out = self.f_interp(
-                    x_axes, y_axes, grid_interp_x, grid_interp_y, f_, grid=self._grid
-                )
-                f_out = util.image2array(f_out)
-            else:
-                # n = len(x)
-                f_out = np.zeros(n)
-                for i in range(n):
-                    f_out[i] = self.f_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_
-                    )
+        (f_out,) = self._interpolate(x, y, grid_interp_x, grid_interp_y, {"f_": f_})
         return f_out
 
     def derivatives(
@@ -132,27 +132,9 @@ class Interpol(LensProfileBase):
             grid_interp_y
         :return: f_x, f_y at interpolated positions (x, y)
         """
-        n = len(np.atleast_1d(x))
-        if n <= 1 and np.shape(x) == ():
-            # if type(x) == float or type(x) == int or type(x) == type(np.float64(1)) or len(x) <= 1:
-            f_x_out = self.f_x_interp(x, y, grid_interp_x, grid_interp_y, f_x)
-            f_y_out = self.f_y_interp(x, y, grid_interp_x, grid_interp_y, f_y)
-            return f_x_out, f_y_out
-        else:
-            if self._grid and n >= self._min_grid_number:
-                x_, y_ = util.get_axes(x, y)
-                f_x_out = self.f_x_interp(
-                    x_, y_, grid_interp_x, grid_interp_y, f_x, grid=self._grid
-                )
-                f_y_out = self.f_y_interp(
-                    x_, y_, grid_interp_x, grid_interp_y, f_y, grid=self._grid
-                )
-                f_x_out = util.image2array(f_x_out)
-                f_y_out = util.image2array(f_y_out)
-            else:
-                # n = len(x)
-                f_x_out = self.f_x_interp(x, y, grid_interp_x, grid_interp_y, f_x)
-                f_y_out = self.f_y_interp(x, y, grid_interp_x, grid_interp_y, f_y)
+        f_x_out, f_y_out = self._interpolate(
+            x, y, grid_interp_x, grid_interp_y, {"f_x": f_x, "f_y": f_y}
+        )
         return f_x_out, f_y_out
 
     def hessian(
@@ -190,7 +172,7 @@ class Interpol(LensProfileBase):
             grid_interp_y
         :return: f_xx, f_xy, f_yx, f_yy at interpolated positions (x, y)
         """
-        if not (hasattr(self, "_f_xx_interp")) and (
+        if "f_xx" not in self._splines and (
             f_xx is None or f_yy is None or f_xy is None
         ):
             diff = 0.000001
@@ -246,107 +228,98 @@ class Interpol(LensProfileBase):
             )
             return f_xx_out, f_xy_out, f_yx_out, f_yy_out
 
+        f_xx_out, f_xy_out, f_yy_out = self._interpolate(
+            x,
+            y,
+            grid_interp_x,
+            grid_interp_y,
+            {"f_xx": f_xx, "f_xy": f_xy, "f_yy": f_yy},
+        )
+        return f_xx_out, f_xy_out, f_xy_out, f_yy_out
+
+    def _interpolate(self, x, y, x_grid, y_grid, maps):
+        """Interpolation of several maps at the same positions.
+
+        :param x: x-coordinate (angular position), float or numpy array
+        :param y: y-coordinate (angular position), float or numpy array
+        :param x_grid: numpy array (ascending) to mark the x-direction of the interpolation grid
+        :param y_grid: numpy array (ascending) to mark the y-direction of the interpolation grid
+        :param maps: dictionary of the names and 2d arrays of the maps (the arrays are
+         only used to build the interpolation with the first evaluation)
+        :return: list of the interpolated maps at the positions (x, y)
+        """
+        splines = [self._spline(name, x_grid, y_grid, f) for name, f in maps.items()]
         n = len(np.atleast_1d(x))
-        if n <= 1 and np.shape(x) == ():
-            # if type(x) == float or type(x) == int or type(x) == type(np.float64(1)) or len(x) <= 1:
-            f_xx_out = self.f_xx_interp(x, y, grid_interp_x, grid_interp_y, f_xx)
-            f_yy_out = self.f_yy_interp(x, y, grid_interp_x, grid_interp_y, f_yy)
-            f_xy_out = self.f_xy_interp(x, y, grid_interp_x, grid_interp_y, f_xy)
-            return f_xx_out, f_xy_out, f_xy_out, f_yy_out
-        else:
-            if self._grid and n >= self._min_grid_number:
-                x_, y_ = util.get_axes(x, y)
-                f_xx_out = self.f_xx_interp(
-                    x_, y_, grid_interp_x, grid_interp_y, f_xx, grid=self._grid
-                )
-                f_yy_out = self.f_yy_interp(
-                    x_, y_, grid_interp_x, grid_interp_y, f_yy, grid=self._grid
-                )
-                f_xy_out = self.f_xy_interp(
-                    x_, y_, grid_interp_x, grid_interp_y, f_xy, grid=self._grid
+        if self._grid and np.ndim(x) > 0 and n >= self._min_grid_number:
+            x_axes, y_axes = util.get_axes(x, y)
+            values = _evaluate_splines(splines, x_axes, y_axes, grid=True)
+            return [util.image2array(value) for value in values]
+        return _evaluate_splines(splines, x, y)
+
+    def _spline(self, name, x_grid, y_grid, f):
+        """
+
+        :param name: name of the map
+        :param x_grid: numpy array (ascending) to mark the x-direction of the interpolation grid
+        :param y_grid: numpy array (ascending) to mark the y-direction of the interpolation grid
+        :param f: 2d numpy array of the map, matching the grids in x_grid and y_grid
+        :return: interpolation of the map (built with the first call)
+        """
+        if name not in self._splines:
+            if f is None:
+                raise ValueError(
+                    "The interpolation of %s requires the map and its grid." % name
                 )
-                f_xx_out = util.image2array(f_xx_out)
-                f_yy_out = util.image2array(f_yy_out)
-                f_xy_out = util.image2array(f_xy_out)
-            else:
-                # n = len(x)
-                f_xx_out, f_yy_out, f_xy_out = np.zeros(n), np.zeros(n), np.zeros(n)
-                for i in range(n):
-                    f_xx_out[i] = self.f_xx_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_xx
-                    )
-                    f_yy_out[i] = self.f_yy_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_yy
-                    )
-                    f_xy_out[i] = self.f_xy_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_xy
-                    )
-        return f_xx_out, f_xy_out, f_xy_out, f_yy_out
+            self._splines[name] = _TensorSpline.from_map(
+                y_grid, x_grid, f, self._kwargs_spline
+            )
+        return self._splines[name]
 
     def f_interp(self, x, y, x_grid=None, y_grid=None, f_=None, grid=False):
-        if not hasattr(self, "_f_interp"):
-            self._f_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_, **self._kwargs_spline
-            )
-        return self._f_interp(y, x, grid=grid)
+        return _evaluate_splines([self._spline("f_", x_grid, y_grid, f_)], x, y, grid)[
+            0
+        ]
 
     def f_x_interp(self, x, y, x_grid=None, y_grid=None, f_x=None, grid=False):
-        if not hasattr(self, "_f_x_interp"):
-            self._f_x_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_x, **self._kwargs_spline
-            )
-        return self._f_x_interp(y, x, grid=grid)
+        return _evaluate_splines(
+            [self._spline("f_x", x_grid, y_grid, f_x)], x, y, grid
+        )[0]
 
     def f_y_interp(self, x, y, x_grid=None, y_grid=None, f_y=None, grid=False):
-        if not hasattr(self, "_f_y_interp"):
-            self._f_y_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_y, **self._kwargs_spline
-            )
-        return self._f_y_interp(y, x, grid=grid)
+        return _evaluate_splines(
+            [self._spline("f_y", x_grid, y_grid, f_y)], x, y, grid
+        )[0]
 
     def f_xx_interp(self, x, y, x_grid=None, y_grid=None, f_xx=None, grid=False):
-        if not hasattr(self, "_f_xx_interp"):
-            self._f_xx_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_xx, **self._kwargs_spline
-            )
-        return self._f_xx_interp(y, x, grid=grid)
+        return _evaluate_splines(
+            [self._spline("f_xx", x_grid, y_grid, f_xx)], x, y, grid
+        )[0]
 
     def f_xy_interp(self, x, y, x_grid=None, y_grid=None, f_xy=None, grid=False):
-        if not hasattr(self, "_f_xy_interp"):
-            self._f_xy_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_xy, **self._kwargs_spline
-            )
-        return self._f_xy_interp(y, x, grid=grid)
+        return _evaluate_splines(
+            [self._spline("f_xy", x_grid, y_grid, f_xy)], x, y, grid
+        )[0]
 
     def f_yy_interp(self, x, y, x_grid=None, y_grid=None, f_yy=None, grid=False):
-        if not hasattr(self, "_f_yy_interp"):
-            self._f_yy_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_yy, **self._kwargs_spline
-            )
-        return self._f_yy_interp(y, x, grid=grid)
+        return _evaluate_splines(
+            [self._spline("f_yy", x_grid, y_grid, f_yy)], x, y, grid
+        )[0]
 
     def do_interp(self, x_grid, y_grid, f_, f_x, f_y, f_xx=None, f_yy=None, f_xy=None):
-        self._f_interp = scipy.interpolate.RectBivariateSpline(
-            x_grid, y_grid, f_, **self._kwargs_spline
-        )
-        self._f_x_interp = scipy.interpolate.RectBivariateSpline(
-            x_grid, y_grid, f_x, **self._kwargs_spline
-        )
-        self._f_y_interp = scipy.interpolate.RectBivariateSpline(
-            x_grid, y_grid, f_y, **self._kwargs_spline
-        )
-        if f_xx is not None:
-            self._f_xx_interp = scipy.interpolate.RectBivariateSpline(
-                x_grid, y_grid, f_xx, **self._kwargs_spline
-            )
-        if f_xy is not None:
-            self._f_xy_interp = scipy.interpolate.RectBivariateSpline(
-                x_grid, y_grid, f_xy, **self._kwargs_spline
-            )
-        if f_yy is not None:
-            self._f_yy_interp = scipy.interpolate.RectBivariateSpline(
-                x_grid, y_grid, f_yy, **self._kwargs_spline
-            )
+        maps = {
+            "f_": f_,
+            "f_x": f_x,
+            "f_y": f_y,
+            "f_xx": f_xx,
+            "f_xy": f_xy,
+            "f_yy": f_yy,
+        }
+        for name, f in maps.items():
+            if f is not None:
+                # the first axis of the maps is along x_grid here
+                self._splines[name] = _TensorSpline.from_map(
+                    x_grid, y_grid, f, self._kwargs_spline
+                )
 
 
 class InterpolScaled(LensProfileBase):
@@ -491,3 +464,219 @@ class InterpolScaled(LensProfileBase):
         f_xy_out *= scale_factor
         f_yx_out *= scale_factor
         return f_xx_out, f_xy_out, f_yx_out, f_yy_out
+
+
+def save_interpol_kwargs(directory, kwargs_interp):
+    """Stores the grids and maps of an 'INTERPOL' lens model as .npy files such that
+    they can be memory-mapped with load_interpol_kwargs().
+
+    :param directory: path of the directory (created if it does not exist)
+    :param kwargs_interp: keyword arguments of Interpol (grid_interp_x, grid_interp_y, f_, ...)
+    :return: None
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name, value in kwargs_interp.items():
+        if value is not None:
+            np.save(os.path.join(directory, name + ".npy"), np.asarray(value))
+
+
+def load_interpol_kwargs(directory, mmap_mode="r"):
+    """Loads the grids and maps stored with save_interpol_kwargs(). With the default
+    linear interpolation, Interpol evaluates memory-mapped maps in place, such that
+    large maps (e.g. from hydrodynamical simulations) are not read into memory.
+
+    :param directory: path of the directory
+    :param mmap_mode: memory-map mode of numpy.load() (None to read the arrays into memory)
+    :return: keyword arguments of Interpol
+    """
+    kwargs_interp = {}
+    for name in Interpol.param_names:
+        file_name = os.path.join(directory, name + ".npy")
+        if os.path.exists(file_name):
+            kwargs_interp[name] = np.load(file_name, mmap_mode=mmap_mode)
+    return kwargs_interp
+
+
+class _TensorSpline(object):
+    """Tensor product B-spline of a 2d map in the FITPACK convention (knots,
+    coefficients and evaluation are the ones of scipy.interpolate.RectBivariateSpline),
+    with the first axis of the map along the first coordinate."""
+
+    def __init__(self, t_a, t_b, k_a, k_b, coeffs):
+        """
+
+        :param t_a: knots along the first axis
+        :param t_b: knots along the second axis
+        :param k_a: degree along the first axis
+        :param k_b: degree along the second axis
+        :param coeffs: 2d array of the B-spline coefficients
+        """
+        self.t_a = np.ascontiguousarray(t_a, dtype=float)
+        self.t_b = np.ascontiguousarray(t_b, dtype=float)
+        self.k_a, self.k_b = int(k_a), int(k_b)
+        self.coeffs = coeffs
+
+    @classmethod
+    def from_map(cls, grid_a, grid_b, f, kwargs_spline):
+        """
+
+        :param grid_a: grid (ascending) along the first axis of the map
+        :param grid_b: grid (ascending) along the second axis of the map
+        :param f: 2d map
+        :param kwargs_spline: keyword arguments of scipy.interpolate.RectBivariateSpline
+        :return: _TensorSpline instance
+        """
+        grid_a = np.asarray(grid_a, dtype=float)
+        grid_b = np.asarray(grid_b, dtype=float)
+        kwargs = {"kx": 3, "ky": 3, "s": 0}
+        kwargs.update(kwargs_spline)
+        if (
+            kwargs["kx"] == 1
+            and kwargs["ky"] == 1
+            and kwargs["s"] == 0
+            and kwargs.get("bbox") is None
+        ):
+            # the coefficients of the interpolating linear spline are the map itself
+            t_a = np.concatenate([grid_a[:1], grid_a, grid_a[-1:]])
+            t_b = np.concatenate([grid_b[:1], grid_b, grid_b[-1:]])
+            return cls(t_a, t_b, 1, 1, np.asarray(f, dtype=float))
+        spline = scipy.interpolate.RectBivariateSpline(grid_a, grid_b, f, **kwargs)
+        t_a, t_b, coeffs = spline.tck
+        k_a, k_b = spline.degrees
+        coeffs = coeffs.reshape(len(t_a) - k_a - 1, len(t_b) - k_b - 1)
+        return cls(t_a, t_b, k_a, k_b, coeffs)
+
+
+def _evaluate_splines(splines, x, y, grid=False):
+    """Evaluates splines at the same positions, sharing the knot span lookups between
+    splines with the same knots.
+
+    :param splines: list of _TensorSpline instances
+    :param x: x-coordinate(s) (second axis of the maps)
+    :param y: y-coordinate(s) (first axis of the maps)
+    :param grid: bool, if True, evaluates on the grid spanned by the 1d arrays x and y
+    :return: list of the interpolated values, in the shape of the (broadcast) input
+        or of shape (len(y), len(x)) for grid=True
+    """
+    if grid:
+        y_, x_ = np.ascontiguousarray(y, dtype=float), np.ascontiguousarray(
+            x, dtype=float
+        )
+        shape = (len(y_), len(x_))
+    else:
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+    lookups = []
+
+    def _lookup(t, k, coords):
+        for t_, k_, coords_, result in lookups:
+            if k_ == k and coords_ is coords and np.array_equal(t_, t):
+                return result
+        result = _knot_spans(t, k, coords)
+        lookups.append((t, k, coords, result))
+        return result
+
+    values = []
+    for spline in splines:
+        span_a, basis_a = _lookup(spline.t_a, spline.k_a, y_)
+        span_b, basis_b = _lookup(spline.t_b, spline.k_b, x_)
+        if grid:
+            value = _spline_grid(spline.coeffs, span_a, basis_a, span_b, basis_b)
+        else:
+            value = _spline_points(spline.coeffs, span_a, basis_a, span_b, basis_b)
+        values.append(value.reshape(shape))
+    return values
+
+
+@numba_util.jit()
+def _knot_spans(t, k, x):
+    """Knot spans and non-vanishing B-spline basis functions (FITPACK fpbspl) of a list
+    of coordinates. Coordinates outside the knot range are evaluated at its boundary.
+    The span is estimated assuming evenly spaced knots and corrected by walking along
+    the knots, such that the lookup is of constant cost for regular grids.
+
+    :param t: knots
+    :param k: degree of the spline
+    :param x: 1d array of coordinates
+    :return: index of the knot spans, 2d array of the k+1 basis functions
+    """
+    n = len(t) - k - 1
+    t_min, t_max = t[k], t[n]
+    step = (t_max - t_min) / max(n - 1, 1)
+    num = len(x)
+    span = np.empty(num, dtype=np.int64)
+    basis = np.empty((num, k + 1))
+    for i in numba_util.prange(num):
+        arg = min(max(x[i], t_min), t_max)
+        l = k
+        if step > 0:
+            l = min(max(int((arg - t_min) / step) + (k + 1) // 2, k), n - 1)
+        while l > k and arg < t[l]:
+            l -= 1
+        while l < n - 1 and arg >= t[l + 1]:
+            l += 1
+        span[i] = l
+        basis[i, 0] = 1.0
+        for j in range(1, k + 1):
+            saved = 0.0
+            for r in range(j):
+                l_i = l + r + 1
+                l_j = l_i - j
+                if t[l_i] == t[l_j]:
+                    basis[i, r] = saved
+                    saved = 0.0
+                else:
+                    f = basis[i, r] / (t[l_i] - t[l_j])
+                    basis[i, r] = saved + f * (t[l_i] - arg)
+                    saved = f * (arg - t[l_j])
+            basis[i, j] = saved
+    return span, basis
+
+
+@numba_util.jit()
+def _spline_points(coeffs, span_a, basis_a, span_b, basis_b):
+    """Tensor product spline at a list of positions (FITPACK fpbisp).
+
+    :param coeffs: 2d array of the B-spline coefficients
+    :param span_a: knot spans of the positions along the first axis
+    :param basis_a: basis functions of the positions along the first axis
+    :param span_b: knot spans of the positions along the second axis
+    :param basis_b: basis functions of the positions along the second axis
+    :return: 1d array of the spline values
+    """
+    k_a, k_b = basis_a.shape[1] - 1, basis_b.shape[1] - 1
+    num = len(span_a)
+    values = np.empty(num)
+    for i in numba_util.prange(num):
+        row, col = span_a[i] - k_a, span_b[i] - k_b
+        value = 0.0
+        for p in range(k_a + 1):
+            for q in range(k_b + 1):
+                value += coeffs[row + p, col + q] * basis_a[i, p] * basis_b[i, q]
+        values[i] = value
+    return values
+
+
+@numba_util.jit()
+def _spline_grid(coeffs, span_a, basis_a, span_b, basis_b):
+    """Tensor product spline on the grid spanned by the positions along both axes.
+
+    :param coeffs: 2d array of the B-spline coefficients
+    :param span_a: knot spans of the grid along the first axis
+    :param basis_a: basis functions of the grid along the first axis
+    :param span_b: knot spans of the grid along the second axis
+    :param basis_b: basis functions of the grid along the second axis
+    :return: 2d array (len(span_a), len(span_b)) of the spline values
+    """
+    k_a, k_b = basis_a.shape[1] - 1, basis_b.shape[1] - 1
+    num_a, num_b = len(span_a), len(span_b)
+    values = np.empty((num_a, num_b))
+    for i in numba_util.prange(num_a):
+        row = span_a[i] - k_a
+        for j in range(num_b):
+            col = span_b[j] - k_b
+            value = 0.0
+            for p in range(k_a + 1):
+                for q in range(k_b + 1):
+                    value += coeffs[row + p, col + q] * basis_a[i, p] * basis_b[j, q]
+            values[i, j] = value
+    return values
@@ -19,6 +19,7 @@ class Multipole(LensProfileBase):
     """
 
     param_names = ["m", "a_m", "phi_m", "center_x", "center_y"]
+    non_differentiable_params = ["m"]
     lower_limit_default = {
         "m": 2,
         "a_m": 0,
@@ -96,3 +97,38 @@ class Multipole(LensProfileBase):
         f_yy = 1.0 / r * np.cos(phi) ** 2 * a_m * np.cos(m * (phi - phi_m))
         f_xy = -1.0 / r * a_m * np.cos(phi) * np.sin(phi) * np.cos(m * (phi - phi_m))
         return f_xx, f_xy, f_xy, f_yy
+
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivatives of the deflection angles with respect to a_m, phi_m and
+        the center.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        jacobian = self._center_jacobian(x, y, kwargs, param_names)
+        m, a_m, phi_m = kwargs["m"], kwargs["a_m"], kwargs["phi_m"]
+        r, phi = param_util.cart2polar(
+            x,
+            y,
+            center_x=kwargs.get("center_x", 0),
+            center_y=kwargs.get("center_y", 0),
+        )
+        cos_phi, sin_phi = np.cos(phi), np.sin(phi)
+        cos_m, sin_m = np.cos(m * (phi - phi_m)), np.sin(m * (phi - phi_m))
+        if "a_m" in param_names:
+            # the deflection is linear in a_m
+            jacobian["a_m"] = (
+                (cos_phi * cos_m + m * sin_phi * sin_m) / (1 - m**2),
+                (sin_phi * cos_m - m * cos_phi * sin_m) / (1 - m**2),
+            )
+        if "phi_m" in param_names:
+            amp = a_m / (1 - m**2)
+            jacobian["phi_m"] = (
+                amp * m * (cos_phi * sin_m - m * sin_phi * cos_m),
+                amp * m * (sin_phi * sin_m + m * cos_phi * cos_m),
+            )
+        return jacobian
@@ -0,0 +1,106 @@
+import numpy as np
+from lenstronomy.LensModel.Profiles.multipole import Multipole
+from lenstronomy.Util import numba_util
+
+__all__ = ["Multipole_numba"]
+
+
+class Multipole_numba(Multipole):
+    """Multipole contribution (for 1 component with m>=2) with the deflection angles
+    and the Hessian computed in jitted kernels. Same definitions as 'MULTIPOLE' (Xu et
+    al. 2013, Appendix B3), from which the lensing potential is inherited.
+    """
+
+    def derivatives(self, x, y, m, a_m, phi_m, center_x=0, center_y=0):
+        """
+        Deflection of a multipole contribution (for 1 component with m>=2)
+
+        :param x: x-coordinate to evaluate function
+        :param y: y-coordinate to evaluate function
+        :param m: int, multipole order, m>=2
+        :param a_m: float, multipole strength
+        :param phi_m: float, multipole orientation in radian
+        :param center_x: x-position
+        :param center_y: y-position
+        :return: deflection angles alpha_x, alpha_y
+        """
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        f_x, f_y = _derivatives(x_, y_, float(m), a_m, phi_m, center_x, center_y)
+        return numba_util.reshape_output(shape, f_x, f_y)
+
+    def hessian(self, x, y, m, a_m, phi_m, center_x=0, center_y=0):
+        """
+        Hessian of a multipole contribution (for 1 component with m>=2)
+
+        :param x: x-coordinate to evaluate function
+        :param y: y-coordinate to evaluate function
+        :param m: int, multipole order, m>=2
+        :param a_m: float, multipole strength
+        :param phi_m: float, multipole orientation in radian
+        :param center_x: x-position
+        :param center_y: y-position
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        f_xx, f_xy, f_yy = _hessian(x_, y_, float(m), a_m, phi_m, center_x, center_y)
+        f_xx, f_xy, f_yy = numba_util.reshape_output(shape, f_xx, f_xy, f_yy)
+        return f_xx, f_xy, f_xy, f_yy
+
+
+@numba_util.jit()
+def _derivatives(x, y, m, a_m, phi_m, center_x, center_y):
+    """Deflection angles of a multipole for a list of coordinates.
+
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param m: multipole order
+    :param a_m: multipole strength
+    :param phi_m: multipole orientation in radian
+    :param center_x: x-position
+    :param center_y: y-position
+    :return: alpha_x, alpha_y
+    """
+    n = len(x)
+    f_x = np.empty(n)
+    f_y = np.empty(n)
+    norm = a_m / (1 - m**2)
+    for i in numba_util.prange(n):
+        phi = np.arctan2(y[i] - center_y, x[i] - center_x)
+        cos_phi = np.cos(phi)
+        sin_phi = np.sin(phi)
+        cos_m = norm * np.cos(m * (phi - phi_m))
+        sin_m = m * norm * np.sin(m * (phi - phi_m))
+        f_x[i] = cos_phi * cos_m + sin_phi * sin_m
+        f_y[i] = sin_phi * cos_m - cos_phi * sin_m
+    return f_x, f_y
+
+
+@numba_util.jit()
+def _hessian(x, y, m, a_m, phi_m, center_x, center_y):
+    """Hessian of a multipole for a list of coordinates.
+
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param m: multipole order
+    :param a_m: multipole strength
+    :param phi_m: multipole orientation in radian
+    :param center_x: x-position
+    :param center_y: y-position
+    :return: f_xx, f_xy, f_yy
+    """
+    n = len(x)
+    f_xx = np.empty(n)
+    f_xy = np.empty(n)
+    f_yy = np.empty(n)
+    for i in numba_util.prange(n):
+        dx = x[i] - center_x
+        dy = y[i] - center_y
+        r = max(np.sqrt(dx**2 + dy**2), 0.000001)
+        phi = np.arctan2(dy, dx)
+        cos_phi = np.cos(phi)
+        sin_phi = np.sin(phi)
+        amp = a_m * np.cos(m * (phi - phi_m)) / r
+        f_xx[i] = sin_phi**2 * amp
+        f_yy[i] = cos_phi**2 * amp
+        f_xy[i] = -cos_phi * sin_phi * amp
+    return f_xx, f_xy, f_yy
@@ -92,8 +92,7 @@ class NFW(LensProfileBase):
         :return: deflection angle in x, deflection angle in y
         """
         rho0_input = self.alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs)
-        if Rs < 0.0000001:
-            Rs = 0.0000001
+        Rs = np.maximum(Rs, 0.0000001)
         x_ = x - center_x
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
@@ -112,18 +111,37 @@ class NFW(LensProfileBase):
         :return: Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2
         """
         rho0_input = self.alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs)
-        if Rs < 0.0000001:
-            Rs = 0.0000001
+        Rs = np.maximum(Rs, 0.0000001)
         x_ = x - center_x
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
-        kappa = self.density_2d(R, 0, Rs, rho0_input)
-        gamma1, gamma2 = self.nfw_gamma(R, Rs, rho0_input, x_, y_)
+        # the projection integral is evaluated once for the convergence and the shear
+        Fx = self.F_(R / Rs)
+        kappa = 2 * rho0_input * Rs * Fx
+        gamma1, gamma2 = self._nfw_gamma(R, Rs, rho0_input, x_, y_, Fx)
         f_xx = kappa + gamma1
         f_yy = kappa - gamma1
         f_xy = gamma2
         return f_xx, f_xy, f_xy, f_yy
 
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivatives of the deflection angles with respect to alpha_Rs and the
+        center. The scale radius is differentiated numerically.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        jacobian = self._center_jacobian(x, y, kwargs, param_names)
+        if "alpha_Rs" in param_names:
+            # the deflection is linear in alpha_Rs
+            kwargs_unit = dict(kwargs, alpha_Rs=1)
+            jacobian["alpha_Rs"] = self.derivatives(x, y, **kwargs_unit)
+        return jacobian
+
     @staticmethod
     def density(R, Rs, rho0):
         """Three-dimensional NFW profile.
@@ -274,11 +292,26 @@ class NFW(LensProfileBase):
         :type ax_y: same as R
         :return: Epsilon(R) projected density at radius R
         """
+        return self._nfw_gamma(R, Rs, rho0, ax_x, ax_y)
+
+    def _nfw_gamma(self, R, Rs, rho0, ax_x, ax_y, Fx=None):
+        """Shear gamma of NFW profile, see nfw_gamma().
+
+        :param R: radius of interest
+        :param Rs: scale radius
+        :param rho0: density normalization (characteristic density)
+        :param ax_x: projection to either x- or y-axis
+        :param ax_y: projection to either x- or y-axis
+        :param Fx: None or F_(R / Rs), projection integral at the (not clipped) radius
+        :return: gamma1, gamma2
+        """
         c = 0.000001
+        clipped = np.any(R < c)
         R = np.maximum(R, c)
         x = R / Rs
         gx = self.g_(x)
-        Fx = self.F_(x)
+        if Fx is None or clipped:
+            Fx = self.F_(x)
         a = (
             2 * rho0 * Rs * (2 * gx / x**2 - Fx)
         )  # /x #2*rho0*Rs*(2*gx/x**2 - Fx)*axis/x
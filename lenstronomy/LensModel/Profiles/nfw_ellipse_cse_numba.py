@@ -0,0 +1,95 @@
+import numpy as np
+import lenstronomy.Util.param_util as param_util
+from lenstronomy.LensModel.Profiles.nfw_ellipse_cse import NFW_ELLIPSE_CSE
+from lenstronomy.LensModel.Profiles.cored_steep_ellipsoid_numba import (
+    cse_set_derivatives,
+    cse_set_hessian,
+)
+from lenstronomy.Util import numba_util
+
+__all__ = ["NFW_ELLIPSE_CSE_numba"]
+
+
+class NFW_ELLIPSE_CSE_numba(NFW_ELLIPSE_CSE):
+    """Elliptical NFW profile approximated with CSE profiles (see 'NFW_ELLIPSE_CSE')
+    with the deflection angles and the Hessian computed in jitted kernels that fuse the
+    elliptical transform with the sum over the CSE components."""
+
+    profile_name = "NFW_ELLIPSE_CSE_NUMBA"
+
+    def __init__(self, high_accuracy=True):
+        """
+
+        :param high_accuracy: if True uses a more accurate larger set of CSE profiles (see Oguri 2021)
+        :type high_accuracy: boolean
+        """
+        super(NFW_ELLIPSE_CSE_numba, self).__init__(high_accuracy=high_accuracy)
+        self._a_array = np.array(self._a_list, dtype=float)
+        self._s_array = np.array(self._s_list, dtype=float)
+
+    def derivatives(self, x, y, Rs, alpha_Rs, e1, e2, center_x=0, center_y=0):
+        """Returns df/dx and df/dy of the function, calculated as an elliptically
+        distorted deflection angle of the spherical NFW profile.
+
+        :param x: angular position (normally in units of arc seconds)
+        :param y: angular position (normally in units of arc seconds)
+        :param Rs: turn over point in the slope of the NFW profile in angular unit
+        :param alpha_Rs: deflection (angular units) at projected Rs
+        :param e1: eccentricity component in x-direction
+        :param e2: eccentricity component in y-direction
+        :param center_x: center of halo (in angular units)
+        :param center_y: center of halo (in angular units)
+        :return: deflection in x-direction, deflection in y-direction
+        """
+        phi_q, q = param_util.ellipticity2phi_q(e1, e2)
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        # product averaged CSEs: coordinates scaled by sqrt(q), amplitudes by 1/q and
+        # the deflection by sqrt(q) from the derivative of the scaled coordinates
+        const = self._normalization(alpha_Rs, Rs, q) / Rs / np.sqrt(q)
+        f_x, f_y = cse_set_derivatives(
+            x_,
+            y_,
+            self._a_array,
+            self._s_array,
+            q,
+            np.cos(phi_q),
+            np.sin(phi_q),
+            center_x,
+            center_y,
+            np.sqrt(q) / Rs,
+            const,
+        )
+        return numba_util.reshape_output(shape, f_x, f_y)
+
+    def hessian(self, x, y, Rs, alpha_Rs, e1, e2, center_x=0, center_y=0):
+        """Returns Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2.
+
+        :param x: angular position (normally in units of arc seconds)
+        :param y: angular position (normally in units of arc seconds)
+        :param Rs: turn over point in the slope of the NFW profile in angular unit
+        :param alpha_Rs: deflection (angular units) at projected Rs
+        :param e1: eccentricity component in x-direction
+        :param e2: eccentricity component in y-direction
+        :param center_x: center of halo (in angular units)
+        :param center_y: center of halo (in angular units)
+        :return: d^2f/dx^2, d^2/dxdy, d^2/dydx, d^f/dy^2
+        """
+        phi_q, q = param_util.ellipticity2phi_q(e1, e2)
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        # the 1/q of the amplitudes cancels the two sqrt(q) factors of the derivatives
+        const = self._normalization(alpha_Rs, Rs, q) / Rs**2
+        f_xx, f_xy, f_yy = cse_set_hessian(
+            x_,
+            y_,
+            self._a_array,
+            self._s_array,
+            q,
+            np.cos(phi_q),
+            np.sin(phi_q),
+            center_x,
+            center_y,
+            np.sqrt(q) / Rs,
+            const,
+        )
+        f_xx, f_xy, f_yy = numba_util.reshape_output(shape, f_xx, f_xy, f_yy)
+        return f_xx, f_xy, f_xy, f_yy
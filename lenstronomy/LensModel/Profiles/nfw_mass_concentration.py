@@ -3,11 +3,13 @@ mass/kappa space."""
 
 __author__ = "sibirrer"
 
+import functools
+
 from lenstronomy.LensModel.Profiles.nfw import NFW
 from lenstronomy.Cosmo.lens_cosmo import LensCosmo
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 
-__all__ = ["NFWMC"]
+__all__ = ["NFWMC", "default_cosmo"]
 
 
 class NFWMC(LensProfileBase):
@@ -48,9 +50,7 @@ class NFWMC(LensProfileBase):
         self._nfw = NFW()
         if cosmo is None:
             # TODO: print warning if these lines get executed
-            from astropy.cosmology import FlatLambdaCDM
-
-            cosmo = FlatLambdaCDM(H0=70, Om0=0.3, Ob0=0.05)
+            cosmo = default_cosmo()
         self._lens_cosmo = LensCosmo(z_lens=z_lens, z_source=z_source, cosmo=cosmo)
         self._static = static
         super(NFWMC, self).__init__()
@@ -118,3 +118,16 @@ class NFWMC(LensProfileBase):
         d^f/dy^2."""
         Rs, alpha_Rs = self._m_c2deflections(logM, concentration)
         return self._nfw.hessian(x, y, Rs, alpha_Rs, center_x, center_y)
+
+
+@functools.lru_cache(maxsize=None)
+def default_cosmo():
+    """Default cosmology of the mass-concentration parameterizations. The instance is
+    shared as the construction of an astropy cosmology is expensive compared to the
+    construction of the lens profiles.
+
+    :return: astropy.cosmology.FlatLambdaCDM instance
+    """
+    from astropy.cosmology import FlatLambdaCDM
+
+    return FlatLambdaCDM(H0=70, Om0=0.3, Ob0=0.05)
@@ -7,6 +7,7 @@ import numpy as np
 from lenstronomy.Util import constants as const
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 from lenstronomy.Cosmo.lens_cosmo import LensCosmo
+from lenstronomy.LensModel.Profiles.nfw_mass_concentration import default_cosmo
 
 __all__ = ["NFWVirTrunc"]
 
@@ -28,9 +29,7 @@ class NFWVirTrunc(LensProfileBase):
         """
 
         if cosmo is None:
-            from astropy.cosmology import FlatLambdaCDM
-
-            cosmo = FlatLambdaCDM(H0=70, Om0=0.3, Ob0=0.05)
+            cosmo = default_cosmo()
         self._lens_cosmo = LensCosmo(z_lens=z_lens, z_source=z_source, cosmo=cosmo)
         super(NFWVirTrunc, self).__init__()
 
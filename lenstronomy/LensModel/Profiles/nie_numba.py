@@ -0,0 +1,176 @@
+import numpy as np
+from lenstronomy.LensModel.Profiles.nie import NIE
+from lenstronomy.LensModel.Profiles.sie import SIE
+from lenstronomy.Util import numba_util
+
+__all__ = ["NIE_numba", "SIE_numba"]
+
+
+class NIE_numba(NIE):
+    """Non-singular isothermal ellipsoid (NIE) with the deflection angles and the
+    Hessian computed in jitted kernels.
+
+    The shift and the rotation into the major axis frame are fused with the evaluation
+    in loops over the coordinates, parallelized when numba is configured with
+    parallel=True. In difference to NIE, the Hessian is evaluated
+    analytically (derivatives of Keeton & Kochanek 1998 Equation 8) instead of with
+    finite differences of the deflection angles.
+
+    The lensing potential is inherited from the numpy implementation 'NIE'.
+    """
+
+    def derivatives(self, x, y, theta_E, e1, e2, s_scale, center_x=0, center_y=0):
+        """
+
+        :param x: x-coordinate in image plane
+        :param y: y-coordinate in image plane
+        :param theta_E: Einstein radius
+        :param e1: eccentricity component
+        :param e2: eccentricity component
+        :param s_scale: smoothing scale
+        :param center_x: profile center
+        :param center_y: profile center
+        :return: alpha_x, alpha_y
+        """
+        b, s, q, phi_G = self.param_conv(theta_E, e1, e2, s_scale)
+        if q >= 1:
+            q = 0.99999999
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        cos_phi, sin_phi = np.cos(phi_G), np.sin(phi_G)
+        u, v = _derivatives_arguments(
+            x_, y_, s, q, cos_phi, sin_phi, center_x, center_y
+        )
+        # the vectorized numpy inverse trigonometric functions are substantially faster
+        # than their scalar counterparts called within numba
+        norm = b / np.sqrt(1.0 - q**2)
+        f_x, f_y = _rotate_back(
+            np.arctan(u), np.arctanh(v), norm * cos_phi, norm * sin_phi
+        )
+        return numba_util.reshape_output(shape, f_x, f_y)
+
+    def hessian(self, x, y, theta_E, e1, e2, s_scale, center_x=0, center_y=0):
+        """
+
+        :param x: x-coordinate in image plane
+        :param y: y-coordinate in image plane
+        :param theta_E: Einstein radius
+        :param e1: eccentricity component
+        :param e2: eccentricity component
+        :param s_scale: smoothing scale
+        :param center_x: profile center
+        :param center_y: profile center
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        b, s, q, phi_G = self.param_conv(theta_E, e1, e2, s_scale)
+        if q >= 1:
+            q = 0.99999999
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        f_xx, f_xy, f_yy = _hessian(
+            x_, y_, b, s, q, np.cos(phi_G), np.sin(phi_G), center_x, center_y
+        )
+        f_xx, f_xy, f_yy = numba_util.reshape_output(shape, f_xx, f_xy, f_yy)
+        return f_xx, f_xy, f_xy, f_yy
+
+
+class SIE_numba(SIE):
+    """Singular isothermal ellipsoid (SIE) evaluated with the jitted NIE kernels of
+    NIE_numba (with a vanishing core, as the analytic option of 'SIE')."""
+
+    def __init__(self):
+        super(SIE_numba, self).__init__(NIE=True)
+        self.profile = NIE_numba()
+
+
+@numba_util.jit()
+def _derivatives_arguments(x, y, s, q, cos_phi, sin_phi, center_x, center_y):
+    """Arguments of the arctan and arctanh of the NIE deflection angles in the major
+    axis frame (Keeton & Kochanek 1998 Equation 8) for a list of coordinates.
+
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param s: smoothing scale along the major axis
+    :param q: axis ratio (<1)
+    :param cos_phi: cosine of the position angle
+    :param sin_phi: sine of the position angle
+    :param center_x: profile center
+    :param center_y: profile center
+    :return: argument of the arctan (x-deflection), argument of the arctanh
+        (y-deflection)
+    """
+    n = len(x)
+    u = np.empty(n)
+    v = np.empty(n)
+    q2 = q**2
+    e = np.sqrt(1.0 - q2)
+    for i in numba_util.prange(n):
+        dx = x[i] - center_x
+        dy = y[i] - center_y
+        x_ = dx * cos_phi + dy * sin_phi
+        y_ = -dx * sin_phi + dy * cos_phi
+        psi = np.sqrt(q2 * (s**2 + x_**2) + y_**2)
+        u[i] = e * x_ / (psi + s)
+        v[i] = e * y_ / (psi + q2 * s)
+    return u, v
+
+
+@numba_util.jit()
+def _rotate_back(f_x_, f_y_, cos_phi, sin_phi):
+    """Rotates the deflection angles from the major axis frame back to the image frame.
+
+    :param f_x_: 1d array, deflection along the major axis
+    :param f_y_: 1d array, deflection along the minor axis
+    :param cos_phi: cosine of the position angle (times a normalization)
+    :param sin_phi: sine of the position angle (times a normalization)
+    :return: alpha_x, alpha_y
+    """
+    n = len(f_x_)
+    f_x = np.empty(n)
+    f_y = np.empty(n)
+    for i in numba_util.prange(n):
+        f_x[i] = f_x_[i] * cos_phi - f_y_[i] * sin_phi
+        f_y[i] = f_x_[i] * sin_phi + f_y_[i] * cos_phi
+    return f_x, f_y
+
+
+@numba_util.jit()
+def _hessian(x, y, b, s, q, cos_phi, sin_phi, center_x, center_y):
+    """Hessian of the NIE for a list of coordinates.
+
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param b: critical radius along the major axis
+    :param s: smoothing scale along the major axis
+    :param q: axis ratio (<1)
+    :param cos_phi: cosine of the position angle
+    :param sin_phi: sine of the position angle
+    :param center_x: profile center
+    :param center_y: profile center
+    :return: f_xx, f_xy, f_yy
+    """
+    n = len(x)
+    f_xx = np.empty(n)
+    f_xy = np.empty(n)
+    f_yy = np.empty(n)
+    q2 = q**2
+    cos_2phi = cos_phi**2 - sin_phi**2
+    sin_2phi = 2 * cos_phi * sin_phi
+    for i in numba_util.prange(n):
+        dx = x[i] - center_x
+        dy = y[i] - center_y
+        x_ = dx * cos_phi + dy * sin_phi
+        y_ = -dx * sin_phi + dy * cos_phi
+        psi = np.sqrt(q2 * (s**2 + x_**2) + y_**2)
+        denom_x = psi * ((psi + s) ** 2 + (1.0 - q2) * x_**2)
+        denom_y = psi * ((psi + q2 * s) ** 2 - (1.0 - q2) * y_**2)
+        f__xx = b * (psi * (psi + s) - q2 * x_**2) / denom_x
+        f__yy = b * (psi * (psi + q2 * s) - y_**2) / denom_y
+        f__xy = -b * x_ * y_ / denom_x
+        # rotate back
+        kappa = (f__xx + f__yy) / 2.0
+        gamma1_ = (f__xx - f__yy) / 2.0
+        gamma1 = cos_2phi * gamma1_ - sin_2phi * f__xy
+        gamma2 = sin_2phi * gamma1_ + cos_2phi * f__xy
+        f_xx[i] = kappa + gamma1
+        f_yy[i] = kappa - gamma1
+        f_xy[i] = gamma2
+    return f_xx, f_xy, f_yy
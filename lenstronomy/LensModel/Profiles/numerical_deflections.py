@@ -1,6 +1,7 @@
 __author__ = "dgilman"
 
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.tabulated_lens_model import TabulatedLensModel
 
 __all__ = ["TabulatedDeflections"]
 
@@ -66,6 +67,10 @@ class TabulatedDeflections(LensProfileBase):
         :param center_y: the deflector y coordinate :param kwargs: keyword arguments for
         the profile :return: the derivatives of the deflection angles that make up the
         hessian matrix."""
+        if isinstance(self._custom_lens_class, TabulatedLensModel):
+            # the tabulated Hessian is used instead of finite differences of the
+            # interpolated deflection angles
+            return self._custom_lens_class.hessian(x - center_x, y - center_y, **kwargs)
 
         diff = 1e-6
         alpha_ra, alpha_dec = self.derivatives(
@@ -230,8 +230,10 @@ class SersicUtil(object):
                 exponent = -bn * (R_frac ** (1.0 / n_sersic) - 1.0)
                 result = np.exp(exponent)
         else:
-            R_frac_real = R_frac[R_frac <= max_R_frac]
-            exponent = -bn * (R_frac_real ** (1.0 / n_sersic) - 1.0)
-            result = np.zeros_like(R_)
-            result[R_frac <= max_R_frac] = np.exp(exponent)
+            # evaluated on the (broadcast) full array to support parameter arrays, the
+            # values outside the window are discarded
+            inside = R_frac <= max_R_frac
+            exponent = -bn * (np.where(inside, R_frac, 1) ** (1.0 / n_sersic) - 1.0)
+            result = np.zeros(np.shape(R_frac), dtype=np.asarray(R_).dtype)
+            result[inside] = np.exp(exponent)[inside]
         return np.nan_to_num(result)
@@ -67,6 +67,32 @@ class Shear(LensProfileBase):
         f_xy = gamma2
         return f_xx, f_xy, f_xy, f_yy
 
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivatives of the deflection angles with respect to all
+        parameters.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        gamma1, gamma2 = kwargs["gamma1"], kwargs["gamma2"]
+        x_ = x - kwargs.get("ra_0", 0)
+        y_ = y - kwargs.get("dec_0", 0)
+        zeros = np.zeros_like(x_, dtype=float)
+        jacobian = {}
+        if "gamma1" in param_names:
+            jacobian["gamma1"] = (x_ + zeros, -y_ + zeros)
+        if "gamma2" in param_names:
+            jacobian["gamma2"] = (y_ + zeros, x_ + zeros)
+        if "ra_0" in param_names:
+            jacobian["ra_0"] = (zeros - gamma1, zeros - gamma2)
+        if "dec_0" in param_names:
+            jacobian["dec_0"] = (zeros - gamma2, zeros + gamma1)
+        return jacobian
+
 
 class ShearGammaPsi(LensProfileBase):
     """
@@ -0,0 +1,51 @@
+import numpy as np
+from lenstronomy.LensModel.Profiles.shear import Shear
+from lenstronomy.Util import numba_util
+
+__all__ = ["Shear_numba"]
+
+
+class Shear_numba(Shear):
+    """External shear gamma1, gamma2 with the deflection angles computed in a jitted
+    kernel (single pass over the coordinates without temporary arrays).
+
+    The lensing potential and the (constant) Hessian are inherited from 'SHEAR'.
+    """
+
+    def derivatives(self, x, y, gamma1, gamma2, ra_0=0, dec_0=0):
+        """
+
+        :param x: x-coordinate (angle)
+        :param y: y0-coordinate (angle)
+        :param gamma1: shear component
+        :param gamma2: shear component
+        :param ra_0: x/ra position where shear deflection is 0
+        :param dec_0: y/dec position where shear deflection is 0
+        :return: deflection angles
+        """
+        x_, y_, shape = numba_util.ravel_coordinates(x, y)
+        f_x, f_y = _derivatives(x_, y_, gamma1, gamma2, ra_0, dec_0)
+        return numba_util.reshape_output(shape, f_x, f_y)
+
+
+@numba_util.jit()
+def _derivatives(x, y, gamma1, gamma2, ra_0, dec_0):
+    """Deflection angles of an external shear for a list of coordinates.
+
+    :param x: 1d array of x-coordinates
+    :param y: 1d array of y-coordinates
+    :param gamma1: shear component
+    :param gamma2: shear component
+    :param ra_0: x/ra position where shear deflection is 0
+    :param dec_0: y/dec position where shear deflection is 0
+    :return: alpha_x, alpha_y
+    """
+    n = len(x)
+    f_x = np.empty(n)
+    f_y = np.empty(n)
+    for i in numba_util.prange(n):
+        x_ = x[i] - ra_0
+        y_ = y[i] - dec_0
+        f_x[i] = gamma1 * x_ + gamma2 * y_
+        f_y[i] = gamma2 * x_ - gamma1 * y_
+    return f_x, f_y
@@ -127,6 +127,25 @@ class SIE(LensProfileBase):
                 x, y, theta_E, self._gamma, e1, e2, center_x, center_y
             )
 
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivative of the deflection angles with respect to theta_E. The
+        ellipticity and the center are differentiated numerically (the Hessian of the
+        NIE is itself computed with finite differences).
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        jacobian = {}
+        if "theta_E" in param_names:
+            # the deflection is linear in theta_E
+            kwargs_unit = dict(kwargs, theta_E=1)
+            jacobian["theta_E"] = self.derivatives(x, y, **kwargs_unit)
+        return jacobian
+
     @staticmethod
     def theta2rho(theta_E):
         """Converts projected density parameter (in units of deflection) into 3d density
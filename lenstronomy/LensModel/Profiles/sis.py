@@ -34,10 +34,15 @@ class SIS(LensProfileBase):
         if isinstance(R, int) or isinstance(R, float):
             a = theta_E / max(0.000001, R)
         else:
-            a = np.empty_like(R)
-            r = R[R > 0]  # in the SIS regime
-            a[R == 0] = 0
-            a[R > 0] = theta_E / r
+            # zero in the center (theta_E may be an array broadcasting against R)
+            a = np.divide(
+                theta_E,
+                R,
+                out=np.zeros(
+                    np.broadcast(theta_E, R).shape, dtype=np.result_type(theta_E, R)
+                ),
+                where=R > 0,
+            )
         f_x = a * x_shift
         f_y = a * y_shift
         return f_x, f_y
@@ -51,16 +56,38 @@ class SIS(LensProfileBase):
         if isinstance(R, int) or isinstance(R, float):
             prefac = theta_E / max(0.000001, R)
         else:
-            prefac = np.empty_like(R)
-            r = R[R > 0]  # in the SIS regime
-            prefac[R == 0] = 0.0
-            prefac[R > 0] = theta_E / r
+            prefac = np.divide(
+                theta_E,
+                R,
+                out=np.zeros(
+                    np.broadcast(theta_E, R).shape, dtype=np.result_type(theta_E, R)
+                ),
+                where=R > 0,
+            )
 
         f_xx = y_shift * y_shift * prefac
         f_yy = x_shift * x_shift * prefac
         f_xy = -x_shift * y_shift * prefac
         return f_xx, f_xy, f_xy, f_yy
 
+    def _derivatives_jacobian(self, x, y, kwargs, param_names):
+        """Analytic derivatives of the deflection angles with respect to theta_E and the
+        center.
+
+        :param x: x-coordinate (angle)
+        :param y: y-coordinate (angle)
+        :param kwargs: keyword arguments of the profile
+        :param param_names: list of requested parameter names
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        jacobian = self._center_jacobian(x, y, kwargs, param_names)
+        if "theta_E" in param_names:
+            # the deflection is linear in theta_E
+            kwargs_unit = dict(kwargs, theta_E=1)
+            jacobian["theta_E"] = self.derivatives(x, y, **kwargs_unit)
+        return jacobian
+
     @staticmethod
     def rho2theta(rho0):
         """Converts 3d density into 2d projected density parameter :param rho0:
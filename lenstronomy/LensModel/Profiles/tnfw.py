@@ -190,7 +190,7 @@ class TNFW(LensProfileBase):
         y_ = y - center_y
         R = np.sqrt(x_**2 + y_**2)
         x = R * Rs**-1
-        tau = float(r_trunc) * Rs**-1
+        tau = np.asarray(r_trunc, dtype=float) * Rs**-1
         Fx = self._F(x, tau)
         return 2 * rho0 * Rs * Fx
 
@@ -236,7 +236,7 @@ class TNFW(LensProfileBase):
         """
         x = R / Rs
         x = np.maximum(x, self._s)
-        tau = float(r_trunc) / Rs
+        tau = np.asarray(r_trunc, dtype=float) / Rs
         hx = self._h(x, tau)
         return 2 * rho0 * Rs**3 * hx
 
@@ -258,7 +258,7 @@ class TNFW(LensProfileBase):
         R = np.maximum(R, self._s * Rs)
         x = R / Rs
         x = np.maximum(x, self._s)
-        tau = float(r_trunc) / Rs
+        tau = np.asarray(r_trunc, dtype=float) / Rs
         gx = self._g(x, tau)
         a = 4 * rho0 * Rs * gx / x**2
         return a * ax_x, a * ax_y
@@ -281,7 +281,7 @@ class TNFW(LensProfileBase):
         """
         R = np.maximum(R, self._s * Rs)
         x = R / Rs
-        tau = float(r_trunc) * Rs**-1
+        tau = np.asarray(r_trunc, dtype=float) * Rs**-1
         gx = self._g(x, tau)
         Fx = self._F(x, tau)
         a = 2 * rho0 * Rs * (2 * gx / x**2 - Fx)
@@ -315,10 +315,13 @@ class TNFW(LensProfileBase):
         _F = self.F(X)
         a = t2 * (t2 + 1) ** -2
         if isinstance(X, np.ndarray):
-            # b = (t2 + 1) * (X ** 2 - 1) ** -1 * (1 - _F)
-            b = np.ones_like(X)
-            b[X == 1] = (t2 + 1) * 1.0 / 3
-            b[X != 1] = (t2 + 1) * (X[X != 1] ** 2 - 1) ** -1 * (1 - _F[X != 1])
+            # tau may be an array broadcasting against X
+            with np.errstate(divide="ignore", invalid="ignore"):
+                b = np.where(
+                    X == 1,
+                    (t2 + 1) * 1.0 / 3,
+                    (t2 + 1) * (X**2 - 1) ** -1 * (1 - _F),
+                )
 
         elif isinstance(X, float) or isinstance(X, int):
             if X == 1:
@@ -12,9 +12,8 @@ from lenstronomy.LensModel.Util.epl_util import (
     brentq_inline,
 )
 from lenstronomy.LensModel.Util.epl_util import pol_to_ell, ell_to_pol, geomlinspace
-from lenstronomy.Util.image_util import findOverlap
 from lenstronomy.LensModel.Profiles.epl_numba import alpha, omega
-from lenstronomy.Util.numba_util import jit
+from lenstronomy.Util.numba_util import jit, prange
 from lenstronomy.Util.param_util import (
     ellipticity2phi_q,
     shear_cartesian2polar,
@@ -22,6 +21,10 @@ from lenstronomy.Util.param_util import (
 )
 from lenstronomy.LensModel.Profiles.shear import Shear
 
+# maximal number of images stored per source position in the batched solver (an EPL
+# with external shear has at most five images)
+_MAX_IMAGES = 8
+
 
 @jit()
 def _alpha_epl_shear(x, y, b, q, t=1, gamma1=0, gamma2=0, Omega=None):
@@ -92,6 +95,60 @@ def _one_dim_lens_eq_both(phi, args):
     return eq, eq_notsmooth
 
 
+@jit()
+def _one_dim_lens_eq_grid(phi, b, t, q, gamma1, gamma2):
+    """Factors of the 1-dimensional lens equations on a grid of angles that do not
+    depend on the source position, see _one_dim_lens_eq_from_grid().
+
+    :param phi: array of angles
+    :param b: Einstein radius (angle), see alpha()
+    :param t: logarithmic power-law slope t=gamma-1
+    :param q: axis ratio
+    :param gamma1: shear component in the major-axis frame
+    :param gamma2: shear component in the major-axis frame
+    :return: tuple of the factors
+    """
+    Omega, const, phiell, q, r, rhat, t, b, thetahat, y = _one_dim_lens_eq_calcs(
+        (b, t, 0.0, 0.0, q, gamma1, gamma2), phi
+    )
+    rr, thetaa = ell_to_pol(1, phiell, q)
+    omega_theta = cdot(Omega, thetahat)
+    return (
+        rhat,
+        thetahat,
+        omega_theta,
+        cdot(Omega, rhat),
+        (rr * b) ** (2 / t - 2),
+        ps(rr * b, 1 - t),
+        np.abs(omega_theta) ** t,
+        const,
+    )
+
+
+@jit()
+def _one_dim_lens_eq_from_grid(y1, y2, t, grid):
+    """Smooth and not-smooth 1-dimensional lens equations as _one_dim_lens_eq_both(),
+    with the factors independent of the source position taken from a grid.
+
+    :param y1: source position along the major axis
+    :param y2: source position along the minor axis
+    :param t: logarithmic power-law slope t=gamma-1
+    :param grid: factors of the lens equations, see _one_dim_lens_eq_grid()
+    :return: smooth and not-smooth lens equation on the grid
+    """
+    rhat, thetahat, omega_theta, omega_r, fac, fac_notsmooth, omega_theta_t, const = (
+        grid
+    )
+    y_theta = y1 * thetahat.real + y2 * thetahat.imag
+    y_r = y1 * rhat.real + y2 * rhat.imag
+    ip = y_r * omega_theta - omega_r * y_theta
+    eq = fac * ps(y_theta / const, 2 / t) * ip**2 + ps(ip, 2 / t) * omega_theta**2
+    eq_notsmooth = (
+        fac_notsmooth * (y_theta / const) * np.abs(ip) ** t + ip * omega_theta_t
+    )
+    return eq, eq_notsmooth
+
+
 @jit()
 def _getr(phi, args):
     """Given an angle phi, get the radius r."""
@@ -144,6 +201,20 @@ def _getphi(thpl, args):
     :return: an array containing all roots
     """
     y, y_notsmooth = _one_dim_lens_eq_both(thpl, args)
+    return _getphi_roots(thpl, y, y_notsmooth, args)
+
+
+@jit()
+def _getphi_roots(thpl, y, y_notsmooth, args):
+    """Roots of the 1-dimensional lens equation from its values on a grid, see
+    _getphi().
+
+    :param thpl: sorted grid of angles
+    :param y: smooth 1-dimensional lens equation on thpl
+    :param y_notsmooth: not-smooth 1-dimensional lens equation on thpl
+    :param args: Parameters to be passed to the lens equation
+    :return: an array containing all roots
+    """
     num_phi = len(thpl)
     roots = []
     for i in range(num_phi - 1):
@@ -221,32 +292,103 @@ def solvelenseq_majoraxis(args, Nmeas=200, Nmeas_extra=50):
     """Solve the lens equation, where the arguments have been properly rotated to the
     major-axis."""
     b, t, y1, y2, q, gamma1, gamma2 = args
+    b, t, q, gamma1, gamma2 = float(b), float(t), float(q), float(gamma1), float(gamma2)
+    thpl_lin = np.linspace(0.0, np.pi, Nmeas)
+    return _solve_majoraxis(
+        b,
+        t,
+        float(y1),
+        float(y2),
+        q,
+        gamma1,
+        gamma2,
+        thpl_lin,
+        _one_dim_lens_eq_grid(thpl_lin, b, t, q, gamma1, gamma2),
+        geomlinspace(1e-4, 0.1, Nmeas_extra),
+    )
+
+
+@jit()
+def _solve_majoraxis(b, t, y1, y2, q, gamma1, gamma2, thpl_lin, grid_lin, geom):
+    """Solve the lens equation for a source position in the major-axis frame.
+
+    :param b: Einstein radius (angle), see alpha()
+    :param t: logarithmic power-law slope t=gamma-1
+    :param y1: source position along the major axis
+    :param y2: source position along the minor axis
+    :param q: axis ratio
+    :param gamma1: shear component in the major-axis frame
+    :param gamma2: shear component in the major-axis frame
+    :param thpl_lin: regular grid of angles in [0, pi] to search for roots
+    :param grid_lin: factors of the lens equations on thpl_lin, see
+        _one_dim_lens_eq_grid()
+    :param geom: offsets of the additional angles sampled around the direction of the
+        source position (see geomlinspace())
+    :return: x- and y-coordinates of the images
+    """
+    args = (b, t, y1, y2, q, gamma1, gamma2)
     p1 = np.arctan2(y2 * (1 - gamma1) + gamma2 * y1, y1 * (1 + gamma1) + gamma2 * y2)
-    int_points = [p1]
-    geom = geomlinspace(1e-4, 0.1, Nmeas_extra)
-
-    thpl = np.sort(
-        np.concatenate(
-            (
-                np.linspace(0.0, np.pi, Nmeas),
-                *[i % np.pi - geom for i in int_points],
-                *[i % np.pi + geom for i in int_points],
-            )
-        )
+    # the equations on the additional angles are evaluated directly and merged with
+    # the ones on the regular grid
+    thpl_extra = np.concatenate((p1 % np.pi - geom, p1 % np.pi + geom))
+    eq_lin, eq_notsmooth_lin = _one_dim_lens_eq_from_grid(y1, y2, t, grid_lin)
+    eq_extra, eq_notsmooth_extra = _one_dim_lens_eq_both(thpl_extra, args)
+    thpl = np.concatenate((thpl_lin, thpl_extra))
+    order = np.argsort(thpl, kind="mergesort")
+    the = _getphi_roots(
+        thpl[order],
+        np.concatenate((eq_lin, eq_extra))[order],
+        np.concatenate((eq_notsmooth_lin, eq_notsmooth_extra))[order],
+        args,
     )
-    the = _getphi(thpl, (b, t, y1, y2, q, gamma1, gamma2))
     thetas = np.concatenate((the, the + np.pi))
-    Rs = np.array([_getr(theta, (b, t, y1, y2, q, gamma1, gamma2)) for theta in thetas])
-    stuff = np.array(pol_to_cart(Rs[Rs > 0], thetas[Rs > 0]))
+    rs = np.empty(len(thetas))
+    for i in range(len(thetas)):
+        rs[i] = _getr(thetas[i], args)
+    x, y = pol_to_cart(rs[rs > 0], thetas[rs > 0])
     diff = (
         -y1
         - y2 * 1j
-        + stuff[0]
-        + stuff[1] * 1j
-        - _alpha_epl_shear(stuff[0], stuff[1], b, q, t, gamma1=gamma1, gamma2=gamma2)
+        + x
+        + y * 1j
+        - _alpha_epl_shear(x, y, b, q, t, gamma1=gamma1, gamma2=gamma2)
     )
-    goodones = np.abs(diff) < 1e-8
-    return findOverlap(*stuff[:, goodones], 1e-8)
+    x, y = x[np.abs(diff) < 1e-8], y[np.abs(diff) < 1e-8]
+    # remove multiples (as findOverlap)
+    keep = np.ones(len(x), dtype=np.bool_)
+    for i in range(1, len(x)):
+        for j in range(i):
+            if abs(x[i] - x[j]) < 1e-8 and abs(y[i] - y[j]) < 1e-8:
+                keep[i] = False
+                break
+    return x[keep], y[keep]
+
+
+@jit()
+def _solve_majoraxis_batch(b, t, y1, y2, q, gamma1, gamma2, thpl_lin, geom):
+    """Solve the lens equation for many source positions in the major-axis frame, see
+    _solve_majoraxis(). The factors of the lens equations on the regular grid of
+    angles are computed once for all source positions.
+
+    :param y1: array of source positions along the major axis
+    :param y2: array of source positions along the minor axis
+    :return: x- and y-coordinates of the images (2d arrays padded with nan, with the
+        images of a source position along the second axis), number of images
+    """
+    n = len(y1)
+    x_images = np.full((n, _MAX_IMAGES), np.nan)
+    y_images = np.full((n, _MAX_IMAGES), np.nan)
+    num_images = np.zeros(n, dtype=np.int64)
+    grid_lin = _one_dim_lens_eq_grid(thpl_lin, b, t, q, gamma1, gamma2)
+    for i in prange(n):
+        x, y = _solve_majoraxis(
+            b, t, y1[i], y2[i], q, gamma1, gamma2, thpl_lin, grid_lin, geom
+        )
+        num = min(len(x), _MAX_IMAGES)
+        x_images[i, :num] = x[:num]
+        y_images[i, :num] = y[:num]
+        num_images[i] = num
+    return x_images, y_images, num_images
 
 
 def _check_center(kwargs_lens):
@@ -265,19 +407,14 @@ def _check_center(kwargs_lens):
         return 0, 0
 
 
-def solve_lenseq_pemd(pos_, kwargs_lens, Nmeas=400, Nmeas_extra=80, **kwargs):
-    """Solves the lens equation using a semi-analytical recipe.
+def _major_axis_frame(kwargs_lens):
+    """Parameters of an EPL+SHEAR lens model in the frame of the major axis of the EPL.
 
-    :param pos_: The source plane position (shape (2,)), or the source plane positions (shape (2,N)) for which to solve the lens equation
-    :param kwargs_lens: List of kwargs in lenstronomy style, following ['EPL', 'SHEAR'] format
-    :param Nmeas: resolution with which to sample the angular grid, higher means more reliable lens equation solving. For solving many positions at once, you may want to set this higher.
-    :param Nmeas_extra: resolution with which to additionally sample the angular grid at the low-shear end, higher means more reliable lens equation solving. For solving many positions at once, you may want to set this higher.
-    :return: The lens plane positions.
-    Note: generally the (demagnified) central image will also be included.
+    :param kwargs_lens: List of kwargs in lenstronomy style, following ['EPL', 'SHEAR']
+        format
+    :return: b, t, q, complex shear in the major-axis frame, rotation factor, complex
+        center of the EPL, complex shift of the source position from the shear center
     """
-    pos = np.asarray(pos_)
-    if pos.ndim > 1 and pos.shape[-1] != 1:
-        pos = pos[..., None]
     t = kwargs_lens[0]["gamma"] - 1 if "gamma" in kwargs_lens[0] else 1
 
     theta_ell, q = ellipticity2phi_q(kwargs_lens[0]["e1"], kwargs_lens[0]["e2"])
@@ -289,10 +426,30 @@ def solve_lenseq_pemd(pos_, kwargs_lens, Nmeas=400, Nmeas_extra=80, **kwargs):
     shift_x, shift_y = _check_center(kwargs_lens)
     shift = shift_x + 1j * shift_y
     cen = kwargs_lens[0]["center_x"] + 1j * kwargs_lens[0]["center_y"]
-    p = pos[0] + 1j * pos[1] - cen + shift
 
     rotfact = np.exp(-1j * theta_ell)
     gamma *= rotfact**2
+    return b, t, q, gamma, rotfact, cen, shift
+
+
+def solve_lenseq_pemd(pos_, kwargs_lens, Nmeas=400, Nmeas_extra=80, **kwargs):
+    """Solves the lens equation using a semi-analytical recipe.
+
+    :param pos_: The source plane position (shape (2,)), or the source plane positions (shape (2,N)) for which to solve the lens equation
+    :param kwargs_lens: List of kwargs in lenstronomy style, following ['EPL', 'SHEAR'] format
+    :param Nmeas: resolution with which to sample the angular grid, higher means more reliable lens equation solving. For solving many positions at once, you may want to set this higher.
+    :param Nmeas_extra: resolution with which to additionally sample the angular grid at the low-shear end, higher means more reliable lens equation solving. For solving many positions at once, you may want to set this higher.
+    :return: The lens plane positions. For (2,N) source positions, arrays of shape (N, M) padded with nan (see solve_lenseq_pemd_batch()).
+    Note: generally the (demagnified) central image will also be included.
+    """
+    pos = np.asarray(pos_)
+    if pos.ndim > 1:
+        x, y, _ = solve_lenseq_pemd_batch(
+            pos, kwargs_lens, Nmeas=Nmeas, Nmeas_extra=Nmeas_extra
+        )
+        return x, y
+    b, t, q, gamma, rotfact, cen, shift = _major_axis_frame(kwargs_lens)
+    p = pos[0] + 1j * pos[1] - cen + shift
     p *= rotfact
     res = solvelenseq_majoraxis(
         (b, t, p.real, p.imag, q, gamma.real, gamma.imag),
@@ -300,10 +457,46 @@ def solve_lenseq_pemd(pos_, kwargs_lens, Nmeas=400, Nmeas_extra=80, **kwargs):
         Nmeas_extra=Nmeas_extra,
     )
     xsol, ysol = res
-    x = np.array([(xs + 1j * ys) / rotfact + cen for xs, ys in zip(xsol, ysol)])
+    x = (xsol + 1j * ysol) / rotfact + cen
     return x.real, x.imag
 
 
+def solve_lenseq_pemd_batch(pos_, kwargs_lens, Nmeas=400, Nmeas_extra=80):
+    """Solves the lens equation of an EPL+SHEAR lens model for many source positions
+    at once with the semi-analytical recipe of solve_lenseq_pemd(). The source
+    positions are solved in a compiled loop (parallel if numba is configured with
+    parallel=True).
+
+    :param pos_: the source plane positions, shape (2, N)
+    :param kwargs_lens: List of kwargs in lenstronomy style, following ['EPL', 'SHEAR']
+        format
+    :param Nmeas: resolution with which to sample the angular grid, see
+        solve_lenseq_pemd()
+    :param Nmeas_extra: resolution with which to additionally sample the angular grid at
+        the low-shear end, see solve_lenseq_pemd()
+    :return: x- and y-coordinates of the images, arrays of shape (N, M) with M the
+        largest number of images of a source position, padded with nan, and the number
+        of images of each source position (shape (N,))
+    """
+    pos = np.asarray(pos_, dtype=float).reshape(2, -1)
+    b, t, q, gamma, rotfact, cen, shift = _major_axis_frame(kwargs_lens)
+    p = (pos[0] + 1j * pos[1] - cen + shift) * rotfact
+    x, y, num_images = _solve_majoraxis_batch(
+        float(b),
+        float(t),
+        p.real,
+        p.imag,
+        float(q),
+        float(gamma.real),
+        float(gamma.imag),
+        np.linspace(0.0, np.pi, Nmeas),
+        geomlinspace(1e-4, 0.1, Nmeas_extra),
+    )
+    num_max = np.max(num_images) if len(num_images) > 0 else 0
+    z = (x[:, :num_max] + 1j * y[:, :num_max]) / rotfact + cen
+    return z.real, z.imag, num_images
+
+
 def caustics_epl_shear(
     kwargs_lens, num_th=500, maginf=0, sourceplane=True, return_which=None
 ):
@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import lenstronomy.Util.util as util
 import lenstronomy.Util.image_util as image_util
@@ -18,6 +20,8 @@ class LensEquationSolver(object):
             lenstronomy.LensModel.lens_model
         """
         self.lensModel = lensModel
+        # mesh of the hierarchical candidate search reused across calls
+        self._mesh = None
 
     def image_position_stochastic(
         self,
@@ -101,10 +105,18 @@ class LensEquationSolver(object):
         verbose=False,
         x_center=0,
         y_center=0,
+        hierarchical=False,
+        reuse_mesh=False,
     ):
         """Finds pixels in the image plane possibly hosting a solution of the lens
         equation, for the given source position and lens model.
 
+        By default, the full search window is ray-shot on a grid of min_distance and the
+        local minima of the distance to the source position are selected. With
+        hierarchical=True, the window is covered by coarse cells that are only refined
+        where their image in the source plane contains the source position (see
+        _CandidateMesh), which requires far fewer ray-shooting evaluations.
+
         :param sourcePos_x: source position in units of angle
         :param sourcePos_y: source position in units of angle
         :param kwargs_lens: lens model parameters as keyword arguments
@@ -115,18 +127,30 @@ class LensEquationSolver(object):
         :param verbose: bool, if True, prints some useful information for the user
         :param x_center: float, center of the window to search for point sources
         :param y_center: float, center of the window to search for point sources
+        :param hierarchical: bool, if True, uses the hierarchical refinement of the
+            search grid instead of the full grid
+        :param reuse_mesh: bool, if True (and hierarchical=True), keeps the ray-shot
+            grid points of the refinement and reuses them in calls with the same
+            lens model parameters and search window
         :returns: (approximate) angular position of (multiple) images ra_pos, dec_pos in
             units of angles, related ray-traced source displacements and pixel width
         :raises: AttributeError, KeyError
         """
+        if hierarchical:
+            mesh = self._candidate_mesh(
+                kwargs_lens,
+                min_distance,
+                search_window,
+                x_center,
+                y_center,
+                reuse_mesh=reuse_mesh,
+            )
+            x_mins, y_mins, delta_map = mesh.search(sourcePos_x, sourcePos_y)
+            return x_mins, y_mins, delta_map, min_distance
         kwargs_lens = self.lensModel.set_static(kwargs_lens)
-        # compute number of pixels to cover the search window with the required min_distance
-        numPix = int(round(search_window / min_distance) + 0.5)
-        x_grid, y_grid = util.make_grid(numPix, min_distance)
-        x_grid += x_center
-        y_grid += y_center
-        # ray-shoot to find the relative distance to the required source position for each grid point
-        x_mapped, y_mapped = self.lensModel.ray_shooting(x_grid, y_grid, kwargs_lens)
+        x_grid, y_grid, x_mapped, y_mapped = self._ray_shooting_grid(
+            kwargs_lens, min_distance, search_window, x_center, y_center
+        )
         absmapped = util.displaceAbs(x_mapped, y_mapped, sourcePos_x, sourcePos_y)
         # select minima in the grid points and select grid points that do not deviate more than the
         # width of the grid point to a solution of the lens equation
@@ -136,6 +160,66 @@ class LensEquationSolver(object):
 
         return x_mins, y_mins, delta_map, pixel_width
 
+    def _candidate_mesh(
+        self,
+        kwargs_lens,
+        min_distance,
+        search_window,
+        x_center,
+        y_center,
+        reuse_mesh=False,
+    ):
+        """Quadtree mesh for the hierarchical candidate search.
+
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param min_distance: size of the finest cells
+        :param search_window: window size
+        :param x_center: float, center of the window
+        :param y_center: float, center of the window
+        :param reuse_mesh: bool, if True, returns the mesh of the previous call if the
+            lens model parameters and the window are the same
+        :return: _CandidateMesh instance
+        """
+        if reuse_mesh:
+            key = pickle.dumps(
+                (kwargs_lens, min_distance, search_window, x_center, y_center)
+            )
+            if self._mesh is not None and self._mesh[0] == key:
+                return self._mesh[1]
+        kwargs_static = self.lensModel.set_static(kwargs_lens)
+        mesh = _CandidateMesh(
+            lambda x, y: self.lensModel.ray_shooting(x, y, kwargs_static),
+            min_distance,
+            search_window,
+            x_center,
+            y_center,
+        )
+        if reuse_mesh:
+            self._mesh = (key, mesh)
+        return mesh
+
+    def _ray_shooting_grid(
+        self, kwargs_lens, min_distance, search_window, x_center, y_center
+    ):
+        """Ray-shooting of the grid of the search window (independent of the source
+        position).
+
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param min_distance: grid spacing
+        :param search_window: window size
+        :param x_center: float, center of the window
+        :param y_center: float, center of the window
+        :return: x_grid, y_grid, ray-shot x_grid, ray-shot y_grid
+        """
+        # compute number of pixels to cover the search window with the required min_distance
+        numPix = int(round(search_window / min_distance) + 0.5)
+        x_grid, y_grid = util.make_grid(numPix, min_distance)
+        x_grid += x_center
+        y_grid += y_center
+        # ray-shoot to find the relative distance to the required source position for each grid point
+        x_mapped, y_mapped = self.lensModel.ray_shooting(x_grid, y_grid, kwargs_lens)
+        return x_grid, y_grid, x_mapped, y_mapped
+
     def image_position_analytical(
         self,
         x,
@@ -230,6 +314,9 @@ class LensEquationSolver(object):
         num_random=0,
         non_linear=False,
         magnification_limit=None,
+        vectorized=False,
+        hierarchical=False,
+        reuse_mesh=False,
     ):
         """Finds image position  given source position and lens model. The solver first
         samples does a grid search in the lens plane, and the grid points that are
@@ -260,6 +347,13 @@ class LensEquationSolver(object):
             Hessian computation
         :param magnification_limit: None or float, if set will only return image
             positions that have an abs(magnification) larger than this number
+        :param vectorized: bool, if True, all starting points are iterated
+            simultaneously with one ray-shooting and one Hessian evaluation per
+            iteration (see image_position_lenstronomy_batch() for many source positions)
+        :param hierarchical: bool, if True, the grid search only refines the search
+            grid where it can host a solution (see candidate_solutions())
+        :param reuse_mesh: bool, if True (and hierarchical=True), reuses the ray-shot
+            search grid in calls with the same lens model parameters
         :returns: (exact) angular position of (multiple) images ra_pos, dec_pos in units
             of angle
         :raises: AttributeError, KeyError
@@ -275,6 +369,8 @@ class LensEquationSolver(object):
             verbose,
             x_center,
             y_center,
+            hierarchical=hierarchical,
+            reuse_mesh=reuse_mesh,
         )
         if verbose:
             print(
@@ -322,6 +418,7 @@ class LensEquationSolver(object):
             verbose=verbose,
             min_distance=min_distance,
             non_linear=non_linear,
+            vectorized=vectorized,
         )
         # only select iterative results that match the precision limit
         x_mins = x_mins[solver_precision <= precision_limit]
@@ -337,6 +434,139 @@ class LensEquationSolver(object):
         self.lensModel.set_dynamic()
         return x_mins, y_mins
 
+    def image_position_lenstronomy_batch(
+        self,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        min_distance=0.1,
+        search_window=10,
+        precision_limit=10 ** (-10),
+        num_iter_max=100,
+        arrival_time_sort=True,
+        initial_guess_cut=True,
+        x_center=0,
+        y_center=0,
+        num_random=0,
+        magnification_limit=None,
+        hierarchical=False,
+    ):
+        """Image positions of many source positions with the same lens model, as
+        image_position_lenstronomy() with vectorized=True. The grid search is ray-
+        shot once for all source positions and the starting points of all source
+        positions are iterated simultaneously.
+
+        :param sourcePos_x: array of source positions in units of angle
+        :param sourcePos_y: array of source positions in units of angle
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param min_distance: minimum separation to consider for two images in units of
+            angle
+        :param search_window: window size to be considered by the solver. Will not find
+            image position outside this window
+        :param precision_limit: required precision in the lens equation solver (in units
+            of angle in the source plane).
+        :param num_iter_max: maximum iteration of lens-source mapping conducted by
+            solver to match the required precision
+        :param arrival_time_sort: bool, if True, sorts image position in arrival time
+            (first arrival photon first listed)
+        :param initial_guess_cut: bool, if True, cuts initial local minima selected by
+            the grid search based on distance criteria from the source position
+        :param x_center: float, center of the window to search for point sources
+        :param y_center: float, center of the window to search for point sources
+        :param num_random: int, number of random positions within the search window to
+            be added to be starting positions for the gradient decent solver (per source
+            position)
+        :param magnification_limit: None or float, if set will only return image
+            positions that have an abs(magnification) larger than this number
+        :param hierarchical: bool, if True, the search grid is refined for each source
+            position only where it can host a solution (see candidate_solutions()),
+            sharing the ray-shot grid points between the source positions
+        :returns: list of the image ra_pos arrays, list of the image dec_pos arrays
+            (one array per source position)
+        """
+        sourcePos_x = np.atleast_1d(np.asarray(sourcePos_x, dtype=float))
+        sourcePos_y = np.atleast_1d(np.asarray(sourcePos_y, dtype=float))
+        if hierarchical:
+            mesh = self._candidate_mesh(
+                kwargs_lens, min_distance, search_window, x_center, y_center
+            )
+        kwargs_lens = self.lensModel.set_static(kwargs_lens)
+        if not hierarchical:
+            x_grid, y_grid, x_mapped, y_mapped = self._ray_shooting_grid(
+                kwargs_lens, min_distance, search_window, x_center, y_center
+            )
+        x_guess, y_guess, delta_list, index_list = [], [], [], []
+        for n, (source_x, source_y) in enumerate(zip(sourcePos_x, sourcePos_y)):
+            if hierarchical:
+                x_mins, y_mins, delta_map = mesh.search(source_x, source_y)
+            else:
+                absmapped = util.displaceAbs(x_mapped, y_mapped, source_x, source_y)
+                x_mins, y_mins, delta_map = util.local_minima_2d(
+                    absmapped, x_grid, y_grid
+                )
+            x_guess.append(x_mins)
+            y_guess.append(y_mins)
+            delta_list.append(delta_map)
+            index_list.append(np.full(len(x_mins), n))
+        x_guess = np.concatenate(x_guess)
+        y_guess = np.concatenate(y_guess)
+        delta_map = np.concatenate(delta_list)
+        index = np.concatenate(index_list).astype(int)
+        if initial_guess_cut and len(x_guess) > 0:
+            mag = np.abs(self.lensModel.magnification(x_guess, y_guess, kwargs_lens))
+            mag[mag < 1] = 1
+            select = delta_map <= min_distance * mag * 5
+            x_guess, y_guess, index = x_guess[select], y_guess[select], index[select]
+        if num_random > 0:
+            num = num_random * len(sourcePos_x)
+            x_guess = np.append(
+                x_guess,
+                np.random.uniform(
+                    low=-search_window / 2 + x_center,
+                    high=search_window / 2 + x_center,
+                    size=num,
+                ),
+            )
+            y_guess = np.append(
+                y_guess,
+                np.random.uniform(
+                    low=-search_window / 2 + y_center,
+                    high=search_window / 2 + y_center,
+                    size=num,
+                ),
+            )
+            index = np.append(index, np.repeat(np.arange(len(sourcePos_x)), num_random))
+        x_solved, y_solved, solver_precision, _ = self._solve_proposals(
+            x_guess,
+            y_guess,
+            sourcePos_x[index],
+            sourcePos_y[index],
+            kwargs_lens,
+            precision_limit,
+            num_iter_max,
+            max_step=min_distance,
+        )
+        converged = solver_precision <= precision_limit
+        x_list, y_list = [], []
+        for n in range(len(sourcePos_x)):
+            select = converged & (index == n)
+            x_mins, y_mins = image_util.findOverlap(
+                x_solved[select], y_solved[select], min_distance
+            )
+            if arrival_time_sort:
+                x_mins, y_mins = self.sort_arrival_times(x_mins, y_mins, kwargs_lens)
+            x_list.append(x_mins)
+            y_list.append(y_mins)
+        if magnification_limit is not None:
+            for n in range(len(sourcePos_x)):
+                mag = np.abs(
+                    self.lensModel.magnification(x_list[n], y_list[n], kwargs_lens)
+                )
+                x_list[n] = x_list[n][mag >= magnification_limit]
+                y_list[n] = y_list[n][mag >= magnification_limit]
+        self.lensModel.set_dynamic()
+        return x_list, y_list
+
     def _find_gradient_decent(
         self,
         x_min,
@@ -349,6 +579,7 @@ class LensEquationSolver(object):
         verbose=False,
         min_distance=0.01,
         non_linear=False,
+        vectorized=False,
     ):
         """Given a 'good guess' of a solution of the lens equation (expected image
         position given a fixed source position) this routine iteratively performs a ray-
@@ -370,8 +601,27 @@ class LensEquationSolver(object):
             in unstable regions)
         :param non_linear: bool, if True, uses scipy.miminize instead of the directly
             implemented gradient decent approach.
+        :param vectorized: bool, if True, iterates all starting points simultaneously
+            (see _solve_proposals()), not applicable with non_linear=True
         :return: x_position array, y_position array, error in the source plane array
         """
+        if vectorized and not non_linear:
+            x_mins, y_mins, solver_precision, num_iter = self._solve_proposals(
+                x_min,
+                y_min,
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                precision_limit,
+                num_iter_max,
+                max_step=min_distance,
+            )
+            if verbose:
+                print(
+                    "Solutions found with required precision after %s iterations"
+                    % num_iter
+                )
+            return x_mins, y_mins, solver_precision
         num_candidates = len(x_min)
         x_mins = np.zeros(num_candidates)
         y_mins = np.zeros(num_candidates)
@@ -476,6 +726,87 @@ class LensEquationSolver(object):
                 )
         return x_guess, y_guess, delta, l
 
+    def _solve_proposals(
+        self,
+        x_guess,
+        y_guess,
+        source_x,
+        source_y,
+        kwargs_lens,
+        precision_limit,
+        num_iter_max,
+        max_step,
+    ):
+        """Gradient decent solution of many proposed starting points at once, following
+        the steps of _solve_single_proposal() and _gradient_step(). Each iteration
+        evaluates the Hessian at the points that accepted their last step and ray-
+        shoots the new proposals of all points that have not converged yet, such that
+        there is one Hessian and one ray-shooting call per iteration for all points
+        together.
+
+        :param x_guess: array of starting positions in the image plane
+        :param y_guess: array of starting positions in the image plane
+        :param source_x: source position(s) to solve for, float or array matching
+            x_guess (e.g. for starting points of different source positions)
+        :param source_y: source position(s) to solve for, float or array matching
+            y_guess
+        :param kwargs_lens: keyword argument list of the lens model
+        :param precision_limit: float, required match in the solution in the source
+            plane
+        :param num_iter_max: int, maximum number of iterations before the algorithm
+            stops
+        :param max_step: maximum correction applied per step (to avoid over-shooting in
+            instable regions)
+        :return: x_positions, y_positions, errors in the source plane, number of
+            iterations done
+        """
+        x = np.array(x_guess, dtype=float)
+        y = np.array(y_guess, dtype=float)
+        source_x = np.broadcast_to(np.asarray(source_x, dtype=float), x.shape)
+        source_y = np.broadcast_to(np.asarray(source_y, dtype=float), y.shape)
+        beta_x, beta_y = self.lensModel.ray_shooting(x, y, kwargs_lens)
+        beta_x, beta_y = np.array(beta_x, dtype=float), np.array(beta_y, dtype=float)
+        delta = np.sqrt((beta_x - source_x) ** 2 + (beta_y - source_y) ** 2)
+        step_x, step_y = np.zeros_like(x), np.zeros_like(y)
+        num_iter = np.zeros(len(x), dtype=int)
+        # points requiring a new Newton step (after an accepted step)
+        new_step = np.ones(len(x), dtype=bool)
+        active = delta > precision_limit
+        l = 0
+        while np.any(active):
+            # Newton step (image plane correction from the inverse of the lensing Jacobian)
+            i = np.where(active & new_step)[0]
+            if len(i) > 0:
+                f_xx, f_xy, f_yx, f_yy = self.lensModel.hessian(x[i], y[i], kwargs_lens)
+                det = (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
+                d_x, d_y = beta_x[i] - source_x[i], beta_y[i] - source_y[i]
+                v_x = ((1 - f_yy) * d_x + f_yx * d_y) / det
+                v_y = (f_xy * d_x + (1 - f_xx) * d_y) / det
+                dist = np.sqrt(v_x**2 + v_y**2)
+                scale = np.where(dist > max_step, max_step / dist, 1)
+                step_x[i], step_y[i] = v_x * scale, v_y * scale
+            # proposals of all active points
+            i = np.where(active)[0]
+            x_new, y_new = x[i] - step_x[i], y[i] - step_y[i]
+            x_mapped, y_mapped = self.lensModel.ray_shooting(x_new, y_new, kwargs_lens)
+            delta_new = np.sqrt(
+                (x_mapped - source_x[i]) ** 2 + (y_mapped - source_y[i]) ** 2
+            )
+            num_iter[i] += 1
+            accept = delta_new <= delta[i]
+            j = i[accept]
+            x[j], y[j], delta[j] = x_new[accept], y_new[accept], delta_new[accept]
+            beta_x[j], beta_y[j] = x_mapped[accept], y_mapped[accept]
+            new_step[i] = accept
+            # if the new proposal is worse than the previous one, a new proposal is
+            # randomly drawn in a different direction
+            k = i[~accept]
+            step_x[k] *= np.random.normal(loc=0, scale=0.5, size=len(k))
+            step_y[k] *= np.random.normal(loc=0, scale=0.5, size=len(k))
+            active = (delta > precision_limit) & (num_iter < num_iter_max)
+            l += 1
+        return x, y, delta, l
+
     def _gradient_step(
         self,
         x_guess,
@@ -548,6 +879,8 @@ class LensEquationSolver(object):
         magnification_limit=None,
         initial_guess_cut=True,
         verbose=False,
+        vectorized=False,
+        hierarchical=False,
     ):
         """
 
@@ -568,6 +901,8 @@ class LensEquationSolver(object):
         :param non_linear: bool, if True applies a non-linear solver not dependent on Hessian computation
         :param magnification_limit: None or float, if set will only return image positions that have an
          abs(magnification) larger than this number
+        :param vectorized: bool, if True, iterates all starting points of the solver simultaneously
+        :param hierarchical: bool, if True, refines the search grid only where it can host a solution
         :returns: (exact) angular position of (multiple) images ra_pos, dec_pos in units of angle
         """
 
@@ -587,6 +922,8 @@ class LensEquationSolver(object):
             num_random=num_random,
             non_linear=non_linear,
             magnification_limit=magnification_limit,
+            vectorized=vectorized,
+            hierarchical=hierarchical,
         )
         mag_list = []
         for i in range(len(x_mins)):
@@ -628,3 +965,225 @@ class LensEquationSolver(object):
         x_mins = np.array(x_mins)[idx]
         y_mins = np.array(y_mins)[idx]
         return x_mins, y_mins
+
+
+class _CandidateMesh(object):
+    """Quadtree of square cells covering the search window in the image plane, used to
+    find the candidate solutions of the lens equation without ray-shooting the full
+    grid.
+
+    The search starts from coarse cells of 2**num_refinements times min_distance. Each
+    cell is split into two triangles and only the cells for which the source position
+    lies within the (expanded) image of one of the triangles in the source plane are
+    split into four sub-cells, down to cells of min_distance. The ray-shot grid points
+    are kept (on the lattice of the finest cells) such that searches for other source
+    positions with the same lens model only ray-shoot the points not yet covered.
+    """
+
+    def __init__(
+        self,
+        ray_shooting,
+        min_distance,
+        search_window,
+        x_center,
+        y_center,
+        num_refinements=None,
+    ):
+        """
+
+        :param ray_shooting: function ray_shooting(x, y) of the lens model (with fixed
+            keyword arguments)
+        :param min_distance: size of the finest cells
+        :param search_window: window size to be covered by the cells
+        :param x_center: float, center of the window
+        :param y_center: float, center of the window
+        :param num_refinements: int, number of refinements of the coarse cells; None
+            chooses coarse cells of about 1/16 of the search window
+        """
+        if num_refinements is None:
+            num_refinements = int(
+                max(np.floor(np.log2(search_window / (16.0 * min_distance))), 0)
+            )
+        self._ray_shooting = ray_shooting
+        self._num_refinements = num_refinements
+        self._pixel_width = min_distance
+        stride = 2**num_refinements
+        num_pix = int(round(search_window / min_distance) + 0.5)
+        self._num_cells = max(int(np.ceil(num_pix / stride)), 1)
+        # number of lattice points of the finest cells along each axis
+        self._num_lattice = self._num_cells * stride + 1
+        # the lattice points coincide with the grid points of the full search grid
+        offset = (self._num_lattice - 1) / 2.0 + (num_pix % 2 - 1) / 2.0
+        self._x_min = x_center - offset * min_distance
+        self._y_min = y_center - offset * min_distance
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._beta_x = np.zeros(0)
+        self._beta_y = np.zeros(0)
+
+    @property
+    def num_ray_shooting(self):
+        """
+
+        :return: number of ray-shot grid points
+        """
+        return len(self._keys)
+
+    def search(self, source_x, source_y, expansion=1.0):
+        """Candidate solutions of the lens equation for a source position.
+
+        :param source_x: source position
+        :param source_y: source position
+        :param expansion: relative expansion of the triangles about their centroid
+            when testing whether they contain the source position (to account for the
+            non-linearity of the lens mapping across a cell)
+        :return: x-positions, y-positions of the candidates (grid points of the finest
+            cells closest to the source position when ray-shot) and their distances to
+            the source position in the source plane
+        """
+        stride = 2**self._num_refinements
+        i, j = np.meshgrid(
+            np.arange(self._num_cells) * stride, np.arange(self._num_cells) * stride
+        )
+        i, j = i.ravel(), j.ravel()
+        size = stride
+        while True:
+            beta_x, beta_y = self._mapped(
+                np.concatenate([i, i + size, i, i + size]),
+                np.concatenate([j, j, j + size, j + size]),
+            )
+            beta_x = beta_x.reshape(4, -1) - source_x
+            beta_y = beta_y.reshape(4, -1) - source_y
+            # triangles (lower left, lower right, upper right) and (lower left, upper
+            # right, upper left)
+            inside = (
+                _in_triangle(
+                    beta_x[0],
+                    beta_y[0],
+                    beta_x[1],
+                    beta_y[1],
+                    beta_x[3],
+                    beta_y[3],
+                    expansion,
+                )
+                | _in_triangle(
+                    beta_x[0],
+                    beta_y[0],
+                    beta_x[3],
+                    beta_y[3],
+                    beta_x[2],
+                    beta_y[2],
+                    expansion,
+                )
+                | _in_box(beta_x, beta_y, expansion)
+            )
+            i, j = i[inside], j[inside]
+            if size == 1:
+                break
+            beta_x, beta_y = beta_x[:, inside], beta_y[:, inside]
+            size //= 2
+            i = np.concatenate([i, i + size, i, i + size])
+            j = np.concatenate([j, j, j + size, j + size])
+        # closest corner of each of the finest cells
+        delta = np.sqrt(beta_x[:, inside] ** 2 + beta_y[:, inside] ** 2)
+        corner = np.argmin(delta, axis=0) if len(i) > 0 else np.zeros(0, dtype=int)
+        i = i + corner % 2
+        j = j + corner // 2
+        delta = np.min(delta, axis=0) if len(i) > 0 else np.zeros(0)
+        keys, index = np.unique(self._key(i, j), return_index=True)
+        i, j, delta = i[index], j[index], delta[index]
+        # local minima of the distance among neighbouring candidates
+        minimum = np.ones(len(keys), dtype=bool)
+        for d_i in [-1, 0, 1]:
+            for d_j in [-1, 0, 1]:
+                if len(keys) == 0 or d_i == d_j == 0:
+                    continue
+                neighbour = self._key(i + d_i, j + d_j)
+                index = np.minimum(np.searchsorted(keys, neighbour), len(keys) - 1)
+                valid = (i + d_i >= 0) & (i + d_i < self._num_lattice)
+                minimum &= ~(
+                    valid & (keys[index] == neighbour) & (delta[index] < delta)
+                )
+        i, j, delta = i[minimum], j[minimum], delta[minimum]
+        x_mins = self._x_min + i * self._pixel_width
+        y_mins = self._y_min + j * self._pixel_width
+        return x_mins, y_mins, delta
+
+    def _key(self, i, j):
+        """
+
+        :param i: lattice index along x
+        :param j: lattice index along y
+        :return: unique integer key of the lattice points
+        """
+        return np.asarray(i, dtype=np.int64) + np.asarray(j, dtype=np.int64) * np.int64(
+            self._num_lattice
+        )
+
+    def _mapped(self, i, j):
+        """Source plane positions of lattice points, ray-shooting the points that have
+        not been ray-shot before.
+
+        :param i: lattice index along x
+        :param j: lattice index along y
+        :return: ray-shot x-positions, y-positions
+        """
+        keys = self._key(i, j)
+        unique_keys = np.unique(keys)
+        missing = unique_keys[~np.isin(unique_keys, self._keys, assume_unique=True)]
+        if len(missing) > 0:
+            i_, j_ = missing % self._num_lattice, missing // self._num_lattice
+            beta_x, beta_y = self._ray_shooting(
+                self._x_min + i_ * self._pixel_width,
+                self._y_min + j_ * self._pixel_width,
+            )
+            keys_ = np.concatenate([self._keys, missing])
+            order = np.argsort(keys_, kind="stable")
+            self._keys = keys_[order]
+            self._beta_x = np.concatenate([self._beta_x, beta_x])[order]
+            self._beta_y = np.concatenate([self._beta_y, beta_y])[order]
+        index = np.searchsorted(self._keys, keys)
+        return self._beta_x[index], self._beta_y[index]
+
+
+def _in_box(x, y, expansion=0.0):
+    """Tests whether the origin lies within the bounding boxes of sets of points,
+    expanded about their centers.
+
+    :param x: x-coordinates, 2d array with the points of a set along the first axis
+    :param y: y-coordinates, 2d array with the points of a set along the first axis
+    :param expansion: relative expansion of the boxes about their centers
+    :return: bool array
+    """
+    x_min, x_max = np.min(x, axis=0), np.max(x, axis=0)
+    y_min, y_max = np.min(y, axis=0), np.max(y, axis=0)
+    margin_x = (x_max - x_min) * expansion / 2.0
+    margin_y = (y_max - y_min) * expansion / 2.0
+    return (
+        (x_min - margin_x <= 0)
+        & (x_max + margin_x >= 0)
+        & (y_min - margin_y <= 0)
+        & (y_max + margin_y >= 0)
+    )
+
+
+def _in_triangle(x_1, y_1, x_2, y_2, x_3, y_3, expansion=0.0):
+    """Tests whether the origin lies within triangles, expanded about their centroids.
+
+    :param x_1: x-coordinates of the first vertices
+    :param y_1: y-coordinates of the first vertices
+    :param x_2: x-coordinates of the second vertices
+    :param y_2: y-coordinates of the second vertices
+    :param x_3: x-coordinates of the third vertices
+    :param y_3: y-coordinates of the third vertices
+    :param expansion: relative expansion of the triangles about their centroids
+    :return: bool array
+    """
+    # barycentric coordinates of the origin; the expanded triangle contains all points
+    # with barycentric coordinates larger than -expansion / 3
+    det = (x_2 - x_1) * (y_3 - y_1) - (x_3 - x_1) * (y_2 - y_1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        l_2 = ((-x_1) * (y_3 - y_1) - (x_3 - x_1) * (-y_1)) / det
+        l_3 = ((x_2 - x_1) * (-y_1) - (-x_1) * (y_2 - y_1)) / det
+    l_1 = 1 - l_2 - l_3
+    limit = -expansion / 3.0
+    return (l_1 >= limit) & (l_2 >= limit) & (l_3 >= limit)
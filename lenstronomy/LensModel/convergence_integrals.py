@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 import numpy as np
+import scipy.fft
 import scipy.signal as scp
 from lenstronomy.Util import util
 from lenstronomy.Util import image_util
@@ -28,11 +31,7 @@ def potential_from_kappa_grid(kappa, grid_spacing):
     :param grid_spacing: scale of an individual pixel (per axis) of grid
     :return: lensing potential in a 2d grid at positions x_grid, y_grid
     """
-    num_pix = len(kappa) * 2
-    if num_pix % 2 == 0:
-        num_pix += 1
-    kernel = potential_kernel(num_pix, grid_spacing)
-    f_ = scp.fftconvolve(kappa, kernel, mode="same") / np.pi * grid_spacing**2
+    (f_,) = _convolve_kernels(kappa, grid_spacing, ["potential"])
     return f_
 
 
@@ -51,13 +50,13 @@ def potential_from_kappa_grid_adaptive(
     :return: lensing potential in a 2d grid at positions x_grid, y_grid
     """
     kappa_low_res = image_util.re_size(kappa_high_res, factor=low_res_factor)
-    num_pix = len(kappa_high_res) * 2
-    if num_pix % 2 == 0:
-        num_pix += 1
     grid_spacing_low_res = grid_spacing * low_res_factor
-    kernel = potential_kernel(num_pix, grid_spacing)
-    kernel_low_res, kernel_high_res = kernel_util.split_kernel(
-        kernel, high_res_kernel_size, low_res_factor, normalized=False
+    kernel_low_res, kernel_high_res = _split_kernel(
+        "potential",
+        _kernel_size(len(kappa_high_res)),
+        grid_spacing,
+        high_res_kernel_size,
+        low_res_factor,
     )
 
     f_high_res = (
@@ -90,12 +89,7 @@ def deflection_from_kappa_grid(kappa, grid_spacing):
     :param grid_spacing: scale of an individual pixel (per axis) of grid
     :return: numerical deflection angles in x- and y- direction over the convergence grid points
     """
-    num_pix = len(kappa) * 2
-    if num_pix % 2 == 0:
-        num_pix += 1
-    kernel_x, kernel_y = deflection_kernel(num_pix, grid_spacing)
-    f_x = scp.fftconvolve(kappa, kernel_x, mode="same") / np.pi * grid_spacing**2
-    f_y = scp.fftconvolve(kappa, kernel_y, mode="same") / np.pi * grid_spacing**2
+    f_x, f_y = _convolve_kernels(kappa, grid_spacing, ["deflection_x", "deflection_y"])
     return f_x, f_y
 
 
@@ -115,15 +109,11 @@ def deflection_from_kappa_grid_adaptive(
     :return: numerical deflection angles in x- and y- direction
     """
     kappa_low_res = image_util.re_size(kappa_high_res, factor=low_res_factor)
-    num_pix = len(kappa_high_res) * 2
-    if num_pix % 2 == 0:
-        num_pix += 1
-
-    kernel_x, kernel_y = deflection_kernel(num_pix, grid_spacing)
+    num_pix = _kernel_size(len(kappa_high_res))
     grid_spacing_low_res = grid_spacing * low_res_factor
 
-    kernel_low_res_x, kernel_high_res_x = kernel_util.split_kernel(
-        kernel_x, high_res_kernel_size, low_res_factor, normalized=False
+    kernel_low_res_x, kernel_high_res_x = _split_kernel(
+        "deflection_x", num_pix, grid_spacing, high_res_kernel_size, low_res_factor
     )
     f_x_high_res = (
         scp.fftconvolve(kappa_high_res, kernel_high_res_x, mode="same")
@@ -138,8 +128,8 @@ def deflection_from_kappa_grid_adaptive(
     )
     f_x = f_x_high_res + f_x_low_res
 
-    kernel_low_res_y, kernel_high_res_y = kernel_util.split_kernel(
-        kernel_y, high_res_kernel_size, low_res_factor, normalized=False
+    kernel_low_res_y, kernel_high_res_y = _split_kernel(
+        "deflection_y", num_pix, grid_spacing, high_res_kernel_size, low_res_factor
     )
     f_y_high_res = (
         scp.fftconvolve(kappa_high_res, kernel_high_res_y, mode="same")
@@ -156,6 +146,213 @@ def deflection_from_kappa_grid_adaptive(
     return f_x, f_y
 
 
+@export
+class KappaGridSolver(object):
+    """Lensing potential and deflection angles of (batches of) convergence maps on a
+    fixed square grid.
+
+    The convolutions with the Green's functions (see potential_from_kappa_grid() and
+    deflection_from_kappa_grid(), with identical results) are done with real FFTs.
+    The spectra of the kernels are computed once per (num_pix, grid_spacing) and shared
+    between all solvers and calls, and the spectrum of a convergence map is shared
+    between the potential and both deflection components. The zero-padding is the
+    minimal one avoiding aliasing within the map (twice instead of three times the
+    map size).
+
+    Example::
+
+        >>> solver = KappaGridSolver(num_pix=100, grid_spacing=0.05)
+        >>> f_x, f_y = solver.deflection(kappa_maps)  # kappa_maps of shape (..., 100, 100)
+        >>> kwargs_interp = solver.kwargs_interpol(kappa)
+        >>> lens_model = LensModel(['INTERPOL'])
+        >>> alpha_x, alpha_y = lens_model.alpha(x, y, [kwargs_interp])
+    """
+
+    def __init__(self, num_pix, grid_spacing, workers=None):
+        """
+
+        :param num_pix: number of pixels per axis of the convergence maps
+        :param grid_spacing: scale of an individual pixel (per axis) of grid
+        :param workers: number of parallel workers of the FFTs (see scipy.fft)
+        """
+        self._num_pix = int(num_pix)
+        self._grid_spacing = grid_spacing
+        self._workers = workers
+
+    def potential(self, kappa):
+        """Lensing potential, see potential_from_kappa_grid().
+
+        :param kappa: convergence map(s), array of shape (..., num_pix, num_pix)
+        :return: lensing potential in the shape of kappa
+        """
+        (f_,) = self._convolve(kappa, ["potential"])
+        return f_
+
+    def deflection(self, kappa):
+        """Deflection angles, see deflection_from_kappa_grid().
+
+        :param kappa: convergence map(s), array of shape (..., num_pix, num_pix)
+        :return: deflection angles in x- and y- direction in the shape of kappa
+        """
+        f_x, f_y = self._convolve(kappa, ["deflection_x", "deflection_y"])
+        return f_x, f_y
+
+    def solve(self, kappa):
+        """Lensing potential and deflection angles with a single forward FFT of the
+        convergence.
+
+        :param kappa: convergence map(s), array of shape (..., num_pix, num_pix)
+        :return: lensing potential, deflection angles in x- and y- direction
+        """
+        f_, f_x, f_y = self._convolve(
+            kappa, ["potential", "deflection_x", "deflection_y"]
+        )
+        return f_, f_x, f_y
+
+    def kwargs_interpol(self, kappa, center_x=0, center_y=0):
+        """Keyword arguments of the 'INTERPOL' lens model of a convergence map.
+
+        :param kappa: convergence map, 2d array (num_pix, num_pix)
+        :param center_x: x-coordinate of the center of the map
+        :param center_y: y-coordinate of the center of the map
+        :return: keyword arguments of the 'INTERPOL' lens model
+        """
+        if np.ndim(kappa) != 2:
+            raise ValueError(
+                "kwargs_interpol() requires a single convergence map, got shape %s."
+                % (np.shape(kappa),)
+            )
+        f_, f_x, f_y = self.solve(kappa)
+        x_grid, y_grid = util.make_grid(
+            numPix=self._num_pix, deltapix=self._grid_spacing
+        )
+        x_axes, y_axes = util.get_axes(x_grid, y_grid)
+        return {
+            "grid_interp_x": x_axes + center_x,
+            "grid_interp_y": y_axes + center_y,
+            "f_": f_,
+            "f_x": f_x,
+            "f_y": f_y,
+        }
+
+    def _convolve(self, kappa, kernel_types):
+        """
+
+        :param kappa: convergence map(s), array of shape (..., num_pix, num_pix)
+        :param kernel_types: list of kernel types, see _kernel_spectrum()
+        :return: list of the convolved maps
+        """
+        if np.shape(kappa)[-2:] != (self._num_pix, self._num_pix):
+            raise ValueError(
+                "Convergence maps of shape %s do not match the grid of %s pixels."
+                % (np.shape(kappa), self._num_pix)
+            )
+        return _convolve_kernels(
+            kappa, self._grid_spacing, kernel_types, workers=self._workers
+        )
+
+
+def _kernel_size(num_pix):
+    """
+
+    :param num_pix: number of pixels of the convergence map along its first axis
+    :return: number of pixels of the kernels (odd)
+    """
+    num_pix_kernel = num_pix * 2
+    if num_pix_kernel % 2 == 0:
+        num_pix_kernel += 1
+    return num_pix_kernel
+
+
+def _convolve_kernels(kappa, grid_spacing, kernel_types, workers=None):
+    """Convolution of convergence maps with the integration kernels, equivalent to
+    scipy.signal.fftconvolve(kappa, kernel, mode='same') * grid_spacing**2 / pi.
+
+    :param kappa: convergence map(s), array of shape (..., n_y, n_x)
+    :param grid_spacing: scale of an individual pixel (per axis) of grid
+    :param kernel_types: list of kernel types, see _kernel_spectrum()
+    :param workers: number of parallel workers of the FFTs (see scipy.fft)
+    :return: list of the convolved maps in the shape of kappa
+    """
+    kappa = np.asarray(kappa, dtype=float)
+    n_y, n_x = kappa.shape[-2:]
+    # the kernels of size 2 * n_y + 1 are centered on the pixel with index n_y. The
+    # circular convolution is free of aliasing within the map when padded to n_y + n
+    # pixels (instead of the 3 * n pixels of the linear convolution)
+    shape = (
+        scipy.fft.next_fast_len(2 * n_y, real=True),
+        scipy.fft.next_fast_len(n_y + n_x, real=True),
+    )
+    kappa_fft = scipy.fft.rfft2(kappa, s=shape, workers=workers)
+    results = []
+    for kernel_type in kernel_types:
+        spectrum = _kernel_spectrum(kernel_type, n_y, grid_spacing, shape)
+        f = scipy.fft.irfft2(
+            kappa_fft * spectrum, s=shape, workers=workers, overwrite_x=True
+        )
+        results.append(f[..., n_y : 2 * n_y, n_y : n_y + n_x])
+    return results
+
+
+@lru_cache(maxsize=16)
+def _kernel_spectrum(kernel_type, num_pix, grid_spacing, shape):
+    """Spectrum of an integration kernel (including the normalization
+    grid_spacing**2 / pi), zero-padded to the shape of the FFTs.
+
+    :param kernel_type: 'potential', 'deflection_x' or 'deflection_y'
+    :param num_pix: number of pixels of the convergence map along its first axis
+    :param grid_spacing: scale of an individual pixel (per axis) of grid
+    :param shape: shape of the FFTs
+    :return: read-only real FFT of the kernel
+    """
+    kernel = _kernel(kernel_type, _kernel_size(num_pix), grid_spacing)
+    # kernel pixels beyond the FFT shape only contribute outside of the map
+    kernel = kernel[: shape[0], : shape[1]] * grid_spacing**2 / np.pi
+    spectrum = scipy.fft.rfft2(kernel, s=shape)
+    spectrum.setflags(write=False)
+    return spectrum
+
+
+@lru_cache(maxsize=16)
+def _split_kernel(
+    kernel_type, num_pix, grid_spacing, high_res_kernel_size, low_res_factor
+):
+    """Kernel split into a low resolution and a high resolution part for the adaptive
+    convolutions (see kernel_util.split_kernel()).
+
+    :param kernel_type: 'potential', 'deflection_x' or 'deflection_y'
+    :param num_pix: number of pixels of the kernel per axis
+    :param grid_spacing: scale of an individual pixel (per axis) of grid
+    :param high_res_kernel_size: int, size of high resolution kernel in units of
+        degraded pixels
+    :param low_res_factor: lower resolution factor of larger scale kernel
+    :return: read-only low resolution kernel, read-only high resolution kernel
+    """
+    kernel = _kernel(kernel_type, num_pix, grid_spacing)
+    kernel_low_res, kernel_high_res = kernel_util.split_kernel(
+        kernel, high_res_kernel_size, low_res_factor, normalized=False
+    )
+    kernel_low_res.setflags(write=False)
+    kernel_high_res.setflags(write=False)
+    return kernel_low_res, kernel_high_res
+
+
+def _kernel(kernel_type, num_pix, grid_spacing):
+    """
+
+    :param kernel_type: 'potential', 'deflection_x' or 'deflection_y'
+    :param num_pix: number of pixels of the kernel per axis
+    :param grid_spacing: scale of an individual pixel (per axis) of grid
+    :return: integration kernel
+    """
+    if kernel_type == "potential":
+        return potential_kernel(num_pix, grid_spacing)
+    kernel_x, kernel_y = deflection_kernel(num_pix, grid_spacing)
+    if kernel_type == "deflection_x":
+        return kernel_x
+    return kernel_y
+
+
 @export
 def potential_kernel(num_pix, delta_pix):
     """Numerical gridded integration kernel for convergence to lensing kernel with given
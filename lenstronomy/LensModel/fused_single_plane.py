@@ -0,0 +1,241 @@
+import numpy as np
+from lenstronomy.LensModel.single_plane import SinglePlane
+from lenstronomy.LensModel.Profiles.base_profile import _is_real_scalar
+
+__all__ = ["FusedSinglePlane", "stack_kwargs", "alpha_batch"]
+
+
+class FusedSinglePlane(SinglePlane):
+    """Single plane lens model that evaluates the deflection angles and Hessian of
+    profiles of the same type together. The components of each supported profile type
+    (see FUSED_MODELS) are evaluated vectorized over the components with parameter
+    arrays, instead of one profile call per component. All other profiles are evaluated
+    one by one as in SinglePlane.
+
+    The components are evaluated with the profiles' own derivatives() and hessian()
+    methods, with the keyword arguments of the components passed as arrays. The results
+    agree with SinglePlane to floating point rounding (the parameter-only expressions
+    are evaluated on arrays instead of scalars) and the contributions are added to the
+    output in the order of the lens model list.
+
+    The class is built from an existing single plane LensModel (sharing its profile
+    instances) and can replace it, e.g.:
+
+    >>> lens_model.lens_model = FusedSinglePlane(lens_model)
+    """
+
+    def __init__(self, lens_model, max_elements=2**16):
+        """
+
+        :param lens_model: LensModel() instance in single plane mode (or a SinglePlane() instance)
+        :param max_elements: maximum number of elements (number of components x number of coordinates) evaluated
+         in one vectorized call. Groups with more components are evaluated in chunks to limit the memory.
+        """
+        single_plane = getattr(lens_model, "lens_model", lens_model)
+        if type(single_plane) is not SinglePlane:
+            raise ValueError(
+                "FusedSinglePlane requires a single plane lens model without line-of-sight corrections, got %s."
+                % type(single_plane).__name__
+            )
+        self.func_list = single_plane.func_list
+        self._num_func = single_plane._num_func
+        self._model_list = single_plane._model_list
+        self._max_elements = max_elements
+        # indexes of the lens models of each fused profile type
+        self._groups = {}
+        for i, lens_type in enumerate(self._model_list):
+            if lens_type in FUSED_MODELS:
+                self._groups.setdefault(lens_type, []).append(i)
+
+    def alpha(self, x, y, kwargs, k=None):
+        """Deflection angles.
+
+        :param x: x-position (preferentially arcsec)
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec)
+        :type y: numpy array
+        :param kwargs: list of keyword arguments of lens model parameters matching the
+            lens model classes
+        :param k: only evaluate the k-th lens model
+        :return: deflectionangles in units of arcsec
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        if isinstance(k, int) or x.ndim == 0:
+            return super(FusedSinglePlane, self).alpha(x, y, kwargs, k=k)
+        f_x, f_y = self._accumulate("alpha", x, y, kwargs, k)
+        return f_x, f_y
+
+    def hessian(self, x, y, kwargs, k=None):
+        """Hessian matrix.
+
+        :param x: x-position (preferentially arcsec)
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec)
+        :type y: numpy array
+        :param kwargs: list of keyword arguments of lens model parameters matching the
+            lens model classes
+        :param k: only evaluate the k-th lens model
+        :return: f_xx, f_xy, f_yx, f_yy components
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        if isinstance(k, int) or x.ndim == 0:
+            return super(FusedSinglePlane, self).hessian(x, y, kwargs, k=k)
+        f_xx, f_xy, f_yx, f_yy = self._accumulate("hessian", x, y, kwargs, k)
+        return f_xx, f_xy, f_yx, f_yy
+
+    def _accumulate(self, quantity, x, y, kwargs, k):
+        """Adds up the contributions of all lens models in the order of the lens model
+        list into pre-allocated output arrays.
+
+        :param quantity: 'alpha' or 'hessian'
+        :param x: x-position, numpy array
+        :param y: y-position, numpy array
+        :param kwargs: list of keyword arguments of lens model parameters
+        :param k: None, list of ints or bool list of lens models to be evaluated
+        :return: tuple of output arrays of the shape of x
+        """
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+        bool_list = self._bool_list(k)
+        num_out = 2 if quantity == "alpha" else 4
+        out = [np.zeros_like(x) for _ in range(num_out)]
+        chunk_size = max(1, self._max_elements // max(len(x), 1))
+        # per profile type: position in the list of active components and the evaluated chunk
+        active, position, chunks = {}, {}, {}
+        for lens_type, index_list in self._groups.items():
+            active[lens_type] = [i for i in index_list if bool_list[i] is True]
+            position[lens_type] = 0
+            chunks[lens_type] = (0, None)
+        for i, func in enumerate(self.func_list):
+            if bool_list[i] is not True:
+                continue
+            lens_type = self._model_list[i]
+            if lens_type in self._groups:
+                n = position[lens_type]
+                start, values = chunks[lens_type]
+                if values is None or n >= start + len(values[0]):
+                    index_chunk = active[lens_type][n : n + chunk_size]
+                    values = _evaluate_fused(
+                        quantity,
+                        lens_type,
+                        func,
+                        x,
+                        y,
+                        [kwargs[j] for j in index_chunk],
+                    )
+                    start = n
+                    chunks[lens_type] = (start, values)
+                contribution = [value[n - start] for value in values]
+                position[lens_type] = n + 1
+            elif quantity == "alpha":
+                contribution = func.derivatives(x, y, **kwargs[i])
+            else:
+                contribution = func.hessian(x, y, **kwargs[i])
+            for out_j, contribution_j in zip(out, contribution):
+                out_j += contribution_j
+        return tuple(out_j.reshape(shape) for out_j in out)
+
+
+def _evaluate_fused(quantity, lens_type, func, x, y, kwargs_list):
+    """Evaluates the components of one profile type together with a single call of the
+    profile's derivatives() or hessian() method. The keyword arguments of the
+    components are passed as (num_components, 1) arrays broadcasting against the
+    coordinates.
+
+    :param quantity: 'alpha' or 'hessian'
+    :param lens_type: string, lens model name
+    :param func: profile instance
+    :param x: x-position, 1d numpy array
+    :param y: y-position, 1d numpy array
+    :param kwargs_list: list of keyword arguments of the components
+    :return: tuple of 2d arrays (num_components, len(x)) (or (num_components, 1) for
+        constant quantities)
+    """
+    method = func.derivatives if quantity == "alpha" else func.hessian
+    kwargs_array = stack_kwargs(kwargs_list)
+    if kwargs_array is None:
+        # components with different (or non-scalar) keyword arguments are evaluated one
+        # by one
+        values = [method(x, y, **kwargs) for kwargs in kwargs_list]
+        return tuple(np.array(value) for value in zip(*values))
+    return tuple(np.atleast_2d(value) for value in method(x, y, **kwargs_array))
+
+
+def stack_kwargs(kwargs_list):
+    """Stacks the keyword arguments of N evaluations of the same profile into (N, 1)
+    arrays, broadcasting against coordinates of shape (M,) or (N, M).
+
+    :param kwargs_list: list of N keyword arguments
+    :return: dictionary of (N, 1) arrays, or None if the keyword arguments do not have
+        the same names or contain values other than real scalars
+    """
+    names = list(kwargs_list[0])
+    if any(list(kwargs) != names for kwargs in kwargs_list) or not all(
+        _is_real_scalar(value) for kwargs in kwargs_list for value in kwargs.values()
+    ):
+        return None
+    return {
+        name: np.array([kwargs[name] for kwargs in kwargs_list], dtype=float)[
+            :, np.newaxis
+        ]
+        for name in names
+    }
+
+
+def alpha_batch(lens_model, x, y, kwargs_batch):
+    """Deflection angles of N realisations of the lens model parameters at the same
+    coordinates. The components of the profiles in BATCH_MODELS are evaluated with a
+    single call for all realisations (see _evaluate_fused()), all other components are
+    evaluated for each realisation separately.
+
+    :param lens_model: LensModel() instance in single plane mode (or a SinglePlane()
+        instance)
+    :param x: x-position, 1d numpy array
+    :param y: y-position, 1d numpy array
+    :param kwargs_batch: list of N lists of keyword arguments of the lens model
+    :return: deflection angles, two 2d arrays (N, len(x))
+    """
+    single_plane = getattr(lens_model, "lens_model", lens_model)
+    if type(single_plane) not in (SinglePlane, FusedSinglePlane):
+        raise ValueError(
+            "alpha_batch requires a single plane lens model without line-of-sight corrections, got %s."
+            % type(single_plane).__name__
+        )
+    x = np.array(x, dtype=float)
+    y = np.array(y, dtype=float)
+    f_x = np.zeros((len(kwargs_batch), len(x)))
+    f_y = np.zeros((len(kwargs_batch), len(x)))
+    for i, func in enumerate(single_plane.func_list):
+        kwargs_list = [kwargs[i] for kwargs in kwargs_batch]
+        if len(kwargs_list) > 1 and single_plane._model_list[i] in BATCH_MODELS:
+            # profiles set static ignore the keyword arguments and return a single row
+            # broadcasting against the output
+            alpha_x, alpha_y = _evaluate_fused(
+                "alpha", single_plane._model_list[i], func, x, y, kwargs_list
+            )
+        else:
+            alpha = [func.derivatives(x, y, **kwargs) for kwargs in kwargs_list]
+            alpha_x, alpha_y = (np.array(value) for value in zip(*alpha))
+        f_x += alpha_x
+        f_y += alpha_y
+    return f_x, f_y
+
+
+# lens models whose derivatives() and hessian() support keyword arguments given as arrays
+# broadcasting against the coordinates, and are therefore evaluated vectorized over the
+# components
+FUSED_MODELS = ["SIS", "POINT_MASS", "NFW", "TNFW", "SHEAR", "CONVERGENCE"]
+
+# lens models whose derivatives() support keyword arguments given as arrays, evaluated
+# vectorized over the realisations in alpha_batch(). The NIE-based profiles can be set
+# static and are therefore not fused over the components in FusedSinglePlane
+BATCH_MODELS = FUSED_MODELS + [
+    "SIE",
+    "NIE",
+    "NFW_ELLIPSE_CSE",
+    "HERNQUIST",
+    "CORED_DENSITY",
+    "SHEAR_GAMMA_PSI",
+]
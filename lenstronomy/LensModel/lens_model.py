@@ -2,8 +2,10 @@ __author__ = "sibirrer"
 from lenstronomy.LensModel.single_plane import SinglePlane
 from lenstronomy.LensModel.LineOfSight.single_plane_los import SinglePlaneLOS
 from lenstronomy.LensModel.MultiPlane.multi_plane import MultiPlane
+from lenstronomy.LensModel.Profiles.base_profile import _is_real_scalar
 from lenstronomy.Cosmo.lens_cosmo import LensCosmo
 from lenstronomy.Util import constants as const
+import numpy as np
 
 __all__ = ["LensModel"]
 
@@ -158,6 +160,93 @@ class LensModel(object):
         """
         return self.lens_model.ray_shooting(x, y, kwargs, k=k)
 
+    def ray_shooting_jacobian(self, x, y, kwargs, k=None, step=1e-6):
+        """Derivatives of the source plane positions with respect to the lens model
+        parameters, e.g. for gradient-based optimizations of the source plane
+        positions of multiple images.
+
+        In the single-plane setting, these are the negative derivatives of the
+        deflection angles provided by the individual profiles (analytic where
+        available). In the multi-plane and line-of-sight settings, ray_shooting() is
+        differentiated with central finite differences. The lens model must not be
+        static (see set_static()).
+
+        :param x: x-position (preferentially arcsec)
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec)
+        :type y: numpy array
+        :param kwargs: list of keyword arguments of lens model parameters matching the
+            lens model classes
+        :param k: only evaluate the k-th lens model
+        :param step: relative step size of finite differences (absolute step for
+            parameters with modulus below 1)
+        :return: list (one entry per lens model) of dictionaries with parameter names
+            as keys and (d beta_x / d param, d beta_y / d param) as values; a single
+            dictionary if k is an integer
+        """
+        if self.multi_plane is False and not isinstance(
+            self.lens_model, SinglePlaneLOS
+        ):
+            jacobian = self.lens_model.alpha_jacobian(x, y, kwargs, k=k)
+            if isinstance(k, int):
+                return {name: (-d_x, -d_y) for name, (d_x, d_y) in jacobian.items()}
+            return [
+                {name: (-d_x, -d_y) for name, (d_x, d_y) in jacobian_i.items()}
+                for jacobian_i in jacobian
+            ]
+        return self._ray_shooting_jacobian_differential(x, y, kwargs, k=k, step=step)
+
+    def _ray_shooting_jacobian_differential(self, x, y, kwargs, k=None, step=1e-6):
+        """Derivatives of the source plane positions with respect to the lens model
+        parameters with central finite differences of ray_shooting().
+
+        :param x: x-position
+        :param y: y-position
+        :param kwargs: list of keyword arguments of lens model parameters
+        :param k: only evaluate the k-th lens model
+        :param step: relative step size (absolute step for parameters with modulus
+            below 1)
+        :return: see ray_shooting_jacobian()
+        """
+        if self.multi_plane is True:
+            func_list = self.lens_model.multi_plane_base.func_list
+            # the multi-plane ray-shooting can not be restricted to a subset of the
+            # models, the selection only applies to the differentiated parameters
+            k_ray_shooting = None
+        else:
+            func_list = self.lens_model.func_list
+            k_ray_shooting = k
+        if isinstance(k, int):
+            index_list = [k]
+        elif k is None:
+            index_list = range(len(kwargs))
+        else:
+            index_list = k
+        jacobian = [{} for _ in kwargs]
+        for i in index_list:
+            non_differentiable = getattr(func_list[i], "non_differentiable_params", [])
+            for name, value in kwargs[i].items():
+                if name in non_differentiable or not _is_real_scalar(value):
+                    continue
+                delta = step * max(1.0, abs(value))
+                kwargs_plus = [dict(kwargs_j) for kwargs_j in kwargs]
+                kwargs_minus = [dict(kwargs_j) for kwargs_j in kwargs]
+                kwargs_plus[i][name] = value + delta
+                kwargs_minus[i][name] = value - delta
+                beta_x_plus, beta_y_plus = self.ray_shooting(
+                    x, y, kwargs_plus, k=k_ray_shooting
+                )
+                beta_x_minus, beta_y_minus = self.ray_shooting(
+                    x, y, kwargs_minus, k=k_ray_shooting
+                )
+                jacobian[i][name] = (
+                    (beta_x_plus - beta_x_minus) / (2 * delta),
+                    (beta_y_plus - beta_y_minus) / (2 * delta),
+                )
+        if isinstance(k, int):
+            return jacobian[k]
+        return jacobian
+
     def fermat_potential(
         self, x_image, y_image, kwargs_lens, x_source=None, y_source=None
     ):
@@ -428,16 +517,18 @@ class LensModel(object):
         f_yyy = (f_yy_dy - f_yy_dy_) / diff
         return f_xxx, f_xxy, f_xyy, f_yyy
 
-    def set_static(self, kwargs):
+    def set_static(self, kwargs, cache=None):
         """Set this instance to a static lens model. This can improve the speed in
         evaluating lensing quantities at different positions but must not be used with
         different lens model parameters!
 
         :param kwargs: lens model keyword argument list
+        :param cache: None or lenstronomy.LensModel.static_cache.StaticCache instance
+            re-using the pre-computations of previous calls (also of other processes)
         :return: kwargs_updated (in case of image position convention in multiplane
             lensing this is changed)
         """
-        return self.lens_model.set_static(kwargs)
+        return self.lens_model.set_static(kwargs, cache=cache)
 
     def set_dynamic(self):
         """Deletes cache for static setting and makes sure the observed convention in
@@ -535,7 +626,9 @@ class LensModel(object):
         :param theta_y: angular position and direction of the ray
         :param kwargs_lens: list of keyword arguments of lens model parameters matching
             the lens model classes
-        :param diff: numerical differential step (float)
+        :param diff: numerical differential step (float). If None, the derivatives are
+            propagated along the rays with the Hessians of the deflectors, see
+            MultiPlane.hessian()
         :return: f_xx, f_xy, f_yx, f_yy
         """
         if self.multi_plane is False:
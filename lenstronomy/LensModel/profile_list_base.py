@@ -1,96 +1,262 @@
+import importlib
+
+from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 from lenstronomy.Util.util import convert_bool_list
 
 __all__ = ["ProfileListBase"]
 
 
-_SUPPORTED_MODELS = [
-    "ARC_PERT",
-    "BLANK_PLANE",
+# lens model name: (module, class name); the modules are only imported when a model is
+# requested. When adding a new profile, insert it in its alphabetical position.
+_MODEL_REGISTRY = {
+    "ARC_PERT": (
+        "lenstronomy.LensModel.Profiles.arc_perturbations",
+        "ArcPerturbations",
+    ),
+    "BLANK_PLANE": ("lenstronomy.LensModel.Profiles.blank_plane", "BlankPlane"),
+    "CHAMELEON": ("lenstronomy.LensModel.Profiles.chameleon", "Chameleon"),
+    "CNFW": ("lenstronomy.LensModel.Profiles.cnfw", "CNFW"),
+    "CNFW_ELLIPSE": ("lenstronomy.LensModel.Profiles.cnfw_ellipse", "CNFW_ELLIPSE"),
+    "CONST_MAG": ("lenstronomy.LensModel.Profiles.const_mag", "ConstMag"),
+    "CONVERGENCE": ("lenstronomy.LensModel.Profiles.convergence", "Convergence"),
+    "coreBURKERT": ("lenstronomy.LensModel.Profiles.coreBurkert", "CoreBurkert"),
+    "CORED_DENSITY": ("lenstronomy.LensModel.Profiles.cored_density", "CoredDensity"),
+    "CORED_DENSITY_2": (
+        "lenstronomy.LensModel.Profiles.cored_density_2",
+        "CoredDensity2",
+    ),
+    "CORED_DENSITY_2_MST": (
+        "lenstronomy.LensModel.Profiles.cored_density_mst",
+        "CoredDensityMST",
+    ),
+    "CORED_DENSITY_EXP": (
+        "lenstronomy.LensModel.Profiles.cored_density_exp",
+        "CoredDensityExp",
+    ),
+    "CORED_DENSITY_EXP_MST": (
+        "lenstronomy.LensModel.Profiles.cored_density_mst",
+        "CoredDensityMST",
+    ),
+    "CORED_DENSITY_MST": (
+        "lenstronomy.LensModel.Profiles.cored_density_mst",
+        "CoredDensityMST",
+    ),
+    "CORED_DENSITY_ULDM_MST": (
+        "lenstronomy.LensModel.Profiles.cored_density_mst",
+        "CoredDensityMST",
+    ),
+    "CSE": ("lenstronomy.LensModel.Profiles.cored_steep_ellipsoid", "CSE"),
+    "CTNFW_GAUSS_DEC": (
+        "lenstronomy.LensModel.Profiles.gauss_decomposition",
+        "CTNFWGaussDec",
+    ),
+    "CURVED_ARC_CONST": (
+        "lenstronomy.LensModel.Profiles.curved_arc_const",
+        "CurvedArcConst",
+    ),
+    "CURVED_ARC_CONST_MST": (
+        "lenstronomy.LensModel.Profiles.curved_arc_const",
+        "CurvedArcConstMST",
+    ),
+    "CURVED_ARC_SIS_MST": (
+        "lenstronomy.LensModel.Profiles.curved_arc_sis_mst",
+        "CurvedArcSISMST",
+    ),
+    "CURVED_ARC_SPP": ("lenstronomy.LensModel.Profiles.curved_arc_spp", "CurvedArcSPP"),
+    "CURVED_ARC_SPT": ("lenstronomy.LensModel.Profiles.curved_arc_spt", "CurvedArcSPT"),
+    "CURVED_ARC_TAN_DIFF": (
+        "lenstronomy.LensModel.Profiles.curved_arc_tan_diff",
+        "CurvedArcTanDiff",
+    ),
+    "DIPOLE": ("lenstronomy.LensModel.Profiles.dipole", "Dipole"),
+    "DOUBLE_CHAMELEON": ("lenstronomy.LensModel.Profiles.chameleon", "DoubleChameleon"),
+    "EPL": ("lenstronomy.LensModel.Profiles.epl", "EPL"),
+    "EPL_BOXYDISKY": ("lenstronomy.LensModel.Profiles.epl_boxydisky", "EPL_BOXYDISKY"),
+    "EPL_NUMBA": ("lenstronomy.LensModel.Profiles.epl_numba", "EPL_numba"),
+    "EPL_Q_PHI": ("lenstronomy.LensModel.Profiles.epl", "EPLQPhi"),
+    "ElliSLICE": (
+        "lenstronomy.LensModel.Profiles.elliptical_density_slice",
+        "ElliSLICE",
+    ),
+    "FLEXION": ("lenstronomy.LensModel.Profiles.flexion", "Flexion"),
+    "FLEXIONFG": ("lenstronomy.LensModel.Profiles.flexionfg", "Flexionfg"),
+    "GAUSSIAN": ("lenstronomy.LensModel.Profiles.gaussian_potential", "Gaussian"),
+    "GAUSSIAN_ELLIPSE_KAPPA": (
+        "lenstronomy.LensModel.Profiles.gaussian_ellipse_kappa",
+        "GaussianEllipseKappa",
+    ),
+    "GAUSSIAN_ELLIPSE_POTENTIAL": (
+        "lenstronomy.LensModel.Profiles.gaussian_ellipse_potential",
+        "GaussianEllipsePotential",
+    ),
+    "GAUSSIAN_KAPPA": (
+        "lenstronomy.LensModel.Profiles.gaussian_kappa",
+        "GaussianKappa",
+    ),
+    "GNFW": ("lenstronomy.LensModel.Profiles.gnfw", "GNFW"),
+    "HERNQUIST": ("lenstronomy.LensModel.Profiles.hernquist", "Hernquist"),
+    "HERNQUIST_ELLIPSE": (
+        "lenstronomy.LensModel.Profiles.hernquist_ellipse",
+        "Hernquist_Ellipse",
+    ),
+    "HERNQUIST_ELLIPSE_CSE": (
+        "lenstronomy.LensModel.Profiles.hernquist_ellipse_cse",
+        "HernquistEllipseCSE",
+    ),
+    "HERNQUIST_ELLIPSE_CSE_NUMBA": (
+        "lenstronomy.LensModel.Profiles.hernquist_ellipse_cse_numba",
+        "HernquistEllipseCSE_numba",
+    ),
+    "HESSIAN": ("lenstronomy.LensModel.Profiles.hessian", "Hessian"),
+    "INTERPOL": ("lenstronomy.LensModel.Profiles.interpol", "Interpol"),
+    "INTERPOL_SCALED": ("lenstronomy.LensModel.Profiles.interpol", "InterpolScaled"),
+    "LOS": ("lenstronomy.LensModel.LineOfSight.LOSModels.los", "LOS"),
+    "LOS_MINIMAL": (
+        "lenstronomy.LensModel.LineOfSight.LOSModels.los_minimal",
+        "LOSMinimal",
+    ),
+    "MULTIPOLE": ("lenstronomy.LensModel.Profiles.multipole", "Multipole"),
+    "MULTIPOLE_NUMBA": (
+        "lenstronomy.LensModel.Profiles.multipole_numba",
+        "Multipole_numba",
+    ),
+    "MULTI_GAUSSIAN_KAPPA": (
+        "lenstronomy.LensModel.Profiles.multi_gaussian_kappa",
+        "MultiGaussianKappa",
+    ),
+    "MULTI_GAUSSIAN_KAPPA_ELLIPSE": (
+        "lenstronomy.LensModel.Profiles.multi_gaussian_kappa",
+        "MultiGaussianKappaEllipse",
+    ),
+    "NFW": ("lenstronomy.LensModel.Profiles.nfw", "NFW"),
+    "NFW_ELLIPSE": ("lenstronomy.LensModel.Profiles.nfw_ellipse", "NFW_ELLIPSE"),
+    "NFW_ELLIPSE_CSE": (
+        "lenstronomy.LensModel.Profiles.nfw_ellipse_cse",
+        "NFW_ELLIPSE_CSE",
+    ),
+    "NFW_ELLIPSE_CSE_NUMBA": (
+        "lenstronomy.LensModel.Profiles.nfw_ellipse_cse_numba",
+        "NFW_ELLIPSE_CSE_numba",
+    ),
+    "NFW_ELLIPSE_GAUSS_DEC": (
+        "lenstronomy.LensModel.Profiles.gauss_decomposition",
+        "NFWEllipseGaussDec",
+    ),
+    "NFW_MC": ("lenstronomy.LensModel.Profiles.nfw_mass_concentration", "NFWMC"),
+    "NFW_MC_ELLIPSE": (
+        "lenstronomy.LensModel.Profiles.nfw_mass_concentration_ellipse",
+        "NFWMCEllipse",
+    ),
+    "NIE": ("lenstronomy.LensModel.Profiles.nie", "NIE"),
+    "NIE_NUMBA": ("lenstronomy.LensModel.Profiles.nie_numba", "NIE_numba"),
+    "NIE_POTENTIAL": ("lenstronomy.LensModel.Profiles.nie_potential", "NIE_POTENTIAL"),
+    "NIE_SIMPLE": ("lenstronomy.LensModel.Profiles.nie", "NIEMajorAxis"),
+    "PEMD": ("lenstronomy.LensModel.Profiles.pemd", "PEMD"),
+    "PJAFFE": ("lenstronomy.LensModel.Profiles.p_jaffe", "PJaffe"),
+    "PJAFFE_ELLIPSE": (
+        "lenstronomy.LensModel.Profiles.p_jaffe_ellipse",
+        "PJaffe_Ellipse",
+    ),
+    "POINT_MASS": ("lenstronomy.LensModel.Profiles.point_mass", "PointMass"),
+    "PSEUDO_DPL": (
+        "lenstronomy.LensModel.Profiles.pseudo_double_powerlaw",
+        "PseudoDoublePowerlaw",
+    ),
+    "RADIAL_INTERPOL": (
+        "lenstronomy.LensModel.Profiles.radial_interpolated",
+        "RadialInterpolate",
+    ),
+    "SERSIC": ("lenstronomy.LensModel.Profiles.sersic", "Sersic"),
+    "SERSIC_ELLIPSE_GAUSS_DEC": (
+        "lenstronomy.LensModel.Profiles.gauss_decomposition",
+        "SersicEllipseGaussDec",
+    ),
+    "SERSIC_ELLIPSE_KAPPA": (
+        "lenstronomy.LensModel.Profiles.sersic_ellipse_kappa",
+        "SersicEllipseKappa",
+    ),
+    "SERSIC_ELLIPSE_POTENTIAL": (
+        "lenstronomy.LensModel.Profiles.sersic_ellipse_potential",
+        "SersicEllipse",
+    ),
+    "SHAPELETS_CART": (
+        "lenstronomy.LensModel.Profiles.shapelet_pot_cartesian",
+        "CartShapelets",
+    ),
+    "SHAPELETS_POLAR": (
+        "lenstronomy.LensModel.Profiles.shapelet_pot_polar",
+        "PolarShapelets",
+    ),
+    "SHIFT": ("lenstronomy.LensModel.Profiles.constant_shift", "Shift"),
+    "SHEAR": ("lenstronomy.LensModel.Profiles.shear", "Shear"),
+    "SHEAR_GAMMA_PSI": ("lenstronomy.LensModel.Profiles.shear", "ShearGammaPsi"),
+    "SHEAR_NUMBA": ("lenstronomy.LensModel.Profiles.shear_numba", "Shear_numba"),
+    "SHEAR_REDUCED": ("lenstronomy.LensModel.Profiles.shear", "ShearReduced"),
+    "SIE": ("lenstronomy.LensModel.Profiles.sie", "SIE"),
+    "SIE_NUMBA": ("lenstronomy.LensModel.Profiles.nie_numba", "SIE_numba"),
+    "SIS": ("lenstronomy.LensModel.Profiles.sis", "SIS"),
+    "SIS_TRUNCATED": ("lenstronomy.LensModel.Profiles.sis_truncate", "SIS_truncate"),
+    "SPEMD": ("lenstronomy.LensModel.Profiles.spemd", "SPEMD"),
+    "SPEP": ("lenstronomy.LensModel.Profiles.spep", "SPEP"),
+    "SPL_CORE": ("lenstronomy.LensModel.Profiles.splcore", "SPLCORE"),
+    "SPP": ("lenstronomy.LensModel.Profiles.spp", "SPP"),
+    "SYNTHESIS": ("lenstronomy.LensModel.Profiles.synthesis", "SynthesisProfile"),
+    "TABULATED_DEFLECTIONS": (
+        "lenstronomy.LensModel.Profiles.numerical_deflections",
+        "TabulatedDeflections",
+    ),
+    "TNFW": ("lenstronomy.LensModel.Profiles.tnfw", "TNFW"),
+    "TNFWC": ("lenstronomy.LensModel.Profiles.nfw_core_truncated", "TNFWC"),
+    "TNFW_ELLIPSE": ("lenstronomy.LensModel.Profiles.tnfw_ellipse", "TNFW_ELLIPSE"),
+    "TRIPLE_CHAMELEON": ("lenstronomy.LensModel.Profiles.chameleon", "TripleChameleon"),
+    "ULDM": ("lenstronomy.LensModel.Profiles.uldm", "Uldm"),
+}
+
+# fixed keyword arguments passed to the class of the lens model
+_MODEL_KWARGS = {
+    "CORED_DENSITY_2_MST": {"profile_type": "CORED_DENSITY_2"},
+    "CORED_DENSITY_EXP_MST": {"profile_type": "CORED_DENSITY_EXP"},
+    "CORED_DENSITY_MST": {"profile_type": "CORED_DENSITY"},
+    "CORED_DENSITY_ULDM_MST": {"profile_type": "CORED_DENSITY_ULDM"},
+}
+
+_SUPPORTED_MODELS = list(_MODEL_REGISTRY.keys())
+
+# those models require a new instance per profile as some pre-computations are different when parameters or
+# other settings are changed. For example, the 'INTERPOL' model needs to know the specific map to be
+# interpolated.
+_PER_INSTANCE_MODELS = [
     "CHAMELEON",
-    "CNFW",
-    "CNFW_ELLIPSE",
-    "CONST_MAG",
-    "CONVERGENCE",
-    "coreBURKERT",
-    "CORED_DENSITY",
-    "CORED_DENSITY_2",
-    "CORED_DENSITY_2_MST",
-    "CORED_DENSITY_EXP",
-    "CORED_DENSITY_EXP_MST",
-    "CORED_DENSITY_MST",
-    "CORED_DENSITY_ULDM_MST",
-    "CSE",
     "CTNFW_GAUSS_DEC",
-    "CURVED_ARC_CONST",
-    "CURVED_ARC_SIS_MST",
-    "CURVED_ARC_SPP",
-    "CURVED_ARC_SPT",
-    "CURVED_ARC_TAN_DIFF",
-    "DIPOLE",
     "DOUBLE_CHAMELEON",
-    "EPL",
-    "EPL_BOXYDISKY",
-    "EPL_NUMBA",
-    "EPL_Q_PHI",
-    "ElliSLICE",
-    "FLEXION",
-    "FLEXIONFG",
-    "GAUSSIAN",
-    "GAUSSIAN_ELLIPSE_KAPPA",
-    "GAUSSIAN_ELLIPSE_POTENTIAL",
-    "GAUSSIAN_KAPPA",
-    "GNFW",
-    "HERNQUIST",
-    "HERNQUIST_ELLIPSE",
-    "HERNQUIST_ELLIPSE_CSE",
-    "HESSIAN",
     "INTERPOL",
     "INTERPOL_SCALED",
-    "RADIAL_INTERPOL" "LOS",
-    "LOS_MINIMAL",
-    "MULTIPOLE",
-    "MULTI_GAUSSIAN_KAPPA",
-    "MULTI_GAUSSIAN_KAPPA_ELLIPSE",
-    "NFW",
-    "NFW_ELLIPSE",
-    "NFW_ELLIPSE_CSE",
     "NFW_ELLIPSE_GAUSS_DEC",
     "NFW_MC",
     "NFW_MC_ELLIPSE",
     "NIE",
-    "NIE_POTENTIAL",
+    "NIE_NUMBA",
     "NIE_SIMPLE",
-    "PEMD",
-    "PJAFFE",
-    "PJAFFE_ELLIPSE",
-    "POINT_MASS",
-    "PSEUDO_DPL",
-    "SERSIC",
-    "SERSIC_ELLIPSE_GAUSS_DEC",
-    "SERSIC_ELLIPSE_KAPPA",
-    "SERSIC_ELLIPSE_POTENTIAL",
-    "SHAPELETS_CART",
-    "SHAPELETS_POLAR",
-    "SHEAR",
-    "SHEAR_GAMMA_PSI",
-    "SHEAR_REDUCED",
-    "SHIFT",
-    "SIE",
-    "SIS",
-    "SIS_TRUNCATED",
-    "SPEMD",
-    "SPEP",
-    "SPL_CORE",
-    "SPP",
+    "RADIAL_INTERPOL",
+    "TRIPLE_CHAMELEON",
+]
+
+# models whose instance depends on the keyword arguments of lens_class()
+_CONFIGURED_MODELS = [
+    "INTERPOL",
+    "INTERPOL_SCALED",
+    "NFW_MC",
+    "NFW_MC_ELLIPSE",
     "SYNTHESIS",
     "TABULATED_DEFLECTIONS",
-    "TNFW",
-    "TNFWC",
-    "TNFW_ELLIPSE",
-    "TRIPLE_CHAMELEON",
-    "ULDM",
 ]
 
+# classes of the lens models imported so far
+_CLASSES = {}
+
+# instances of stateless lens models shared between all ProfileListBase instances
+_SHARED_INSTANCES = {}
+
 
 class ProfileListBase(object):
     """Class that manages the list of lens model class instances.
@@ -145,23 +311,7 @@ class ProfileListBase(object):
         func_list = []
         imported_classes = {}
         for i, lens_type in enumerate(lens_model_list):
-            # those models require a new instance per profile as some pre-computations are different when parameters or
-            # other settings are changed. For example, the 'INTERPOL' model needs to know the specific map to be
-            # interpolated.
-            if lens_type in [
-                "CHAMELEON",
-                "CTNFW_GAUSS_DEC",
-                "DOUBLE_CHAMELEON",
-                "INTERPOL",
-                "INTERPOL_SCALED",
-                "NFW_ELLIPSE_GAUSS_DEC",
-                "NFW_MC",
-                "NFW_MC_ELLIPSE",
-                "NIE",
-                "NIE_SIMPLE",
-                "RADIAL_INTERPOL",
-                "TRIPLE_CHAMELEON",
-            ]:
+            if lens_type in _PER_INSTANCE_MODELS:
                 lensmodel_class = lens_class(
                     lens_type,
                     custom_class=custom_class,
@@ -172,7 +322,7 @@ class ProfileListBase(object):
                 )
             else:
                 if lens_type not in imported_classes.keys():
-                    lensmodel_class = lens_class(
+                    lensmodel_class = shared_lens_class(
                         lens_type,
                         custom_class=custom_class,
                         kwargs_interp=kwargs_interp,
@@ -196,14 +346,20 @@ class ProfileListBase(object):
         """
         return convert_bool_list(n=self._num_func, k=k)
 
-    def set_static(self, kwargs_list):
+    def set_static(self, kwargs_list, cache=None):
         """
 
         :param kwargs_list: list of keyword arguments for each profile
+        :param cache: None or StaticCache instance providing the pre-computations of
+            previous calls (also of other processes). Profiles configured at
+            construction (e.g. NFW_MC with its redshifts) are not cached.
         :return: kwargs_list
         """
         for i, func in enumerate(self.func_list):
-            func.set_static(**kwargs_list[i])
+            if cache is None or self._model_list[i] in _CONFIGURED_MODELS:
+                func.set_static(**kwargs_list[i])
+            else:
+                cache.set_static(func, kwargs_list[i])
         return kwargs_list
 
     def set_dynamic(self):
@@ -238,397 +394,66 @@ def lens_class(
         'INTERPOL_SCALED' models.
     :return: class instance of the lens model type
     """
-
-    if lens_type == "ARC_PERT":
-        from lenstronomy.LensModel.Profiles.arc_perturbations import (
-            ArcPerturbations,
-        )
-
-        return ArcPerturbations()
-    if lens_type == "BLANK_PLANE":
-        from lenstronomy.LensModel.Profiles.blank_plane import BlankPlane
-
-        return BlankPlane()
-    elif lens_type == "CHAMELEON":
-        from lenstronomy.LensModel.Profiles.chameleon import Chameleon
-
-        return Chameleon()
-    elif lens_type == "CNFW":
-        from lenstronomy.LensModel.Profiles.cnfw import CNFW
-
-        return CNFW()
-    elif lens_type == "CNFW_ELLIPSE":
-        from lenstronomy.LensModel.Profiles.cnfw_ellipse import CNFW_ELLIPSE
-
-        return CNFW_ELLIPSE()
-    elif lens_type == "CONST_MAG":
-        from lenstronomy.LensModel.Profiles.const_mag import ConstMag
-
-        return ConstMag()
-    elif lens_type == "CONVERGENCE":
-        from lenstronomy.LensModel.Profiles.convergence import Convergence
-
-        return Convergence()
-    elif lens_type == "coreBURKERT":
-        from lenstronomy.LensModel.Profiles.coreBurkert import CoreBurkert
-
-        return CoreBurkert()
-    elif lens_type == "CORED_DENSITY":
-        from lenstronomy.LensModel.Profiles.cored_density import CoredDensity
-
-        return CoredDensity()
-    elif lens_type == "CORED_DENSITY_2":
-        from lenstronomy.LensModel.Profiles.cored_density_2 import CoredDensity2
-
-        return CoredDensity2()
-    elif lens_type == "CORED_DENSITY_2_MST":
-        from lenstronomy.LensModel.Profiles.cored_density_mst import CoredDensityMST
-
-        return CoredDensityMST(profile_type="CORED_DENSITY_2")
-    elif lens_type == "CORED_DENSITY_EXP":
-        from lenstronomy.LensModel.Profiles.cored_density_exp import CoredDensityExp
-
-        return CoredDensityExp()
-    elif lens_type == "CORED_DENSITY_EXP_MST":
-        from lenstronomy.LensModel.Profiles.cored_density_mst import CoredDensityMST
-
-        return CoredDensityMST(profile_type="CORED_DENSITY_EXP")
-    elif lens_type == "CORED_DENSITY_MST":
-        from lenstronomy.LensModel.Profiles.cored_density_mst import CoredDensityMST
-
-        return CoredDensityMST(profile_type="CORED_DENSITY")
-    elif lens_type == "CORED_DENSITY_ULDM_MST":
-        from lenstronomy.LensModel.Profiles.cored_density_mst import CoredDensityMST
-
-        return CoredDensityMST(profile_type="CORED_DENSITY_ULDM")
-    elif lens_type == "CSE":
-        from lenstronomy.LensModel.Profiles.cored_steep_ellipsoid import CSE
-
-        return CSE()
-    elif lens_type == "CTNFW_GAUSS_DEC":
-        from lenstronomy.LensModel.Profiles.gauss_decomposition import CTNFWGaussDec
-
-        return CTNFWGaussDec()
-    elif lens_type == "CURVED_ARC_CONST":
-        from lenstronomy.LensModel.Profiles.curved_arc_const import CurvedArcConst
-
-        return CurvedArcConst()
-    elif lens_type == "CURVED_ARC_CONST_MST":
-        from lenstronomy.LensModel.Profiles.curved_arc_const import CurvedArcConstMST
-
-        return CurvedArcConstMST()
-    elif lens_type == "CURVED_ARC_SIS_MST":
-        from lenstronomy.LensModel.Profiles.curved_arc_sis_mst import CurvedArcSISMST
-
-        return CurvedArcSISMST()
-    elif lens_type == "CURVED_ARC_SPP":
-        from lenstronomy.LensModel.Profiles.curved_arc_spp import CurvedArcSPP
-
-        return CurvedArcSPP()
-    elif lens_type == "CURVED_ARC_SPT":
-        from lenstronomy.LensModel.Profiles.curved_arc_spt import CurvedArcSPT
-
-        return CurvedArcSPT()
-    elif lens_type == "CURVED_ARC_TAN_DIFF":
-        from lenstronomy.LensModel.Profiles.curved_arc_tan_diff import (
-            CurvedArcTanDiff,
-        )
-
-        return CurvedArcTanDiff()
-    elif lens_type == "DIPOLE":
-        from lenstronomy.LensModel.Profiles.dipole import Dipole
-
-        return Dipole()
-    elif lens_type == "DOUBLE_CHAMELEON":
-        from lenstronomy.LensModel.Profiles.chameleon import DoubleChameleon
-
-        return DoubleChameleon()
-    elif lens_type == "EPL":
-        from lenstronomy.LensModel.Profiles.epl import EPL
-
-        return EPL()
-    elif lens_type == "EPL_BOXYDISKY":
-        from lenstronomy.LensModel.Profiles.epl_boxydisky import EPL_BOXYDISKY
-
-        return EPL_BOXYDISKY()
-    elif lens_type == "EPL_NUMBA":
-        from lenstronomy.LensModel.Profiles.epl_numba import EPL_numba
-
-        return EPL_numba()
-    elif lens_type == "EPL_Q_PHI":
-        from lenstronomy.LensModel.Profiles.epl import EPLQPhi
-
-        return EPLQPhi()
-    elif lens_type == "ElliSLICE":
-        from lenstronomy.LensModel.Profiles.elliptical_density_slice import (
-            ElliSLICE,
-        )
-
-        return ElliSLICE()
-    elif lens_type == "FLEXION":
-        from lenstronomy.LensModel.Profiles.flexion import Flexion
-
-        return Flexion()
-    elif lens_type == "FLEXIONFG":
-        from lenstronomy.LensModel.Profiles.flexionfg import Flexionfg
-
-        return Flexionfg()
-    elif lens_type == "GAUSSIAN":
-        from lenstronomy.LensModel.Profiles.gaussian_potential import Gaussian
-
-        return Gaussian()
-    elif lens_type == "GAUSSIAN_ELLIPSE_KAPPA":
-        from lenstronomy.LensModel.Profiles.gaussian_ellipse_kappa import (
-            GaussianEllipseKappa,
-        )
-
-        return GaussianEllipseKappa()
-    elif lens_type == "GAUSSIAN_ELLIPSE_POTENTIAL":
-        from lenstronomy.LensModel.Profiles.gaussian_ellipse_potential import (
-            GaussianEllipsePotential,
-        )
-
-        return GaussianEllipsePotential()
-    elif lens_type == "GAUSSIAN_KAPPA":
-        from lenstronomy.LensModel.Profiles.gaussian_kappa import GaussianKappa
-
-        return GaussianKappa()
-    elif lens_type == "GNFW":
-        from lenstronomy.LensModel.Profiles.gnfw import GNFW
-
-        return GNFW()
-    elif lens_type == "HERNQUIST":
-        from lenstronomy.LensModel.Profiles.hernquist import Hernquist
-
-        return Hernquist()
-    elif lens_type == "HERNQUIST_ELLIPSE":
-        from lenstronomy.LensModel.Profiles.hernquist_ellipse import (
-            Hernquist_Ellipse,
-        )
-
-        return Hernquist_Ellipse()
-    elif lens_type == "HERNQUIST_ELLIPSE_CSE":
-        from lenstronomy.LensModel.Profiles.hernquist_ellipse_cse import (
-            HernquistEllipseCSE,
-        )
-
-        return HernquistEllipseCSE()
-    elif lens_type == "HESSIAN":
-        from lenstronomy.LensModel.Profiles.hessian import Hessian
-
-        return Hessian()
-    elif lens_type == "INTERPOL":
-        from lenstronomy.LensModel.Profiles.interpol import Interpol
-
-        return Interpol(**kwargs_interp)
-    elif lens_type == "INTERPOL_SCALED":
-        from lenstronomy.LensModel.Profiles.interpol import InterpolScaled
-
-        return InterpolScaled(**kwargs_interp)
-    elif lens_type == "LOS":
-        from lenstronomy.LensModel.LineOfSight.LOSModels.los import LOS
-
-        return LOS()
-    elif lens_type == "LOS_MINIMAL":
-        from lenstronomy.LensModel.LineOfSight.LOSModels.los_minimal import (
-            LOSMinimal,
-        )
-
-        return LOSMinimal()
-    elif lens_type == "MULTIPOLE":
-        from lenstronomy.LensModel.Profiles.multipole import Multipole
-
-        return Multipole()
-    elif lens_type == "MULTI_GAUSSIAN_KAPPA":
-        from lenstronomy.LensModel.Profiles.multi_gaussian_kappa import (
-            MultiGaussianKappa,
-        )
-
-        return MultiGaussianKappa()
-    elif lens_type == "MULTI_GAUSSIAN_KAPPA_ELLIPSE":
-        from lenstronomy.LensModel.Profiles.multi_gaussian_kappa import (
-            MultiGaussianKappaEllipse,
-        )
-
-        return MultiGaussianKappaEllipse()
-    elif lens_type == "NFW":
-        from lenstronomy.LensModel.Profiles.nfw import NFW
-
-        return NFW()
-    elif lens_type == "NFW_ELLIPSE":
-        from lenstronomy.LensModel.Profiles.nfw_ellipse import NFW_ELLIPSE
-
-        return NFW_ELLIPSE()
-    elif lens_type == "NFW_ELLIPSE_CSE":
-        from lenstronomy.LensModel.Profiles.nfw_ellipse_cse import NFW_ELLIPSE_CSE
-
-        return NFW_ELLIPSE_CSE()
-    elif lens_type == "NFW_ELLIPSE_GAUSS_DEC":
-        from lenstronomy.LensModel.Profiles.gauss_decomposition import (
-            NFWEllipseGaussDec,
-        )
-
-        return NFWEllipseGaussDec()
-    elif lens_type == "NFW_MC":
-        from lenstronomy.LensModel.Profiles.nfw_mass_concentration import NFWMC
-
-        return NFWMC(z_lens=z_lens, z_source=z_source)
-    elif lens_type == "NFW_MC_ELLIPSE":
-        from lenstronomy.LensModel.Profiles.nfw_mass_concentration_ellipse import (
-            NFWMCEllipse,
-        )
-
-        return NFWMCEllipse(z_lens=z_lens, z_source=z_source)
-    elif lens_type == "NIE":
-        from lenstronomy.LensModel.Profiles.nie import NIE
-
-        return NIE()
-    elif lens_type == "NIE_POTENTIAL":
-        from lenstronomy.LensModel.Profiles.nie_potential import NIE_POTENTIAL
-
-        return NIE_POTENTIAL()
-    elif lens_type == "NIE_SIMPLE":
-        from lenstronomy.LensModel.Profiles.nie import NIEMajorAxis
-
-        return NIEMajorAxis()
-    elif lens_type == "PEMD":
-        from lenstronomy.LensModel.Profiles.pemd import PEMD
-
-        return PEMD()
-    elif lens_type == "PJAFFE":
-        from lenstronomy.LensModel.Profiles.p_jaffe import PJaffe
-
-        return PJaffe()
-    elif lens_type == "PJAFFE_ELLIPSE":
-        from lenstronomy.LensModel.Profiles.p_jaffe_ellipse import PJaffe_Ellipse
-
-        return PJaffe_Ellipse()
-    elif lens_type == "POINT_MASS":
-        from lenstronomy.LensModel.Profiles.point_mass import PointMass
-
-        return PointMass()
-    elif lens_type == "PSEUDO_DPL":
-        from lenstronomy.LensModel.Profiles.pseudo_double_powerlaw import (
-            PseudoDoublePowerlaw,
-        )
-
-        return PseudoDoublePowerlaw()
-    elif lens_type == "RADIAL_INTERPOL":
-        from lenstronomy.LensModel.Profiles.radial_interpolated import (
-            RadialInterpolate,
-        )
-
-        return RadialInterpolate()
-    elif lens_type == "SERSIC":
-        from lenstronomy.LensModel.Profiles.sersic import Sersic
-
-        return Sersic()
-    elif lens_type == "SERSIC_ELLIPSE_GAUSS_DEC":
-        from lenstronomy.LensModel.Profiles.gauss_decomposition import (
-            SersicEllipseGaussDec,
-        )
-
-        return SersicEllipseGaussDec()
-    elif lens_type == "SERSIC_ELLIPSE_KAPPA":
-        from lenstronomy.LensModel.Profiles.sersic_ellipse_kappa import (
-            SersicEllipseKappa,
-        )
-
-        return SersicEllipseKappa()
-    elif lens_type == "SERSIC_ELLIPSE_POTENTIAL":
-        from lenstronomy.LensModel.Profiles.sersic_ellipse_potential import (
-            SersicEllipse,
-        )
-
-        return SersicEllipse()
-    elif lens_type == "SHAPELETS_CART":
-        from lenstronomy.LensModel.Profiles.shapelet_pot_cartesian import (
-            CartShapelets,
+    if lens_type not in _MODEL_REGISTRY:
+        raise ValueError(
+            "%s is not a valid lens model. Supported are: %s."
+            % (lens_type, _SUPPORTED_MODELS)
         )
+    profile_class = _import_class(lens_type)
+    if lens_type in ["INTERPOL", "INTERPOL_SCALED"]:
+        return profile_class(**kwargs_interp)
+    elif lens_type in ["NFW_MC", "NFW_MC_ELLIPSE"]:
+        return profile_class(z_lens=z_lens, z_source=z_source)
+    elif lens_type == "SYNTHESIS":
+        return profile_class(**kwargs_synthesis)
+    elif lens_type == "TABULATED_DEFLECTIONS":
+        return profile_class(custom_class)
+    return profile_class(**_MODEL_KWARGS.get(lens_type, {}))
 
-        return CartShapelets()
-    elif lens_type == "SHAPELETS_POLAR":
-        from lenstronomy.LensModel.Profiles.shapelet_pot_polar import PolarShapelets
-
-        return PolarShapelets()
-    elif lens_type == "SHIFT":
-        from lenstronomy.LensModel.Profiles.constant_shift import Shift
-
-        return Shift()
-    elif lens_type == "SHEAR":
-        from lenstronomy.LensModel.Profiles.shear import Shear
-
-        return Shear()
-    elif lens_type == "SHEAR_GAMMA_PSI":
-        from lenstronomy.LensModel.Profiles.shear import ShearGammaPsi
-
-        return ShearGammaPsi()
-    elif lens_type == "SHEAR_REDUCED":
-        from lenstronomy.LensModel.Profiles.shear import ShearReduced
-
-        return ShearReduced()
-    elif lens_type == "SIE":
-        from lenstronomy.LensModel.Profiles.sie import SIE
-
-        return SIE()
-    elif lens_type == "SIS":
-        from lenstronomy.LensModel.Profiles.sis import SIS
-
-        return SIS()
-    elif lens_type == "SIS_TRUNCATED":
-        from lenstronomy.LensModel.Profiles.sis_truncate import SIS_truncate
-
-        return SIS_truncate()
-    elif lens_type == "SPEMD":
-        from lenstronomy.LensModel.Profiles.spemd import SPEMD
-
-        return SPEMD()
-    elif lens_type == "SPEP":
-        from lenstronomy.LensModel.Profiles.spep import SPEP
-
-        return SPEP()
-    elif lens_type == "SPL_CORE":
-        from lenstronomy.LensModel.Profiles.splcore import SPLCORE
-
-        return SPLCORE()
-    elif lens_type == "SPP":
-        from lenstronomy.LensModel.Profiles.spp import SPP
 
-        return SPP()
-    elif lens_type == "SYNTHESIS":
-        from lenstronomy.LensModel.Profiles.synthesis import SynthesisProfile
+def shared_lens_class(lens_type, **kwargs):
+    """Class instance of a single lens, shared between all callers for stateless
+    profiles. Profiles that can be set static (see LensProfileBase.set_static()),
+    that require a new instance per profile or that depend on the keyword arguments
+    are instantiated with every call.
 
-        return SynthesisProfile(**kwargs_synthesis)
-    elif lens_type == "TABULATED_DEFLECTIONS":
-        from lenstronomy.LensModel.Profiles.numerical_deflections import (
-            TabulatedDeflections,
-        )
+    :param lens_type: string, lens model type
+    :param kwargs: keyword arguments of lens_class()
+    :return: class instance of the lens model type
+    """
+    if lens_type in _SHARED_INSTANCES:
+        return _SHARED_INSTANCES[lens_type]
+    instance = lens_class(lens_type, **kwargs)
+    if (
+        lens_type not in _PER_INSTANCE_MODELS
+        and lens_type not in _CONFIGURED_MODELS
+        and _is_stateless(instance)
+    ):
+        _SHARED_INSTANCES[lens_type] = instance
+    return instance
 
-        return TabulatedDeflections(custom_class)
-    elif lens_type == "TNFW":
-        from lenstronomy.LensModel.Profiles.tnfw import TNFW
 
-        return TNFW()
-    elif lens_type == "TNFWC":
-        from lenstronomy.LensModel.Profiles.nfw_core_truncated import TNFWC
+def _import_class(lens_type):
+    """Imports the module of a lens model (if not done before) and returns its class.
 
-        return TNFWC()
-    elif lens_type == "TNFW_ELLIPSE":
-        from lenstronomy.LensModel.Profiles.tnfw_ellipse import TNFW_ELLIPSE
+    :param lens_type: string, lens model type
+    :return: class of the lens model type
+    """
+    if lens_type not in _CLASSES:
+        module_name, class_name = _MODEL_REGISTRY[lens_type]
+        module = importlib.import_module(module_name)
+        _CLASSES[lens_type] = getattr(module, class_name)
+    return _CLASSES[lens_type]
 
-        return TNFW_ELLIPSE()
-    elif lens_type == "TRIPLE_CHAMELEON":
-        from lenstronomy.LensModel.Profiles.chameleon import TripleChameleon
 
-        return TripleChameleon()
-    elif lens_type == "ULDM":
-        from lenstronomy.LensModel.Profiles.uldm import Uldm
+def _is_stateless(instance):
+    """
 
-        return Uldm()
-    # when adding a new profile, insert the corresponding elif statement in its
-    # alphabetical position
-    else:
-        raise ValueError(
-            "%s is not a valid lens model. Supported are: %s."
-            % (lens_type, _SUPPORTED_MODELS)
-        )
+    :param instance: lens model instance
+    :return: bool, True if the instance does not hold any state depending on the lens
+        model parameters
+    """
+    return (
+        isinstance(instance, LensProfileBase)
+        and type(instance).set_static is LensProfileBase.set_static
+    )
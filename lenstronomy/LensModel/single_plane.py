@@ -2,6 +2,11 @@ __author__ = "sibirrer"
 
 import numpy as np
 from lenstronomy.LensModel.profile_list_base import ProfileListBase
+from lenstronomy.LensModel.Profiles.base_profile import (
+    LensProfileBase,
+    finite_difference_jacobian,
+    _is_real_scalar,
+)
 
 __all__ = ["SinglePlane"]
 
@@ -97,6 +102,52 @@ class SinglePlane(ProfileListBase):
 
         return f_x, f_y
 
+    def alpha_jacobian(self, x, y, kwargs, k=None):
+        """Derivatives of the deflection angles with respect to the lens model
+        parameters. The deflection angles are additive such that the derivatives of
+        every profile are independent of the other profiles.
+
+        :param x: x-position (preferentially arcsec)
+        :type x: numpy array
+        :param y: y-position (preferentially arcsec)
+        :type y: numpy array
+        :param kwargs: list of keyword arguments of lens model parameters matching the
+            lens model classes
+        :param k: only evaluate the k-th lens model
+        :return: list (one entry per lens model) of dictionaries with parameter names
+            as keys and (d alpha_x / d param, d alpha_y / d param) as values (empty
+            dictionaries for models not evaluated); a single dictionary if k is an
+            integer
+        """
+        x = np.array(x, dtype=float)
+        y = np.array(y, dtype=float)
+        if isinstance(k, int):
+            return self._profile_alpha_jacobian(self.func_list[k], x, y, kwargs[k])
+        bool_list = self._bool_list(k)
+        jacobian = []
+        for i, func in enumerate(self.func_list):
+            if bool_list[i] is True:
+                jacobian.append(self._profile_alpha_jacobian(func, x, y, kwargs[i]))
+            else:
+                jacobian.append({})
+        return jacobian
+
+    @staticmethod
+    def _profile_alpha_jacobian(func, x, y, kwargs):
+        """
+
+        :param func: lens profile instance
+        :param x: x-position
+        :param y: y-position
+        :param kwargs: keyword arguments of the profile
+        :return: dictionary with parameter names as keys and (d alpha_x / d param, d
+            alpha_y / d param) as values
+        """
+        if isinstance(func, LensProfileBase):
+            return func.derivatives_jacobian(x, y, kwargs)
+        param_names = [name for name, value in kwargs.items() if _is_real_scalar(value)]
+        return finite_difference_jacobian(func.derivatives, x, y, kwargs, param_names)
+
     def hessian(self, x, y, kwargs, k=None):
         """Hessian matrix.
 
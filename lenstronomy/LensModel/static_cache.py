@@ -0,0 +1,207 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+
+__all__ = ["StaticCache"]
+
+
+class StaticCache(object):
+    """Content-addressed cache of the pre-computations of the lens profiles in
+    set_static().
+
+    The entries are keyed on the profile class and its keyword arguments and hold the
+    attributes set by set_static() (including the ones of sub-profiles, e.g. of
+    CHAMELEON). They are kept in memory and, if a directory is provided, stored as one
+    file per entry such that other processes (MPI ranks or the workers of a
+    lenstronomy.Sampling.Pool) attach to the same cache and read the pre-computations
+    instead of repeating them. A directory on a memory-backed file system (e.g.
+    /dev/shm) serves as shared memory between the processes of a node.
+
+    Example::
+
+        >>> cache = StaticCache(directory="static_cache")
+        >>> lens_model.set_static(kwargs_lens, cache=cache)
+
+    and in the workers::
+
+        >>> cache = StaticCache(directory="static_cache", read_only=True)
+        >>> lens_model.set_static(kwargs_lens, cache=cache)
+    """
+
+    def __init__(self, directory=None, read_only=False):
+        """
+
+        :param directory: None or path of the directory storing the entries (created
+            if it does not exist)
+        :param read_only: bool, if True, new entries are only kept in memory and not
+            written to the directory
+        """
+        self._directory = directory
+        self._read_only = read_only
+        if directory is not None and not read_only:
+            os.makedirs(directory, exist_ok=True)
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(func, kwargs):
+        """Content address of the pre-computations of a profile.
+
+        :param func: lens profile instance
+        :param kwargs: keyword arguments of the profile
+        :return: string, hash of the profile class and the keyword arguments
+        """
+        hasher = hashlib.sha1()
+        hasher.update(
+            ("%s.%s" % (type(func).__module__, type(func).__qualname__)).encode()
+        )
+        for name in sorted(kwargs):
+            value = kwargs[name]
+            hasher.update(name.encode())
+            if np.ndim(value) == 0 and not isinstance(value, np.ndarray):
+                hasher.update(repr(value).encode())
+            else:
+                value = np.ascontiguousarray(value)
+                hasher.update(("%s%s" % (value.dtype.str, value.shape)).encode())
+                hasher.update(value.tobytes())
+        return hasher.hexdigest()
+
+    def set_static(self, func, kwargs):
+        """Sets a profile static, with the pre-computations taken from the cache if
+        available.
+
+        :param func: lens profile instance
+        :param kwargs: keyword arguments of the profile
+        :return: None
+        """
+        if type(func).set_static is LensProfileBase.set_static:
+            # nothing to pre-compute
+            return
+        # plain python hashing of the keyword arguments is much faster than
+        # computing the content address, which is only required for arrays and
+        # for the directory
+        try:
+            memory_key = (type(func), tuple(sorted(kwargs.items())))
+            state = self._entries.get(memory_key)
+        except TypeError:
+            memory_key = self.key(func, kwargs)
+            state = self._entries.get(memory_key)
+        if state is None:
+            key = self.key(func, kwargs)
+            state = self._load(key)
+            if state is None:
+                func.set_dynamic()
+                attributes = _attributes(func)
+                func.set_static(**kwargs)
+                state = _changed_state(func, attributes)
+                self._entries[memory_key] = state
+                self._store(key, state)
+                return
+            self._entries[memory_key] = state
+        _restore_state(func, state)
+
+    def clear(self):
+        """Removes all entries from memory (the files in the directory are kept).
+
+        :return: None
+        """
+        self._entries = {}
+
+    def _file_name(self, key):
+        """
+
+        :param key: content address
+        :return: path of the file of the entry
+        """
+        return os.path.join(self._directory, key + ".pkl")
+
+    def _load(self, key):
+        """
+
+        :param key: content address
+        :return: entry stored in the directory or None
+        """
+        if self._directory is None:
+            return None
+        try:
+            with open(self._file_name(key), "rb") as f:
+                state = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        return state
+
+    def _store(self, key, state):
+        """Writes an entry to the directory (atomically, such that processes reading
+        concurrently never see an incomplete file).
+
+        :param key: content address
+        :param state: entry
+        :return: None
+        """
+        if self._directory is None or self._read_only:
+            return
+        try:
+            fd, file_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(state, f)
+            os.replace(file_name, self._file_name(key))
+        except OSError:
+            # the entry is still used from memory when it can not be stored
+            pass
+
+
+def _attributes(func):
+    """Attributes of a profile and of its sub-profiles.
+
+    :param func: lens profile instance
+    :return: dictionary with the attributes and the attributes of the sub-profiles
+    """
+    attributes = dict(vars(func))
+    profiles = {
+        name: _attributes(value)
+        for name, value in attributes.items()
+        if isinstance(value, LensProfileBase)
+    }
+    return {"attributes": attributes, "profiles": profiles}
+
+
+def _changed_state(func, attributes):
+    """Attributes of a profile and its sub-profiles that changed with respect to a
+    previous state.
+
+    :param func: lens profile instance
+    :param attributes: previous attributes, see _attributes()
+    :return: state of the changed attributes, see _restore_state()
+    """
+    state = {
+        name: value
+        for name, value in vars(func).items()
+        if name not in attributes["attributes"]
+        or attributes["attributes"][name] is not value
+    }
+    profiles = {}
+    for name, attributes_sub in attributes["profiles"].items():
+        state_sub = _changed_state(getattr(func, name), attributes_sub)
+        if state_sub["attributes"] or state_sub["profiles"]:
+            profiles[name] = state_sub
+    return {"attributes": state, "profiles": profiles}
+
+
+def _restore_state(func, state):
+    """
+
+    :param func: lens profile instance
+    :param state: state of the attributes, see _changed_state()
+    :return: None
+    """
+    for name, value in state["attributes"].items():
+        setattr(func, name, value)
+    for name, state_sub in state["profiles"].items():
+        _restore_state(getattr(func, name), state_sub)
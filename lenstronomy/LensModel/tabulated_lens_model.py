@@ -0,0 +1,338 @@
+import numpy as np
+
+__all__ = ["TabulatedLensModel", "tabulate_lens_model", "load_tabulated_lens_model"]
+
+# order of the tabulated quantities
+_QUANTITIES = ["f_x", "f_y", "f_xx", "f_xy", "f_yy"]
+
+
+class TabulatedLensModel(object):
+    """Adaptive multi-resolution table of the deflection angles and the Hessian of a
+    fixed lens model, e.g. all fixed line-of-sight halos plus a complicated main
+    deflector, created with tabulate_lens_model().
+
+    The tabulated region is divided into square tiles of tile_size x tile_size grid
+    cells. Every tile of a level can be replaced by four tiles of half the size (and
+    half the grid spacing) on the next level. The quantities are bilinearly
+    interpolated within the tile of the finest level that contains the position.
+    Positions outside the tabulated region are evaluated at the closest position on
+    its boundary.
+
+    An instance can be used as a lens profile through the 'TABULATED_DEFLECTIONS' lens
+    model:
+
+    >>> table = tabulate_lens_model(lens_model_fixed, kwargs_fixed, x_range=[-3, 3], y_range=[-3, 3], grid_spacing=0.05)
+    >>> lens_model = LensModel(['TABULATED_DEFLECTIONS', 'EPL'], numerical_alpha_class=table)
+    >>> kwargs_lens = [{}, kwargs_epl]
+
+    The table represents the effective (single-plane) deflection of the tabulated lens
+    model. The lensing potential is not tabulated.
+    """
+
+    def __init__(self, x_min, y_min, grid_spacing, tile_size, tile_maps, tile_values):
+        """
+
+        :param x_min: lower x-coordinate of the tabulated region
+        :param y_min: lower y-coordinate of the tabulated region
+        :param grid_spacing: grid spacing of the coarsest level
+        :param tile_size: number of grid cells per tile side
+        :param tile_maps: list (one per level) of 2d integer arrays with the index of
+            the tile in tile_values for each tile position (y, x) of the level, -1 if
+            the level does not contain the tile
+        :param tile_values: list (one per level) of arrays of shape (number of tiles,
+            5, tile_size + 1, tile_size + 1) with f_x, f_y, f_xx, f_xy and f_yy on the
+            grid points of the tiles
+        """
+        self._x_min = float(x_min)
+        self._y_min = float(y_min)
+        self._grid_spacing = float(grid_spacing)
+        self._tile_size = int(tile_size)
+        self._tile_maps = [np.asarray(tile_map, dtype=int) for tile_map in tile_maps]
+        self._tile_values = [np.asarray(values, dtype=float) for values in tile_values]
+        num_tiles_y, num_tiles_x = self._tile_maps[0].shape
+        tile_length = self._tile_size * self._grid_spacing
+        self._x_max = self._x_min + num_tiles_x * tile_length
+        self._y_max = self._y_min + num_tiles_y * tile_length
+
+    @property
+    def num_levels(self):
+        """
+
+        :return: number of resolution levels
+        """
+        return len(self._tile_maps)
+
+    @property
+    def num_grid_points(self):
+        """
+
+        :return: total number of tabulated grid points of all levels
+        """
+        return (
+            int(sum(len(values) for values in self._tile_values))
+            * (self._tile_size + 1) ** 2
+        )
+
+    def __call__(self, x, y, **kwargs):
+        """Deflection angles, interface of the 'TABULATED_DEFLECTIONS' lens model.
+
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param kwargs: not used
+        :return: f_x, f_y
+        """
+        return self.derivatives(x, y)
+
+    def derivatives(self, x, y, **kwargs):
+        """Deflection angles.
+
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param kwargs: not used
+        :return: f_x, f_y
+        """
+        f_x, f_y = self._interpolate(x, y, [0, 1])
+        return f_x, f_y
+
+    def hessian(self, x, y, **kwargs):
+        """Hessian matrix.
+
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param kwargs: not used
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        f_xx, f_xy, f_yy = self._interpolate(x, y, [2, 3, 4])
+        return f_xx, f_xy, f_xy, f_yy
+
+    def _interpolate(self, x, y, index_list):
+        """Bilinear interpolation in the finest tile containing the positions.
+
+        :param x: x-coordinate
+        :param y: y-coordinate
+        :param index_list: indices of the quantities (see _QUANTITIES)
+        :return: list of interpolated quantities in the shape of x
+        """
+        x, y = np.broadcast_arrays(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        )
+        shape = x.shape
+        x_ = np.clip(x.ravel(), self._x_min, self._x_max)
+        y_ = np.clip(y.ravel(), self._y_min, self._y_max)
+        # finest level containing the positions
+        finest_level = np.zeros(len(x_), dtype=int)
+        for level in range(1, self.num_levels):
+            tile_x, tile_y = self._tile_position(x_, y_, level)
+            inside = self._tile_maps[level][tile_y, tile_x] >= 0
+            if not np.any(inside):
+                # finer levels only refine tiles of this level
+                break
+            finest_level[inside] = level
+        out = np.zeros((len(index_list), len(x_)))
+        index = np.asarray(index_list)[None, :]
+        for level in range(self.num_levels):
+            select = finest_level == level
+            if not np.any(select):
+                continue
+            tile_x, tile_y = self._tile_position(x_[select], y_[select], level)
+            spacing = self._grid_spacing / 2**level
+            u = (x_[select] - self._x_min) / spacing - tile_x * self._tile_size
+            v = (y_[select] - self._y_min) / spacing - tile_y * self._tile_size
+            i = np.minimum(u.astype(int), self._tile_size - 1)
+            j = np.minimum(v.astype(int), self._tile_size - 1)
+            dx, dy = (u - i)[:, None], (v - j)[:, None]
+            t = self._tile_maps[level][tile_y, tile_x][:, None]
+            i, j = i[:, None], j[:, None]
+            values = self._tile_values[level]
+            out[:, select] = (
+                values[t, index, j, i] * (1 - dx) * (1 - dy)
+                + values[t, index, j, i + 1] * dx * (1 - dy)
+                + values[t, index, j + 1, i] * (1 - dx) * dy
+                + values[t, index, j + 1, i + 1] * dx * dy
+            ).T
+        if len(shape) == 0:
+            return [float(out_i[0]) for out_i in out]
+        return [out_i.reshape(shape) for out_i in out]
+
+    def _tile_position(self, x, y, level):
+        """
+
+        :param x: x-coordinates inside the tabulated region
+        :param y: y-coordinates inside the tabulated region
+        :param level: resolution level
+        :return: tile position (x, y) of the coordinates on the level
+        """
+        tile_map = self._tile_maps[level]
+        tile_length = self._tile_size * self._grid_spacing / 2**level
+        tile_x = np.minimum(
+            ((x - self._x_min) // tile_length).astype(int), tile_map.shape[1] - 1
+        )
+        tile_y = np.minimum(
+            ((y - self._y_min) // tile_length).astype(int), tile_map.shape[0] - 1
+        )
+        return tile_x, tile_y
+
+    def save(self, filename):
+        """Stores the table in a .npz file or, for file names ending with .h5 or
+        .hdf5, in an HDF5 file.
+
+        :param filename: path of the file
+        :return: None
+        """
+        data = {
+            "x_min": self._x_min,
+            "y_min": self._y_min,
+            "grid_spacing": self._grid_spacing,
+            "tile_size": self._tile_size,
+            "num_levels": self.num_levels,
+        }
+        for level in range(self.num_levels):
+            data["tile_map_%s" % level] = self._tile_maps[level]
+            data["tile_values_%s" % level] = self._tile_values[level]
+        if filename.endswith((".h5", ".hdf5")):
+            import h5py
+
+            with h5py.File(filename, "w") as f:
+                for key, value in data.items():
+                    f.create_dataset(key, data=value)
+        else:
+            np.savez(filename, **data)
+
+
+def load_tabulated_lens_model(filename):
+    """Reads a table stored with TabulatedLensModel.save().
+
+    :param filename: path of the .npz, .h5 or .hdf5 file
+    :return: TabulatedLensModel instance
+    """
+    if filename.endswith((".h5", ".hdf5")):
+        import h5py
+
+        with h5py.File(filename, "r") as f:
+            data = {key: f[key][()] for key in f.keys()}
+    else:
+        with np.load(filename) as f:
+            data = {key: f[key] for key in f.files}
+    num_levels = int(data["num_levels"])
+    return TabulatedLensModel(
+        x_min=float(data["x_min"]),
+        y_min=float(data["y_min"]),
+        grid_spacing=float(data["grid_spacing"]),
+        tile_size=int(data["tile_size"]),
+        tile_maps=[data["tile_map_%s" % level] for level in range(num_levels)],
+        tile_values=[data["tile_values_%s" % level] for level in range(num_levels)],
+    )
+
+
+def tabulate_lens_model(
+    lens_model,
+    kwargs_lens,
+    x_range,
+    y_range,
+    grid_spacing,
+    k=None,
+    tile_size=8,
+    num_levels=3,
+    atol=1e-4,
+):
+    """Tabulates the deflection angles and the Hessian of a fixed lens model (or the
+    sub-list k of its profiles) on an adaptive multi-resolution grid. A tile is refined
+    with half the grid spacing on the next level if it contains a critical curve, the
+    center of a profile, or if the bilinear interpolation of the deflection angles at
+    the centers of its grid cells deviates by more than atol from the lens model.
+
+    :param lens_model: LensModel instance
+    :param kwargs_lens: keyword argument list of the lens model
+    :param x_range: [x_min, x_max] tabulated range; x_max is extended to a multiple of
+        the tile length
+    :param y_range: [y_min, y_max] tabulated range; y_max is extended to a multiple of
+        the tile length
+    :param grid_spacing: grid spacing of the coarsest level
+    :param k: None or list of indices of the profiles to tabulate (single plane only)
+    :param tile_size: number of grid cells per tile side
+    :param num_levels: number of resolution levels (1 for a regular grid)
+    :param atol: tolerance on the interpolation error of the deflection angles (in
+        units of the coordinates); None to only refine tiles with critical curves or
+        profile centers
+    :return: TabulatedLensModel instance
+    """
+    kwargs_k = {} if k is None else {"k": k}
+
+    def _evaluate(x, y):
+        f_x, f_y = lens_model.alpha(x, y, kwargs_lens, **kwargs_k)
+        f_xx, f_xy, f_yx, f_yy = lens_model.hessian(x, y, kwargs_lens, **kwargs_k)
+        return np.array([f_x, f_y, f_xx, f_xy, f_yy])
+
+    if k is None:
+        kwargs_list = kwargs_lens
+    else:
+        kwargs_list = [kwargs_lens[i] for i in k]
+    centers = np.array(
+        [
+            [kwargs["center_x"], kwargs["center_y"]]
+            for kwargs in kwargs_list
+            if "center_x" in kwargs and "center_y" in kwargs
+        ]
+    ).reshape(-1, 2)
+
+    x_min, y_min = float(x_range[0]), float(y_range[0])
+    tile_length = tile_size * grid_spacing
+    num_tiles_x = max(int(np.ceil((x_range[1] - x_min) / tile_length)), 1)
+    num_tiles_y = max(int(np.ceil((y_range[1] - y_min) / tile_length)), 1)
+    tile_y, tile_x = np.mgrid[0:num_tiles_y, 0:num_tiles_x]
+    tile_x, tile_y = tile_x.ravel(), tile_y.ravel()
+
+    nodes = np.arange(tile_size + 1)
+    cells = np.arange(tile_size) + 0.5
+    tile_maps, tile_values = [], []
+    for level in range(num_levels):
+        spacing = grid_spacing / 2**level
+        length = tile_size * spacing
+        tile_map = -np.ones((num_tiles_y * 2**level, num_tiles_x * 2**level), dtype=int)
+        tile_map[tile_y, tile_x] = np.arange(len(tile_x))
+        x0 = x_min + tile_x * length
+        y0 = y_min + tile_y * length
+        # grid points of all tiles, shape (number of tiles, tile_size + 1, tile_size + 1)
+        x = x0[:, None, None] + nodes[None, None, :] * spacing
+        y = y0[:, None, None] + nodes[None, :, None] * spacing
+        x, y = np.broadcast_arrays(x, y)
+        values = _evaluate(x.ravel(), y.ravel()).reshape((5,) + x.shape)
+        tile_maps.append(tile_map)
+        tile_values.append(np.moveaxis(values, 0, 1))
+        if level == num_levels - 1 or len(tile_x) == 0:
+            break
+
+        # tiles containing a critical curve (sign change of the magnification)
+        det_a = (1 - values[2]) * (1 - values[4]) - values[3] ** 2
+        refine = (np.min(det_a, axis=(1, 2)) < 0) & (np.max(det_a, axis=(1, 2)) > 0)
+        # tiles containing the center of a profile
+        for center_x, center_y in centers:
+            refine |= (
+                (center_x >= x0)
+                & (center_x <= x0 + length)
+                & (center_y >= y0)
+                & (center_y <= y0 + length)
+            )
+        # tiles with an interpolation error above the tolerance
+        if atol is not None:
+            x_c = x0[:, None, None] + cells[None, None, :] * spacing
+            y_c = y0[:, None, None] + cells[None, :, None] * spacing
+            x_c, y_c = np.broadcast_arrays(x_c, y_c)
+            f_x_c, f_y_c = lens_model.alpha(
+                x_c.ravel(), y_c.ravel(), kwargs_lens, **kwargs_k
+            )
+            for f_c, f_nodes in zip([f_x_c, f_y_c], values[:2]):
+                f_interp = (
+                    f_nodes[:, :-1, :-1]
+                    + f_nodes[:, 1:, :-1]
+                    + f_nodes[:, :-1, 1:]
+                    + f_nodes[:, 1:, 1:]
+                ) / 4.0
+                error = np.abs(f_c.reshape(x_c.shape) - f_interp)
+                refine |= np.max(error, axis=(1, 2)) > atol
+        # four tiles of half the size on the next level for every refined tile
+        tile_x = (2 * tile_x[refine][:, None] + np.array([0, 1, 0, 1])).ravel()
+        tile_y = (2 * tile_y[refine][:, None] + np.array([0, 0, 1, 1])).ravel()
+    return TabulatedLensModel(
+        x_min, y_min, grid_spacing, tile_size, tile_maps, tile_values
+    )
@@ -44,6 +44,25 @@ _MODELS_SUPPORTED = [
 ]
 
 
+# light models whose function() supports keyword arguments given as arrays broadcasting
+# against the coordinates, evaluated vectorized in surface_brightness_batch()
+BATCH_MODELS = [
+    "GAUSSIAN",
+    "GAUSSIAN_ELLIPSE",
+    "ELLIPSOID",
+    "SERSIC",
+    "SERSIC_ELLIPSE",
+    "SERSIC_ELLIPSE_Q_PHI",
+    "CORE_SERSIC",
+    "HERNQUIST",
+    "HERNQUIST_ELLIPSE",
+    "UNIFORM",
+    "POWER_LAW",
+    "NIE",
+    "LINEAR",
+]
+
+
 class LightModelBase(object):
     """Class to handle source and lens light models."""
 
@@ -210,18 +229,56 @@ class LightModelBase(object):
         :param k: integer or list of integers for selecting subsets of light profiles
         """
         kwargs_list_standard = self._transform_kwargs(kwargs_list)
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
+        # single precision coordinates are evaluated in single precision
+        dtype = _float_dtype(x, y)
+        x = np.array(x, dtype=dtype)
+        y = np.array(y, dtype=dtype)
         flux = np.zeros_like(x)
         bool_list = self._bool_list(k=k)
         for i, func in enumerate(self.func_list):
             if bool_list[i] is True:
                 out = np.array(
-                    func.function(x, y, **kwargs_list_standard[i]), dtype=float
+                    func.function(x, y, **kwargs_list_standard[i]), dtype=dtype
                 )
                 flux += out
         return flux
 
+    def surface_brightness_batch(self, x, y, kwargs_batch, k=None):
+        """Surface brightness of N realisations of the light model parameters, each
+        evaluated on its own set of coordinates. The profiles in BATCH_MODELS are
+        evaluated with a single call for all realisations with the keyword arguments
+        passed as (N, 1) arrays, all other profiles for each realisation separately.
+
+        :param x: coordinates in units of arcsec, 2d array (N, M)
+        :param y: coordinates in units of arcsec, 2d array (N, M)
+        :param kwargs_batch: list of N keyword argument lists of the light profiles
+        :param k: integer or list of integers for selecting subsets of light profiles
+        :return: surface brightness, 2d array (N, M)
+        """
+        from lenstronomy.LensModel.fused_single_plane import stack_kwargs
+
+        kwargs_batch = [self._transform_kwargs(kwargs) for kwargs in kwargs_batch]
+        dtype = _float_dtype(x, y)
+        x = np.array(x, dtype=dtype)
+        y = np.array(y, dtype=dtype)
+        flux = np.zeros_like(x)
+        bool_list = self._bool_list(k=k)
+        for i, func in enumerate(self.func_list):
+            if bool_list[i] is not True:
+                continue
+            kwargs_list = [kwargs[i] for kwargs in kwargs_batch]
+            kwargs_array = None
+            if len(kwargs_list) > 1 and self.profile_type_list[i] in BATCH_MODELS:
+                kwargs_array = stack_kwargs(kwargs_list)
+            if kwargs_array is not None:
+                flux += np.array(func.function(x, y, **kwargs_array), dtype=dtype)
+            else:
+                for j, kwargs in enumerate(kwargs_list):
+                    flux[j] += np.array(
+                        func.function(x[j], y[j], **kwargs), dtype=dtype
+                    )
+        return flux
+
     def light_3d(self, r, kwargs_list, k=None):
         """Computes 3d density at radius r :param r: 3d radius units of arcsec relative
         to the center of the light profile :param kwargs_list: keyword argument list of
@@ -333,3 +390,16 @@ class LightModelBase(object):
         :return: bool list
         """
         return convert_bool_list(n=self._num_func, k=k)
+
+
+def _float_dtype(x, y):
+    """Floating point type in which the surface brightness is evaluated.
+
+    :param x: coordinate(s)
+    :param y: coordinate(s)
+    :return: numpy.float32 if both coordinates are single precision arrays, float
+        otherwise
+    """
+    if np.asarray(x).dtype == np.float32 and np.asarray(y).dtype == np.float32:
+        return np.float32
+    return float
@@ -72,6 +72,7 @@ class PointSource(object):
         if flux_from_point_source_list is None:
             flux_from_point_source_list = [True] * len(point_source_type_list)
         self._flux_from_point_source_list = flux_from_point_source_list
+        self._additional_images_list = additional_images_list
         for i, model in enumerate(point_source_type_list):
             if model == "UNLENSED":
                 from lenstronomy.PointSource.Types.unlensed import Unlensed
@@ -120,6 +121,22 @@ class PointSource(object):
         self._magnification_limit = magnification_limit
         self._save_cache = save_cache
 
+    @property
+    def lens_model_dependent(self):
+        """Whether the image positions or the fixed magnification ratios of the point
+        sources depend on the lens model keyword arguments.
+
+        :return: bool
+        """
+        for i, model in enumerate(self.point_source_type_list):
+            if model == "SOURCE_POSITION":
+                return True
+            if model == "LENSED_POSITION" and (
+                self._fixed_magnification_list[i] or self._additional_images_list[i]
+            ):
+                return True
+        return False
+
     def update_search_window(
         self,
         search_window,
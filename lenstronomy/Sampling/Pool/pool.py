@@ -36,7 +36,7 @@ _VERBOSE = 5
 # from schwimmbad.multiprocessing import MultiPool
 # from schwimmbad.jl import JoblibPool
 
-__all__ = ["choose_pool"]
+__all__ = ["choose_pool", "TimedPool"]
 
 
 def choose_pool(mpi=False, processes=1, **kwargs):
@@ -96,3 +96,65 @@ def choose_pool(mpi=False, processes=1, **kwargs):
     else:
         log.info("Running with SerialPool")
         return SerialPool(**kwargs)
+
+
+class TimedPool(object):
+    """Wrapper of a multiprocessing or MPI pool that collects the timings of the
+    likelihood stages recorded in the worker processes (see
+    lenstronomy.Util.timing_util.StageTimer). The worker processes evaluate copies of
+    the likelihood with copies of its StageTimer. With each result, the timings
+    recorded for it are returned and merged into the StageTimer of this process.
+
+    All other attributes (e.g. is_master()) are the ones of the wrapped pool.
+    """
+
+    def __init__(self, pool, stage_timer):
+        """
+
+        :param pool: pool instance with a map() method evaluating in other processes
+        :param stage_timer: StageTimer instance the likelihood evaluated with map()
+            records in
+        """
+        self._pool = pool
+        self._stage_timer = stage_timer
+
+    def map(self, func, iterable, *args, **kwargs):
+        """Equivalent to the map() method of the wrapped pool.
+
+        :param func: function evaluated for each element of iterable
+        :param iterable: list or iterable of tasks
+        :return: list of the results of func
+        """
+        results = self._pool.map(
+            _TimedCall(func, self._stage_timer), iterable, *args, **kwargs
+        )
+        for _, report in results:
+            self._stage_timer.merge(report)
+        return [result for result, _ in results]
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+
+class _TimedCall(object):
+    """Function wrapper returning the timings recorded while evaluating the function
+    together with its result.
+
+    The StageTimer is pickled together with the function, such that in the worker
+    process, it is the copy the likelihood records in.
+    """
+
+    def __init__(self, func, stage_timer):
+        """
+
+        :param func: function
+        :param stage_timer: StageTimer instance func records in
+        """
+        self._func = func
+        self._stage_timer = stage_timer
+
+    def __call__(self, *args):
+        # only the copy of the timer in the worker process is reset
+        self._stage_timer.reset()
+        result = self._func(*args)
+        return result, self._stage_timer.report()
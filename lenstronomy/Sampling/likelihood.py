@@ -8,6 +8,8 @@ from lenstronomy.Sampling.Likelihoods.flux_ratio_likelihood import FluxRatioLike
 from lenstronomy.Sampling.Likelihoods.prior_likelihood import PriorLikelihood
 from lenstronomy.Sampling.Likelihoods.kinematic_2D_likelihood import KinLikelihood
 import lenstronomy.Util.class_creator as class_creator
+from lenstronomy.Util import timing_util
+from lenstronomy.Util.timing_util import StageTimer
 import numpy as np
 
 __all__ = ["LikelihoodModule"]
@@ -75,6 +77,8 @@ class LikelihoodModule(object):
         kin_lens_light_idx=0,
         tracer_likelihood=False,
         tracer_likelihood_mask=None,
+        profiling=False,
+        stage_timer=None,
     ):
         """Initializing class.
 
@@ -123,6 +127,11 @@ class LikelihoodModule(object):
             pixel-based solver (see SLITronomy documentation)
         :param kinematic_2d_likelihood: bool, option to compute the kinematic likelihood
         :param tracer_likelihood: option to perform likelihood on tracer quantity derived from imaging or spectroscopy
+        :param profiling: bool, if True, records the wall time and number of calls of the individual likelihood
+         stages (and the sub-stages of the imaging likelihood) in each log_likelihood() evaluation.
+         See profiling_report(). The timings are recorded in the process evaluating the likelihood.
+        :param stage_timer: StageTimer instance to record the timings in when profiling=True (if None, a new one is
+         created). This allows to accumulate the timings over several LikelihoodModule instances.
         """
         # TODO unpack also tracer model from kwargs_data
         (
@@ -167,6 +176,12 @@ class LikelihoodModule(object):
         self._flux_ratio_likelihood = flux_ratio_likelihood
         self._tracer_likelihood = tracer_likelihood
         self._kinematic_2D_likelihood = kinematic_2d_likelihood
+        if profiling is True:
+            if stage_timer is None:
+                stage_timer = StageTimer()
+            self._stage_timer = stage_timer
+        else:
+            self._stage_timer = None
         if kwargs_flux_compute is None:
             kwargs_flux_compute = {}
         linear_solver = self.param.linear_solver
@@ -361,6 +376,20 @@ class LikelihoodModule(object):
         :returns:
          - logL (float) log likelihood of the data given the model (natural logarithm)
         """
+        if self._stage_timer is None:
+            return self._log_likelihood(kwargs_return, verbose=verbose)
+        with self._stage_timer.recording():
+            with timing_util.stage("log_likelihood"):
+                return self._log_likelihood(kwargs_return, verbose=verbose)
+
+    def _log_likelihood(self, kwargs_return, verbose=False):
+        """Computes the log likelihood, see log_likelihood().
+
+        :param kwargs_return: keyword arguments of the model parameters
+        :param verbose: if True, makes print statements about individual likelihood
+            components
+        :return: log likelihood of the data given the model (natural logarithm)
+        """
         kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps, kwargs_special = (
             kwargs_return["kwargs_lens"],
             kwargs_return["kwargs_source"],
@@ -376,7 +405,8 @@ class LikelihoodModule(object):
         logL = 0
 
         if self._image_likelihood is True:
-            logL_image, param = self.image_likelihood.logL(**kwargs_return)
+            with timing_util.stage("image_likelihood"):
+                logL_image, param = self.image_likelihood.logL(**kwargs_return)
             logL += logL_image
             if verbose is True:
                 print("image logL = %s" % logL_image)
@@ -384,50 +414,80 @@ class LikelihoodModule(object):
             param = None
 
         if self._time_delay_likelihood is True:
-            logL_time_delay = self.time_delay_likelihood.logL(
-                kwargs_lens, kwargs_ps, kwargs_special
-            )
+            with timing_util.stage("time_delay_likelihood"):
+                logL_time_delay = self.time_delay_likelihood.logL(
+                    kwargs_lens, kwargs_ps, kwargs_special
+                )
             logL += logL_time_delay
             if verbose is True:
                 print("time-delay logL = %s" % logL_time_delay)
         if self._flux_ratio_likelihood is True:
-            ra_image_list, dec_image_list = self.PointSource.image_position(
-                kwargs_ps=kwargs_ps, kwargs_lens=kwargs_lens
-            )
-            x_pos, y_pos = ra_image_list[0], dec_image_list[0]
-            logL_flux_ratios = self.flux_ratio_likelihood.logL(
-                x_pos, y_pos, kwargs_lens, kwargs_special
-            )
+            with timing_util.stage("flux_ratio_likelihood"):
+                ra_image_list, dec_image_list = self.PointSource.image_position(
+                    kwargs_ps=kwargs_ps, kwargs_lens=kwargs_lens
+                )
+                x_pos, y_pos = ra_image_list[0], dec_image_list[0]
+                logL_flux_ratios = self.flux_ratio_likelihood.logL(
+                    x_pos, y_pos, kwargs_lens, kwargs_special
+                )
             logL += logL_flux_ratios
             if verbose is True:
                 print("flux ratio logL = %s" % logL_flux_ratios)
         if self._kinematic_2D_likelihood is True:
-            logL_kinematic_2d = self.kinematic_2D_likelihood.logL(
-                kwargs_lens, kwargs_lens_light, kwargs_special
-            )
+            with timing_util.stage("kinematic_2d_likelihood"):
+                logL_kinematic_2d = self.kinematic_2D_likelihood.logL(
+                    kwargs_lens, kwargs_lens_light, kwargs_special
+                )
             logL += logL_kinematic_2d
             if verbose is True:
                 print("kinematic logL = %s" % logL_kinematic_2d)
-        logL += self._position_likelihood.logL(
-            kwargs_lens, kwargs_ps, kwargs_special, verbose=verbose
-        )
+        with timing_util.stage("position_likelihood"):
+            logL += self._position_likelihood.logL(
+                kwargs_lens, kwargs_ps, kwargs_special, verbose=verbose
+            )
         if self._tracer_likelihood is True:
-            logL_tracer = self.tracer_likelihood.logL(param=param, **kwargs_return)
+            with timing_util.stage("tracer_likelihood"):
+                logL_tracer = self.tracer_likelihood.logL(param=param, **kwargs_return)
             if verbose is True:
                 print("tracer logL = %s" % logL_tracer)
             logL += logL_tracer
-        logL_prior = self._prior_likelihood.logL(**kwargs_return)
+        with timing_util.stage("prior_likelihood"):
+            logL_prior = self._prior_likelihood.logL(**kwargs_return)
         logL += logL_prior
         if verbose is True:
             print("Prior likelihood = %s" % logL_prior)
         if self._custom_logL_addition is not None:
-            logL_cond = self._custom_logL_addition(**kwargs_return)
+            with timing_util.stage("custom_likelihood"):
+                logL_cond = self._custom_logL_addition(**kwargs_return)
             logL += logL_cond
             if verbose is True:
                 print("custom added logL = %s" % logL_cond)
         self._reset_point_source_cache(bool_input=False)
         return logL  # , None
 
+    @property
+    def stage_timer(self):
+        """
+
+        :return: StageTimer instance recording the likelihood stages (None if profiling is turned off)
+        """
+        return self._stage_timer
+
+    def profiling_report(self):
+        """Wall time and number of calls of the likelihood stages recorded so far. The
+        stages are 'log_likelihood' (total), the individual likelihood terms (e.g.
+        'image_likelihood', 'prior_likelihood') and the sub-stages of the imaging
+        likelihood ('ray_shooting', 'source', 'lens_light', 'point_source',
+        'convolution', 'linear_solve', 'error_map').
+
+        :return: dictionary of the recorded stages, see StageTimer.report()
+        """
+        if self._stage_timer is None:
+            raise ValueError(
+                "profiling_report() requires the LikelihoodModule to be initialized with profiling=True."
+            )
+        return self._stage_timer.report()
+
     @staticmethod
     def check_bounds(args, lowerLimit, upperLimit, verbose=False):
         """Checks whether the parameter vector has left its bound, if so, adds a big
@@ -5,7 +5,7 @@ import time
 import numpy as np
 from lenstronomy.Sampling.Samplers.pso import ParticleSwarmOptimizer
 from lenstronomy.Util import sampling_util
-from lenstronomy.Sampling.Pool.pool import choose_pool
+from lenstronomy.Sampling.Pool.pool import choose_pool, TimedPool
 from scipy.optimize import minimize
 
 __all__ = ["Sampler"]
@@ -96,7 +96,7 @@ class Sampler(object):
             lower_start = np.maximum(lower_start, self.lower_limit)
             upper_start = np.minimum(upper_start, self.upper_limit)
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        pool = self._choose_pool(mpi, threadCount)
 
         if mpi is True and pool.is_master():
             print("MPI option chosen for PSO.")
@@ -187,7 +187,7 @@ class Sampler(object):
                 size=n_walkers,
             )
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        pool = self._choose_pool(mpi, threadCount)
 
         if backend_filename is not None:
             backend = emcee.backends.HDFBackend(
@@ -363,7 +363,7 @@ class Sampler(object):
         else:
             pass
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        pool = self._choose_pool(mpi, threadCount)
 
         sampler = zeus.EnsembleSampler(
             nwalkers=n_walkers,
@@ -393,6 +393,24 @@ class Sampler(object):
 
         return flat_samples, dist
 
+    def _choose_pool(self, mpi, threadCount):
+        """Pool evaluating the likelihood. With profiling turned on in the
+        LikelihoodModule and evaluations in other processes, the pool collects the
+        timings recorded in the worker processes (see TimedPool).
+
+        :param mpi: bool, if True, makes instance of MPIPool to allow for MPI execution
+        :param threadCount: number of processes (only applied if mpi=False)
+        :return: pool instance
+        """
+        from schwimmbad.serial import SerialPool
+
+        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        stage_timer = getattr(self.chain, "stage_timer", None)
+        if stage_timer is None or isinstance(pool, SerialPool):
+            # evaluated in this process, the timings are recorded directly
+            return pool
+        return TimedPool(pool, stage_timer)
+
     def _print_result(self, result):
         kwargs_return = self.chain.param.args2kwargs(result)
         print(
@@ -215,7 +215,8 @@ def coordInImage(x_coord, y_coord, num_pix, deltapix):
 def re_size(image, factor=1):
     """Re-sizes image with nx x ny to nx/factor x ny/factor.
 
-    :param image: 2d image with shape (nx,ny)
+    :param image: 2d image with shape (nx,ny), or a stack of images with shape
+        (n_images, nx, ny), in which case each image is re-sized
     :param factor: integer >=1
     :return:
     """
@@ -224,9 +225,14 @@ def re_size(image, factor=1):
     elif factor == 1:
         return image
     f = int(factor)
-    nx, ny = np.shape(image)
+    nx, ny = np.shape(image)[-2:]
     if int(nx / f) == nx / f and int(ny / f) == ny / f:
-        small = image.reshape([int(nx / f), f, int(ny / f), f]).mean(3).mean(1)
+        shape_leading = list(np.shape(image)[:-2])
+        small = (
+            image.reshape(shape_leading + [int(nx / f), f, int(ny / f), f])
+            .mean(-1)
+            .mean(-2)
+        )
         return small
     else:
         raise ValueError(
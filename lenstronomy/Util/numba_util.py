@@ -1,3 +1,4 @@
+import numpy as np
 from lenstronomy.Conf import config_loader
 from os import environ
 
@@ -27,7 +28,13 @@ if numba_enabled:
         numba = None
         extending = None
 
-__all__ = ["jit"]
+# parallel loop range of numba (falls back to the python range without numba)
+if numba_enabled:
+    prange = numba.prange
+else:
+    prange = range
+
+__all__ = ["jit", "prange", "ravel_coordinates", "reshape_output"]
 
 
 def jit(
@@ -57,3 +64,29 @@ def jit(
             return func
 
     return wrapper
+
+
+def ravel_coordinates(x, y):
+    """Broadcasts the coordinates against each other and flattens them into contiguous
+    1d float arrays, as required by the jitted kernels looping over coordinates.
+
+    :param x: x-coordinate(s), float or numpy array
+    :param y: y-coordinate(s), float or numpy array
+    :return: 1d array of x-coordinates, 1d array of y-coordinates, shape of the input
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    shape = x.shape
+    return np.ascontiguousarray(x).ravel(), np.ascontiguousarray(y).ravel(), shape
+
+
+def reshape_output(shape, *arrays):
+    """Brings the 1d outputs of a jitted kernel back into the shape of the input
+    coordinates (see ravel_coordinates()).
+
+    :param shape: shape of the input coordinates
+    :param arrays: 1d arrays
+    :return: tuple of arrays in the given shape (floats for a scalar input)
+    """
+    if len(shape) == 0:
+        return tuple(float(array[0]) for array in arrays)
+    return tuple(array.reshape(shape) for array in arrays)
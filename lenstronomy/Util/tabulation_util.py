@@ -0,0 +1,331 @@
+"""Pre-computed lookup tables of dimensionless functions that are expensive to evaluate
+(typically numerical integrals evaluated with scipy.integrate.quad one coordinate at a
+time).
+
+A table is built once on a regular grid in (optionally logarithmic) x and y, refined
+until the interpolation error at the centers of all grid cells is below the requested
+tolerance, and stored in the 'tables' folder of the lenstronomy user configuration
+directory such that later sessions read it from disk. Points outside the tabulated
+range are evaluated with the function the table was built from (which can itself be
+an approximation, e.g. a fixed-order quadrature).
+"""
+
+import hashlib
+import os
+import tempfile
+import warnings
+import zipfile
+
+import numpy as np
+from scipy.interpolate import InterpolatedUnivariateSpline, RectBivariateSpline
+
+from lenstronomy.Conf import config_loader
+from lenstronomy.Util.package_util import exporter
+
+export, __all__ = exporter()
+
+# tables already built or loaded in this session, shared between profile instances
+_TABLES = {}
+
+
+@export
+def tabulated_function(name, func, x_range, y_range=None, **kwargs):
+    """Tabulation of a function shared between all instances requesting the same name
+    and settings within a session.
+
+    :param name: string, unique name of the tabulated function
+    :param func: function to tabulate, see Tabulation
+    :param x_range: see Tabulation
+    :param y_range: see Tabulation
+    :param kwargs: keyword arguments of Tabulation
+    :return: Tabulation instance
+    """
+    table = Tabulation(name, func, x_range, y_range=y_range, **kwargs)
+    key = table.key
+    if key not in _TABLES:
+        _TABLES[key] = table
+    return _TABLES[key]
+
+
+@export
+class Tabulation(object):
+    """Lookup table of a function f(x) or f(x, y) interpolated with cubic splines.
+
+    The table is built lazily with the first evaluation. Starting from num_x (and
+    num_y) grid points, the number of grid intervals is doubled until the maximal
+    relative interpolation error at the centers of the grid cells is below rtol (or
+    max_refinement is reached, then with a warning). The achieved error is accessible
+    with the 'error' attribute. It is an empirical estimate from the cell centers, where
+    the cubic spline error is typically largest, not a guaranteed bound for all points
+    of the tabulated range, and it is relative to func, not to the underlying
+    mathematical function.
+    """
+
+    def __init__(
+        self,
+        name,
+        func,
+        x_range,
+        y_range=None,
+        num_x=101,
+        num_y=21,
+        log_x=True,
+        log_y=False,
+        log_f=False,
+        rtol=None,
+        max_refinement=3,
+        cache=None,
+        version=1,
+    ):
+        """
+
+        :param name: string, unique name of the tabulated function (used for the cache file)
+        :param func: function to tabulate; func(x) or func(x, y) with 1d arrays x (and y of
+         the same length) returning a 1d array. It is also used outside the tabulated range.
+        :param x_range: [x_min, x_max] tabulated range of x
+        :param y_range: [y_min, y_max] tabulated range of y (None for a function of x only)
+        :param num_x: initial number of grid points in x
+        :param num_y: initial number of grid points in y
+        :param log_x: bool, if True, the grid is regular in log(x)
+        :param log_y: bool, if True, the grid is regular in log(y)
+        :param log_f: bool, if True, log(f) is interpolated (requires f > 0)
+        :param rtol: targeted maximal relative interpolation error (default from the
+         'tabulation' section of the lenstronomy configuration)
+        :param max_refinement: maximal number of refinements of the grid
+        :param cache: bool, if True, stores the table on disk (default from the configuration)
+        :param version: version of func; change it when the function changes
+         to invalidate previously stored tables
+        """
+        conf = config_loader.tabulation_conf()
+        if rtol is None:
+            rtol = float(conf["rtol"])
+        if cache is None:
+            cache = conf["cache"]
+        self._name = name
+        self._func = func
+        self._x_range = [float(x_range[0]), float(x_range[1])]
+        self._2d = y_range is not None
+        if self._2d:
+            self._y_range = [float(y_range[0]), float(y_range[1])]
+        else:
+            self._y_range = None
+        self._num_x, self._num_y = int(num_x), int(num_y)
+        self._log_x, self._log_y, self._log_f = log_x, log_y, log_f
+        self._rtol = rtol
+        self._max_refinement = max_refinement
+        self._cache = cache
+        settings = repr(
+            (
+                self._x_range,
+                self._y_range,
+                self._num_x,
+                self._num_y,
+                log_x,
+                log_y,
+                log_f,
+                rtol,
+                max_refinement,
+                version,
+            )
+        )
+        self.key = "%s_%s" % (name, hashlib.md5(settings.encode()).hexdigest()[:16])
+        self._interp = None
+        self.error = None
+
+    @property
+    def file_name(self):
+        """
+
+        :return: path of the table file in the user configuration directory
+        """
+        return os.path.join(config_loader.user_table_directory, self.key + ".npz")
+
+    def __call__(self, x, y=None):
+        """Interpolated function inside the tabulated range, func outside of it.
+
+        :param x: float or numpy array
+        :param y: float or numpy array (only for functions of x and y)
+        :return: f(x) or f(x, y) in the shape of the (broadcast) input
+        """
+        if self._interp is None:
+            self.build()
+        if self._2d:
+            x, y = np.broadcast_arrays(
+                np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+            )
+            y_ = y.ravel()
+        else:
+            x = np.asarray(x, dtype=float)
+        shape = x.shape
+        x_ = x.ravel()
+        inside = (x_ >= self._x_range[0]) & (x_ <= self._x_range[1])
+        if self._2d:
+            inside &= (y_ >= self._y_range[0]) & (y_ <= self._y_range[1])
+        f = np.empty(len(x_))
+        if self._2d:
+            f[inside] = self._interpolate(x_[inside], y_[inside])
+        else:
+            f[inside] = self._interpolate(x_[inside])
+        outside = ~inside
+        if np.any(outside):
+            if self._2d:
+                f[outside] = self._func(x_[outside], y_[outside])
+            else:
+                f[outside] = self._func(x_[outside])
+        if len(shape) == 0:
+            return float(f[0])
+        return f.reshape(shape)
+
+    def build(self):
+        """Loads the table from disk or computes it (and stores it if caching is
+        enabled).
+
+        :return: None
+        """
+        if self._cache and os.path.exists(self.file_name):
+            try:
+                with np.load(self.file_name) as table:
+                    self._set_interpolation(
+                        table["x_grid"], table["y_grid"], table["f_grid"]
+                    )
+                    self.error = float(table["error"])
+                return
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+                # corrupt or incompatible file, re-compute the table
+                pass
+        num_x, num_y = self._num_x, self._num_y
+        for i in range(self._max_refinement + 1):
+            x_grid = self._grid(self._x_range, num_x, self._log_x)
+            y_grid = self._grid(self._y_range, num_y, self._log_y)
+            f_grid = self._evaluate_grid(x_grid, y_grid)
+            self._set_interpolation(x_grid, y_grid, f_grid)
+            self.error = self._validate(x_grid, y_grid)
+            if self.error <= self._rtol:
+                break
+            num_x = 2 * num_x - 1
+            if self._2d:
+                num_y = 2 * num_y - 1
+        if self.error > self._rtol:
+            warnings.warn(
+                "Tabulation %s reached a relative error of %s, above the requested %s."
+                % (self._name, self.error, self._rtol),
+                Warning,
+            )
+        if self._cache:
+            self._store(x_grid, y_grid, f_grid)
+
+    def _store(self, x_grid, y_grid, f_grid):
+        """Writes the table to disk (atomically, such that processes reading
+        concurrently never see an incomplete file).
+
+        :param x_grid: 1d array, x-values of the table
+        :param y_grid: 1d array, y-values of the table
+        :param f_grid: 2d array, function values of the table
+        :return: None
+        """
+        file_name = None
+        try:
+            directory = os.path.dirname(self.file_name)
+            os.makedirs(directory, exist_ok=True)
+            fd, file_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f, x_grid=x_grid, y_grid=y_grid, f_grid=f_grid, error=self.error
+                )
+            os.replace(file_name, self.file_name)
+        except OSError:
+            # the table is still used in this session when it can not be stored
+            if file_name is not None and os.path.exists(file_name):
+                os.remove(file_name)
+
+    def _evaluate_grid(self, x_grid, y_grid):
+        """Function func on the grid.
+
+        :param x_grid: 1d array of the grid points in x
+        :param y_grid: 1d array of the grid points in y (empty for a function of x only)
+        :return: function values, 2d array (len(x_grid), len(y_grid)) or 1d array
+        """
+        if not self._2d:
+            return np.asarray(self._func(x_grid), dtype=float)
+        xx, yy = np.meshgrid(x_grid, y_grid, indexing="ij")
+        f = self._func(xx.ravel(), yy.ravel())
+        return np.asarray(f, dtype=float).reshape(xx.shape)
+
+    def _validate(self, x_grid, y_grid):
+        """Maximal relative interpolation error at the centers of the grid cells.
+
+        :param x_grid: 1d array of the grid points in x
+        :param y_grid: 1d array of the grid points in y
+        :return: maximal relative error
+        """
+        x_mid = self._centers(x_grid, self._log_x)
+        if self._2d:
+            y_mid = self._centers(y_grid, self._log_y)
+            xx, yy = np.meshgrid(x_mid, y_mid, indexing="ij")
+            xx, yy = xx.ravel(), yy.ravel()
+            f_exact = np.asarray(self._func(xx, yy), dtype=float)
+            f_interp = self._interpolate(xx, yy)
+        else:
+            f_exact = np.asarray(self._func(x_mid), dtype=float)
+            f_interp = self._interpolate(x_mid)
+        return float(np.max(np.abs(f_interp - f_exact) / np.abs(f_exact)))
+
+    def _set_interpolation(self, x_grid, y_grid, f_grid):
+        """
+
+        :param x_grid: 1d array of the grid points in x
+        :param y_grid: 1d array of the grid points in y
+        :param f_grid: function values on the grid
+        :return: None
+        """
+        u = np.log(x_grid) if self._log_x else x_grid
+        f = np.log(f_grid) if self._log_f else f_grid
+        if self._2d:
+            v = np.log(y_grid) if self._log_y else y_grid
+            self._interp = RectBivariateSpline(u, v, f, kx=3, ky=3)
+        else:
+            self._interp = InterpolatedUnivariateSpline(u, f, k=3)
+
+    def _interpolate(self, x, y=None):
+        """
+
+        :param x: 1d array inside the tabulated range
+        :param y: 1d array inside the tabulated range
+        :return: interpolated function values
+        """
+        u = np.log(x) if self._log_x else x
+        if self._2d:
+            v = np.log(y) if self._log_y else y
+            f = self._interp.ev(u, v)
+        else:
+            f = self._interp(u)
+        if self._log_f:
+            return np.exp(f)
+        return f
+
+    @staticmethod
+    def _grid(grid_range, num, log):
+        """
+
+        :param grid_range: [min, max] or None
+        :param num: number of grid points
+        :param log: bool, if True, regular in log
+        :return: 1d array of grid points
+        """
+        if grid_range is None:
+            return np.zeros(0)
+        if log:
+            return np.logspace(np.log10(grid_range[0]), np.log10(grid_range[1]), num)
+        return np.linspace(grid_range[0], grid_range[1], num)
+
+    @staticmethod
+    def _centers(grid, log):
+        """
+
+        :param grid: 1d array of grid points
+        :param log: bool, if True, the centers are taken in log
+        :return: centers of the grid intervals
+        """
+        if log:
+            return np.sqrt(grid[1:] * grid[:-1])
+        return (grid[1:] + grid[:-1]) / 2.0
@@ -0,0 +1,172 @@
+"""Light-weight wall-time instrumentation of the likelihood evaluation.
+
+The different stages of a computation are wrapped into ``with stage(name):`` blocks.
+As long as no StageTimer is recording, stage() returns a shared no-op context such
+that the instrumentation comes at negligible costs. While a StageTimer is recording
+(see StageTimer.recording()), the wall time and the number of calls of every stage are
+accumulated.
+"""
+
+import time
+
+from lenstronomy.Util.package_util import exporter
+
+export, __all__ = exporter()
+
+# StageTimer instance currently recording (None if no recording is active)
+_active_timer = None
+
+
+class _NullStage(object):
+    """No-op context manager used when no timer is recording."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage(object):
+    """Context manager accumulating the wall time and number of calls of a single
+    stage."""
+
+    def __init__(self):
+        self.time = 0.0
+        self.calls = 0
+        self._start = []
+
+    def __enter__(self):
+        self._start.append(time.perf_counter())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        start = self._start.pop()
+        # nested calls of the same stage are only counted once in the wall time
+        if len(self._start) == 0:
+            self.time += time.perf_counter() - start
+        self.calls += 1
+        return False
+
+
+@export
+def stage(name):
+    """Context manager timing the stage with the given name in the currently recording
+    StageTimer. Without an active recording, this is a no-op.
+
+    :param name: string, name of the stage
+    :return: context manager
+    """
+    if _active_timer is None:
+        return _NULL_STAGE
+    return _active_timer.stage(name)
+
+
+@export
+class StageTimer(object):
+    """Accumulates the wall time and number of calls of named stages.
+
+    The stages are not exclusive: a stage can contain other stages (e.g.
+    'image_likelihood' contains 'convolution'). Each process records its own timings. When the evaluations
+    are distributed over a pool of processes (multiprocessing or MPI), the reports of
+    the individual processes are combined with merge() (see
+    lenstronomy.Sampling.Pool.pool.TimedPool).
+    """
+
+    def __init__(self):
+        self._stages = {}
+
+    def stage(self, name):
+        """
+
+        :param name: string, name of the stage
+        :return: context manager timing the stage
+        """
+        try:
+            return self._stages[name]
+        except KeyError:
+            self._stages[name] = _Stage()
+            return self._stages[name]
+
+    def recording(self):
+        """Context manager activating this timer such that all stage() blocks executed
+        inside are recorded.
+
+        :return: context manager
+        """
+        return _Recording(self)
+
+    def report(self):
+        """
+
+        :return: dictionary with stage names as keys and dictionaries with entries
+            'time' (total wall time in seconds), 'calls' (number of calls) and
+            'time_per_call' as values
+        """
+        report = {}
+        for name, stage_ in self._stages.items():
+            report[name] = {
+                "time": stage_.time,
+                "calls": stage_.calls,
+                "time_per_call": stage_.time / max(stage_.calls, 1),
+            }
+        return report
+
+    def merge(self, report):
+        """Adds the timings of a report (i.e. recorded in a different process) to this
+        timer.
+
+        :param report: dictionary as returned by report()
+        :return: None
+        """
+        for name, entry in report.items():
+            stage_ = self.stage(name)
+            stage_.time += entry["time"]
+            stage_.calls += entry["calls"]
+
+    def reset(self):
+        """Deletes all recorded timings.
+
+        :return: None
+        """
+        self._stages = {}
+
+    def summary(self):
+        """
+
+        :return: string of a table of the recorded stages, sorted by total wall time
+        """
+        lines = [
+            "%-24s %12s %10s %14s" % ("stage", "time [s]", "calls", "per call [s]")
+        ]
+        report = self.report()
+        for name in sorted(report, key=lambda key: -report[key]["time"]):
+            entry = report[name]
+            lines.append(
+                "%-24s %12.4g %10d %14.4g"
+                % (name, entry["time"], entry["calls"], entry["time_per_call"])
+            )
+        return "\n".join(lines)
+
+
+class _Recording(object):
+    """Context manager setting a StageTimer as the recording one and restoring the
+    previous state on exit."""
+
+    def __init__(self, timer):
+        self._timer = timer
+        self._previous = None
+
+    def __enter__(self):
+        global _active_timer
+        self._previous = _active_timer
+        _active_timer = self._timer
+        return self._timer
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active_timer
+        _active_timer = self._previous
+        return False
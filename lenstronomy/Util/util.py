@@ -92,9 +92,13 @@ def rotate(xcoords, ycoords, angle):
     :param angle: angle in radians
     :return: x points and y points rotated ccw by angle theta
     """
-    return xcoords * np.cos(angle) + ycoords * np.sin(angle), -xcoords * np.sin(
-        angle
-    ) + ycoords * np.cos(angle)
+    # the trigonometric functions are evaluated once per angle (and not once per
+    # coordinate for angle arrays broadcasting against the coordinates)
+    cos_angle, sin_angle = np.cos(angle), np.sin(angle)
+    return (
+        xcoords * cos_angle + ycoords * sin_angle,
+        -xcoords * sin_angle + ycoords * cos_angle,
+    )
 
 
 @export
@@ -775,3 +779,56 @@ def area(vs):
         x0 = x1
         y0 = y1
     return abs(a)
+
+
+@export
+def kwargs_equal(kwargs_1, kwargs_2):
+    """Compares two (nested) structures of keyword arguments, including array values.
+
+    :param kwargs_1: keyword arguments, list of keyword arguments or nested lists thereof
+    :param kwargs_2: keyword arguments, list of keyword arguments or nested lists thereof
+    :return: bool, True if all the entries are equal
+    """
+    if isinstance(kwargs_1, dict) and isinstance(kwargs_2, dict):
+        if kwargs_1.keys() != kwargs_2.keys():
+            return False
+        return all(kwargs_equal(kwargs_1[key], kwargs_2[key]) for key in kwargs_1)
+    if isinstance(kwargs_1, (list, tuple)) and isinstance(kwargs_2, (list, tuple)):
+        if len(kwargs_1) != len(kwargs_2):
+            return False
+        return all(kwargs_equal(a, b) for a, b in zip(kwargs_1, kwargs_2))
+    if isinstance(kwargs_1, np.ndarray) or isinstance(kwargs_2, np.ndarray):
+        return np.array_equal(kwargs_1, kwargs_2)
+    if type(kwargs_1) is not type(kwargs_2) and (
+        isinstance(kwargs_1, (dict, list, tuple))
+        or isinstance(kwargs_2, (dict, list, tuple))
+    ):
+        return False
+    return bool(kwargs_1 == kwargs_2)
+
+
+@export
+def batch_kwargs(*kwargs_lists):
+    """Groups lists of N keyword arguments into N sets of keyword arguments.
+
+    :param kwargs_lists: lists of N keyword arguments each, or None
+    :return: list of N tuples with one entry (or None) of each list
+    """
+    num_list = [
+        len(kwargs_list) for kwargs_list in kwargs_lists if kwargs_list is not None
+    ]
+    if len(num_list) == 0:
+        raise ValueError("at least one list of keyword arguments needs to be provided.")
+    num = num_list[0]
+    if any(n != num for n in num_list):
+        raise ValueError(
+            "the lists of keyword arguments need to have the same length, got %s."
+            % num_list
+        )
+    return [
+        tuple(
+            None if kwargs_list is None else kwargs_list[i]
+            for kwargs_list in kwargs_lists
+        )
+        for i in range(num)
+    ]
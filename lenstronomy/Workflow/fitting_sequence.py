@@ -12,6 +12,7 @@ from lenstronomy.Sampling.Samplers.nautilus_sampler import NautilusSampler
 from lenstronomy.Sampling.Samplers.cobaya_sampler import CobayaSampler
 import numpy as np
 import lenstronomy.Util.analysis_util as analysis_util
+from lenstronomy.Util.timing_util import StageTimer
 
 __all__ = ["FittingSequence"]
 
@@ -67,6 +68,8 @@ class FittingSequence(object):
             num_bands=len(self.multi_band_list),
         )
         self._mcmc_init_samples = None
+        # accumulates the likelihood stage timings of all fitting steps with kwargs_likelihood['profiling'] = True
+        self._stage_timer = StageTimer()
 
     @property
     def kwargs_fixed(self):
@@ -103,6 +106,9 @@ class FittingSequence(object):
             elif fitting_type == "psf_iteration":
                 self.psf_iteration(**kwargs)
 
+            elif fitting_type == "adaptive_supersampling":
+                self.adaptive_supersampling(**kwargs)
+
             elif fitting_type == "align_images":
                 self.align_images(**kwargs)
 
@@ -184,7 +190,8 @@ class FittingSequence(object):
                     "fitting_sequence {} is not supported. Please use: 'PSO', 'SIMPLEX', "
                     "'MCMC' or 'emcee', 'zeus', 'Cobaya', "
                     "'dynesty', 'dyPolyChord',  'Multinest', 'Nautilus, '"
-                    "'psf_iteration', 'restart', 'update_settings', 'calibrate_images' or "
+                    "'psf_iteration', 'adaptive_supersampling', 'restart', 'update_settings', "
+                    "'calibrate_images' or "
                     "'align_images'".format(fitting_type)
                 )
 
@@ -250,10 +257,28 @@ class FittingSequence(object):
         kwargs_model = self._updateManager.kwargs_model
         kwargs_likelihood = self._updateManager.kwargs_likelihood
         likelihoodModule = LikelihoodModule(
-            self.kwargs_data_joint, kwargs_model, self.param_class, **kwargs_likelihood
+            self.kwargs_data_joint,
+            kwargs_model,
+            self.param_class,
+            stage_timer=self._stage_timer,
+            **kwargs_likelihood
         )
         return likelihoodModule
 
+    def likelihood_profile(self, reset=False):
+        """Wall time and number of calls of the likelihood stages accumulated over all
+        fitting steps run so far. This requires kwargs_likelihood['profiling'] = True.
+        The evaluations done in the worker processes of the multiprocessing or MPI pools
+        of the PSO, emcee and zeus samplers are included (see TimedPool).
+
+        :param reset: bool, if True, deletes the recorded timings after reporting them
+        :return: dictionary of the recorded stages, see StageTimer.report()
+        """
+        report = self._stage_timer.report()
+        if reset is True:
+            self._stage_timer.reset()
+        return report
+
     def simplex(self, n_iterations, method="Nelder-Mead"):
         """Downhill simplex optimization using the Nelder-Mead algorithm.
 
@@ -576,6 +601,75 @@ class FittingSequence(object):
                 self.multi_band_list[band_index][1] = kwargs_psf
         return 0
 
+    def adaptive_supersampling(
+        self, tolerance, supersampling_factor=3, compute_bands=None
+    ):
+        """Selects the pixels to be supersampled (compute_mode='adaptive') and the
+        supersampling convolution kernel size based on the current best fit model (see
+        ImageModel.adaptive_supersampling_numerics()).
+
+        :param tolerance: float, maximum tolerated flux error per pixel (in units of the
+            image)
+        :param supersampling_factor: int, factor of higher resolution sub-pixel sampling
+        :param compute_bands: bool list, if multiple bands, this process can be limited
+            to a subset of bands
+        :return: 0, updated numerics settings are stored in self.multi_band_list
+        """
+        kwargs_model = self._updateManager.kwargs_model
+        kwargs_likelihood = self._updateManager.kwargs_likelihood
+        likelihood_mask_list = kwargs_likelihood.get("image_likelihood_mask_list", None)
+        kwargs_temp = self.best_fit(bijective=False)
+        if compute_bands is None:
+            compute_bands = [True] * len(self.multi_band_list)
+
+        for band_index in range(len(self.multi_band_list)):
+            if compute_bands[band_index] is True:
+                image_model = SingleBandMultiModel(
+                    self.multi_band_list,
+                    kwargs_model,
+                    likelihood_mask_list=likelihood_mask_list,
+                    band_index=band_index,
+                )
+                kwargs_lens = kwargs_temp.get("kwargs_lens", None)
+                kwargs_source = kwargs_temp.get("kwargs_source", None)
+                kwargs_lens_light = kwargs_temp.get("kwargs_lens_light", None)
+                kwargs_ps = kwargs_temp.get("kwargs_ps", None)
+                kwargs_extinction = kwargs_temp.get("kwargs_extinction", None)
+                kwargs_special = kwargs_temp.get("kwargs_special", None)
+                # linear amplitudes of the current model
+                _, _, _, param = image_model.image_linear_solve(
+                    kwargs_lens,
+                    kwargs_source,
+                    kwargs_lens_light,
+                    kwargs_ps,
+                    kwargs_extinction,
+                    kwargs_special,
+                )
+                (
+                    kwargs_lens_i,
+                    kwargs_source_i,
+                    kwargs_lens_light_i,
+                    _,
+                ) = image_model.update_linear_kwargs(
+                    param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+                )
+                _, _, _, _, kwargs_extinction_i = image_model.select_kwargs(
+                    kwargs_extinction=kwargs_extinction
+                )
+                kwargs_numerics = image_model.adaptive_supersampling_numerics(
+                    tolerance,
+                    supersampling_factor=supersampling_factor,
+                    kwargs_lens=kwargs_lens_i,
+                    kwargs_source=kwargs_source_i,
+                    kwargs_lens_light=kwargs_lens_light_i,
+                    kwargs_extinction=kwargs_extinction_i,
+                    kwargs_special=kwargs_special,
+                )
+                self.multi_band_list[band_index][2] = dict(
+                    self.multi_band_list[band_index][2], **kwargs_numerics
+                )
+        return 0
+
     def align_images(
         self,
         n_particles=10,
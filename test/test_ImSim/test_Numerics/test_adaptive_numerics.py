@@ -2,7 +2,12 @@ __author__ = "sibirrer"
 
 import numpy as np
 import numpy.testing as npt
-from lenstronomy.ImSim.Numerics.adaptive_numerics import AdaptiveConvolution
+from lenstronomy.ImSim.Numerics.adaptive_numerics import (
+    AdaptiveConvolution,
+    adaptive_supersampled_indexes,
+    adaptive_supersampling_kernel_size,
+)
+from lenstronomy.Util import image_util
 from lenstronomy.ImSim.Numerics.convolution import SubgridKernelConvolution
 from lenstronomy.LightModel.light_model import LightModel
 import lenstronomy.Util.util as util
@@ -82,6 +87,73 @@ class TestAdaptiveConvolution(object):
         )
         npt.assert_almost_equal(model_subgrid_conv, model_adaptive_conv, decimal=2)
 
+    def test_adaptive_supersampled_indexes(self):
+        supersampled_indexes = adaptive_supersampled_indexes(
+            self.model, self.model_sub, tolerance=0.0003
+        )
+        assert supersampled_indexes.shape == self.model.shape
+        error = np.abs(
+            image_util.re_size(self.model_sub, self.supersampling_factor) - self.model
+        )
+        npt.assert_array_equal(supersampled_indexes, error > 0.0003)
+        # the central peak of the Gaussian is curved the most
+        assert supersampled_indexes[10, 10]
+        assert not supersampled_indexes[0, 0]
+        assert not np.any(
+            adaptive_supersampled_indexes(self.model, self.model_sub, tolerance=1)
+        )
+
+    def test_adaptive_supersampling_kernel_size(self):
+        supersampled_indexes = adaptive_supersampled_indexes(
+            self.model, self.model_sub, tolerance=0.0003
+        )
+        kernel_size_max = len(self.kernel)
+        kernel_size = adaptive_supersampling_kernel_size(
+            self.kernel_sub,
+            self.supersampling_factor,
+            self.model_sub,
+            supersampled_indexes,
+            tolerance=0.00001,
+        )
+        assert kernel_size % 2 == 1
+        assert 1 <= kernel_size <= kernel_size_max
+        image_high_res_partial = self.model_sub * np.kron(
+            supersampled_indexes, np.ones((3, 3))
+        )
+        image_low_res = image_util.re_size(self.model_sub, self.supersampling_factor)
+        image_conv = AdaptiveConvolution(
+            self.kernel_sub,
+            self.supersampling_factor,
+            supersampled_indexes,
+            supersampling_kernel_size=kernel_size,
+        ).re_size_convolve(image_low_res, image_high_res_partial)
+        image_conv_full = AdaptiveConvolution(
+            self.kernel_sub,
+            self.supersampling_factor,
+            supersampled_indexes,
+            supersampling_kernel_size=kernel_size_max,
+        ).re_size_convolve(image_low_res, image_high_res_partial)
+        assert np.max(np.abs(image_conv - image_conv_full)) < 0.00001
+
+        # a tight tolerance needs the full kernel
+        kernel_size = adaptive_supersampling_kernel_size(
+            self.kernel_sub,
+            self.supersampling_factor,
+            self.model_sub,
+            supersampled_indexes,
+            tolerance=0,
+        )
+        assert kernel_size == kernel_size_max
+        # without supersampled pixels
+        kernel_size = adaptive_supersampling_kernel_size(
+            self.kernel_sub,
+            self.supersampling_factor,
+            self.model_sub,
+            np.zeros_like(supersampled_indexes),
+            tolerance=0.001,
+        )
+        assert kernel_size == 1
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -10,6 +10,7 @@ from lenstronomy.ImSim.Numerics.convolution import (
 )
 from lenstronomy.LightModel.light_model import LightModel
 import lenstronomy.Util.util as util
+import lenstronomy.Util.image_util as image_util
 import pytest
 
 
@@ -45,6 +46,24 @@ class TestPixelKernelConvolution(object):
         npt.assert_equal(pixel_conv.pixel_kernel(), kernel)
         npt.assert_equal(pixel_conv.pixel_kernel(num_pix=3), kernel[1:-1, 1:-1])
 
+    def test_convolution2d_stack(self):
+        kernel = np.ones((3, 3)) / 9.0
+        kernel[0, 1] = 0.3
+        images = np.array([self.model, self.model**2, self.model.T])
+        for convolution_type in ["fft_static", "fft", "grid"]:
+            pixel_conv = PixelKernelConvolution(
+                kernel=kernel, convolution_type=convolution_type
+            )
+            image_stack_conv = pixel_conv.convolution2d_stack(images)
+            for i, image in enumerate(images):
+                npt.assert_almost_equal(
+                    image_stack_conv[i], pixel_conv.convolution2d(image), decimal=10
+                )
+            image_stack_conv = pixel_conv.re_size_convolve_stack(images)
+            npt.assert_almost_equal(
+                image_stack_conv[1], pixel_conv.convolution2d(images[1]), decimal=10
+            )
+
 
 class TestSubgridKernelConvolution(object):
     def setup_method(self):
@@ -142,6 +161,34 @@ class TestSubgridKernelConvolution(object):
         )
         npt.assert_almost_equal(model_subgrid_conv, model_subgrid_conv_split, decimal=3)
 
+    def test_convolution2d_stack(self):
+        subgrid_conv = SubgridKernelConvolution(
+            self.kernel_sub,
+            self.supersampling_factor,
+            supersampling_kernel_size=3,
+            convolution_type="fft_static",
+        )
+        images_sub = np.array([self.model_sub, self.model_sub.T**2])
+        images = image_util.re_size(images_sub, self.supersampling_factor)
+        npt.assert_almost_equal(
+            images[1], image_util.re_size(images_sub[1], self.supersampling_factor)
+        )
+        image_stack_conv = subgrid_conv.convolution2d_stack(images_sub)
+        image_stack_re_size_conv = subgrid_conv.re_size_convolve_stack(
+            images, images_sub
+        )
+        for i in range(len(images_sub)):
+            npt.assert_almost_equal(
+                image_stack_conv[i],
+                subgrid_conv.convolution2d(images_sub[i]),
+                decimal=10,
+            )
+            npt.assert_almost_equal(
+                image_stack_re_size_conv[i],
+                subgrid_conv.re_size_convolve(images[i], images_sub[i]),
+                decimal=10,
+            )
+
 
 class TestMultiGaussianConvolution(object):
     def setup_method(self):
@@ -163,6 +210,15 @@ class TestMultiGaussianConvolution(object):
         image_convolved = mge_conv.convolution2d(self.model)
         npt.assert_almost_equal(np.sum(image_convolved), np.sum(self.model), decimal=2)
 
+        images = np.array([self.model, 2 * self.model.T])
+        image_stack_convolved = mge_conv.re_size_convolve_stack(images, None)
+        npt.assert_almost_equal(image_stack_convolved[0], image_convolved, decimal=10)
+        npt.assert_almost_equal(
+            image_stack_convolved[1],
+            mge_conv.convolution2d(2 * self.model.T),
+            decimal=10,
+        )
+
 
 class TestMGEConvolution(object):
     def setup_method(self):
@@ -82,6 +82,91 @@ class TestAdaptiveGrid(object):
         )
         assert len(image_high_res) == self.nx * self._supersampling_factor
 
+    def test_index_maps(self):
+        # non-square grid with several supersampled regions, compared against a pixel-by-pixel placement
+        nx, ny, supersampling_factor = 40, 30, 3
+        supersampling_indexes = np.zeros((nx, ny), dtype=bool)
+        supersampling_indexes[5:12, 3:9] = True
+        supersampling_indexes[25:33, 18:27] = True
+        adaptive_grid = AdaptiveGrid(
+            nx,
+            ny,
+            np.array([[0.1, 0.02], [-0.01, 0.1]]),
+            -2,
+            -1.5,
+            supersampling_indexes,
+            supersampling_factor,
+        )
+        x, y = adaptive_grid.coordinates_evaluate
+        flux_values = np.random.random(len(x))
+        image_low_res, image_high_res = adaptive_grid.flux_array2image_low_high(
+            flux_values
+        )
+
+        num_sub = supersampling_factor**2
+        num_low_res = nx * ny - np.sum(supersampling_indexes)
+        image_low_res_ref = np.zeros((nx, ny))
+        image_high_res_ref = np.zeros(
+            (nx * supersampling_factor, ny * supersampling_factor)
+        )
+        index_low, index_high = 0, 0
+        for i in range(nx):
+            for j in range(ny):
+                if supersampling_indexes[i, j]:
+                    sub_values = flux_values[
+                        num_low_res
+                        + index_high * num_sub : num_low_res
+                        + (index_high + 1) * num_sub
+                    ]
+                    image_low_res_ref[i, j] = np.mean(sub_values)
+                    image_high_res_ref[
+                        i * supersampling_factor : (i + 1) * supersampling_factor,
+                        j * supersampling_factor : (j + 1) * supersampling_factor,
+                    ] = sub_values.reshape(supersampling_factor, supersampling_factor)
+                    index_high += 1
+                else:
+                    image_low_res_ref[i, j] = flux_values[index_low]
+                    index_low += 1
+        npt.assert_almost_equal(image_low_res, image_low_res_ref, decimal=14)
+        npt.assert_array_equal(image_high_res, image_high_res_ref)
+
+    def test_index_maps_loop(self):
+        # same placement as the sub-pixel positions set one by one (see
+        # benchmarks/bench_adaptive_grid.py for the timing)
+        nx, ny, supersampling_factor = 100, 100, 5
+        supersampling_indexes = np.zeros((nx, ny), dtype=bool)
+        for x, y in [(30, 30), (30, 70), (70, 30), (70, 70)]:
+            supersampling_indexes[x - 6 : x + 7, y - 6 : y + 7] = True
+        adaptive_grid = AdaptiveGrid(
+            nx,
+            ny,
+            np.eye(2) * 0.05,
+            -2.5,
+            -2.5,
+            supersampling_indexes,
+            supersampling_factor,
+        )
+        num_sub = supersampling_factor**2
+        high_res_values = np.random.random(np.sum(supersampling_indexes) * num_sub)
+        supersampling_indexes1d = util.image2array(supersampling_indexes)
+
+        def _high_res_image_loop():
+            high_res = np.zeros((nx * supersampling_factor, ny * supersampling_factor))
+            count = 0
+            for i in range(supersampling_factor):
+                for j in range(supersampling_factor):
+                    grid1d = np.zeros(nx * ny)
+                    grid1d[supersampling_indexes1d] = high_res_values[count::num_sub]
+                    high_res[i::supersampling_factor, j::supersampling_factor] = (
+                        util.array2image(grid1d, nx, ny)
+                    )
+                    count += 1
+            return high_res
+
+        npt.assert_array_equal(
+            adaptive_grid._high_res_image(high_res_values), _high_res_image_loop()
+        )
+
 
 class TestRegularGrid(object):
     def setup_method(self):
@@ -113,6 +198,25 @@ class TestRegularGrid(object):
         ssf = self._regular_grid.supersampling_factor
         assert ssf == self._supersampling_factor
 
+    def test_dtype(self):
+        regular_grid = RegularGrid(
+            self.nx,
+            self.ny,
+            np.array([[1, 0], [0, 1]]) * self._deltaPix,
+            -5,
+            -5,
+            supersampling_factor=self._supersampling_factor,
+            dtype=np.float32,
+        )
+        x, y = regular_grid.coordinates_evaluate
+        x_64, y_64 = self._regular_grid.coordinates_evaluate
+        assert x.dtype == np.float32
+        npt.assert_almost_equal(x, x_64, decimal=6)
+        npt.assert_almost_equal(y, y_64, decimal=6)
+        image_low_res, image_high_res = regular_grid.flux_array2image_low_high(x)
+        assert image_low_res.dtype == np.float32
+        assert image_high_res.dtype == np.float32
+
 
 if __name__ == "__main__":
     pytest.main()
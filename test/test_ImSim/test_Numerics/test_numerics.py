@@ -275,6 +275,68 @@ class TestNumerics(object):
         delta = (self.image_true - image_conv) / self.image_true
         npt.assert_almost_equal(delta[self._conv_pixels_partial], 0, decimal=1)
 
+    def test_re_size_convolve_stack(self):
+        for kwargs_numerics in [
+            self.kwargs_numerics_true,
+            self.kwargs_numerics_high_res_narrow,
+            self.kwargs_numerics_low_conv_high_adaptive,
+            self.kwargs_numerics_high_adaptive,
+            self.kwargs_numerics_partial,
+        ]:
+            image_model = ImageModel(
+                self.pixel_grid,
+                self.psf_class,
+                lens_light_model_class=self.lightModel,
+                kwargs_numerics=kwargs_numerics,
+            )
+            numerics = image_model.ImageNumerics
+            x, y = numerics.coordinates_evaluate
+            flux = self.lightModel.surface_brightness(x, y, self.kwargs_light)
+            flux_arrays = np.array([flux, flux**2])
+            for unconvolved in [False, True]:
+                image_stack = numerics.re_size_convolve_stack(
+                    flux_arrays, unconvolved=unconvolved
+                )
+                for i, flux_array in enumerate(flux_arrays):
+                    image = numerics.re_size_convolve(
+                        flux_array, unconvolved=unconvolved
+                    )
+                    npt.assert_almost_equal(image_stack[i], image, decimal=8)
+
+    def test_float32(self):
+        for kwargs_numerics in [
+            self.kwargs_numerics_true,
+            self.kwargs_numerics_high_res_narrow,
+            self.kwargs_numerics_high_adaptive,
+            self.kwargs_numerics_partial,
+        ]:
+            image_model = ImageModel(
+                self.pixel_grid,
+                self.psf_class,
+                lens_light_model_class=self.lightModel,
+                kwargs_numerics=kwargs_numerics,
+            )
+            image_model_32 = ImageModel(
+                self.pixel_grid,
+                self.psf_class,
+                lens_light_model_class=self.lightModel,
+                kwargs_numerics=dict(kwargs_numerics, dtype="float32"),
+            )
+            assert image_model_32.ImageNumerics.dtype == np.float32
+            x, y = image_model_32.ImageNumerics.coordinates_evaluate
+            assert x.dtype == np.float32
+            assert y.dtype == np.float32
+            flux = self.lightModel.surface_brightness(x, y, self.kwargs_light)
+            assert flux.dtype == np.float32
+            assert (
+                image_model_32.ImageNumerics.re_size_convolve(flux).dtype == np.float32
+            )
+            image = image_model.image(kwargs_lens_light=self.kwargs_light)
+            image_32 = image_model_32.image(kwargs_lens_light=self.kwargs_light)
+            npt.assert_allclose(
+                image_32, image, rtol=1e-4, atol=1e-5 * np.max(np.abs(image))
+            )
+
     def test_property_access(self):
         image_model = ImageModel(
             self.pixel_grid,
@@ -476,6 +538,22 @@ class TestRaise(unittest.TestCase):
         with self.assertRaises(TypeError):
             Numerics(pixel_grid=None, psf=psf_class, supersampling_factor=1.0)
 
+    def test_dtype(self):
+        from lenstronomy.Data.psf import PSF
+        from lenstronomy.Data.pixel_grid import PixelGrid
+        from lenstronomy.ImSim.Numerics.numerics import Numerics
+
+        psf_class = PSF(psf_type="NONE")
+        pixel_grid = PixelGrid(
+            nx=10,
+            ny=10,
+            transform_pix2angle=np.eye(2),
+            ra_at_xy_0=0,
+            dec_at_xy_0=0,
+        )
+        with self.assertRaises(ValueError):
+            Numerics(pixel_grid=pixel_grid, psf=psf_class, dtype="float16")
+
 
 if __name__ == "__main__":
     pytest.main()
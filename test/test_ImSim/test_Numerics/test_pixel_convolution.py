@@ -43,6 +43,24 @@ class TestPixelConvolution(object):
         image_convolved = pixel_conv.convolution2d(self.model)
         npt.assert_almost_equal(model_conv_numba, image_convolved, decimal=10)
 
+    def test_convolve2d_parallel(self):
+        conv_pixels = np.ones_like(self.model, dtype=bool)
+        compute_pixels = np.zeros_like(self.model, dtype=bool)
+        compute_pixels[2:8, 3:9] = True
+        for compute in [conv_pixels, compute_pixels]:
+            numba_conv = NumbaConvolution(
+                kernel=self.kernel, conv_pixels=conv_pixels, compute_pixels=compute
+            )
+            numba_conv_parallel = NumbaConvolution(
+                kernel=self.kernel,
+                conv_pixels=conv_pixels,
+                compute_pixels=compute,
+                parallel=True,
+            )
+            model_conv = numba_conv.convolve2d(self.model)
+            model_conv_parallel = numba_conv_parallel.convolve2d(self.model)
+            npt.assert_almost_equal(model_conv_parallel, model_conv, decimal=10)
+
 
 class TestSubgirdNumbaConvolution(object):
     def setup_method(self):
@@ -96,6 +114,23 @@ class TestSubgirdNumbaConvolution(object):
         )
         npt.assert_almost_equal(model_conv_numba, image_convolved, decimal=10)
 
+    def test_convolve2d_parallel(self):
+        conv_pixels = np.zeros_like(self.model, dtype=bool)
+        conv_pixels[1:9, 2:7] = True
+        compute_pixels = np.zeros_like(self.model, dtype=bool)
+        compute_pixels[3:10, 0:6] = True
+        kwargs = {
+            "kernel_super": self.kernel_super,
+            "conv_pixels": conv_pixels,
+            "compute_pixels": compute_pixels,
+            "supersampling_factor": self.supersampling_factor,
+        }
+        numba_conv = SubgridNumbaConvolution(**kwargs)
+        numba_conv_parallel = SubgridNumbaConvolution(parallel=True, **kwargs)
+        model_conv = numba_conv.convolve2d(self.model_super)
+        model_conv_parallel = numba_conv_parallel.convolve2d(self.model_super)
+        npt.assert_almost_equal(model_conv_parallel, model_conv, decimal=10)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -3,6 +3,7 @@ __author__ = "sibirrer"
 import numpy as np
 import numpy.testing as npt
 from lenstronomy.ImSim import de_lens
+from scipy import sparse
 import pytest
 
 
@@ -52,6 +53,40 @@ class TestDeLens(object):
         npt.assert_almost_equal(result[1], 0, decimal=8)
         npt.assert_almost_equal(image[0], 0, decimal=8)
 
+    def test_get_param_WLS_sparse(self):
+        A = np.array([[1, 2, 3, 0, 0], [3, 2, 1, 0, 0], [0, 0, 1, 2, 3]]).T
+        C_D_inv = np.array([1, 2, 1, 0.5, 1])
+        d = np.array([1, 2, 3, 4, 5])
+        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d)
+        result_sparse, cov_error_sparse, image_sparse = de_lens.get_param_WLS_sparse(
+            sparse.csr_matrix(A), C_D_inv, d
+        )
+        npt.assert_almost_equal(result_sparse, result, decimal=10)
+        npt.assert_almost_equal(cov_error_sparse, cov_error, decimal=10)
+        npt.assert_almost_equal(image_sparse, image, decimal=10)
+
+        result_sparse, cov_error_sparse, image_sparse = de_lens.get_param_WLS_sparse(
+            A, C_D_inv, d, inv_bool=False
+        )
+        npt.assert_almost_equal(result_sparse, result, decimal=10)
+        assert cov_error_sparse is None
+
+        # degenerate response
+        A = np.array([[1, 2, 1], [1, 2, 1]]).T
+        d = np.array([1, 2, 3])
+        result, cov_error, image = de_lens.get_param_WLS_sparse(
+            A, np.array([1, 1, 1]), d
+        )
+        npt.assert_almost_equal(result, 0, decimal=8)
+        npt.assert_almost_equal(cov_error, 0, decimal=8)
+        npt.assert_almost_equal(image, 0, decimal=8)
+
+        result, cov_error, image = de_lens.get_param_WLS_sparse(
+            A, np.array([0, 0, 0]), d, inv_bool=False
+        )
+        npt.assert_almost_equal(result, 0, decimal=8)
+        assert cov_error is None
+
     def test_marginalisation_const(self):
         A = np.array([[1, 2, 3], [3, 2, 1]]).T
         C_D_inv = np.array([1, 1, 1])
@@ -86,6 +121,21 @@ class TestDeLens(object):
         log_det_old = de_lens.marginalisation_const(M_inv)
         npt.assert_almost_equal(log_det, log_det_old, decimal=9)
 
+    def test_marginalisation_const_cholesky(self):
+        M_inv = np.array([[2, -0.5, 1], [-0.5, 3, 0], [1, 0, 2]])
+        log_det = de_lens.marginalisation_const_cholesky(M_inv)
+        npt.assert_almost_equal(
+            log_det, de_lens.marginalisation_const(M_inv), decimal=10
+        )
+        log_det = de_lens.marginalization_new(M_inv, d_prior=None, cholesky=True)
+        npt.assert_almost_equal(
+            log_det, de_lens.marginalisation_const(M_inv), decimal=10
+        )
+
+        M_inv = np.array([[1, 1, 1], [0.0, 1.0, 0.0], [1.0, 2.0, 1.0]])
+        log_det = de_lens.marginalisation_const_cholesky(M_inv)
+        assert log_det == -(10**15)
+
     def test_stable_inv(self):
         m = np.diag(np.ones(10) * 2)
         m_inv = de_lens._stable_inv(m)
@@ -143,6 +143,32 @@ class TestMultiSourcePlane(object):
         assert len(source_x) == 10
         assert len(source_y) == 10
 
+    def test_image_flux_joint_batch(self):
+        x, y = util.make_grid(numPix=10, deltapix=0.5)
+        kwargs_lens_batch, kwargs_light_batch = [], []
+        for i in range(3):
+            kwargs_lens_batch.append(
+                [dict(self.kwargs_lens[0], theta_E=1 + 0.1 * i), self.kwargs_lens[1]]
+            )
+            kwargs_light_batch.append(
+                [dict(self.kwargs_light[0], n_sersic=1 + i), self.kwargs_light[1]]
+            )
+        for mapping in [
+            self.singlePlane_singlePlane,
+            self.singlePlane_pseudoMulti,
+            self.multi_single,
+            self.multi_multi,
+        ]:
+            flux = mapping.image_flux_joint_batch(
+                x, y, kwargs_lens_batch, kwargs_light_batch
+            )
+            assert flux.shape == (3, len(x))
+            for i in range(3):
+                flux_i = mapping.image_flux_joint(
+                    x, y, kwargs_lens_batch[i], kwargs_light_batch[i]
+                )
+                npt.assert_allclose(flux[i], flux_i, rtol=1e-12)
+
     def test_image_flux_split(self):
         kwargs_special = {
             "factor_a_1": 1,
@@ -284,6 +310,51 @@ class TestMultiSourcePlane(object):
         )
         npt.assert_almost_equal(beta_x0, beta_x, decimal=10)
 
+    def test_ray_shooting_cache(self):
+        lens_model = LensModel(lens_model_list=["SIS", "SIS"])
+        light_model = LightModel(["SERSIC", "SERSIC"])
+        mapping = Image2SourceMapping(lens_model, light_model, ray_shooting_cache=2)
+        mapping_no_cache = Image2SourceMapping(lens_model, light_model)
+        x, y = util.make_grid(numPix=10, deltapix=0.1)
+        kwargs_lens_2 = [
+            {"theta_E": 1.1, "center_x": 0, "center_y": 0},
+            self.kwargs_lens[1],
+        ]
+        kwargs_lens_3 = [self.kwargs_lens[0], {"theta_E": 0.4}]
+        kwargs_lens_3[1].update({"center_x": 1, "center_y": 1})
+
+        flux = mapping.image_flux_joint(x, y, self.kwargs_lens, self.kwargs_light)
+        flux_no_cache = mapping_no_cache.image_flux_joint(
+            x, y, self.kwargs_lens, self.kwargs_light
+        )
+        npt.assert_almost_equal(flux, flux_no_cache, decimal=10)
+        beta_x, beta_y = mapping._ray_shooting(x, y, self.kwargs_lens)
+        beta_x_cache, beta_y_cache = mapping._ray_shooting(
+            np.copy(x), np.copy(y), [kwargs.copy() for kwargs in self.kwargs_lens]
+        )
+        assert beta_x_cache is beta_x
+        assert beta_y_cache is beta_y
+        assert len(mapping._ray_shooting_cache) == 1
+
+        # different lens model keyword arguments or coordinates are ray-shot again
+        response, n = mapping.image_flux_split(x, y, kwargs_lens_2, self.kwargs_light)
+        response_no_cache, n = mapping_no_cache.image_flux_split(
+            x, y, kwargs_lens_2, self.kwargs_light
+        )
+        npt.assert_almost_equal(response, response_no_cache, decimal=10)
+        beta_x_new, _ = mapping._ray_shooting(x + 0.01, y, self.kwargs_lens)
+        assert beta_x_new is not beta_x
+        assert len(mapping._ray_shooting_cache) == 2
+
+        # the least recently used entry is dropped
+        mapping._ray_shooting(x, y, kwargs_lens_3)
+        assert len(mapping._ray_shooting_cache) == 2
+        beta_x_cache, _ = mapping._ray_shooting(x, y, self.kwargs_lens)
+        assert beta_x_cache is not beta_x
+
+        mapping.reset_ray_shooting_cache()
+        assert len(mapping._ray_shooting_cache) == 0
+
     def test__re_order_split(self):
         lens_model = LensModel(
             lens_model_list=["SIS", "SIS"],
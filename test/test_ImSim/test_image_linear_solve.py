@@ -3,6 +3,7 @@ __author__ = "sibirrer"
 import numpy as np
 
 from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+import lenstronomy.ImSim.de_lens as de_lens
 import lenstronomy.Util.param_util as param_util
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
@@ -11,6 +12,7 @@ import lenstronomy.Util.simulation_util as sim_util
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
 import numpy.testing as npt
+from scipy import sparse
 
 
 class TestImageLinearFit(object):
@@ -120,3 +122,349 @@ class TestImageLinearFit(object):
             kwargs_lens=self.kwargs_lens, kwargs_ps=self.kwargs_ps, kwargs_special=None
         )
         npt.assert_almost_equal(model_error, 0)
+
+    def test_sparse_linear_solver(self):
+        kwargs_ps = [
+            {"ra_image": np.array([1.0, -1.0]), "dec_image": np.array([0.1, 0.0])}
+        ]
+        image_model_list = []
+        for sparse_solver in [False, True]:
+            image_model = ImageLinearFit(
+                self.imageModel.Data,
+                self.imageModel.PSF,
+                self.imageModel.LensModel,
+                self.imageModel.SourceModel,
+                self.imageModel.LensLightModel,
+                PointSource(point_source_type_list=["LENSED_POSITION"]),
+                kwargs_numerics={
+                    "supersampling_factor": 2,
+                    "supersampling_convolution": False,
+                    "sparse_linear_solver": sparse_solver,
+                    "linear_response_cache": sparse_solver,
+                },
+            )
+            image_model_list.append(image_model)
+        image_model, image_model_sparse = image_model_list
+        A = image_model.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        A_sparse = image_model_sparse._linear_response_matrix(
+            self.kwargs_lens,
+            self.kwargs_source,
+            self.kwargs_lens_light,
+            kwargs_ps,
+            sparse_format=True,
+        )
+        assert sparse.issparse(A_sparse)
+        assert A_sparse.nnz < A.size
+        npt.assert_almost_equal(A_sparse.toarray(), A, decimal=10)
+        # cached sparse rows are returned in dense format for the public API
+        A_dense = image_model_sparse.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        npt.assert_almost_equal(A_dense, A, decimal=10)
+
+        model, error_map, cov_param, param = image_model.image_linear_solve(
+            self.kwargs_lens,
+            self.kwargs_source,
+            self.kwargs_lens_light,
+            kwargs_ps,
+            inv_bool=True,
+        )
+        (
+            model_sparse,
+            error_map_sparse,
+            cov_param_sparse,
+            param_sparse,
+        ) = image_model_sparse.image_linear_solve(
+            self.kwargs_lens,
+            self.kwargs_source,
+            self.kwargs_lens_light,
+            kwargs_ps,
+            inv_bool=True,
+        )
+        npt.assert_almost_equal(param_sparse, param, decimal=6)
+        npt.assert_almost_equal(cov_param_sparse, cov_param, decimal=6)
+        npt.assert_almost_equal(model_sparse, model, decimal=6)
+
+        for linear_prior in [None, 1000]:
+            logL, _ = image_model.likelihood_data_given_model(
+                self.kwargs_lens,
+                self.kwargs_source,
+                self.kwargs_lens_light,
+                kwargs_ps,
+                source_marg=True,
+                linear_prior=linear_prior,
+            )
+            logL_sparse, _ = image_model_sparse.likelihood_data_given_model(
+                self.kwargs_lens,
+                self.kwargs_source,
+                self.kwargs_lens_light,
+                kwargs_ps,
+                source_marg=True,
+                linear_prior=linear_prior,
+            )
+            npt.assert_almost_equal(logL_sparse, logL, decimal=5)
+        # the marginalisation constant is taken from the decomposition of the solve
+        cov_param_sparse, marg_const = image_model_sparse._marg_const_cholesky
+        npt.assert_almost_equal(
+            marg_const, de_lens.marginalisation_const(cov_param_sparse), decimal=8
+        )
+
+        # the rows are built from the support of each component
+        image_model_sparse.reset_linear_response_cache()
+        A_sparse = image_model_sparse._linear_response_matrix(
+            self.kwargs_lens,
+            self.kwargs_source,
+            self.kwargs_lens_light,
+            kwargs_ps,
+            sparse_format=True,
+        )
+        npt.assert_almost_equal(A_sparse.toarray(), A, decimal=10)
+        A_point_source = A_sparse[-2:]
+        assert A_point_source.nnz == np.count_nonzero(A[-2:])
+        assert A_point_source.nnz < A[-2:].size
+
+    def test_float32(self):
+        kwargs_ps = [
+            {"ra_image": np.array([1.0, -1.0]), "dec_image": np.array([0.1, 0.0])}
+        ]
+        image_model_list = []
+        for dtype in ["float64", "float32"]:
+            image_model = ImageLinearFit(
+                self.imageModel.Data,
+                self.imageModel.PSF,
+                self.imageModel.LensModel,
+                self.imageModel.SourceModel,
+                self.imageModel.LensLightModel,
+                PointSource(point_source_type_list=["LENSED_POSITION"]),
+                kwargs_numerics={
+                    "supersampling_factor": 2,
+                    "supersampling_convolution": False,
+                    "dtype": dtype,
+                },
+            )
+            image_model_list.append(image_model)
+        image_model, image_model_32 = image_model_list
+        A = image_model.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        A_32 = image_model_32.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        assert A_32.dtype == np.float32
+        npt.assert_allclose(A_32, A, rtol=1e-4, atol=1e-5 * np.max(np.abs(A)))
+
+        # the linear solution and the likelihood are computed in double precision
+        logL, param = image_model.likelihood_data_given_model(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        logL_32, param_32 = image_model_32.likelihood_data_given_model(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        assert param_32.dtype == np.float64
+        npt.assert_allclose(param_32, param, rtol=1e-3)
+        npt.assert_allclose(logL_32, logL, rtol=1e-5)
+
+    def test_float32_shapelets(self):
+        # configuration of benchmarks/bench_float32.py on a smaller image
+        kwargs_data = sim_util.data_configure_simple(
+            40, 0.05, exposure_time=100, background_rms=0.05
+        )
+        data_class = ImageData(**kwargs_data)
+        x, y = np.meshgrid(np.arange(31), np.arange(31))
+        kernel = np.exp(-((x - 15) ** 2 + (y - 15) ** 2) / 2.0 / 3**2)
+        psf_class = PSF(psf_type="PIXEL", kernel_point_source=kernel)
+        lens_model_class = LensModel(["SIE", "SHEAR"])
+        source_model_class = LightModel(["SERSIC_ELLIPSE", "SHAPELETS"])
+        kwargs_lens = [
+            {"theta_E": 0.6, "e1": 0.1, "e2": -0.05, "center_x": 0, "center_y": 0},
+            {"gamma1": 0.03, "gamma2": 0.01},
+        ]
+        kwargs_source = [
+            {
+                "amp": 10,
+                "R_sersic": 0.3,
+                "n_sersic": 2,
+                "e1": 0.1,
+                "e2": 0,
+                "center_x": 0.05,
+                "center_y": 0,
+            },
+            {"amp": np.ones(45), "n_max": 8, "beta": 0.2},
+        ]
+        image_model_list = []
+        for dtype in ["float64", "float32"]:
+            image_model = ImageLinearFit(
+                data_class,
+                psf_class,
+                lens_model_class,
+                source_model_class,
+                kwargs_numerics={"supersampling_factor": 3, "dtype": dtype},
+            )
+            image_model_list.append(image_model)
+        image_model, image_model_32 = image_model_list
+        image = image_model.image(kwargs_lens, kwargs_source)
+        np.random.seed(42)
+        data_class.update_data(image + np.random.normal(0, 0.05, image.shape))
+        logL, param = image_model.likelihood_data_given_model(
+            kwargs_lens, kwargs_source
+        )
+        logL_32, param_32 = image_model_32.likelihood_data_given_model(
+            kwargs_lens, kwargs_source
+        )
+        npt.assert_allclose(logL_32, logL, atol=1e-3)
+        npt.assert_allclose(param_32, param, rtol=1e-2, atol=1e-2 * np.max(param))
+
+    def test_ray_shooting_cache(self):
+        image_model = ImageLinearFit(
+            self.imageModel.Data,
+            self.imageModel.PSF,
+            self.imageModel.LensModel,
+            self.imageModel.SourceModel,
+            kwargs_numerics={"supersampling_factor": 2, "ray_shooting_cache": 1},
+        )
+        image = image_model.image(self.kwargs_lens, self.kwargs_source)
+        image_cache = image_model.image(self.kwargs_lens, self.kwargs_source)
+        npt.assert_almost_equal(image_cache, image, decimal=10)
+        assert len(image_model.source_mapping._ray_shooting_cache) == 1
+        # the ray-shooting does not depend on the PSF
+        image_model.update_psf(self.imageModel.PSF)
+        assert len(image_model.source_mapping._ray_shooting_cache) == 1
+        image_model.update_data(self.imageModel.Data)
+        assert len(image_model.source_mapping._ray_shooting_cache) == 0
+
+    def test_update_numerics_options(self):
+        image_model = ImageLinearFit(
+            self.imageModel.Data,
+            self.imageModel.PSF,
+            self.imageModel.LensModel,
+            self.imageModel.SourceModel,
+            kwargs_numerics={"supersampling_factor": 1},
+        )
+        # options of ImageModel are applied, not passed to the numerics
+        image_model.update_numerics(
+            {
+                "supersampling_factor": 2,
+                "ray_shooting_cache": 4,
+                "linear_response_cache": True,
+                "sparse_linear_solver": True,
+            }
+        )
+        assert image_model.ImageNumerics.grid_supersampling_factor == 2
+        assert image_model._linear_response_cache is True
+        assert image_model._sparse_linear_solver is True
+        image_model.image(self.kwargs_lens, self.kwargs_source)
+        assert len(image_model.source_mapping._ray_shooting_cache) == 1
+        logL, _ = image_model.likelihood_data_given_model(
+            self.kwargs_lens, self.kwargs_source
+        )
+        assert len(image_model._response_cache) > 0
+
+        # the options are kept with later updates
+        image_model.update_numerics({"supersampling_factor": 1})
+        assert image_model.ImageNumerics.grid_supersampling_factor == 1
+        assert image_model._linear_response_cache is True
+        image_model.update_numerics({"ray_shooting_cache": 0})
+        assert len(image_model.source_mapping._ray_shooting_cache) == 0
+        image_model.image(self.kwargs_lens, self.kwargs_source)
+        assert len(image_model.source_mapping._ray_shooting_cache) == 0
+
+    def test_linear_response_cache(self):
+        kwargs_ps = [
+            {"ra_image": np.array([1.0, -1.0]), "dec_image": np.array([0.1, 0.0])}
+        ]
+        image_model_list = []
+        for cache in [False, True]:
+            image_model = ImageLinearFit(
+                self.imageModel.Data,
+                self.imageModel.PSF,
+                self.imageModel.LensModel,
+                self.imageModel.SourceModel,
+                self.imageModel.LensLightModel,
+                PointSource(point_source_type_list=["LENSED_POSITION"]),
+                kwargs_numerics={
+                    "supersampling_factor": 2,
+                    "supersampling_convolution": False,
+                    "linear_response_cache": cache,
+                },
+            )
+            image_model_list.append(image_model)
+        image_model, image_model_cache = image_model_list
+        A = image_model.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        A_cache = image_model_cache.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        npt.assert_almost_equal(A_cache, A, decimal=10)
+        assert image_model._response_cache == {}
+
+        # a change in the lens model re-computes the lensed components only
+        lens_light_rows = image_model_cache._response_cache["lens_light"][1]
+        point_source_rows = image_model_cache._response_cache["point_source"][1]
+        kwargs_lens = [{"theta_E": 1.1, "center_x": 0, "center_y": 0}]
+        A = image_model.linear_response_matrix(
+            kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        A_cache = image_model_cache.linear_response_matrix(
+            kwargs_lens, self.kwargs_source, self.kwargs_lens_light, kwargs_ps
+        )
+        npt.assert_almost_equal(A_cache, A, decimal=10)
+        assert image_model_cache._response_cache["lens_light"][1] is lens_light_rows
+        assert image_model_cache._response_cache["point_source"][1] is point_source_rows
+
+        # a change in the linear amplitudes does not require a re-computation
+        source_rows = image_model_cache._response_cache["source"][1]
+        kwargs_source = [dict(self.kwargs_source[0], amp=10)]
+        kwargs_ps_amp = [dict(kwargs_ps[0], point_amp=np.array([2.0, 3.0]))]
+        A_cache = image_model_cache.linear_response_matrix(
+            kwargs_lens, kwargs_source, self.kwargs_lens_light, kwargs_ps_amp
+        )
+        npt.assert_almost_equal(A_cache, A, decimal=10)
+        assert image_model_cache._response_cache["source"][1] is source_rows
+        assert image_model_cache._response_cache["point_source"][1] is point_source_rows
+
+        # a change in the non-linear parameters of the lens light and point source
+        kwargs_lens_light = [dict(self.kwargs_lens_light[0], R_sersic=0.2)]
+        kwargs_ps = [dict(kwargs_ps[0], ra_image=np.array([1.0, -0.9]))]
+        A = image_model.linear_response_matrix(
+            kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+        )
+        A_cache = image_model_cache.linear_response_matrix(
+            kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+        )
+        npt.assert_almost_equal(A_cache, A, decimal=10)
+        assert image_model_cache._response_cache["source"][1] is source_rows
+
+        image_model_cache.update_psf(self.imageModel.PSF)
+        assert image_model_cache._response_cache == {}
+
+    def test_linear_response_cache_lens_amp(self):
+        # "amp" of the lens model is a non-linear parameter of the lensed source rows
+        image_model_list = []
+        for cache in [False, True]:
+            image_model = ImageLinearFit(
+                self.imageModel.Data,
+                self.imageModel.PSF,
+                LensModel(lens_model_list=["GAUSSIAN_KAPPA"]),
+                self.imageModel.SourceModel,
+                kwargs_numerics={
+                    "supersampling_factor": 1,
+                    "linear_response_cache": cache,
+                },
+            )
+            image_model_list.append(image_model)
+        image_model, image_model_cache = image_model_list
+        for amp in [1.0, 2.0]:
+            kwargs_lens = [{"amp": amp, "sigma": 0.5, "center_x": 0, "center_y": 0}]
+            A = image_model.linear_response_matrix(kwargs_lens, self.kwargs_source)
+            A_cache = image_model_cache.linear_response_matrix(
+                kwargs_lens, self.kwargs_source
+            )
+            npt.assert_almost_equal(A_cache, A, decimal=10)
+        A_1 = image_model.linear_response_matrix(
+            [{"amp": 1.0, "sigma": 0.5, "center_x": 0, "center_y": 0}],
+            self.kwargs_source,
+        )
+        assert np.max(np.abs(A - A_1)) > 0
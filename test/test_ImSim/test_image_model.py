@@ -252,6 +252,128 @@ class TestImageModel(object):
         )
         assert num_param_linear == 3
 
+    def test_image_batch(self):
+        kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list = [], [], []
+        for theta_E, amp in [(0.9, 1), (1.0, 2), (1.1, 0.5)]:
+            kwargs_lens_list.append(
+                [dict(self.kwargs_lens[0], theta_E=theta_E), self.kwargs_lens[1]]
+            )
+            kwargs_source_list.append([dict(self.kwargs_source[0], amp=amp)])
+            kwargs_lens_light_list.append([dict(self.kwargs_lens_light[0], amp=amp)])
+        kwargs_ps_list = [self.kwargs_ps] * 3
+        images = self.imageModel.image_batch(
+            kwargs_lens_list,
+            kwargs_source_list,
+            kwargs_lens_light_list,
+            kwargs_ps_list,
+        )
+        assert images.shape == (3, 100, 100)
+        for i in range(3):
+            image = self.imageModel.image(
+                kwargs_lens_list[i],
+                kwargs_source_list[i],
+                kwargs_lens_light_list[i],
+                kwargs_ps_list[i],
+            )
+            npt.assert_almost_equal(images[i], image, decimal=8)
+
+        images = self.imageModel.image_batch(
+            kwargs_lens_list,
+            kwargs_source_list,
+            kwargs_lens_light_list,
+            unconvolved=True,
+            point_source_add=False,
+        )
+        image = self.imageModel.image(
+            kwargs_lens_list[1],
+            kwargs_source_list[1],
+            kwargs_lens_light_list[1],
+            unconvolved=True,
+            point_source_add=False,
+        )
+        npt.assert_almost_equal(images[1], image, decimal=8)
+
+        logL_list = self.imageModel.likelihood_data_given_model_batch(
+            kwargs_lens_list,
+            kwargs_source_list,
+            kwargs_lens_light_list,
+            kwargs_ps_list,
+            linear_solver=False,
+        )
+        for i in range(3):
+            logL, _ = self.imageModel._likelihood_data_given_model(
+                kwargs_lens_list[i],
+                kwargs_source_list[i],
+                kwargs_lens_light_list[i],
+                kwargs_ps_list[i],
+                linear_solver=False,
+            )
+            npt.assert_almost_equal(logL_list[i], logL, decimal=6)
+
+        # linear inversion for each realisation
+        image_model = ImageLinearFit(
+            self.imageModel.Data,
+            self.imageModel.PSF,
+            self.imageModel.LensModel,
+            self.imageModel.SourceModel,
+            self.imageModel.LensLightModel,
+        )
+        logL_list = image_model.likelihood_data_given_model_batch(
+            kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list
+        )
+        for i in range(3):
+            logL, _ = image_model.likelihood_data_given_model(
+                kwargs_lens_list[i], kwargs_source_list[i], kwargs_lens_light_list[i]
+            )
+            npt.assert_almost_equal(logL_list[i], logL, decimal=6)
+
+    def test_image_batch_vectorized(self):
+        # profiles evaluated vectorized over the realisations (SIE, SHEAR, SERSIC_ELLIPSE,
+        # HERNQUIST) together with profiles evaluated for each realisation (EPL,
+        # SHAPELETS), in chunks of two realisations
+        kwargs_data = sim_util.data_configure_simple(20, 0.1, 100, 0.05)
+        image_model = ImageModel(
+            ImageData(**kwargs_data),
+            PSF(psf_type="GAUSSIAN", fwhm=0.2, pixel_size=0.1),
+            LensModel(["SIE", "SHEAR", "EPL"]),
+            LightModel(["SERSIC_ELLIPSE", "SHAPELETS"]),
+            LightModel(["SERSIC_ELLIPSE", "HERNQUIST"]),
+            kwargs_numerics={"supersampling_factor": 2},
+        )
+        kwargs_lens_list, kwargs_source_list, kwargs_lens_light_list = [], [], []
+        for i in range(5):
+            kwargs_lens_list.append(
+                [
+                    {"theta_E": 0.9 + 0.05 * i, "e1": 0.05 * i, "e2": -0.1},
+                    {"gamma1": 0.01 * i, "gamma2": 0.02},
+                    {"theta_E": 0.1, "gamma": 1.9 + 0.05 * i, "e1": 0, "e2": 0},
+                ]
+            )
+            kwargs_source_list.append(
+                [
+                    dict(self.kwargs_source[0], amp=1 + i, R_sersic=0.2 + 0.1 * i),
+                    {"amp": [1.0, 0.5, 0.2], "n_max": 1, "beta": 0.2 + 0.1 * i},
+                ]
+            )
+            kwargs_lens_light_list.append(
+                [
+                    dict(self.kwargs_source[0], center_x=0.1 * i),
+                    {"amp": 2.0, "Rs": 0.5, "center_x": 0, "center_y": 0.1 * i},
+                ]
+            )
+        images = image_model.image_batch(
+            kwargs_lens_list,
+            kwargs_source_list,
+            kwargs_lens_light_list,
+            max_elements=2 * 40 * 40,
+        )
+        assert images.shape == (5, 20, 20)
+        for i in range(5):
+            image = image_model.image(
+                kwargs_lens_list[i], kwargs_source_list[i], kwargs_lens_light_list[i]
+            )
+            npt.assert_allclose(images[i], image, rtol=1e-10, atol=1e-12)
+
     def test_update_data(self):
         kwargs_data = sim_util.data_configure_simple(
             numPix=10, deltaPix=1, exposure_time=1, background_rms=1, inverse=True
@@ -260,6 +382,52 @@ class TestImageModel(object):
         self.imageModel.update_data(data_class)
         assert self.imageModel.Data.num_pixel == 100
 
+    def test_adaptive_supersampling_numerics(self):
+        kwargs_numerics = self.imageModel.adaptive_supersampling_numerics(
+            tolerance=0.01,
+            supersampling_factor=3,
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+        )
+        supersampled_indexes = kwargs_numerics["supersampled_indexes"]
+        assert kwargs_numerics["compute_mode"] == "adaptive"
+        assert kwargs_numerics["supersampling_factor"] == 3
+        assert supersampled_indexes.shape == self.imageModel.Data.num_pixel_axes
+        # only the few pixels with strong curvature of the surface brightness are selected
+        assert not supersampled_indexes[0, 0]
+        assert 0 < np.sum(supersampled_indexes) < 100**2 / 100
+        assert kwargs_numerics["supersampling_kernel_size"] % 2 == 1
+
+        # the adaptive numerics meet the tolerance relative to the full supersampling
+        kwargs = {
+            "kwargs_lens": self.kwargs_lens,
+            "kwargs_source": self.kwargs_source,
+            "kwargs_lens_light": self.kwargs_lens_light,
+            "point_source_add": False,
+        }
+        image_model = ImageModel(
+            self.imageModel.Data,
+            self.imageModel.PSF,
+            self.imageModel.LensModel,
+            self.imageModel.SourceModel,
+            self.imageModel.LensLightModel,
+            kwargs_numerics={
+                "supersampling_factor": 3,
+                "supersampling_convolution": True,
+            },
+        )
+        image_full = image_model.image(**kwargs)
+        image_model.update_numerics(kwargs_numerics)
+        assert image_model.ImageNumerics.grid_supersampling_factor == 3
+        image_adaptive = image_model.image(**kwargs)
+        image_model.update_numerics({"supersampling_factor": 1})
+        image_regular = image_model.image(**kwargs)
+        error_adaptive = np.max(np.abs(image_adaptive - image_full))
+        error_regular = np.max(np.abs(image_regular - image_full))
+        assert error_adaptive < 0.01
+        assert error_adaptive < error_regular
+
     def test_point_source_rendering(self):
         # initialize data
 
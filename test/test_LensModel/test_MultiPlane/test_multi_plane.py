@@ -621,6 +621,113 @@ class TestMultiPlane(object):
         npt.assert_almost_equal(f_yx_z12, f_yx, decimal=5)
         npt.assert_almost_equal(f_yy_z12, f_yy, decimal=5)
 
+    def test_hessian_jacobian(self):
+        lens_model_list = ["SIS", "NFW", "EPL", "SHEAR", "SIS"]
+        redshift_list = [0.3, 0.3, 0.5, 0.5, 0.8]
+        kwargs_lens = [
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0},
+            {"Rs": 0.2, "alpha_Rs": 0.05, "center_x": -0.3, "center_y": 0.2},
+            {"theta_E": 1.0, "gamma": 2.1, "e1": 0.1, "e2": -0.05},
+            {"gamma1": 0.03, "gamma2": -0.01},
+            {"theta_E": 0.1, "center_x": 0.3, "center_y": 0.3},
+        ]
+        x = np.linspace(-1.5, 1.5, 7)
+        y = np.linspace(1, -0.7, 7)
+        for observed_convention_index in [None, [4]]:
+            multi_plane = MultiPlane(
+                z_source=1.5,
+                lens_model_list=lens_model_list,
+                lens_redshift_list=redshift_list,
+                observed_convention_index=observed_convention_index,
+            )
+            # propagated Jacobian against finite differences
+            hessian = multi_plane.hessian(x, y, kwargs_lens, diff=None)
+            hessian_diff = multi_plane.hessian(x, y, kwargs_lens, diff=1e-7)
+            for f, f_diff in zip(hessian, hessian_diff):
+                npt.assert_almost_equal(f, f_diff, decimal=5)
+            hessian = multi_plane.hessian_z1z2(0.2, 1.2, x, y, kwargs_lens, diff=None)
+            hessian_diff = multi_plane.hessian_z1z2(
+                0.2, 1.2, x, y, kwargs_lens, diff=1e-7
+            )
+            for f, f_diff in zip(hessian, hessian_diff):
+                npt.assert_almost_equal(f, f_diff, decimal=5)
+
+        # a single plane reduces to the hessian of the profiles
+        lens_model = LensModel(lens_model_list=lens_model_list[2:4])
+        multi_plane = MultiPlane(
+            z_source=1.5,
+            lens_model_list=lens_model_list[2:4],
+            lens_redshift_list=[0.5, 0.5],
+        )
+        hessian = multi_plane.hessian(x, y, kwargs_lens[2:4], diff=None)
+        hessian_simple = lens_model.hessian(x, y, kwargs_lens[2:4])
+        for f, f_simple in zip(hessian, hessian_simple):
+            npt.assert_almost_equal(f, f_simple, decimal=10)
+
+    def test_plane_schedule(self):
+        lens_model_list = ["SIS", "NFW", "SIS", "SIE", "SIS"]
+        redshift_list = [0.5, 0.3, 0.3, 0.5, 0.8]
+        kwargs_lens = [
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0},
+            {"Rs": 0.2, "alpha_Rs": 0.05, "center_x": -0.3, "center_y": 0.2},
+            {"theta_E": 0.2, "center_x": 0, "center_y": -0.4},
+            {"theta_E": 1.0, "e1": 0.1, "e2": -0.05, "center_x": 0, "center_y": 0},
+            {"theta_E": 0.1, "center_x": 0.3, "center_y": 0.3},
+        ]
+        multi_plane = MultiPlaneBase(
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+            z_source_convention=1.5,
+        )
+        planes, _ = multi_plane._plane_schedule(0, 1.5)
+        assert len(planes) == 3
+        assert [len(plane[3]) for plane in planes] == [2, 2, 1]
+
+        x = np.linspace(-1, 1, 5)
+        y = np.linspace(1, -0.5, 5)
+        for z_start, z_stop, include_z_start in [
+            (0, 1.5, False),
+            (0.3, 1.5, False),
+            (0.3, 1.5, True),
+            (0.1, 0.5, False),
+            (0.5, 0.8, True),
+        ]:
+            x_, y_, alpha_x_, alpha_y_ = multi_plane.ray_shooting_partial_comoving(
+                x, y, x, y, z_start, z_stop, kwargs_lens, include_z_start
+            )
+            # deflections added one lens at a time
+            x_0, y_0 = np.array(x, dtype=float), np.array(y, dtype=float)
+            alpha_x, alpha_y = np.array(x, dtype=float), np.array(y, dtype=float)
+            z_last = z_start
+            for i, idex in enumerate(multi_plane.sorted_redshift_index):
+                z_lens = redshift_list[idex]
+                if multi_plane._start_condition(include_z_start, z_lens, z_start):
+                    if z_lens <= z_stop:
+                        x_0 += alpha_x * multi_plane._cosmo_bkg.T_xy(z_last, z_lens)
+                        y_0 += alpha_y * multi_plane._cosmo_bkg.T_xy(z_last, z_lens)
+                        alpha_x, alpha_y = multi_plane._add_deflection(
+                            x_0, y_0, alpha_x, alpha_y, kwargs_lens, i
+                        )
+                        z_last = z_lens
+            x_0 += alpha_x * multi_plane._cosmo_bkg.T_xy(z_last, z_stop)
+            y_0 += alpha_y * multi_plane._cosmo_bkg.T_xy(z_last, z_stop)
+            npt.assert_almost_equal(x_, x_0, decimal=10)
+            npt.assert_almost_equal(y_, y_0, decimal=10)
+            npt.assert_almost_equal(alpha_x_, alpha_x, decimal=10)
+            npt.assert_almost_equal(alpha_y_, alpha_y, decimal=10)
+
+        # least recently used schedules are evicted
+        for z_stop in np.linspace(0.9, 1.4, 40):
+            multi_plane._plane_schedule(0, z_stop)
+        assert len(multi_plane._plane_schedules) == 32
+        assert (0, 1.5, False) not in multi_plane._plane_schedules
+
+        # updated distances invalidate the schedules
+        multi_plane.T_ij_list = [2 * T_ij for T_ij in multi_plane.T_ij_list]
+        assert len(multi_plane._plane_schedules) == 0
+        planes_, _ = multi_plane._plane_schedule(0, 1.5)
+        npt.assert_almost_equal(planes_[1][0], 2 * planes[1][0], decimal=10)
+
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
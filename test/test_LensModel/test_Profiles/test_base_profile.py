@@ -1,4 +1,19 @@
-from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Profiles.base_profile import (
+    LensProfileBase,
+    finite_difference_jacobian,
+)
+from lenstronomy.LensModel.Profiles.sis import SIS
+from lenstronomy.LensModel.Profiles.sie import SIE
+from lenstronomy.LensModel.Profiles.epl import EPL
+from lenstronomy.LensModel.Profiles.nfw import NFW
+from lenstronomy.LensModel.Profiles.shear import Shear
+from lenstronomy.LensModel.Profiles.convergence import Convergence
+from lenstronomy.LensModel.Profiles.multipole import Multipole
+from lenstronomy.LensModel.Profiles.gaussian_potential import Gaussian
+from lenstronomy.LensModel.Profiles.shapelet_pot_cartesian import CartShapelets
+import numpy as np
+import numpy.testing as npt
+import pytest
 import unittest
 
 
@@ -12,6 +27,83 @@ class TestBaseProfile(object):
         base.set_dynamic()
 
 
+@pytest.mark.parametrize(
+    "profile, kwargs",
+    [
+        (SIS(), {"theta_E": 1.2, "center_x": 0.1, "center_y": -0.2}),
+        (
+            SIE(),
+            {"theta_E": 1.2, "e1": 0.1, "e2": -0.05, "center_x": 0.1, "center_y": 0},
+        ),
+        (
+            EPL(),
+            {
+                "theta_E": 1.2,
+                "gamma": 2.2,
+                "e1": 0.1,
+                "e2": -0.05,
+                "center_x": 0.1,
+                "center_y": 0,
+            },
+        ),
+        (NFW(), {"Rs": 2.0, "alpha_Rs": 0.5, "center_x": 0.1, "center_y": -0.2}),
+        (Shear(), {"gamma1": 0.05, "gamma2": -0.02, "ra_0": 0.1, "dec_0": 0.3}),
+        (Convergence(), {"kappa": 0.1, "ra_0": 0.1, "dec_0": 0.3}),
+        (
+            Multipole(),
+            {"m": 4, "a_m": 0.05, "phi_m": 0.3, "center_x": 0.1, "center_y": -0.2},
+        ),
+        (
+            Gaussian(),
+            {"amp": 1, "sigma_x": 1, "sigma_y": 1, "center_x": 0.1, "center_y": 0},
+        ),
+    ],
+)
+def test_derivatives_jacobian(profile, kwargs):
+    x = np.array([0.9, -0.7, 0.3, 1.5])
+    y = np.array([0.4, 0.8, -1.1, -0.2])
+    jacobian = profile.derivatives_jacobian(x, y, kwargs)
+    param_names = [
+        name for name in kwargs if name not in profile.non_differentiable_params
+    ]
+    assert sorted(jacobian.keys()) == sorted(param_names)
+    jacobian_num = finite_difference_jacobian(
+        profile.derivatives, x, y, kwargs, param_names, step=1e-5
+    )
+    for name in param_names:
+        npt.assert_allclose(jacobian[name][0], jacobian_num[name][0], atol=1e-6)
+        npt.assert_allclose(jacobian[name][1], jacobian_num[name][1], atol=1e-6)
+
+    jacobian = profile.derivatives_jacobian(
+        x[0], y[0], kwargs, param_names=param_names[:1]
+    )
+    assert list(jacobian.keys()) == param_names[:1]
+    npt.assert_allclose(
+        jacobian[param_names[0]][0], jacobian_num[param_names[0]][0][0], atol=1e-6
+    )
+
+
+def test_derivatives_jacobian_array_kwargs():
+    # array valued keyword arguments (here the shapelet coefficients) are not
+    # differentiated by default
+    profile = CartShapelets()
+    kwargs = {
+        "coeffs": np.array([1.0, 0.2, -0.1, 0.05, 0.1, 0.02]),
+        "beta": 1.5,
+        "center_x": 0.1,
+        "center_y": -0.2,
+    }
+    x = np.array([0.9, -0.7, 0.3, 1.5])
+    y = np.array([0.4, 0.8, -1.1, -0.2])
+    jacobian = profile.derivatives_jacobian(x, y, kwargs)
+    assert sorted(jacobian.keys()) == ["beta", "center_x", "center_y"]
+    jacobian_num = finite_difference_jacobian(
+        profile.derivatives, x, y, kwargs, ["beta"], step=1e-5
+    )
+    npt.assert_allclose(jacobian["beta"][0], jacobian_num["beta"][0], atol=1e-6)
+    npt.assert_allclose(jacobian["beta"][1], jacobian_num["beta"][1], atol=1e-6)
+
+
 class TestRaise(unittest.TestCase):
     def test_raise(self):
         base = LensProfileBase()
@@ -27,3 +119,13 @@ class TestRaise(unittest.TestCase):
             base.mass_3d_lens()
         with self.assertRaises(ValueError):
             base.mass_2d_lens()
+
+    def test_raise_static(self):
+        epl = EPL()
+        kwargs = {"theta_E": 1, "gamma": 2, "e1": 0.1, "e2": 0, "center_x": 0}
+        epl.set_static(**kwargs)
+        with self.assertRaises(ValueError):
+            epl.derivatives_jacobian(1.0, 1.0, kwargs)
+        # analytic derivatives are available for a static profile
+        jacobian = epl.derivatives_jacobian(1.0, 1.0, kwargs, param_names=["theta_E"])
+        assert "theta_E" in jacobian
@@ -158,6 +158,39 @@ class TestEPLvsNIE(object):
         npt.assert_almost_equal(f_xy, 0)
         npt.assert_almost_equal(f_yx, 0)
 
+    def test_series_tolerance(self):
+        from lenstronomy.LensModel.Profiles.epl import EPL
+
+        epl_hyp2f1 = EPL(series_tol=None)
+        x, y = util.make_grid(numPix=20, deltapix=0.2)
+        x, y = np.append(x, 0), np.append(y, 0)
+        for gamma in [1.6, 2.0, 2.4]:
+            for q in [1.0, 0.9, 0.5, 0.15]:
+                e1, e2 = param_util.phi_q2_ellipticity(0.4, q)
+                kwargs = {"theta_E": 1.2, "gamma": gamma, "e1": e1, "e2": e2}
+                f_x, f_y = self.EPL.derivatives(x, y, **kwargs)
+                f_x_, f_y_ = epl_hyp2f1.derivatives(x, y, **kwargs)
+                npt.assert_almost_equal(f_x, f_x_, decimal=12)
+                npt.assert_almost_equal(f_y, f_y_, decimal=12)
+
+        # coarser tolerance with fewer terms
+        e1, e2 = param_util.phi_q2_ellipticity(0.4, 0.5)
+        kwargs = {"theta_E": 1.2, "gamma": 2.2, "e1": e1, "e2": e2}
+        epl_coarse = EPL(series_tol=1e-4)
+        f_x, f_y = epl_coarse.derivatives(x, y, **kwargs)
+        f_x_, f_y_ = epl_hyp2f1.derivatives(x, y, **kwargs)
+        npt.assert_allclose(f_x, f_x_, atol=1e-4 * 1.2)
+        assert len(epl_coarse.epl_major_axis._coefficients) < len(
+            self.EPL.epl_major_axis._series_coefficients(1.2, 0.5)
+        )
+
+        # axis ratios requiring more than max_order terms use scipy.special.hyp2f1
+        epl_max = EPL(max_order=5)
+        f_x, f_y = epl_max.derivatives(x, y, **kwargs)
+        assert epl_max.epl_major_axis._coefficients is None
+        npt.assert_almost_equal(f_x, f_x_, decimal=12)
+        npt.assert_almost_equal(f_y, f_y_, decimal=12)
+
 
 class TestEPLvsPEMD(object):
     """Test EPL model vs PEMD with FASTELL This tests get only executed if fastell is
@@ -112,6 +112,34 @@ class TestGNFW(object):
         npt.assert_almost_equal(f_yy_nfw, f_yy_gnfw, decimal=2)
         npt.assert_almost_equal(f_xy_nfw, f_xy_gnfw, decimal=2)
 
+    def test_tabulated(self, monkeypatch, tmp_path):
+        from lenstronomy.Conf import config_loader
+
+        monkeypatch.setattr(config_loader, "user_table_directory", str(tmp_path))
+        gnfw_tabulated = GNFW(tabulated=True)
+        x, y = np.meshgrid(np.linspace(-3, 3, 15), np.linspace(-3, 3, 15))
+        x, y = x.ravel(), y.ravel()
+        for gamma_in in [0.3, 1, 1.7, 2.5]:
+            kwargs = {"Rs": 1.2, "kappa_s": 0.4, "gamma_in": gamma_in}
+            f_x, f_y = self.gnfw.derivatives(x, y, **kwargs)
+            f_x_tab, f_y_tab = gnfw_tabulated.derivatives(x, y, **kwargs)
+            npt.assert_allclose(f_x_tab, f_x, rtol=1e-5, atol=1e-10)
+            npt.assert_allclose(f_y_tab, f_y, rtol=1e-5, atol=1e-10)
+            hessian = self.gnfw.hessian(x + 0.01, y, **kwargs)
+            hessian_tab = gnfw_tabulated.hessian(x + 0.01, y, **kwargs)
+            for value, value_tab in zip(hessian, hessian_tab):
+                npt.assert_allclose(value_tab, value, rtol=1e-5, atol=1e-8)
+
+        # outside the tabulated range in R/Rs
+        kwargs = {"Rs": 1e-5, "kappa_s": 0.4, "gamma_in": 1.5}
+        f_x, f_y = self.gnfw.derivatives(1.0, 2.0, **kwargs)
+        f_x_tab, f_y_tab = gnfw_tabulated.derivatives(1.0, 2.0, **kwargs)
+        npt.assert_allclose(f_x_tab, f_x, rtol=1e-6)
+
+        # validated interpolation error of the table
+        table = gnfw_tabulated._tables["_alpha_integrand"]
+        assert table.error < 1e-6
+
     def test_density(self):
         """Tests `GNFW.density()`"""
         R = 1
@@ -0,0 +1,59 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.Profiles.hernquist_ellipse_cse import HernquistEllipseCSE
+from lenstronomy.LensModel.Profiles.hernquist_ellipse_cse_numba import (
+    HernquistEllipseCSE_numba,
+)
+
+
+class TestHernquistEllipseCSE_numba(object):
+    def setup_method(self):
+        self.hernquist = HernquistEllipseCSE()
+        self.hernquist_numba = HernquistEllipseCSE_numba()
+        self.kwargs = {
+            "sigma0": 1.5,
+            "Rs": 0.8,
+            "e1": 0.1,
+            "e2": -0.2,
+            "center_x": 0.1,
+            "center_y": -0.05,
+        }
+        np.random.seed(42)
+        self.x = np.random.normal(0, 2, 1000)
+        self.y = np.random.normal(0, 2, 1000)
+
+    def test_derivatives(self):
+        f_x, f_y = self.hernquist.derivatives(self.x, self.y, **self.kwargs)
+        f_x_nb, f_y_nb = self.hernquist_numba.derivatives(self.x, self.y, **self.kwargs)
+        npt.assert_allclose(f_x_nb, f_x, rtol=1e-10, atol=1e-14)
+        npt.assert_allclose(f_y_nb, f_y, rtol=1e-10, atol=1e-14)
+
+    def test_hessian(self):
+        hessian = self.hernquist.hessian(self.x, self.y, **self.kwargs)
+        hessian_nb = self.hernquist_numba.hessian(self.x, self.y, **self.kwargs)
+        for value, value_nb in zip(hessian, hessian_nb):
+            npt.assert_allclose(value_nb, value, rtol=1e-8, atol=1e-12)
+
+    def test_parameter_range(self):
+        # random parameters within the default limits of the numpy profile
+        lower = self.hernquist.lower_limit_default
+        upper = self.hernquist.upper_limit_default
+        for i in range(20):
+            kwargs = {
+                key: np.random.uniform(lower[key], upper[key])
+                for key in self.hernquist.param_names
+            }
+            x, y = self.x + kwargs["center_x"], self.y + kwargs["center_y"]
+            for function in ["derivatives", "hessian"]:
+                values = getattr(self.hernquist, function)(x, y, **kwargs)
+                values_nb = getattr(self.hernquist_numba, function)(x, y, **kwargs)
+                for value, value_nb in zip(values, values_nb):
+                    npt.assert_allclose(
+                        value_nb, value, rtol=0, atol=1e-12 * np.max(np.abs(value))
+                    )
+
+
+if __name__ == "__main__":
+    pytest.main()
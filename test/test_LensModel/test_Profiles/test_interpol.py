@@ -2,10 +2,16 @@ __author__ = "sibirrer"
 import pytest
 import numpy as np
 import numpy.testing as npt
+import scipy.interpolate
 
 import lenstronomy.Util.util as util
 from lenstronomy.LensModel.Profiles.sis import SIS
-from lenstronomy.LensModel.Profiles.interpol import Interpol, InterpolScaled
+from lenstronomy.LensModel.Profiles.interpol import (
+    Interpol,
+    InterpolScaled,
+    save_interpol_kwargs,
+    load_interpol_kwargs,
+)
 
 
 class TestInterpol(object):
@@ -269,6 +275,77 @@ class TestInterpol(object):
         )
         npt.assert_almost_equal(alpha_x_shift, alpha_x, decimal=10)
 
+    @pytest.mark.parametrize(
+        "kwargs_spline",
+        [None, {"kx": 3, "ky": 3, "s": 0}, {"kx": 2, "ky": 3, "s": 0.1}],
+    )
+    def test_scipy_spline(self, kwargs_spline):
+        np.random.seed(41)
+        x_axes = np.linspace(-2, 2, 41)
+        y_axes = np.linspace(-3, 3, 57) + 0.005 * np.cumsum(np.random.rand(57))
+        kwargs_interp = {
+            "grid_interp_x": x_axes,
+            "grid_interp_y": y_axes,
+            "f_x": np.random.rand(57, 41),
+            "f_y": np.random.rand(57, 41),
+        }
+        if kwargs_spline is None:
+            kwargs_scipy = {"kx": 1, "ky": 1, "s": 0}
+        else:
+            kwargs_scipy = kwargs_spline
+        spline_x = scipy.interpolate.RectBivariateSpline(
+            y_axes, x_axes, kwargs_interp["f_x"], **kwargs_scipy
+        )
+        spline_y = scipy.interpolate.RectBivariateSpline(
+            y_axes, x_axes, kwargs_interp["f_y"], **kwargs_scipy
+        )
+        # positions inside and outside of the interpolation grid
+        x, y = np.random.uniform(-3, 3, (2, 1000))
+        interp_func = Interpol(kwargs_spline=kwargs_spline)
+        f_x, f_y = interp_func.derivatives(x, y, **kwargs_interp)
+        npt.assert_almost_equal(f_x, spline_x(y, x, grid=False), decimal=14)
+        npt.assert_almost_equal(f_y, spline_y(y, x, grid=False), decimal=14)
+        f_x, f_y = interp_func.derivatives(x.reshape(10, 100), y.reshape(10, 100))
+        assert f_x.shape == (10, 100)
+
+        # evaluation on a regular grid
+        interp_func = Interpol(grid=True, kwargs_spline=kwargs_spline)
+        x_grid, y_grid = util.make_grid(20, 0.3)
+        f_x, f_y = interp_func.derivatives(x_grid, y_grid, **kwargs_interp)
+        x_, y_ = util.get_axes(x_grid, y_grid)
+        npt.assert_almost_equal(f_x, util.image2array(spline_x(y_, x_)), decimal=14)
+        f_y_grid = interp_func.f_y_interp(x_, y_, grid=True)
+        npt.assert_almost_equal(f_y_grid, spline_y(y_, x_), decimal=14)
+
+    def test_memory_map(self, tmp_path):
+        numPix = 101
+        deltaPix = 0.1
+        x_grid_interp, y_grid_interp = util.make_grid(numPix, deltaPix)
+        sis = SIS()
+        kwargs_SIS = {"theta_E": 1.0, "center_x": 0.5, "center_y": -0.5}
+        f_x_sis, f_y_sis = sis.derivatives(x_grid_interp, y_grid_interp, **kwargs_SIS)
+        x_axes, y_axes = util.get_axes(x_grid_interp, y_grid_interp)
+        kwargs_interp = {
+            "grid_interp_x": x_axes,
+            "grid_interp_y": y_axes,
+            "f_x": util.array2image(f_x_sis),
+            "f_y": util.array2image(f_y_sis),
+        }
+        save_interpol_kwargs(str(tmp_path), kwargs_interp)
+        kwargs_mmap = load_interpol_kwargs(str(tmp_path))
+        assert set(kwargs_mmap.keys()) == set(kwargs_interp.keys())
+        assert isinstance(kwargs_mmap["f_x"], np.memmap)
+
+        x, y = np.random.uniform(-4, 4, (2, 100))
+        f_x, f_y = Interpol().derivatives(x, y, **kwargs_interp)
+        f_x_, f_y_ = Interpol().derivatives(x, y, **kwargs_mmap)
+        npt.assert_almost_equal(f_x_, f_x, decimal=14)
+        npt.assert_almost_equal(f_y_, f_y, decimal=14)
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            Interpol().derivatives(1, 1)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,67 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.Profiles.multipole import Multipole
+from lenstronomy.LensModel.Profiles.multipole_numba import Multipole_numba
+
+
+class TestMultipole_numba(object):
+    def setup_method(self):
+        self.multipole = Multipole()
+        self.multipole_numba = Multipole_numba()
+        np.random.seed(42)
+        self.x = np.random.normal(0, 2, 1000)
+        self.y = np.random.normal(0, 2, 1000)
+
+    def test_derivatives(self):
+        for m in [2, 3, 4]:
+            kwargs = {
+                "m": m,
+                "a_m": 0.05,
+                "phi_m": 0.3,
+                "center_x": 0.1,
+                "center_y": -0.2,
+            }
+            f_x, f_y = self.multipole.derivatives(self.x, self.y, **kwargs)
+            f_x_nb, f_y_nb = self.multipole_numba.derivatives(self.x, self.y, **kwargs)
+            npt.assert_almost_equal(f_x_nb, f_x, decimal=12)
+            npt.assert_almost_equal(f_y_nb, f_y, decimal=12)
+
+    def test_hessian(self):
+        kwargs = {"m": 4, "a_m": 0.05, "phi_m": 0.3, "center_x": 0.1, "center_y": -0.2}
+        x = np.append(self.x, 0.1)
+        y = np.append(self.y, -0.2)
+        hessian = self.multipole.hessian(x, y, **kwargs)
+        hessian_nb = self.multipole_numba.hessian(x, y, **kwargs)
+        for value, value_nb in zip(hessian, hessian_nb):
+            npt.assert_allclose(value_nb, value, rtol=1e-12, atol=1e-12)
+
+        f_xx, f_xy, f_yx, f_yy = self.multipole_numba.hessian(1.0, 2.0, **kwargs)
+        f_xx_, f_xy_, f_yx_, f_yy_ = self.multipole.hessian(1.0, 2.0, **kwargs)
+        npt.assert_almost_equal(f_xx, f_xx_, decimal=12)
+        npt.assert_almost_equal(f_xy, f_xy_, decimal=12)
+
+    def test_parameter_range(self):
+        # random parameters within the default limits of the numpy profile, with the
+        # order m drawn from the lowest ten integer values
+        lower = self.multipole.lower_limit_default
+        upper = self.multipole.upper_limit_default
+        for i in range(20):
+            kwargs = {
+                key: np.random.uniform(lower[key], upper[key])
+                for key in self.multipole.param_names
+            }
+            kwargs["m"] = np.random.randint(lower["m"], lower["m"] + 10)
+            x, y = self.x + kwargs["center_x"], self.y + kwargs["center_y"]
+            for function in ["derivatives", "hessian"]:
+                values = getattr(self.multipole, function)(x, y, **kwargs)
+                values_nb = getattr(self.multipole_numba, function)(x, y, **kwargs)
+                for value, value_nb in zip(values, values_nb):
+                    npt.assert_allclose(
+                        value_nb, value, rtol=0, atol=1e-12 * np.max(np.abs(value))
+                    )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,70 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.Profiles.nfw_ellipse_cse import NFW_ELLIPSE_CSE
+from lenstronomy.LensModel.Profiles.nfw_ellipse_cse_numba import (
+    NFW_ELLIPSE_CSE_numba,
+)
+
+
+class TestNFW_ELLIPSE_CSE_numba(object):
+    def setup_method(self):
+        self.kwargs = {
+            "Rs": 1.5,
+            "alpha_Rs": 0.5,
+            "e1": 0.1,
+            "e2": -0.2,
+            "center_x": 0.1,
+            "center_y": -0.05,
+        }
+        np.random.seed(42)
+        self.x = np.random.normal(0, 2, 1000)
+        self.y = np.random.normal(0, 2, 1000)
+
+    @pytest.mark.parametrize("high_accuracy", [True, False])
+    def test_derivatives(self, high_accuracy):
+        nfw = NFW_ELLIPSE_CSE(high_accuracy=high_accuracy)
+        nfw_numba = NFW_ELLIPSE_CSE_numba(high_accuracy=high_accuracy)
+        f_x, f_y = nfw.derivatives(self.x, self.y, **self.kwargs)
+        f_x_nb, f_y_nb = nfw_numba.derivatives(self.x, self.y, **self.kwargs)
+        npt.assert_allclose(f_x_nb, f_x, rtol=1e-10, atol=1e-14)
+        npt.assert_allclose(f_y_nb, f_y, rtol=1e-10, atol=1e-14)
+
+        f_x, f_y = nfw_numba.derivatives(1.0, 2.0, **self.kwargs)
+        f_x_, f_y_ = nfw.derivatives(1.0, 2.0, **self.kwargs)
+        npt.assert_almost_equal(f_x, f_x_, decimal=12)
+        npt.assert_almost_equal(f_y, f_y_, decimal=12)
+
+    @pytest.mark.parametrize("high_accuracy", [True, False])
+    def test_hessian(self, high_accuracy):
+        nfw = NFW_ELLIPSE_CSE(high_accuracy=high_accuracy)
+        nfw_numba = NFW_ELLIPSE_CSE_numba(high_accuracy=high_accuracy)
+        hessian = nfw.hessian(self.x, self.y, **self.kwargs)
+        hessian_nb = nfw_numba.hessian(self.x, self.y, **self.kwargs)
+        for value, value_nb in zip(hessian, hessian_nb):
+            npt.assert_allclose(value_nb, value, rtol=1e-8, atol=1e-12)
+
+    @pytest.mark.parametrize("high_accuracy", [True, False])
+    def test_parameter_range(self, high_accuracy):
+        # random parameters within the default limits of the numpy profile
+        nfw = NFW_ELLIPSE_CSE(high_accuracy=high_accuracy)
+        nfw_numba = NFW_ELLIPSE_CSE_numba(high_accuracy=high_accuracy)
+        lower, upper = nfw.lower_limit_default, nfw.upper_limit_default
+        for i in range(20):
+            kwargs = {
+                key: np.random.uniform(lower[key], upper[key])
+                for key in nfw.param_names
+            }
+            x, y = self.x + kwargs["center_x"], self.y + kwargs["center_y"]
+            for function in ["derivatives", "hessian"]:
+                values = getattr(nfw, function)(x, y, **kwargs)
+                values_nb = getattr(nfw_numba, function)(x, y, **kwargs)
+                for value, value_nb in zip(values, values_nb):
+                    npt.assert_allclose(
+                        value_nb, value, rtol=0, atol=1e-12 * np.max(np.abs(value))
+                    )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,134 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.Profiles.nie import NIE
+from lenstronomy.LensModel.Profiles.sie import SIE
+from lenstronomy.LensModel.Profiles.nie_numba import NIE_numba, SIE_numba
+
+
+class TestNIE_numba(object):
+    def setup_method(self):
+        self.nie = NIE()
+        self.nie_numba = NIE_numba()
+        self.kwargs = {
+            "theta_E": 1.2,
+            "e1": 0.1,
+            "e2": -0.2,
+            "s_scale": 0.05,
+            "center_x": 0.1,
+            "center_y": -0.05,
+        }
+        np.random.seed(42)
+        self.x = np.random.normal(0, 2, 1000)
+        self.y = np.random.normal(0, 2, 1000)
+
+    def test_derivatives(self):
+        f_x, f_y = self.nie.derivatives(self.x, self.y, **self.kwargs)
+        f_x_nb, f_y_nb = self.nie_numba.derivatives(self.x, self.y, **self.kwargs)
+        npt.assert_almost_equal(f_x_nb, f_x, decimal=12)
+        npt.assert_almost_equal(f_y_nb, f_y, decimal=12)
+
+        # shape of the input is preserved
+        f_x, f_y = self.nie_numba.derivatives(1.0, 2.0, **self.kwargs)
+        assert isinstance(f_x, float)
+        f_x_, f_y_ = self.nie.derivatives(1.0, 2.0, **self.kwargs)
+        npt.assert_almost_equal(f_x, f_x_, decimal=12)
+        f_x, f_y = self.nie_numba.derivatives(
+            self.x.reshape(10, 100), self.y.reshape(10, 100), **self.kwargs
+        )
+        assert f_x.shape == (10, 100)
+
+        # circular limit
+        kwargs = dict(self.kwargs, e1=0, e2=0)
+        f_x, f_y = self.nie.derivatives(self.x, self.y, **kwargs)
+        f_x_nb, f_y_nb = self.nie_numba.derivatives(self.x, self.y, **kwargs)
+        npt.assert_almost_equal(f_x_nb, f_x, decimal=8)
+        npt.assert_almost_equal(f_y_nb, f_y, decimal=8)
+
+    def test_hessian(self):
+        f_xx, f_xy, f_yx, f_yy = self.nie_numba.hessian(self.x, self.y, **self.kwargs)
+        npt.assert_almost_equal(f_xy, f_yx, decimal=12)
+
+        # analytic Hessian against central differences of the deflection angles
+        diff = 1e-6
+        f_x_dx, f_y_dx = self.nie_numba.derivatives(
+            self.x + diff, self.y, **self.kwargs
+        )
+        f_x_dx_, f_y_dx_ = self.nie_numba.derivatives(
+            self.x - diff, self.y, **self.kwargs
+        )
+        f_x_dy, f_y_dy = self.nie_numba.derivatives(
+            self.x, self.y + diff, **self.kwargs
+        )
+        f_x_dy_, f_y_dy_ = self.nie_numba.derivatives(
+            self.x, self.y - diff, **self.kwargs
+        )
+        npt.assert_almost_equal(f_xx, (f_x_dx - f_x_dx_) / (2 * diff), decimal=7)
+        npt.assert_almost_equal(f_xy, (f_x_dy - f_x_dy_) / (2 * diff), decimal=7)
+        npt.assert_almost_equal(f_yx, (f_y_dx - f_y_dx_) / (2 * diff), decimal=7)
+        npt.assert_almost_equal(f_yy, (f_y_dy - f_y_dy_) / (2 * diff), decimal=7)
+
+        # consistent with the finite differences of the numpy implementation
+        f_xx_, f_xy_, f_yx_, f_yy_ = self.nie.hessian(self.x, self.y, **self.kwargs)
+        npt.assert_almost_equal(f_xx, f_xx_, decimal=4)
+        npt.assert_almost_equal(f_xy, f_xy_, decimal=4)
+        npt.assert_almost_equal(f_yy, f_yy_, decimal=4)
+
+    def test_static(self):
+        self.nie_numba.set_static(**self.kwargs)
+        kwargs = dict(self.kwargs, theta_E=2.0)
+        f_x, f_y = self.nie_numba.derivatives(self.x, self.y, **kwargs)
+        self.nie_numba.set_dynamic()
+        f_x_, f_y_ = self.nie_numba.derivatives(self.x, self.y, **self.kwargs)
+        npt.assert_almost_equal(f_x, f_x_, decimal=12)
+
+    def test_parameter_range(self):
+        # random parameters within the default limits of the numpy profile
+        lower, upper = self.nie.lower_limit_default, self.nie.upper_limit_default
+        diff = 1e-6
+        for i in range(20):
+            kwargs = {
+                key: np.random.uniform(lower[key], upper[key])
+                for key in self.nie.param_names
+            }
+            x, y = self.x + kwargs["center_x"], self.y + kwargs["center_y"]
+            f_x, f_y = self.nie.derivatives(x, y, **kwargs)
+            f_x_nb, f_y_nb = self.nie_numba.derivatives(x, y, **kwargs)
+            npt.assert_allclose(f_x_nb, f_x, rtol=0, atol=1e-12 * np.max(np.abs(f_x)))
+            npt.assert_allclose(f_y_nb, f_y, rtol=0, atol=1e-12 * np.max(np.abs(f_y)))
+
+            f_xx, f_xy, f_yx, f_yy = self.nie_numba.hessian(x, y, **kwargs)
+            f_x_dx, f_y_dx = self.nie.derivatives(x + diff, y, **kwargs)
+            f_x_dx_, f_y_dx_ = self.nie.derivatives(x - diff, y, **kwargs)
+            f_x_dy, f_y_dy = self.nie.derivatives(x, y + diff, **kwargs)
+            f_x_dy_, f_y_dy_ = self.nie.derivatives(x, y - diff, **kwargs)
+            for value, value_diff in [
+                (f_xx, (f_x_dx - f_x_dx_) / (2 * diff)),
+                (f_xy, (f_x_dy - f_x_dy_) / (2 * diff)),
+                (f_yy, (f_y_dy - f_y_dy_) / (2 * diff)),
+            ]:
+                npt.assert_allclose(
+                    value, value_diff, rtol=0, atol=1e-6 * np.max(np.abs(f_xx + f_yy))
+                )
+
+
+class TestSIE_numba(object):
+    def setup_method(self):
+        self.sie = SIE(NIE=True)
+        self.sie_numba = SIE_numba()
+
+    def test_derivatives(self):
+        x, y = np.array([1.0, -0.5, 2.0]), np.array([0.3, 1.5, -1])
+        kwargs = {"theta_E": 1.0, "e1": 0.2, "e2": 0.05}
+        f_x, f_y = self.sie.derivatives(x, y, **kwargs)
+        f_x_nb, f_y_nb = self.sie_numba.derivatives(x, y, **kwargs)
+        npt.assert_almost_equal(f_x_nb, f_x, decimal=12)
+        npt.assert_almost_equal(f_y_nb, f_y, decimal=12)
+        f_xx, f_xy, f_yx, f_yy = self.sie_numba.hessian(x, y, **kwargs)
+        f_xx_, f_xy_, f_yx_, f_yy_ = self.sie.hessian(x, y, **kwargs)
+        npt.assert_almost_equal(f_xx + f_yy, f_xx_ + f_yy_, decimal=4)
+
+
+if __name__ == "__main__":
+    pytest.main()
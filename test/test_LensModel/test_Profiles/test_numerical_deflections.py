@@ -210,6 +210,21 @@ class TestNumericalAlpha(object):
                 L = len(diff)
                 npt.assert_almost_equal(np.sum(diff) * L**-1, 1, 6)
 
+    def test_hessian_custom_method(self):
+        # a hessian() method of a user-defined class is not assumed to follow the
+        # conventions of the lens profiles, the finite differences are used instead
+        class TestClassHessian(TestClass):
+            def hessian(self, x, y, **kwargs):
+                raise ValueError("unrelated method")
+
+        kwargs = {"norm": 2, "Rs": 10.0, "center_x": -1.2, "center_y": 0.46}
+        x, y = np.array([10.0, 5.0]), np.array([2.0, 15.0])
+        hessian = TabulatedDeflections(custom_class=TestClass()).hessian(x, y, **kwargs)
+        numerical_alpha = TabulatedDeflections(custom_class=TestClassHessian())
+        hessian_ = numerical_alpha.hessian(x, y, **kwargs)
+        for value, value_ in zip(hessian, hessian_):
+            npt.assert_almost_equal(value_, value, decimal=12)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,53 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.Profiles.shear import Shear
+from lenstronomy.LensModel.Profiles.shear_numba import Shear_numba
+
+
+class TestShear_numba(object):
+    def setup_method(self):
+        self.shear = Shear()
+        self.shear_numba = Shear_numba()
+        self.kwargs = {"gamma1": 0.03, "gamma2": -0.02, "ra_0": 0.1, "dec_0": -0.2}
+
+    def test_derivatives(self):
+        x = np.array([1.0, -0.5, 2.0])
+        y = np.array([0.3, 1.5, -1])
+        f_x, f_y = self.shear.derivatives(x, y, **self.kwargs)
+        f_x_nb, f_y_nb = self.shear_numba.derivatives(x, y, **self.kwargs)
+        npt.assert_almost_equal(f_x_nb, f_x, decimal=15)
+        npt.assert_almost_equal(f_y_nb, f_y, decimal=15)
+
+        f_x, f_y = self.shear.derivatives(1.0, 2.0, **self.kwargs)
+        f_x_nb, f_y_nb = self.shear_numba.derivatives(1.0, 2.0, **self.kwargs)
+        npt.assert_almost_equal(f_x_nb, f_x, decimal=15)
+        npt.assert_almost_equal(f_y_nb, f_y, decimal=15)
+
+    def test_hessian(self):
+        f_xx, f_xy, f_yx, f_yy = self.shear_numba.hessian(1.0, 2.0, **self.kwargs)
+        npt.assert_almost_equal(f_xx, 0.03, decimal=15)
+        npt.assert_almost_equal(f_xy, -0.02, decimal=15)
+        npt.assert_almost_equal(f_yy, -0.03, decimal=15)
+
+    def test_parameter_range(self):
+        # random parameters within the default limits of the numpy profile
+        lower, upper = self.shear.lower_limit_default, self.shear.upper_limit_default
+        np.random.seed(42)
+        for i in range(20):
+            kwargs = {
+                key: np.random.uniform(lower[key], upper[key])
+                for key in self.shear.param_names
+            }
+            x = np.random.normal(kwargs["ra_0"], 2, 100)
+            y = np.random.normal(kwargs["dec_0"], 2, 100)
+            for function in ["derivatives", "hessian"]:
+                values = getattr(self.shear, function)(x, y, **kwargs)
+                values_nb = getattr(self.shear_numba, function)(x, y, **kwargs)
+                for value, value_nb in zip(values, values_nb):
+                    npt.assert_allclose(value_nb, value, rtol=1e-14, atol=1e-14)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -3,7 +3,11 @@ __author__ = "sibirrer"
 import numpy.testing as npt
 import numpy as np
 import pytest
-from lenstronomy.LensModel.Solver.epl_shear_solver import caustics_epl_shear
+from lenstronomy.LensModel.Solver.epl_shear_solver import (
+    caustics_epl_shear,
+    solve_lenseq_pemd,
+    solve_lenseq_pemd_batch,
+)
 from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
 from lenstronomy.LensModel.lens_model import LensModel
 
@@ -355,6 +359,217 @@ class TestLensEquationSolver(object):
         npt.assert_almost_equal(sourcePos_x, source_x, decimal=10)
         npt.assert_almost_equal(sourcePos_y, source_y, decimal=10)
 
+    def test_analytical_batch(self):
+        lensModel = LensModel(["EPL_NUMBA", "SHEAR"])
+        kwargs_lens = [
+            {
+                "theta_E": 1.0,
+                "gamma": 2.2,
+                "center_x": 0.01,
+                "center_y": 0.02,
+                "e1": 0.01,
+                "e2": 0.05,
+            },
+            {"gamma1": -0.04, "gamma2": -0.1, "ra_0": 0.01, "dec_0": 0.02},
+        ]
+        np.random.seed(42)
+        pos = np.random.uniform(-0.2, 0.2, (2, 50))
+        x_pos, y_pos, num_images = solve_lenseq_pemd_batch(pos, kwargs_lens)
+        assert x_pos.shape == y_pos.shape == (50, np.max(num_images))
+        assert np.any(num_images >= 4)
+        for i in range(50):
+            x, y = solve_lenseq_pemd(pos[:, i], kwargs_lens)
+            assert num_images[i] == len(x)
+            npt.assert_almost_equal(x_pos[i, : num_images[i]], x, decimal=9)
+            npt.assert_almost_equal(y_pos[i, : num_images[i]], y, decimal=9)
+            assert np.all(np.isnan(x_pos[i, num_images[i] :]))
+            source_x, source_y = lensModel.ray_shooting(x, y, kwargs_lens)
+            npt.assert_almost_equal(source_x, pos[0, i], decimal=10)
+            npt.assert_almost_equal(source_y, pos[1, i], decimal=10)
+
+        x_pos_, y_pos_ = solve_lenseq_pemd(pos, kwargs_lens)
+        npt.assert_almost_equal(x_pos_, x_pos, decimal=12)
+        npt.assert_almost_equal(y_pos_, y_pos, decimal=12)
+
+    def test_vectorized(self):
+        lensModel = LensModel(["EPL", "SHEAR", "NFW"])
+        lensEquationSolver = LensEquationSolver(lensModel)
+        kwargs_lens = [
+            {"theta_E": 1.0, "gamma": 2.1, "e1": 0.2, "e2": 0.05},
+            {"gamma1": 0.05, "gamma2": -0.02},
+            {"Rs": 0.3, "alpha_Rs": 0.05, "center_x": 0.8, "center_y": 0.4},
+        ]
+        np.random.seed(42)
+        source_x, source_y = np.random.uniform(-0.15, 0.15, (2, 10))
+        x_list, y_list = lensEquationSolver.image_position_lenstronomy_batch(
+            source_x, source_y, kwargs_lens, min_distance=0.05, search_window=5
+        )
+        assert len(x_list) == 10
+        for i in range(10):
+            x_pos, y_pos = lensEquationSolver.image_position_from_source(
+                source_x[i],
+                source_y[i],
+                kwargs_lens,
+                min_distance=0.05,
+                search_window=5,
+            )
+            x_pos_, y_pos_ = lensEquationSolver.image_position_from_source(
+                source_x[i],
+                source_y[i],
+                kwargs_lens,
+                min_distance=0.05,
+                search_window=5,
+                vectorized=True,
+            )
+            npt.assert_almost_equal(x_pos_, x_pos, decimal=8)
+            npt.assert_almost_equal(y_pos_, y_pos, decimal=8)
+            npt.assert_almost_equal(x_list[i], x_pos, decimal=8)
+            npt.assert_almost_equal(y_list[i], y_pos, decimal=8)
+            beta_x, beta_y = lensModel.ray_shooting(x_list[i], y_list[i], kwargs_lens)
+            npt.assert_almost_equal(beta_x, source_x[i], decimal=10)
+            npt.assert_almost_equal(beta_y, source_y[i], decimal=10)
+
+        # magnification limit and random starting points
+        x_list_, y_list_ = lensEquationSolver.image_position_lenstronomy_batch(
+            source_x[:2],
+            source_y[:2],
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=5,
+            num_random=5,
+            magnification_limit=1e5,
+        )
+        assert len(x_list_[0]) == 0
+        assert len(x_list_[1]) == 0
+
+        # multi-plane lens model
+        lensModel = LensModel(
+            ["SIS", "SIS"],
+            multi_plane=True,
+            lens_redshift_list=[0.5, 0.8],
+            z_source=1.5,
+        )
+        lensEquationSolver = LensEquationSolver(lensModel)
+        kwargs_lens = [
+            {"theta_E": 1.0, "center_x": 0, "center_y": 0},
+            {"theta_E": 0.2, "center_x": 0.5, "center_y": 0.1},
+        ]
+        x_list, y_list = lensEquationSolver.image_position_lenstronomy_batch(
+            [0.1, 0.05], [-0.05, 0.1], kwargs_lens, min_distance=0.05
+        )
+        for i, (x_pos, y_pos) in enumerate(zip(x_list, y_list)):
+            x_pos_, y_pos_ = lensEquationSolver.findBrightImage(
+                [0.1, 0.05][i],
+                [-0.05, 0.1][i],
+                kwargs_lens,
+                numImages=len(x_pos),
+                min_distance=0.05,
+                search_window=10,
+                num_iter_max=100,
+                vectorized=True,
+            )
+            npt.assert_almost_equal(np.sort(x_pos_), np.sort(x_pos), decimal=8)
+
+    def test_hierarchical(self):
+        lensModel = LensModel(["EPL", "SHEAR", "NFW"])
+        lensEquationSolver = LensEquationSolver(lensModel)
+        kwargs_lens = [
+            {"theta_E": 1.0, "gamma": 2.1, "e1": 0.2, "e2": 0.05},
+            {"gamma1": 0.05, "gamma2": -0.02},
+            {"Rs": 0.3, "alpha_Rs": 0.05, "center_x": 0.8, "center_y": 0.4},
+        ]
+        np.random.seed(42)
+        source_x, source_y = np.random.uniform(-0.15, 0.15, (2, 10))
+        for i in range(10):
+            x_pos, y_pos = lensEquationSolver.image_position_from_source(
+                source_x[i],
+                source_y[i],
+                kwargs_lens,
+                min_distance=0.05,
+                search_window=5,
+            )
+            x_pos_, y_pos_ = lensEquationSolver.image_position_from_source(
+                source_x[i],
+                source_y[i],
+                kwargs_lens,
+                min_distance=0.05,
+                search_window=5,
+                hierarchical=True,
+                reuse_mesh=True,
+            )
+            npt.assert_almost_equal(x_pos_, x_pos, decimal=8)
+            npt.assert_almost_equal(y_pos_, y_pos, decimal=8)
+
+        # the refinement ray-shoots a fraction of the full grid and is reused
+        mesh = lensEquationSolver._mesh[1]
+        num_ray_shooting = mesh.num_ray_shooting
+        assert num_ray_shooting < 0.2 * 100**2
+        lensEquationSolver.candidate_solutions(
+            source_x[0],
+            source_y[0],
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=5,
+            hierarchical=True,
+            reuse_mesh=True,
+        )
+        assert lensEquationSolver._mesh[1] is mesh
+        assert mesh.num_ray_shooting == num_ray_shooting
+        kwargs_lens[0]["theta_E"] = 1.1
+        lensEquationSolver.candidate_solutions(
+            source_x[0],
+            source_y[0],
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=5,
+            hierarchical=True,
+            reuse_mesh=True,
+        )
+        assert lensEquationSolver._mesh[1] is not mesh
+
+        x_list, y_list = lensEquationSolver.image_position_lenstronomy_batch(
+            source_x, source_y, kwargs_lens, min_distance=0.05, search_window=5
+        )
+        x_list_, y_list_ = lensEquationSolver.image_position_lenstronomy_batch(
+            source_x,
+            source_y,
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=5,
+            hierarchical=True,
+        )
+        for i in range(10):
+            npt.assert_almost_equal(x_list_[i], x_list[i], decimal=8)
+            npt.assert_almost_equal(y_list_[i], y_list[i], decimal=8)
+
+        # multi-plane lens model
+        lensModel = LensModel(
+            ["SIE", "SIS", "SHEAR"],
+            multi_plane=True,
+            lens_redshift_list=[0.5, 0.8, 0.5],
+            z_source=2,
+        )
+        lensEquationSolver = LensEquationSolver(lensModel)
+        kwargs_lens = [
+            {"theta_E": 1, "e1": 0.1, "e2": -0.2},
+            {"theta_E": 0.2, "center_x": -0.8, "center_y": 0.5},
+            {"gamma1": 0.03, "gamma2": -0.04},
+        ]
+        x_pos, y_pos = lensEquationSolver.findBrightImage(
+            -0.22, 0.14, kwargs_lens, min_distance=0.05, search_window=5
+        )
+        x_pos_, y_pos_ = lensEquationSolver.findBrightImage(
+            -0.22,
+            0.14,
+            kwargs_lens,
+            min_distance=0.05,
+            search_window=5,
+            hierarchical=True,
+        )
+        assert len(x_pos) == 4
+        npt.assert_almost_equal(x_pos_, x_pos, decimal=8)
+        npt.assert_almost_equal(y_pos_, y_pos, decimal=8)
+
     def test_assertions(self):
         lensModel = LensModel(["SPEP"])
         lensEquationSolver = LensEquationSolver(lensModel)
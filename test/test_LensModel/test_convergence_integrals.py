@@ -1,8 +1,11 @@
 from lenstronomy.LensModel import convergence_integrals
 import lenstronomy.Util.util as util
 from lenstronomy.LensModel.Profiles.sis import SIS
+import numpy as np
 import numpy.testing as npt
 import pytest
+import scipy.signal
+import unittest
 
 
 class TestConvergenceIntegrals(object):
@@ -213,6 +216,73 @@ class TestConvergenceIntegrals(object):
         x1, y1 = 500, 550
         npt.assert_almost_equal(f_x[x1, y1], f_x_num[x1, y1], decimal=2)
 
+    @pytest.mark.parametrize("shape", [(40, 40), (41, 41), (30, 45), (45, 30)])
+    def test_fftconvolve(self, shape):
+        np.random.seed(42)
+        kappa = np.random.rand(*shape)
+        grid_spacing = 0.03
+        num_pix = len(kappa) * 2 + 1
+        kernel_x, kernel_y = convergence_integrals.deflection_kernel(
+            num_pix, grid_spacing
+        )
+        kernel = convergence_integrals.potential_kernel(num_pix, grid_spacing)
+        norm = grid_spacing**2 / np.pi
+        f_x, f_y = convergence_integrals.deflection_from_kappa_grid(kappa, grid_spacing)
+        f_ = convergence_integrals.potential_from_kappa_grid(kappa, grid_spacing)
+        for f_num, kernel_ in [(f_x, kernel_x), (f_y, kernel_y), (f_, kernel)]:
+            f_ref = scipy.signal.fftconvolve(kappa, kernel_, mode="same") * norm
+            npt.assert_allclose(f_num, f_ref, rtol=1e-12, atol=1e-14)
+
+    def test_kappa_grid_solver(self):
+        sis = SIS()
+        deltaPix = 0.02
+        numPix = 200
+        x_grid, y_grid = util.make_grid(numPix=numPix, deltapix=deltaPix)
+        kwargs_sis = {"theta_E": 1.0, "center_x": 0, "center_y": 0}
+        f_xx, _, _, f_yy = sis.hessian(x_grid, y_grid, **kwargs_sis)
+        kappa = util.array2image((f_xx + f_yy) / 2.0)
+
+        solver = convergence_integrals.KappaGridSolver(numPix, deltaPix)
+        f_, f_x, f_y = solver.solve(kappa)
+        f_x_, f_y_ = convergence_integrals.deflection_from_kappa_grid(kappa, deltaPix)
+        npt.assert_almost_equal(f_x, f_x_, decimal=12)
+        npt.assert_almost_equal(f_y, f_y_, decimal=12)
+        f_x_, f_y_ = solver.deflection(kappa)
+        npt.assert_almost_equal(f_x, f_x_, decimal=12)
+        npt.assert_almost_equal(
+            solver.potential(kappa),
+            convergence_integrals.potential_from_kappa_grid(kappa, deltaPix),
+            decimal=12,
+        )
+
+        # batch of convergence maps
+        kappa_batch = np.array([kappa, 2 * kappa, kappa.T])
+        f_x_batch, f_y_batch = solver.deflection(kappa_batch)
+        assert f_x_batch.shape == (3, numPix, numPix)
+        npt.assert_almost_equal(f_x_batch[0], f_x, decimal=12)
+        npt.assert_almost_equal(f_x_batch[1], 2 * f_x, decimal=12)
+        npt.assert_almost_equal(f_x_batch[2], f_y.T, decimal=12)
+
+        # use as INTERPOL lens model
+        from lenstronomy.LensModel.lens_model import LensModel
+
+        kwargs_interp = solver.kwargs_interpol(kappa, center_x=0.1, center_y=-0.1)
+        lens_model = LensModel(["INTERPOL"])
+        x, y = np.array([0.5, -0.8, 1.1]), np.array([0.3, 0.6, -0.2])
+        alpha_x, alpha_y = lens_model.alpha(x, y, [kwargs_interp])
+        alpha_x_true, alpha_y_true = sis.derivatives(x - 0.1, y + 0.1, **kwargs_sis)
+        npt.assert_almost_equal(alpha_x, alpha_x_true, decimal=1)
+        npt.assert_almost_equal(alpha_y, alpha_y_true, decimal=1)
+
+
+class TestRaise(unittest.TestCase):
+    def test_raise(self):
+        solver = convergence_integrals.KappaGridSolver(10, 0.1)
+        with self.assertRaises(ValueError):
+            solver.deflection(np.ones((11, 11)))
+        with self.assertRaises(ValueError):
+            solver.kwargs_interpol(np.ones((2, 10, 10)))
+
 
 if __name__ == "__main__":
     pytest.main()
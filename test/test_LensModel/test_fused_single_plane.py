@@ -0,0 +1,119 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.fused_single_plane import FusedSinglePlane, alpha_batch
+
+
+class TestFusedSinglePlane(object):
+    def setup_method(self):
+        np.random.seed(41)
+        self.lens_model_list, self.kwargs_lens = [], []
+        for i in range(5):
+            center_x, center_y = np.random.normal(size=2)
+            self.lens_model_list += ["SIS", "NFW", "TNFW", "POINT_MASS"]
+            self.kwargs_lens += [
+                {"theta_E": 0.05, "center_x": center_x, "center_y": center_y},
+                {
+                    "Rs": 0.5 + i * 0.1,
+                    "alpha_Rs": 0.05,
+                    "center_x": center_y,
+                    "center_y": center_x,
+                },
+                {
+                    "Rs": 0.3,
+                    "alpha_Rs": 0.03 + i * 0.01,
+                    "r_trunc": 2.0 + i,
+                    "center_x": -center_x,
+                    "center_y": center_y,
+                },
+                {"theta_E": 0.02, "center_x": center_x, "center_y": -center_y},
+            ]
+        self.lens_model_list += ["SHEAR", "CONVERGENCE", "EPL", "SHEAR"]
+        self.kwargs_lens += [
+            {"gamma1": 0.03, "gamma2": -0.01},
+            {"kappa": 0.05, "ra_0": 0.1},
+            {
+                "theta_E": 1.0,
+                "gamma": 2.1,
+                "e1": 0.1,
+                "e2": 0.02,
+                "center_x": 0,
+                "center_y": 0,
+            },
+            {"gamma1": 0.01, "gamma2": 0.02, "ra_0": 0.1, "dec_0": 0},
+        ]
+        self.lens_model = LensModel(self.lens_model_list)
+        # small max_elements to evaluate the groups in chunks
+        self.fused = FusedSinglePlane(self.lens_model, max_elements=200)
+
+    def test_identical(self):
+        x, y = np.random.normal(size=(2, 10, 30))
+        # evaluation at the center of a SIS
+        x[0, 0] = self.kwargs_lens[0]["center_x"]
+        y[0, 0] = self.kwargs_lens[0]["center_y"]
+        for k in [None, [0, 3, 6, 21], list(range(0, len(self.kwargs_lens), 2)), 5]:
+            alpha = self.lens_model.lens_model.alpha(x, y, self.kwargs_lens, k=k)
+            alpha_fused = self.fused.alpha(x, y, self.kwargs_lens, k=k)
+            for a, a_fused in zip(alpha, alpha_fused):
+                assert np.shape(a_fused) == np.shape(x)
+                npt.assert_allclose(a_fused, a, rtol=1e-13, atol=1e-15)
+            hessian = self.lens_model.lens_model.hessian(x, y, self.kwargs_lens, k=k)
+            hessian_fused = self.fused.hessian(x, y, self.kwargs_lens, k=k)
+            for f, f_fused in zip(hessian, hessian_fused):
+                npt.assert_allclose(f_fused, f, rtol=1e-13, atol=1e-15)
+
+        beta_x, beta_y = self.lens_model.ray_shooting(x, y, self.kwargs_lens)
+        self.lens_model.lens_model = self.fused
+        beta_x_fused, beta_y_fused = self.lens_model.ray_shooting(
+            x, y, self.kwargs_lens
+        )
+        npt.assert_allclose(beta_x_fused, beta_x, rtol=1e-13, atol=1e-15)
+        npt.assert_allclose(beta_y_fused, beta_y, rtol=1e-13, atol=1e-15)
+
+        # scalar input
+        f_x, f_y = self.fused.alpha(-0.3, 0.2, self.kwargs_lens)
+        f_x_, f_y_ = LensModel(self.lens_model_list).alpha(-0.3, 0.2, self.kwargs_lens)
+        assert f_x == f_x_
+        assert f_y == f_y_
+
+    def test_alpha_batch(self):
+        x, y = np.random.normal(size=(2, 30))
+        lens_model_list = self.lens_model_list + ["SIE", "NIE"]
+        lens_model = LensModel(lens_model_list)
+        kwargs_batch = []
+        for i in range(3):
+            kwargs_lens = [
+                {
+                    key: value + 0.1 * i if key == "center_x" else value
+                    for key, value in kwargs.items()
+                }
+                for kwargs in self.kwargs_lens
+            ]
+            kwargs_lens.append(
+                {"theta_E": 1 + 0.1 * i, "e1": 0.1 * i, "e2": 0, "center_x": 0}
+            )
+            # axis ratio q = 1 for the first realisation
+            kwargs_lens.append(
+                {"theta_E": 0.5, "e1": 0, "e2": 0.05 * i, "s_scale": 0.1}
+            )
+            kwargs_batch.append(kwargs_lens)
+        f_x, f_y = alpha_batch(lens_model, x, y, kwargs_batch)
+        assert f_x.shape == (3, 30)
+        for i, kwargs_lens in enumerate(kwargs_batch):
+            f_x_, f_y_ = lens_model.alpha(x, y, kwargs_lens)
+            npt.assert_allclose(f_x[i], f_x_, rtol=1e-12, atol=1e-14)
+            npt.assert_allclose(f_y[i], f_y_, rtol=1e-12, atol=1e-14)
+
+        lens_model = LensModel(
+            ["SIS", "SIS"], multi_plane=True, lens_redshift_list=[0.5, 0.6], z_source=2
+        )
+        with pytest.raises(ValueError):
+            alpha_batch(lens_model, x, y, [[{"theta_E": 1}, {"theta_E": 1}]])
+
+    def test_raise(self):
+        lens_model = LensModel(
+            ["SIS", "SIS"], multi_plane=True, lens_redshift_list=[0.5, 0.6], z_source=2
+        )
+        with pytest.raises(ValueError):
+            FusedSinglePlane(lens_model)
@@ -48,6 +48,12 @@ class TestLensModel(object):
             "MULTI_GAUSSIAN_KAPPA_ELLIPSE",
             "CHAMELEON",
             "DOUBLE_CHAMELEON",
+            "SIE_NUMBA",
+            "NIE_NUMBA",
+            "SHEAR_NUMBA",
+            "MULTIPOLE_NUMBA",
+            "NFW_ELLIPSE_CSE_NUMBA",
+            "HERNQUIST_ELLIPSE_CSE_NUMBA",
         ]
 
         lensModel = LensModel(lens_model_list)
@@ -124,6 +130,61 @@ class TestLensModel(object):
         # assert delta_x == 1 + 0.19470019576785122/(8*np.pi)
         # assert delta_y == 1 + 0.19470019576785122/(8*np.pi)
 
+    def test_ray_shooting_jacobian(self):
+        lens_model_list = ["EPL", "SHEAR", "MULTIPOLE"]
+        kwargs = [
+            {
+                "theta_E": 1.0,
+                "gamma": 2.1,
+                "e1": 0.1,
+                "e2": -0.05,
+                "center_x": 0.02,
+                "center_y": -0.01,
+            },
+            {"gamma1": 0.03, "gamma2": 0.01, "ra_0": 0, "dec_0": 0},
+            {"m": 4, "a_m": 0.01, "phi_m": 0.2, "center_x": 0.02, "center_y": -0.01},
+        ]
+        x, y = np.array([1.1, -0.8, 0.2]), np.array([0.3, 0.6, -1.0])
+        lens_model = LensModel(lens_model_list)
+        jacobian = lens_model.ray_shooting_jacobian(x, y, kwargs)
+        jacobian_num = lens_model._ray_shooting_jacobian_differential(x, y, kwargs)
+        assert "m" not in jacobian[2]
+        for jacobian_i, jacobian_num_i in zip(jacobian, jacobian_num):
+            assert sorted(jacobian_i.keys()) == sorted(jacobian_num_i.keys())
+            for name in jacobian_i:
+                npt.assert_almost_equal(
+                    jacobian_i[name][0], jacobian_num_i[name][0], decimal=6
+                )
+                npt.assert_almost_equal(
+                    jacobian_i[name][1], jacobian_num_i[name][1], decimal=6
+                )
+        jacobian_k = lens_model.ray_shooting_jacobian(x, y, kwargs, k=1)
+        npt.assert_almost_equal(
+            jacobian_k["gamma1"][0], jacobian[1]["gamma1"][0], decimal=10
+        )
+
+        # multi-plane with finite differences of the ray-shooting
+        lens_model = LensModel(
+            lens_model_list,
+            multi_plane=True,
+            lens_redshift_list=[0.5, 0.5, 0.5],
+            z_source=2,
+        )
+        jacobian = lens_model.ray_shooting_jacobian(x, y, kwargs)
+        assert "m" not in jacobian[2]
+        beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs)
+        kwargs_plus = [dict(kwargs_i) for kwargs_i in kwargs]
+        kwargs_plus[0]["gamma"] += 1e-6
+        beta_x_plus, beta_y_plus = lens_model.ray_shooting(x, y, kwargs_plus)
+        npt.assert_almost_equal(
+            jacobian[0]["gamma"][0], (beta_x_plus - beta_x) / 1e-6, decimal=5
+        )
+        npt.assert_almost_equal(
+            jacobian[0]["gamma"][1], (beta_y_plus - beta_y) / 1e-6, decimal=5
+        )
+        jacobian = lens_model.ray_shooting_jacobian(x, y, kwargs, k=0)
+        assert "theta_E" in jacobian
+
     def test_arrival_time(self):
         z_lens = 0.5
         z_source = 1.5
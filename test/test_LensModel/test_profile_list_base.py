@@ -0,0 +1,88 @@
+import subprocess
+import sys
+
+import numpy.testing as npt
+import pytest
+import unittest
+
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Profiles.nfw_mass_concentration import default_cosmo
+from lenstronomy.LensModel.profile_list_base import (
+    _MODEL_REGISTRY,
+    _SUPPORTED_MODELS,
+    lens_class,
+    shared_lens_class,
+)
+
+
+class TestProfileListBase(object):
+    def test_registry(self):
+        for lens_type in _SUPPORTED_MODELS:
+            if lens_type in ["SYNTHESIS", "TABULATED_DEFLECTIONS"]:
+                continue
+            try:
+                instance = lens_class(
+                    lens_type, kwargs_interp={}, z_lens=0.5, z_source=2
+                )
+            except ImportError:
+                # optional dependency (fastell4py) not installed
+                continue
+            module_name, class_name = _MODEL_REGISTRY[lens_type]
+            assert type(instance).__name__ == class_name
+            assert type(instance).__module__ == module_name
+
+    def test_shared_instances(self):
+        lens_model_1 = LensModel(["SIS", "SIS", "EPL", "NIE"])
+        lens_model_2 = LensModel(["SIS", "EPL", "NIE"])
+        func_list_1 = lens_model_1.lens_model.func_list
+        func_list_2 = lens_model_2.lens_model.func_list
+        # stateless profiles are shared between LensModel instances
+        assert func_list_1[0] is func_list_1[1]
+        assert func_list_1[0] is func_list_2[0]
+        assert shared_lens_class("SIS") is func_list_1[0]
+        # profiles that can be set static are only shared within a LensModel instance
+        assert func_list_1[2] is not func_list_2[1]
+        # profiles requiring an instance per component are never shared
+        assert func_list_1[3] is not func_list_2[2]
+
+        kwargs_epl = {"theta_E": 1, "gamma": 2, "e1": 0.1, "e2": 0}
+        kwargs_2 = [{"theta_E": 1}, kwargs_epl, {}]
+        f_x, f_y = lens_model_2.alpha(1.0, 0.5, kwargs_2, k=1)
+        lens_model_1.lens_model.func_list[2].set_static(**dict(kwargs_epl, theta_E=2))
+        f_x_, f_y_ = lens_model_2.alpha(1.0, 0.5, kwargs_2, k=1)
+        npt.assert_almost_equal(f_x, f_x_, decimal=12)
+        npt.assert_almost_equal(f_y, f_y_, decimal=12)
+
+    def test_lazy_import(self):
+        code = (
+            "import sys; from lenstronomy.LensModel.lens_model import LensModel; "
+            "LensModel(['SIS']); "
+            "print('lenstronomy.LensModel.Profiles.epl' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert output.stdout.strip() == "False"
+
+    def test_default_cosmo(self):
+        # the default astropy cosmology of the mass-concentration profiles is created
+        # once instead of per component
+        kwargs = {"z_source": 2, "lens_redshift_list": [0.5, 0.6, 0.7]}
+        lens_model = LensModel(["NFW_MC", "NFW_MC", "NFW_MC_ELLIPSE"], **kwargs)
+        func_list = lens_model.lens_model.func_list
+        cosmo = func_list[0]._lens_cosmo.background.cosmo
+        assert func_list[1]._lens_cosmo.background.cosmo is cosmo
+        assert func_list[2]._lens_cosmo.background.cosmo is cosmo
+        assert default_cosmo() is cosmo
+
+
+class TestRaise(unittest.TestCase):
+    def test_raise(self):
+        with self.assertRaises(ValueError):
+            lens_class("WRONG")
+        with self.assertRaises(ValueError):
+            shared_lens_class("WRONG")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -44,6 +44,39 @@ class TestLensModel(object):
         assert delta_x == 1 + 0.19470019576785122 / (8 * np.pi)
         assert delta_y == 1 + 0.19470019576785122 / (8 * np.pi)
 
+    def test_alpha_jacobian(self):
+        lens_model = SinglePlane(["SIS", "SHEAR", "GAUSSIAN"])
+        kwargs = [
+            {"theta_E": 1.0, "center_x": 0.1, "center_y": 0.0},
+            {"gamma1": 0.05, "gamma2": -0.02},
+            self.kwargs[0],
+        ]
+        x, y = np.array([1.0, -0.5]), np.array([0.3, 0.7])
+        jacobian = lens_model.alpha_jacobian(x, y, kwargs)
+        assert len(jacobian) == 3
+        assert sorted(jacobian[1].keys()) == ["gamma1", "gamma2"]
+        alpha_x, alpha_y = lens_model.alpha(x, y, kwargs)
+        kwargs_plus = [dict(kwargs_i) for kwargs_i in kwargs]
+        kwargs_plus[0]["theta_E"] += 1e-6
+        alpha_x_plus, alpha_y_plus = lens_model.alpha(x, y, kwargs_plus)
+        npt.assert_almost_equal(
+            jacobian[0]["theta_E"][0], (alpha_x_plus - alpha_x) / 1e-6, decimal=5
+        )
+        npt.assert_almost_equal(
+            jacobian[0]["theta_E"][1], (alpha_y_plus - alpha_y) / 1e-6, decimal=5
+        )
+
+        jacobian = lens_model.alpha_jacobian(x, y, kwargs, k=[0, 2])
+        assert jacobian[1] == {}
+        jacobian_k = lens_model.alpha_jacobian(x, y, kwargs, k=2)
+        npt.assert_almost_equal(jacobian_k["amp"][0], jacobian[2]["amp"][0], decimal=10)
+
+        # array valued keyword arguments are skipped
+        lens_model = SinglePlane(["SHAPELETS_CART"])
+        kwargs = [{"coeffs": [1.0, 0.2, -0.1], "beta": 1.5, "center_x": 0.1}]
+        jacobian = lens_model.alpha_jacobian(x, y, kwargs)
+        assert sorted(jacobian[0].keys()) == ["beta", "center_x"]
+
     def test_mass_2d(self):
         lensModel = SinglePlane(["GAUSSIAN_KAPPA"])
         kwargs = [{"amp": 1.0, "sigma": 2.0, "center_x": 0.0, "center_y": 0.0}]
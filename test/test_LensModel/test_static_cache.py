@@ -0,0 +1,136 @@
+import os
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.static_cache import StaticCache
+
+
+class TestStaticCache(object):
+    def setup_method(self):
+        self.lens_model_list = ["EPL", "CHAMELEON", "DOUBLE_CHAMELEON", "SIS", "NFW_MC"]
+        kwargs_chameleon = {
+            "alpha_1": 1.0,
+            "w_c": 0.1,
+            "w_t": 1.0,
+            "e1": 0.1,
+            "e2": -0.05,
+        }
+        kwargs_double_chameleon = {
+            "alpha_1": 1.0,
+            "ratio": 0.5,
+            "w_c1": 0.1,
+            "w_t1": 1.0,
+            "e11": 0.1,
+            "e21": 0.0,
+            "w_c2": 0.3,
+            "w_t2": 2.0,
+            "e12": -0.1,
+            "e22": 0.05,
+        }
+        self.kwargs_lens = [
+            {"theta_E": 1.0, "gamma": 2.1, "e1": 0.1, "e2": 0.05},
+            kwargs_chameleon,
+            kwargs_double_chameleon,
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0.1},
+            {"logM": 12, "concentration": 5},
+        ]
+        self.kwargs_model = {
+            "lens_model_list": self.lens_model_list,
+            "lens_redshift_list": [0.5] * 5,
+            "z_source_convention": 2,
+            "z_source": 2,
+        }
+        self.x, self.y = np.linspace(-2, 2, 20), np.linspace(-1, 1.5, 20)
+
+    def test_set_static(self, tmp_path):
+        lens_model = LensModel(**self.kwargs_model)
+        f_x, f_y = lens_model.alpha(self.x, self.y, self.kwargs_lens)
+
+        cache = StaticCache(directory=str(tmp_path))
+        lens_model.set_static(self.kwargs_lens, cache=cache)
+        f_x_, f_y_ = lens_model.alpha(self.x, self.y, self.kwargs_lens)
+        npt.assert_almost_equal(f_x_, f_x, decimal=12)
+        npt.assert_almost_equal(f_y_, f_y, decimal=12)
+        # EPL, CHAMELEON and DOUBLE_CHAMELEON; SIS has nothing to pre-compute and
+        # NFW_MC depends on its redshifts
+        assert len(cache) == 3
+        assert len(os.listdir(str(tmp_path))) == 3
+
+        # pre-computations restored from memory and from the directory
+        for cache_ in [cache, StaticCache(directory=str(tmp_path), read_only=True)]:
+            lens_model_ = LensModel(**self.kwargs_model)
+            lens_model_.set_static(self.kwargs_lens, cache=cache_)
+            f_x_, f_y_ = lens_model_.alpha(self.x, self.y, self.kwargs_lens)
+            npt.assert_almost_equal(f_x_, f_x, decimal=12)
+            npt.assert_almost_equal(f_y_, f_y, decimal=12)
+            f_xx, f_xy, f_yx, f_yy = lens_model_.hessian(
+                self.x, self.y, self.kwargs_lens
+            )
+            f_xx_, f_xy_, f_yx_, f_yy_ = lens_model.hessian(
+                self.x, self.y, self.kwargs_lens
+            )
+            npt.assert_almost_equal(f_xx_, f_xx, decimal=12)
+            npt.assert_almost_equal(f_xy_, f_xy, decimal=12)
+
+        # a static model with different parameters in the cache
+        kwargs_lens = [dict(kwargs) for kwargs in self.kwargs_lens]
+        kwargs_lens[0]["gamma"] = 1.9
+        kwargs_lens[1]["alpha_1"] = 1.5
+        f_x, f_y = LensModel(**self.kwargs_model).alpha(self.x, self.y, kwargs_lens)
+        lens_model.set_static(kwargs_lens, cache=cache)
+        f_x_, f_y_ = lens_model.alpha(self.x, self.y, kwargs_lens)
+        npt.assert_almost_equal(f_x_, f_x, decimal=12)
+        npt.assert_almost_equal(f_y_, f_y, decimal=12)
+        assert len(cache) == 5
+
+        # read-only caches do not write to the directory
+        cache_read_only = StaticCache(directory=str(tmp_path), read_only=True)
+        kwargs_lens[0]["gamma"] = 2.2
+        lens_model.set_static(kwargs_lens, cache=cache_read_only)
+        assert len(os.listdir(str(tmp_path))) == 5
+
+        lens_model.set_dynamic()
+        f_x, f_y = lens_model.alpha(self.x, self.y, self.kwargs_lens)
+        f_x_, f_y_ = LensModel(**self.kwargs_model).alpha(
+            self.x, self.y, self.kwargs_lens
+        )
+        npt.assert_almost_equal(f_x_, f_x, decimal=12)
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_multi_plane(self):
+        lens_model = LensModel(
+            ["EPL", "CHAMELEON"],
+            multi_plane=True,
+            lens_redshift_list=[0.5, 0.7],
+            z_source=2,
+        )
+        kwargs_lens = self.kwargs_lens[:2]
+        beta_x, beta_y = lens_model.ray_shooting(self.x, self.y, kwargs_lens)
+        cache = StaticCache()
+        for i in range(2):
+            kwargs_static = lens_model.set_static(kwargs_lens, cache=cache)
+            beta_x_, beta_y_ = lens_model.ray_shooting(self.x, self.y, kwargs_static)
+            npt.assert_almost_equal(beta_x_, beta_x, decimal=12)
+            npt.assert_almost_equal(beta_y_, beta_y, decimal=12)
+            lens_model.set_dynamic()
+        assert len(cache) == 2
+
+    def test_key(self):
+        lens_model = LensModel(["EPL", "EPL_NUMBA"])
+        func_epl, func_epl_numba = lens_model.lens_model.func_list
+        kwargs = self.kwargs_lens[0]
+        key = StaticCache.key(func_epl, kwargs)
+        assert key == StaticCache.key(func_epl, dict(reversed(list(kwargs.items()))))
+        assert key != StaticCache.key(func_epl_numba, kwargs)
+        assert key != StaticCache.key(func_epl, dict(kwargs, gamma=2.0))
+        key_array = StaticCache.key(func_epl, {"theta_E": np.array([1.0, 2.0])})
+        assert key_array != StaticCache.key(func_epl, {"theta_E": np.array([1.0, 2.1])})
+
+
+if __name__ == "__main__":
+    pytest.main()
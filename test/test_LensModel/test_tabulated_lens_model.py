@@ -0,0 +1,135 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.tabulated_lens_model import (
+    TabulatedLensModel,
+    load_tabulated_lens_model,
+    tabulate_lens_model,
+)
+
+
+class TestTabulatedLensModel(object):
+    def setup_method(self):
+        self.lens_model = LensModel(["SIS", "SHEAR", "NFW", "NFW"])
+        self.kwargs_lens = [
+            {"theta_E": 1.0, "center_x": 0, "center_y": 0},
+            {"gamma1": 0.03, "gamma2": -0.02},
+            {"Rs": 0.2, "alpha_Rs": 0.02, "center_x": 0.8, "center_y": -0.5},
+            {"Rs": 0.2, "alpha_Rs": 0.02, "center_x": -1.0, "center_y": 0.7},
+        ]
+        self.table = tabulate_lens_model(
+            self.lens_model,
+            self.kwargs_lens,
+            x_range=[-2, 2],
+            y_range=[-2, 2],
+            grid_spacing=0.05,
+            num_levels=3,
+            atol=1e-4,
+        )
+        np.random.seed(42)
+        x, y = np.random.uniform(-1.9, 1.9, (2, 2000))
+        # away from the profile centers
+        far = np.ones_like(x, dtype=bool)
+        for kwargs in [self.kwargs_lens[0]] + self.kwargs_lens[2:]:
+            far &= np.hypot(x - kwargs["center_x"], y - kwargs["center_y"]) > 0.2
+        self.x, self.y = x[far], y[far]
+
+    def test_derivatives(self):
+        f_x, f_y = self.lens_model.alpha(self.x, self.y, self.kwargs_lens)
+        f_x_, f_y_ = self.table.derivatives(self.x, self.y)
+        npt.assert_allclose(f_x_, f_x, atol=5e-4)
+        npt.assert_allclose(f_y_, f_y, atol=5e-4)
+        f_x_, f_y_ = self.table(self.x, self.y)
+        npt.assert_allclose(f_x_, f_x, atol=5e-4)
+
+        # scalar input
+        f_x, f_y = self.lens_model.alpha(0.5, 0.3, self.kwargs_lens)
+        f_x_, f_y_ = self.table.derivatives(0.5, 0.3)
+        assert np.ndim(f_x_) == 0
+        npt.assert_almost_equal(f_x_, f_x, decimal=3)
+        npt.assert_almost_equal(f_y_, f_y, decimal=3)
+
+        # outside the tabulated region, the table is evaluated at the boundary
+        f_x_, f_y_ = self.table.derivatives(np.array([5.0]), np.array([0.0]))
+        f_x, f_y = self.table.derivatives(np.array([2.0]), np.array([0.0]))
+        npt.assert_almost_equal(f_x_, f_x, decimal=8)
+
+    def test_hessian(self):
+        f_xx, f_xy, f_yx, f_yy = self.lens_model.hessian(
+            self.x, self.y, self.kwargs_lens
+        )
+        f_xx_, f_xy_, f_yx_, f_yy_ = self.table.hessian(self.x, self.y)
+        npt.assert_allclose(f_xx_, f_xx, atol=2e-2)
+        npt.assert_allclose(f_xy_, f_xy, atol=2e-2)
+        npt.assert_allclose(f_yy_, f_yy, atol=2e-2)
+        npt.assert_almost_equal(f_xy_, f_yx_, decimal=12)
+
+    def test_refinement(self):
+        assert self.table.num_levels == 3
+        num_tiles = [len(values) for values in self.table._tile_values]
+        assert num_tiles[1] > 0
+        assert num_tiles[2] > 0
+        # only a fraction of the finer levels is tabulated
+        assert num_tiles[1] < 4 * num_tiles[0]
+
+        table = tabulate_lens_model(
+            self.lens_model,
+            self.kwargs_lens,
+            x_range=[-2, 2],
+            y_range=[-2, 2],
+            grid_spacing=0.05,
+            num_levels=1,
+        )
+        assert table.num_levels == 1
+        assert table.num_grid_points < self.table.num_grid_points
+
+    def test_k(self):
+        table = tabulate_lens_model(
+            self.lens_model,
+            self.kwargs_lens,
+            x_range=[-2, 2],
+            y_range=[-2, 2],
+            grid_spacing=0.05,
+            k=[1, 2],
+        )
+        f_x, f_y = self.lens_model.alpha(self.x, self.y, self.kwargs_lens, k=[1, 2])
+        f_x_, f_y_ = table.derivatives(self.x, self.y)
+        npt.assert_allclose(f_x_, f_x, atol=5e-4)
+        npt.assert_allclose(f_y_, f_y, atol=5e-4)
+
+    def test_lens_model(self):
+        lens_model = LensModel(
+            ["TABULATED_DEFLECTIONS", "SIS"], numerical_alpha_class=self.table
+        )
+        kwargs_sis = {"theta_E": 0.1, "center_x": 0.3, "center_y": -0.8}
+        kwargs_lens = [{}, kwargs_sis]
+        lens_model_exact = LensModel(["SIS", "SHEAR", "NFW", "NFW", "SIS"])
+        kwargs_exact = self.kwargs_lens + [kwargs_sis]
+        x, y = self.x[:100], self.y[:100]
+        beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs_lens)
+        beta_x_, beta_y_ = lens_model_exact.ray_shooting(x, y, kwargs_exact)
+        npt.assert_allclose(beta_x, beta_x_, atol=5e-4)
+        npt.assert_allclose(beta_y, beta_y_, atol=5e-4)
+
+        f_xx, f_xy, f_yx, f_yy = lens_model.hessian(x, y, [{}, kwargs_sis], k=0)
+        f_xx_, f_xy_, f_yx_, f_yy_ = self.table.hessian(x, y)
+        npt.assert_almost_equal(f_xx, f_xx_, decimal=10)
+        npt.assert_almost_equal(f_yy, f_yy_, decimal=10)
+
+    @pytest.mark.parametrize("file_name", ["table.npz", "table.h5"])
+    def test_save_load(self, tmp_path, file_name):
+        file_name = str(tmp_path / file_name)
+        self.table.save(file_name)
+        table = load_tabulated_lens_model(file_name)
+        assert isinstance(table, TabulatedLensModel)
+        assert table.num_grid_points == self.table.num_grid_points
+        f_x, f_y = self.table.derivatives(self.x, self.y)
+        f_x_, f_y_ = table.derivatives(self.x, self.y)
+        npt.assert_almost_equal(f_x_, f_x, decimal=14)
+        npt.assert_almost_equal(f_y_, f_y, decimal=14)
+
+
+if __name__ == "__main__":
+    pytest.main()
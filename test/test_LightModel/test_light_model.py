@@ -162,6 +162,28 @@ class TestLightModel(object):
         )
         npt.assert_almost_equal(output[0], 2.647127113888489, decimal=6)
 
+    def test_surface_brightness_batch(self):
+        np.random.seed(42)
+        x, y = np.random.normal(0, 1, (2, 3, 50))
+        kwargs_batch = []
+        for i in range(3):
+            kwargs_list = []
+            for kwargs in self.kwargs:
+                kwargs = dict(kwargs)
+                for key in ["amp", "R_sersic", "center_x", "e1"]:
+                    if key in kwargs and np.isscalar(kwargs[key]):
+                        kwargs[key] += 0.1 * i
+                kwargs_list.append(kwargs)
+            kwargs_batch.append(kwargs_list)
+        flux = self.LightModel.surface_brightness_batch(x, y, kwargs_batch)
+        assert flux.shape == (3, 50)
+        for i in range(3):
+            flux_i = self.LightModel.surface_brightness(x[i], y[i], kwargs_batch[i])
+            npt.assert_allclose(flux[i], flux_i, rtol=1e-12, atol=1e-12)
+        flux = self.LightModel.surface_brightness_batch(x, y, kwargs_batch, k=3)
+        flux_i = self.LightModel.surface_brightness(x[1], y[1], kwargs_batch[1], k=3)
+        npt.assert_allclose(flux[1], flux_i, rtol=1e-12, atol=1e-12)
+
     def test_functions_split(self):
         output = self.LightModel.functions_split(x=1.0, y=1.0, kwargs_list=self.kwargs)
         npt.assert_almost_equal(output[0][0], 0.058549831524319168, decimal=6)
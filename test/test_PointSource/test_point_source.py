@@ -132,6 +132,18 @@ class TestPointSource(object):
         self.PointSource.set_save_cache(False)
         assert self.PointSource._point_source_list[0]._save_cache == False
 
+    def test_lens_model_dependent(self):
+        assert self.PointSource.lens_model_dependent is True
+        point_source = PointSource(
+            point_source_type_list=["LENSED_POSITION", "UNLENSED"]
+        )
+        assert point_source.lens_model_dependent is False
+        point_source = PointSource(
+            point_source_type_list=["LENSED_POSITION", "UNLENSED"],
+            fixed_magnification_list=[True, False],
+        )
+        assert point_source.lens_model_dependent is True
+
     def test_update_lens_model(self):
         lensModel = LensModel(lens_model_list=["SIS"])
         self.PointSource.update_lens_model(lens_model_class=lensModel)
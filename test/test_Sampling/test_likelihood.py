@@ -352,6 +352,59 @@ class TestLikelihoodModule(object):
             ).flatten()
             npt.assert_almost_equal(logL_nokin - logL, image_averaged_chi2 / 2)
 
+    def test_profiling(self):
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        kwargs_likelihood = {"source_marg": True, "time_delay_likelihood": True}
+        likelihood = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            **kwargs_likelihood,
+        )
+        likelihood_profiled = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            profiling=True,
+            **kwargs_likelihood,
+        )
+        assert likelihood.stage_timer is None
+        with pytest.raises(ValueError):
+            likelihood.profiling_report()
+        logL = likelihood.logL(args)
+        logL_profiled = likelihood_profiled.logL(args)
+        npt.assert_almost_equal(logL_profiled, logL, decimal=8)
+        likelihood_profiled.logL(args)
+
+        report = likelihood_profiled.profiling_report()
+        for name in [
+            "log_likelihood",
+            "image_likelihood",
+            "time_delay_likelihood",
+            "prior_likelihood",
+            "ray_shooting",
+            "source",
+            "lens_light",
+            "point_source",
+            "convolution",
+            "linear_solve",
+            "error_map",
+        ]:
+            assert name in report
+        assert report["log_likelihood"]["calls"] == 2
+        assert report["image_likelihood"]["calls"] == 2
+        assert report["image_likelihood"]["time"] <= report["log_likelihood"]["time"]
+        assert report["convolution"]["time"] <= report["image_likelihood"]["time"]
+        # no recording outside of the log_likelihood calls
+        likelihood_profiled.image_likelihood.logL(**self.param_class.args2kwargs(args))
+        assert likelihood_profiled.profiling_report()["image_likelihood"]["calls"] == 2
+
     def test_check_bounds(self):
         penalty, bound_hit = self.Likelihood.check_bounds(
             args=[0, 1], lowerLimit=[1, 0], upperLimit=[2, 2], verbose=True
@@ -2,6 +2,7 @@ __author__ = "sibirrer"
 
 import pytest
 import numpy as np
+import numpy.testing as npt
 import os
 import lenstronomy.Util.simulation_util as sim_util
 from lenstronomy.ImSim.image_model import ImageModel
@@ -10,6 +11,7 @@ from lenstronomy.Sampling.parameters import Param
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.Sampling.sampler import Sampler, choose_pool
+from lenstronomy.Sampling.Pool.pool import TimedPool
 from lenstronomy.Data.imaging_data import ImageData
 from lenstronomy.Data.psf import PSF
 
@@ -132,6 +134,13 @@ class TestSampler(object):
             **kwargs_likelihood
         )
         self.sampler = Sampler(likelihoodModule=self.Likelihood)
+        self.likelihood_profiled = LikelihoodModule(
+            kwargs_data_joint=kwargs_data_joint,
+            kwargs_model=kwargs_model,
+            param_class=self.param_class,
+            profiling=True,
+            **kwargs_likelihood
+        )
 
     def test_pso(self):
         n_particles = 2
@@ -194,6 +203,42 @@ class TestSampler(object):
 
         os.remove(backup_filename)  # just remove the backup file created above
 
+    def test_profiling_pool(self):
+        # the timings recorded in the worker processes are merged into the StageTimer
+        # of the master process
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+        )
+        stage_timer = self.likelihood_profiled.stage_timer
+        pool = choose_pool(mpi=False, processes=2, use_dill=True)
+        try:
+            logL_list = TimedPool(pool, stage_timer).map(
+                self.likelihood_profiled.logL, [args] * 6
+            )
+        finally:
+            pool.close()
+            pool.join()
+        npt.assert_almost_equal(logL_list, [self.Likelihood.logL(args)] * 6, decimal=8)
+        report = stage_timer.report()
+        assert report["log_likelihood"]["calls"] == 6
+        assert report["image_likelihood"]["calls"] == 6
+        assert report["log_likelihood"]["time"] > 0
+
+        stage_timer.reset()
+        np.random.seed(42)
+        n_walkers, n_run, n_burn = 36, 2, 2
+        sampler = Sampler(likelihoodModule=self.likelihood_profiled)
+        sigma_start = np.ones_like(args) * 0.01
+        sampler.mcmc_emcee(n_walkers, n_run, n_burn, args, sigma_start, threadCount=2)
+        # all evaluations are performed in the workers: the initial state and one per
+        # walker and step (apart from proposals outside of the parameter bounds)
+        report = stage_timer.report()
+        num_calls = report["log_likelihood"]["calls"]
+        assert n_walkers * (n_run + n_burn) < num_calls
+        assert num_calls <= n_walkers * (n_run + n_burn + 1)
+
     def test_mcmc_zeus(self):
         n_walkers = 36
         n_run = 2
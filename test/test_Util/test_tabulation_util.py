@@ -0,0 +1,103 @@
+import os
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Conf import config_loader
+from lenstronomy.Util import tabulation_util
+from lenstronomy.Util.tabulation_util import Tabulation
+
+
+class TestTabulation(object):
+    @pytest.fixture(autouse=True)
+    def table_directory(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(config_loader, "user_table_directory", str(tmp_path))
+
+    def test_1d(self):
+        table = Tabulation("test_1d", np.arctan, [0.01, 100], num_x=41, rtol=1e-6)
+        x = np.logspace(-2, 2, 200)
+        npt.assert_allclose(table(x), np.arctan(x), rtol=1e-6)
+        assert table.error < 1e-6
+        npt.assert_almost_equal(table(0.5), np.arctan(0.5), decimal=6)
+        assert isinstance(table(0.5), float)
+        # outside of the tabulated range
+        npt.assert_almost_equal(table([0.001, 1000]), np.arctan([0.001, 1000]), 14)
+        assert table(x.reshape(20, 10)).shape == (20, 10)
+
+    def test_2d(self):
+        def func(x, y):
+            return 1 / (1 + x**y)
+
+        table = Tabulation(
+            "test_2d", func, [0.1, 10], [0, 2], num_x=21, num_y=11, log_f=True
+        )
+        x, y = np.random.uniform(0.1, 10, 100), np.random.uniform(0, 2, 100)
+        npt.assert_allclose(table(x, y), func(x, y), rtol=1e-6)
+        # broadcasting of a scalar y
+        npt.assert_allclose(table(x, 1.5), func(x, 1.5), rtol=1e-6)
+
+    def test_cache(self):
+        calls = []
+
+        def func(x):
+            calls.append(len(x))
+            return np.exp(-x)
+
+        table = Tabulation("test_cache", func, [0, 1], log_x=False, num_x=11)
+        table(0.5)
+        assert os.path.exists(table.file_name)
+        num_calls = len(calls)
+
+        # the second table with the same settings is read from disk
+        table_loaded = Tabulation("test_cache", func, [0, 1], log_x=False, num_x=11)
+        npt.assert_almost_equal(table_loaded(0.3), table(0.3), decimal=15)
+        assert len(calls) == num_calls
+        assert table_loaded.error == table.error
+
+        # different settings do not share the table
+        table_other = Tabulation("test_cache", func, [0, 2], log_x=False, num_x=11)
+        assert table_other.file_name != table.file_name
+
+        table_no_cache = Tabulation(
+            "test_no_cache", func, [0, 1], log_x=False, cache=False
+        )
+        table_no_cache(0.5)
+        assert not os.path.exists(table_no_cache.file_name)
+
+    def test_cache_truncated(self, tmp_path):
+        table = Tabulation("test_truncated", np.exp, [0, 1], log_x=False, num_x=11)
+        table(0.5)
+        # the table is written to a temporary file and moved to its final name
+        assert os.listdir(tmp_path) == [os.path.basename(table.file_name)]
+        # an incompletely written file is re-computed
+        with open(table.file_name, "rb") as f:
+            content = f.read()
+        with open(table.file_name, "wb") as f:
+            f.write(content[: len(content) // 2])
+        table_loaded = Tabulation(
+            "test_truncated", np.exp, [0, 1], log_x=False, num_x=11
+        )
+        npt.assert_almost_equal(table_loaded(0.3), table(0.3), decimal=15)
+        # and stored again
+        with np.load(table.file_name) as table_file:
+            assert float(table_file["error"]) == table.error
+
+    def test_tabulated_function(self):
+        table = tabulation_util.tabulated_function("test_shared", np.sqrt, [1, 2])
+        table_ = tabulation_util.tabulated_function("test_shared", np.sqrt, [1, 2])
+        assert table is table_
+
+
+class TestRaise(object):
+    def test_warning(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(config_loader, "user_table_directory", str(tmp_path))
+        table = Tabulation(
+            "test_warning", np.sin, [0, 100], log_x=False, num_x=5, max_refinement=0
+        )
+        with pytest.warns(Warning):
+            table(1.0)
+
+
+if __name__ == "__main__":
+    pytest.main()
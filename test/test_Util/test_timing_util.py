@@ -0,0 +1,50 @@
+import time
+
+import numpy.testing as npt
+
+from lenstronomy.Util import timing_util
+from lenstronomy.Util.timing_util import StageTimer
+
+
+class TestStageTimer(object):
+    def test_recording(self):
+        timer = StageTimer()
+        # no recording outside of recording()
+        with timing_util.stage("outside"):
+            pass
+        assert timer.report() == {}
+
+        with timer.recording():
+            for i in range(3):
+                with timing_util.stage("outer"):
+                    with timing_util.stage("inner"):
+                        time.sleep(0.001)
+                    # nested calls of the same stage are timed once
+                    with timing_util.stage("outer"):
+                        pass
+        report = timer.report()
+        assert report["outer"]["calls"] == 6
+        assert report["inner"]["calls"] == 3
+        assert report["inner"]["time"] >= 0.003
+        assert report["outer"]["time"] >= report["inner"]["time"]
+        npt.assert_almost_equal(
+            report["inner"]["time_per_call"], report["inner"]["time"] / 3
+        )
+        assert "outer" in timer.summary()
+
+        # the recording is restored after nested recordings
+        timer_2 = StageTimer()
+        with timer.recording():
+            with timer_2.recording():
+                with timing_util.stage("inner"):
+                    pass
+            with timing_util.stage("inner"):
+                pass
+        assert timer_2.report()["inner"]["calls"] == 1
+        assert timer.report()["inner"]["calls"] == 4
+
+        timer_2.merge(timer.report())
+        assert timer_2.report()["inner"]["calls"] == 5
+        assert timer_2.report()["outer"]["calls"] == 6
+        timer.reset()
+        assert timer.report() == {}
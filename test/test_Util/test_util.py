@@ -43,6 +43,20 @@ def test_sort_img_index():
     npt.assert_allclose(np.array(indexes), [0, 1, 2, 3])
 
 
+def test_rotate():
+    x, y = np.array([1.0, 0.0, 2.0]), np.array([0.0, 1.0, -1.0])
+    x_, y_ = util.rotate(x, y, np.pi / 2)
+    npt.assert_almost_equal(x_, y, decimal=15)
+    npt.assert_almost_equal(y_, -x, decimal=15)
+    # angles broadcasting against the coordinates
+    angle = np.array([[0.3], [-1.2]])
+    x_, y_ = util.rotate(x, y, angle)
+    for i in range(2):
+        x_i, y_i = util.rotate(x, y, angle[i, 0])
+        npt.assert_almost_equal(x_[i], x_i, decimal=15)
+        npt.assert_almost_equal(y_[i], y_i, decimal=15)
+
+
 def test_map_coord2pix():
     ra = 0
     dec = 0
@@ -550,6 +564,31 @@ def test_area():
     npt.assert_almost_equal(a, np.pi * r**2, decimal=3)
 
 
+def test_kwargs_equal():
+    kwargs = [{"a": 1, "b": np.array([1.0, 2.0])}, {"c": [1, 2]}]
+    assert util.kwargs_equal(kwargs, [dict(kwargs[0]), dict(kwargs[1])])
+    assert not util.kwargs_equal(kwargs, [dict(kwargs[0], a=2), kwargs[1]])
+    assert not util.kwargs_equal(
+        kwargs, [dict(kwargs[0], b=np.array([1.0, 3.0])), kwargs[1]]
+    )
+    assert not util.kwargs_equal(kwargs, [kwargs[0], {"c": [1, 2], "d": 1}])
+    assert not util.kwargs_equal(kwargs, kwargs[:1])
+    assert not util.kwargs_equal({"a": 1}, {"a": [1]})
+    assert util.kwargs_equal(None, None)
+
+
+def test_batch_kwargs():
+    kwargs_batch = util.batch_kwargs(
+        [[{"a": 1}], [{"a": 2}]], None, [{"b": 1}, {"b": 2}]
+    )
+    assert len(kwargs_batch) == 2
+    assert kwargs_batch[1] == ([{"a": 2}], None, {"b": 2})
+    with pytest.raises(ValueError):
+        util.batch_kwargs([{"a": 1}], [{"b": 1}, {"b": 2}])
+    with pytest.raises(ValueError):
+        util.batch_kwargs(None, None)
+
+
 class TestRaise(unittest.TestCase):
     def test_raise(self):
         with self.assertRaises(ValueError):
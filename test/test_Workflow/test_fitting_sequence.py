@@ -377,6 +377,52 @@ class TestFittingSequence(object):
             fitting_list_three.append(["emcee", kwargs_test])
             fittingSequence.fit_sequence(fitting_list_three)
 
+    def test_adaptive_supersampling(self):
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            self.kwargs_params,
+        )
+        fitting_list = [
+            [
+                "adaptive_supersampling",
+                {"tolerance": 0.001, "supersampling_factor": 3},
+            ]
+        ]
+        fittingSequence.fit_sequence(fitting_list)
+        kwargs_numerics = fittingSequence.multi_band_list[0][2]
+        assert kwargs_numerics["compute_mode"] == "adaptive"
+        assert kwargs_numerics["supersampling_factor"] == 3
+        supersampled_indexes = kwargs_numerics["supersampled_indexes"]
+        assert supersampled_indexes.shape == self.data_class.num_pixel_axes
+        assert np.any(supersampled_indexes)
+        # other numerics settings are kept
+        assert kwargs_numerics["point_source_supersampling_factor"] == 1
+        # the likelihood can be evaluated with the updated numerics
+        logL = fittingSequence.best_fit_likelihood
+        assert logL < 0
+
+    def test_likelihood_profile(self):
+        kwargs_likelihood = copy.deepcopy(self.kwargs_likelihood)
+        kwargs_likelihood["profiling"] = True
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            kwargs_likelihood,
+            self.kwargs_params,
+        )
+        assert fittingSequence.likelihood_profile() == {}
+        fittingSequence.best_fit_likelihood
+        fittingSequence.best_fit_likelihood
+        # timings are accumulated over the likelihood module instances
+        report = fittingSequence.likelihood_profile(reset=True)
+        assert report["log_likelihood"]["calls"] == 2
+        assert "convolution" in report
+        assert fittingSequence.likelihood_profile() == {}
+
     def test_cobaya(self):
         np.random.seed(42)
 